@@ -0,0 +1,484 @@
+"""
+JesusBornd 성능 벤치마크
+챕터 분석기의 대표 연산(groupby, merge, rolling, pivot, dtype/eval/query, IO)을
+10³, 10⁵, 10⁷행에서 측정해 JSON(머신 정보 포함)으로 저장하고, 저장된 기준선보다 느려지면 실패합니다.
+
+"너희 중의 누가 망대를 세우고자 할진대 자기의 가진 것이 준공하기까지에 족할는지
+먼저 앉아 그 비용을 계산하지 아니하겠느냐" (눅 14:28)
+
+사용법:
+    python benchmark.py                             # 모든 연산, 10³/10⁵/10⁷행
+    python benchmark.py --scales 3 5                # 10⁷행 제외
+    python benchmark.py --cases ch09_groupby ch35_csv_io --repeat 5
+    python benchmark.py --save-baseline             # 이번 결과를 기준선으로 저장
+    python benchmark.py --list                      # 연산 목록
+
+종료 코드: 0 회귀 없음, 1 회귀 발견, 3 비교할 기준선 없음 (기준선 파일이 없거나 머신/패키지가 다름)
+
+기준선(benchmarks/baseline.json)은 머신/패키지 정보가 같아야 비교되므로 저장소에 넣지 않습니다.
+회귀 검사를 돌릴 머신(CI 러너 등)에서 한 번 `python benchmark.py --save-baseline`으로 만들고,
+그 머신의 이후 실행이 이 파일과 비교됩니다. 패키지를 올리면 종료 코드 3이 나오니 다시 저장하세요.
+"""
+
+import argparse
+import atexit
+import gc
+import importlib.metadata
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from utils import reporting
+
+PROJECT_ROOT = Path(__file__).parent
+
+# 기준선 (python benchmark.py --save-baseline으로 갱신)
+BASELINE_PATH = PROJECT_ROOT / 'benchmarks' / 'baseline.json'
+
+# 최근 실행 결과
+RESULT_PATH = PROJECT_ROOT / 'build' / 'benchmarks' / 'latest.json'
+
+# 측정할 행 수 (10의 거듭제곱 지수)
+DEFAULT_SCALES = (3, 5, 7)
+
+# 이 행 수 이상에서는 한 번만 측정 (10⁷행은 한 번에 수 초가 걸림)
+SINGLE_RUN_ROWS = 10 ** 7
+
+# 기준선 대비 허용 비율 (0.5 = 50%까지 느려져도 통과)과 잡음으로 보는 최소 차이 (초)
+DEFAULT_TOLERANCE = 0.5
+MIN_REGRESSION_SECONDS = 0.005
+
+# 같은 머신인지 판단하는 머신 정보 키 (다르면 기준선과 비교하지 않음)
+MACHINE_KEYS = ('system', 'machine', 'processor', 'cpu_count', 'python', 'pandas', 'numpy')
+
+# 종료 코드: 회귀 발견, 비교할 기준선 없음 (기준선이 없거나 머신이 달라 게이트가 검사하지 못함)
+EXIT_REGRESSION = 1
+EXIT_NO_BASELINE = 3
+
+_BENCHMARK_PACKAGES = ('pandas', 'numpy', 'pyarrow')
+
+
+@dataclass
+class BenchmarkCase:
+    """측정할 연산 하나
+
+    prepare(rows)는 데이터를 만들고(측정 제외) 측정할 인자 없는 함수를 반환합니다.
+    """
+    name: str
+    chapter: str
+    operation: str
+    prepare: Callable[[int], Callable[[], Any]]
+
+
+@dataclass
+class BenchmarkResult:
+    """연산 하나 x 행 수 하나의 측정 결과 (초)"""
+    case: str
+    chapter: str
+    operation: str
+    rows: int
+    best: float
+    median: float
+    times: List[float]
+
+
+CASES: Dict[str, BenchmarkCase] = {}
+
+
+def benchmark_case(name: str, chapter: str, operation: str):
+    """prepare 함수를 CASES에 등록하는 데코레이터"""
+    def register(prepare: Callable[[int], Callable[[], Any]]):
+        CASES[name] = BenchmarkCase(name, chapter, operation, prepare)
+        return prepare
+    return register
+
+
+# --- groupby ---
+
+@benchmark_case('ch09_groupby', '09', 'groupby')
+def _ch09_aggregation(rows: int):
+    from chapters.ch09.plagues_aggregation import PlaguesAggregationAnalyzer
+
+    analyzer = PlaguesAggregationAnalyzer(num_records=rows)
+    return analyzer.run_all_analyses
+
+
+@benchmark_case('ch10_groupby', '10', 'groupby')
+def _ch10_groupby(rows: int):
+    from chapters.ch10.locusts_darkness_groupby import LocustsDarknessGroupbyAnalyzer
+
+    analyzer = LocustsDarknessGroupbyAnalyzer(num_records=rows)
+    return analyzer.run_all_analyses
+
+
+@benchmark_case('ch38_groupby', '38', 'groupby')
+def _ch38_groupby(rows: int):
+    from chapters.ch38.construction_costs_data import ConstructionCostsDataGenerator
+    from chapters.ch38.cost_analysis import CostAnalysis
+
+    df = ConstructionCostsDataGenerator().generate_costs_data(rows)
+    return lambda: CostAnalysis(df).analyze_costs_by_item()
+
+
+# --- merge ---
+
+@benchmark_case('ch11_merge', '11', 'merge')
+def _ch11_merge(rows: int):
+    from chapters.ch11.passover_merge_join import PassoverMergeJoinAnalyzer
+
+    analyzer = PassoverMergeJoinAnalyzer(num_records=rows)
+    return analyzer.run_all_analyses
+
+
+@benchmark_case('ch33_merge', '33', 'merge')
+def _ch33_merge(rows: int):
+    from chapters.ch33.grace_data import GraceDataGenerator
+    from chapters.ch33.merge_indicator_resolver import MergeIndicatorResolver
+
+    resolver = MergeIndicatorResolver(*GraceDataGenerator().generate_grace_data(rows))
+    return lambda: resolver.resolve_with_indicator(on='id', how='outer')
+
+
+def _ch36_construction(rows: int):
+    """ch36 건축 작업(rows행)과 장인 10명"""
+    from chapters.ch36.craftsmen_data import CraftsmenDataGenerator
+    from chapters.ch36.tabernacle_construction_data import TabernacleConstructionDataGenerator
+
+    return (TabernacleConstructionDataGenerator().generate_construction_data(rows),
+            CraftsmenDataGenerator().generate_craftsmen_data())
+
+
+@benchmark_case('ch36_merge', '36', 'merge')
+def _ch36_merge(rows: int):
+    from chapters.ch36.advanced_joining import AdvancedJoining
+
+    joining = AdvancedJoining(*_ch36_construction(rows))
+    return lambda: joining.merge_dataframes(left_on='assigned_craftsman_id', right_on='craftsman_id')
+
+
+# --- rolling ---
+
+@benchmark_case('ch16_rolling', '16', 'rolling')
+def _ch16_rolling(rows: int):
+    from chapters.ch16.manna_rolling_expanding import MannaRollingExpandingAnalyzer
+
+    analyzer = MannaRollingExpandingAnalyzer(num_records=rows)
+    return analyzer.run_all_analyses
+
+
+@benchmark_case('ch30_rolling', '30', 'rolling')
+def _ch30_rolling(rows: int):
+    from chapters.ch30.incense_altar_data import IncenseAltarDataGenerator
+    from chapters.ch30.time_series_analyzer import TimeSeriesAnalyzer
+
+    # 10⁷일은 나노초 날짜 범위를 넘으므로 분 단위 시계열 사용
+    analyzer = TimeSeriesAnalyzer(IncenseAltarDataGenerator().generate_incense_data(periods=rows, freq='min'))
+    return lambda: analyzer.perform_analysis(column='incense_amount', window=7)
+
+
+@benchmark_case('ch39_rolling', '39', 'rolling')
+def _ch39_rolling(rows: int):
+    from chapters.ch39.priestly_garments_data import PriestlyGarmentsDataGenerator
+    from chapters.ch39.time_series_analysis import TimeSeriesAnalysis
+
+    analysis = TimeSeriesAnalysis(PriestlyGarmentsDataGenerator().generate_garments_data(rows), 'date')
+    return lambda: analysis.rolling_average(window=7, column='progress_percentage')
+
+
+# --- pivot ---
+
+@benchmark_case('ch15_pivot', '15', 'pivot')
+def _ch15_pivot(rows: int):
+    from chapters.ch15.song_pivot_reshape import SongPivotReshapeAnalyzer
+
+    analyzer = SongPivotReshapeAnalyzer(num_records=rows)
+    return analyzer.analyze_pivot_table
+
+
+@benchmark_case('ch36_pivot', '36', 'pivot')
+def _ch36_pivot(rows: int):
+    import pandas as pd
+    from chapters.ch36.advanced_reshaping import AdvancedReshaping
+
+    construction, craftsmen = _ch36_construction(rows)
+    merged = pd.merge(construction, craftsmen, left_on='assigned_craftsman_id', right_on='craftsman_id')
+    reshaping = AdvancedReshaping(merged)
+    return lambda: reshaping.create_pivot_table(values='quantity_needed', index='name',
+                                                columns='component', aggfunc='sum')
+
+
+# --- dtype / eval / query ---
+
+def _ch31_tasks(rows: int):
+    from chapters.ch31.craftsmen_data import CraftsmenDataGenerator
+
+    return CraftsmenDataGenerator().generate_craftsmen_data(rows)
+
+
+@benchmark_case('ch31_dtype', '31', 'dtype')
+def _ch31_dtype(rows: int):
+    from chapters.ch31.dtype_tuner import DtypeTuner
+
+    tuner = DtypeTuner(_ch31_tasks(rows))
+    return tuner.optimize_dtypes
+
+
+@benchmark_case('ch31_dtype_arrow', '31', 'dtype')
+def _ch31_dtype_arrow(rows: int):
+    from chapters.ch31.dtype_tuner import DtypeTuner
+
+    tuner = DtypeTuner(_ch31_tasks(rows))
+    return lambda: tuner.optimize_dtypes(strategy='arrow')
+
+
+@benchmark_case('ch31_eval_query', '31', 'eval/query')
+def _ch31_eval_query(rows: int):
+    from chapters.ch31.eval_query_accelerator import EvalQueryAccelerator
+
+    accelerator = EvalQueryAccelerator(_ch31_tasks(rows))
+
+    def run():
+        accelerator.apply_eval("cost_per_minute = material_cost / time_spent_minutes")
+        return accelerator.apply_query("quality_score > 90 and craftsman == 'Bezalel'")
+    return run
+
+
+# --- IO ---
+
+def _ch35_round_trip(rows: int, handler_class, suffix: str):
+    from chapters.ch35.offering_data import OfferingDataGenerator
+
+    handler = handler_class(OfferingDataGenerator().generate_offering_data(rows))
+    path = str(Path(tempfile.gettempdir()) / f'jesusbornd_bench_{os.getpid()}{suffix}')
+
+    def run():
+        handler.save_data(path)
+        loaded = handler.load_data(path)
+        os.remove(path)
+        return loaded
+    return run
+
+
+@benchmark_case('ch35_csv_io', '35', 'io')
+def _ch35_csv_io(rows: int):
+    from chapters.ch35.csv_io_handler import CsvIOHandler
+
+    return _ch35_round_trip(rows, CsvIOHandler, '.csv')
+
+
+@benchmark_case('ch35_parquet_io', '35', 'io')
+def _ch35_parquet_io(rows: int):
+    from chapters.ch35.parquet_io_handler import ParquetIOHandler
+
+    return _ch35_round_trip(rows, ParquetIOHandler, '.parquet')
+
+
+@benchmark_case('ch35_parquet_dataset_query', '35', 'io')
+def _ch35_parquet_dataset_query(rows: int):
+    """월별 파티션 데이터셋에서 두 달치 세 컬럼만 읽기 (파티션/컬럼 가지치기)"""
+    from chapters.ch35.offering_data import OfferingDataGenerator
+    from chapters.ch35.parquet_io_handler import ParquetIOHandler
+
+    handler = ParquetIOHandler(OfferingDataGenerator().generate_offering_data(rows))
+    path = str(Path(tempfile.gettempdir()) / f'jesusbornd_bench_{os.getpid()}_dataset')
+    handler.save_dataset(path, month_from='offering_date')
+    atexit.register(shutil.rmtree, path, True)
+
+    def run():
+        return handler.load_dataset(path, columns=['offering_type', 'quantity', 'value_shekels'],
+                                    filters=[('month', 'in', ['1446-03', '1446-04'])])
+    return run
+
+
+def _cpu_model() -> str:
+    """CPU 모델 이름 (Linux에서 platform.processor()가 비어 있으면 /proc/cpuinfo)"""
+    model = platform.processor()
+    if not model and Path('/proc/cpuinfo').exists():
+        for line in Path('/proc/cpuinfo').read_text(encoding='utf-8', errors='ignore').splitlines():
+            if line.startswith('model name'):
+                return line.split(':', 1)[1].strip()
+    return model
+
+
+def machine_metadata() -> Dict[str, Any]:
+    """결과를 비교할 수 있는지 판단하기 위한 머신/패키지 정보"""
+    metadata = {
+        'system': platform.system(),
+        'release': platform.release(),
+        'machine': platform.machine(),
+        'processor': _cpu_model(),
+        'cpu_count': os.cpu_count(),
+        'python': platform.python_version(),
+    }
+    if hasattr(os, 'sysconf') and 'SC_PHYS_PAGES' in os.sysconf_names:
+        metadata['memory_gb'] = round(os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') / 1024 ** 3, 1)
+    for package in _BENCHMARK_PACKAGES:
+        try:
+            metadata[package] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            metadata[package] = None
+    return metadata
+
+
+def same_machine(a: Dict[str, Any], b: Dict[str, Any]) -> bool:
+    """두 결과가 같은 머신/패키지 버전에서 측정되었는지"""
+    return all(a.get(key) == b.get(key) for key in MACHINE_KEYS)
+
+
+def measure(case: BenchmarkCase, rows: int, repeat: int = 3) -> BenchmarkResult:
+    """연산 하나를 rows행에서 repeat번 측정 (데이터 준비는 제외, timeit처럼 측정 중 GC 끔)
+
+    reporting.quiet_output() 안에서는 reporting.print_frame()/synthetic.frame_preview()가 DataFrame을
+    문자열로 만들지 않으므로 측정 시간에는 pandas 연산만 들어갑니다 (tests/test_benchmark.py에서 확인).
+    """
+    if rows >= SINGLE_RUN_ROWS:
+        repeat = 1
+
+    times = []
+    with reporting.quiet_output(events=reporting._NullWriter()):
+        run = case.prepare(rows)
+        for _ in range(repeat):
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                run()
+                times.append(time.perf_counter() - start)
+            finally:
+                gc.enable()
+        del run
+    gc.collect()
+
+    return BenchmarkResult(case.name, case.chapter, case.operation, rows,
+                           best=min(times), median=statistics.median(times), times=times)
+
+
+def run_benchmarks(cases: Optional[Iterable[str]] = None, scales: Iterable[int] = DEFAULT_SCALES,
+                   repeat: int = 3, progress: bool = False) -> Dict[str, Any]:
+    """선택한 연산들을 각 행 수에서 측정
+
+    Args:
+        cases: 연산 이름들 (생략 시 전체, 예: ['ch09_groupby', 'ch35_csv_io'])
+        scales: 행 수 지수들 (3 → 10³행)
+        repeat: 반복 측정 횟수 (10⁷행 이상은 1회)
+        progress: True이면 측정할 때마다 한 줄씩 출력
+
+    Returns:
+        dict: {'created', 'machine', 'results': [BenchmarkResult 딕셔너리, ...]}
+    """
+    names = list(CASES) if cases is None else list(cases)
+    unknown = [name for name in names if name not in CASES]
+    if unknown:
+        raise ValueError(f"알 수 없는 벤치마크입니다: {unknown} (가능: {sorted(CASES)})")
+
+    results = []
+    for scale in scales:
+        for name in names:
+            result = measure(CASES[name], 10 ** scale, repeat)
+            results.append(asdict(result))
+            if progress:
+                print(f"  {name:<18}{result.rows:>12,}행  {result.best:>10.4f}초")
+
+    return {'created': datetime.now().isoformat(timespec='seconds'),
+            'machine': machine_metadata(), 'results': results}
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = DEFAULT_TOLERANCE,
+            min_seconds: Optional[float] = None) -> List[Dict[str, Any]]:
+    """기준선보다 느려진 (연산, 행 수) 목록
+
+    최솟값(best)끼리 비교해 baseline * (1 + tolerance)를 넘고 차이가 min_seconds 이상이면 회귀로 봅니다.
+    min_seconds를 생략하면 호출 시점의 MIN_REGRESSION_SECONDS를 씁니다.
+    기준선에 없는 측정은 비교하지 않습니다.
+    """
+    if min_seconds is None:
+        min_seconds = MIN_REGRESSION_SECONDS
+    reference = {(result['case'], result['rows']): result['best'] for result in baseline['results']}
+    regressions = []
+    for result in report['results']:
+        before = reference.get((result['case'], result['rows']))
+        if before is None:
+            continue
+        if result['best'] > before * (1 + tolerance) and result['best'] - before >= min_seconds:
+            regressions.append({'case': result['case'], 'rows': result['rows'], 'baseline': before,
+                                'current': result['best'], 'ratio': result['best'] / before})
+    return regressions
+
+
+def save_report(report: Dict[str, Any], path: Path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def load_report(path: Path) -> Optional[Dict[str, Any]]:
+    """저장된 결과/기준선 (없으면 None)"""
+    if not Path(path).exists():
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JesusBornd 챕터 연산 벤치마크")
+    parser.add_argument("--cases", nargs="*", default=None, help="측정할 연산 (생략 시 전체, --list로 확인)")
+    parser.add_argument("--scales", nargs="*", type=int, default=list(DEFAULT_SCALES),
+                        help="행 수 지수 (기본값: 3 5 7 → 10³, 10⁵, 10⁷행)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 측정 횟수 (10⁷행 이상은 1회)")
+    parser.add_argument("--output", type=Path, default=RESULT_PATH, help="결과 JSON 파일")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="비교할 기준선 JSON 파일")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준선으로 저장 (비교하지 않음)")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="기준선 대비 허용 비율 (기본값: 0.5 = 50%%)")
+    parser.add_argument("--min-seconds", type=float, default=None,
+                        help=f"회귀로 볼 최소 차이 (초, 기본값: {MIN_REGRESSION_SECONDS})")
+    parser.add_argument("--ignore-machine", action="store_true", help="머신 정보가 달라도 기준선과 비교")
+    parser.add_argument("--list", action="store_true", help="연산 목록만 출력")
+    args = parser.parse_args()
+
+    if args.list:
+        for case in CASES.values():
+            print(f"{case.name:<18}ch{case.chapter}  {case.operation}")
+        return 0
+
+    print(f"📏 벤치마크: {', '.join(f'10^{scale}' for scale in args.scales)}행, 반복 {args.repeat}회")
+    report = run_benchmarks(args.cases, args.scales, args.repeat, progress=True)
+    save_report(report, args.output)
+    print(f"📁 결과 저장: {args.output}")
+
+    if args.save_baseline:
+        save_report(report, args.baseline)
+        print(f"📁 기준선 저장: {args.baseline}")
+        return 0
+
+    baseline = load_report(args.baseline)
+    if baseline is None:
+        print(f"⚠️ 기준선이 없습니다 ({args.baseline}). --save-baseline으로 먼저 저장하세요.")
+        return EXIT_NO_BASELINE
+    if not (args.ignore_machine or same_machine(report['machine'], baseline['machine'])):
+        print("⚠️ 기준선과 머신/패키지 정보가 달라 비교하지 않습니다 (--ignore-machine으로 강제).")
+        return EXIT_NO_BASELINE
+
+    regressions = compare(report, baseline, args.tolerance, args.min_seconds)
+    for regression in regressions:
+        print(f"❌ {regression['case']} ({regression['rows']:,}행): "
+              f"{regression['baseline']:.4f}초 → {regression['current']:.4f}초 (x{regression['ratio']:.2f})")
+    if regressions:
+        print(f"❌ 기준선보다 느려진 측정 {len(regressions)}개")
+        return EXIT_REGRESSION
+    print("✅ 기준선 대비 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
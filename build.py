@@ -0,0 +1,235 @@
+"""
+JesusBornd 증분 빌드
+챕터별 산출물(PNG, HTML, CSV/Parquet, results.json)과 그 산출물이 의존하는 모듈/데이터를 그래프로 기록하고,
+의존 파일이나 실행 환경(파이썬/pandas/numpy 버전)이 바뀐 챕터만 다시 빌드합니다 (make처럼). 서로 독립인 챕터는 병렬로 빌드합니다.
+
+"지혜로운 건축자와 같이 내가 터를 닦아 두매" (고전 3:10)
+
+사용법:
+    python build.py                 # 오래된(stale) 챕터만 다시 빌드
+    python build.py 27 28 -j 2      # 일부 챕터만
+    python build.py --dry-run       # 무엇을 다시 빌드할지만 출력
+    python build.py --graph         # 챕터별 의존 모듈/데이터 출력
+"""
+
+import argparse
+import hashlib
+import json
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import run_chapters
+from run_chapters import (DATA_INPUTS, PROJECT_ROOT, _normalize_chapter, discover_chapters,
+                          module_dependencies, reads_shared_data, run_chapter, shared_inputs_digest)
+
+# 빌드 산출물 디렉토리와 빌드 그래프 매니페스트
+BUILD_DIR = PROJECT_ROOT / 'build'
+MANIFEST_NAME = 'manifest.json'
+
+
+@dataclass
+class BuildNode:
+    """챕터 하나의 빌드 노드: 의존 파일들 → 산출물 디렉토리"""
+    chapter: str
+    output_dir: Path
+    modules: List[Path]
+    data: List[Path] = field(default_factory=list)
+
+    @property
+    def deps(self) -> List[Path]:
+        return self.modules + self.data
+
+
+def build_graph(chapters: Optional[Iterable] = None) -> Dict[str, BuildNode]:
+    """챕터별 빌드 노드 (의존 모듈 + bible_utils를 거치는 챕터는 설정/데이터 파일)"""
+    available = discover_chapters(run_chapters.CHAPTERS_DIR)
+    chapters = available if chapters is None else [_normalize_chapter(chapter) for chapter in chapters]
+    missing = [chapter for chapter in chapters if chapter not in available]
+    if missing:
+        raise ValueError(f"run_chapterNN 진입점이 없는 챕터입니다: {missing}")
+
+    data_files = sorted(path for pattern in DATA_INPUTS for path in PROJECT_ROOT.glob(pattern) if path.is_file())
+    graph = {}
+    for chapter in chapters:
+        modules = module_dependencies(run_chapters.CHAPTERS_DIR / f'ch{chapter}' / '__main__.py')
+        graph[chapter] = BuildNode(chapter, BUILD_DIR / f'ch{chapter}', modules,
+                                   data_files if reads_shared_data(modules) else [])
+    return graph
+
+
+def _file_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _relative(path: Path) -> str:
+    return path.relative_to(PROJECT_ROOT).as_posix()
+
+
+def load_manifest() -> Dict:
+    """이전 빌드 기록 (챕터별 의존 파일 해시와 산출물)"""
+    try:
+        with open(BUILD_DIR / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(manifest: Dict):
+    BUILD_DIR.mkdir(parents=True, exist_ok=True)
+    with open(BUILD_DIR / MANIFEST_NAME, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def stale_reason(node: BuildNode, manifest: Dict, environment: Optional[str] = None) -> Optional[str]:
+    """노드를 다시 빌드해야 하는 이유 (최신이면 None)
+
+    environment는 run_chapters.shared_inputs_digest()와 같은 실행 환경 해시입니다 (생략 시 계산).
+    """
+    entry = manifest.get(node.chapter)
+    if entry is None:
+        return "빌드 기록 없음"
+    if entry.get('status') != 'ok':
+        return "이전 빌드 실패"
+    if entry.get('environment') != (environment or shared_inputs_digest()):
+        return "실행 환경 변경 (파이썬/pandas/numpy 버전)"
+
+    recorded = entry.get('deps', {})
+    current = {_relative(path) for path in node.deps}
+    if set(recorded) != current:
+        return "의존 파일 구성 변경"
+    for dep in sorted(current):
+        if recorded[dep] != _file_hash(PROJECT_ROOT / dep):
+            return f"변경됨: {dep}"
+    for artifact in entry.get('artifacts', []):
+        if not (node.output_dir / artifact).exists():
+            return f"산출물 없음: {artifact}"
+    return None
+
+
+def _jsonable(value: Any) -> Any:
+    """results.json용 변환 (DataFrame/Series는 모양과 컬럼만, 나머지는 repr)"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, dict):
+        return {str(key): _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    if hasattr(value, 'shape') and hasattr(value, 'dtypes'):
+        summary = {'type': type(value).__name__, 'shape': list(value.shape)}
+        if hasattr(value, 'columns'):
+            summary['columns'] = [str(col) for col in value.columns]
+        return summary
+    return repr(value)
+
+
+def build_node(node: BuildNode) -> Dict:
+    """노드 하나 빌드 (워커 프로세스에서 호출): 산출물 디렉토리를 비우고 챕터 실행"""
+    if node.output_dir.exists():
+        shutil.rmtree(node.output_dir)
+    node.output_dir.mkdir(parents=True)
+
+    run = run_chapter(node.chapter, log_dir=node.output_dir, output_dir=node.output_dir)
+    with open(node.output_dir / 'results.json', 'w', encoding='utf-8') as f:
+        json.dump(_jsonable(run.results), f, ensure_ascii=False, indent=2)
+
+    return {
+        'status': run.status,
+        'error': run.error,
+        'wall_time': run.wall_time,
+        'peak_rss_mb': run.peak_rss_mb,
+        'built_at': datetime.now().isoformat(timespec='seconds'),
+        'environment': shared_inputs_digest(),
+        'deps': {_relative(path): _file_hash(path) for path in node.deps},
+        'artifacts': sorted(path.relative_to(node.output_dir).as_posix()
+                            for path in node.output_dir.rglob('*') if path.is_file()),
+    }
+
+
+def build(chapters: Optional[Iterable] = None, workers: Optional[int] = None,
+          force: bool = False, dry_run: bool = False) -> Dict[str, Optional[str]]:
+    """오래된 챕터만 다시 빌드
+
+    챕터 노드들은 소스/데이터 파일에만 의존하고 서로 의존하지 않으므로 오래된 노드 전체를
+    프로세스 풀에서 동시에 빌드합니다.
+
+    Args:
+        chapters: 대상 챕터들 (생략 시 전체)
+        workers: 워커 프로세스 수 (생략 시 CPU 수)
+        force: True이면 최신이어도 다시 빌드
+        dry_run: True이면 빌드하지 않고 이유만 반환
+
+    Returns:
+        Dict[str, Optional[str]]: 챕터별 다시 빌드한(할) 이유, 최신이면 None
+    """
+    graph = build_graph(chapters)
+    manifest = load_manifest()
+    environment = shared_inputs_digest()
+    reasons = {chapter: ("강제 빌드" if force else stale_reason(node, manifest, environment))
+               for chapter, node in graph.items()}
+    stale = [chapter for chapter, reason in reasons.items() if reason]
+    if dry_run or not stale:
+        return reasons
+
+    with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1) as pool:
+        futures = {chapter: pool.submit(build_node, graph[chapter]) for chapter in stale}
+        for chapter, future in futures.items():
+            manifest[chapter] = future.result()
+            _save_manifest(manifest)  # 중간에 중단돼도 끝난 노드는 기록
+    return reasons
+
+
+def print_graph(graph: Dict[str, BuildNode]):
+    """챕터별 의존 모듈/데이터 출력"""
+    for chapter, node in graph.items():
+        print(f"ch{chapter} → {node.output_dir}/")
+        for path in node.modules:
+            print(f"    📄 {_relative(path)}")
+        if node.data:
+            print(f"    📊 설정/데이터 {len(node.data)}개 ({', '.join(DATA_INPUTS)})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JesusBornd 증분 빌드 (바뀐 챕터만 다시 빌드)")
+    parser.add_argument("chapters", nargs="*", help="빌드할 챕터 번호 (예: 27 28, 생략 시 전체)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="동시에 빌드할 챕터 수 (기본값: CPU 수)")
+    parser.add_argument("-B", "--always-make", action="store_true", help="최신이어도 모두 다시 빌드")
+    parser.add_argument("-n", "--dry-run", action="store_true", help="다시 빌드할 챕터와 이유만 출력")
+    parser.add_argument("--graph", action="store_true", help="빌드 그래프(의존 모듈/데이터) 출력")
+    args = parser.parse_args()
+
+    targets = args.chapters or None
+    if args.graph:
+        print_graph(build_graph(targets))
+        return 0
+
+    start = time.perf_counter()
+    reasons = build(targets, workers=args.jobs, force=args.always_make, dry_run=args.dry_run)
+    manifest = load_manifest()
+
+    failed = 0
+    for chapter, reason in reasons.items():
+        if reason is None:
+            print(f"ch{chapter}  ✔ 최신")
+        elif args.dry_run:
+            print(f"ch{chapter}  ⟳ 다시 빌드 예정 ({reason})")
+        else:
+            entry = manifest.get(chapter, {})
+            ok = entry.get('status') == 'ok'
+            failed += not ok
+            print(f"ch{chapter}  {'✅' if ok else '❌'} 빌드 ({reason}) "
+                  f"{entry.get('wall_time', 0):.2f}s {entry.get('error') or ''}")
+
+    rebuilt = sum(reason is not None for reason in reasons.values())
+    print(f"\n총 {len(reasons)}개 챕터 중 {rebuilt}개 {'다시 빌드 예정' if args.dry_run else '다시 빌드'}"
+          f", 실패 {failed}개, {time.perf_counter() - start:.2f}초")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
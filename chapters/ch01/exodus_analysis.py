@@ -14,6 +14,7 @@ import sys
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
+from utils import reporting
 from utils.bible_utils import load_twelve_tribes, calculate_leah_spiritual_journey,load_exodus
 
 class TwelveTribesAnalyzer:
@@ -46,7 +47,7 @@ class TwelveTribesAnalyzer:
         })
 
         print("✨ 첫 번째 DataFrame이 창조되었습니다!")
-        print(basic_four)
+        reporting.print_frame(basic_four)
         print(f"\n📊 총 인원: {len(basic_four)}명")
 
         return basic_four
@@ -70,7 +71,7 @@ class TwelveTribesAnalyzer:
         })
 
         print("🏺 12지파 데이터가 완성되었습니다!")
-        print(complete_tribes.head())
+        reporting.print_frame(complete_tribes.head())
         print(f"\n📊 총 지파 수: {len(complete_tribes)}개 (완전수 12)")
 
         return complete_tribes
@@ -83,7 +84,7 @@ class TwelveTribesAnalyzer:
         complete_df.info()
 
         print("\n📊 기본 통계:")
-        print(complete_df.describe(include='all'))
+        reporting.print_frame(complete_df.describe(include='all'))
 
     def analyze_mothers_distribution(self) -> pd.Series:
         """어머니별 아들 수 분석 - 하나님의 공평하심
@@ -94,7 +95,7 @@ class TwelveTribesAnalyzer:
         mothers_count = self.tribes_data['mother'].value_counts()
 
         print("👥 어머니별 아들 수:")
-        print(mothers_count)
+        reporting.print_frame(mothers_count)
 
         return mothers_count
 
@@ -14,6 +14,7 @@ import sys
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
+from utils import reporting
 from utils.bible_utils import (
     load_john_concepts, 
     analyze_light_darkness_ratio,
@@ -52,7 +53,7 @@ class JohnChapter1Analyzer:
         })
         
         print("📜 요한복음 1장 핵심 개념:")
-        print(core_concepts)
+        reporting.print_frame(core_concepts)
         
         # 가장 중요한 개념 찾기
         most_important_idx = core_concepts['중요도'].idxmax()
@@ -79,7 +80,7 @@ class JohnChapter1Analyzer:
         })
         
         print("🌟 중요도 8 이상인 핵심 개념들:")
-        print(high_importance)
+        reporting.print_frame(high_importance)
         
         return high_importance
         
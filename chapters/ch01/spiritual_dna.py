@@ -15,6 +15,7 @@ from typing import List, Dict
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
+from utils import reporting
 from utils.bible_utils import SpiritualMetrics
 
 class PersonalSpiritualDNA:
@@ -69,7 +70,7 @@ class PersonalSpiritualDNA:
         })
         
         print(f"📖 {self.name}의 신앙 여정:")
-        print(self.spiritual_journey)
+        reporting.print_frame(self.spiritual_journey)
         
         return self.spiritual_journey
         
@@ -140,7 +141,7 @@ class PersonalSpiritualDNA:
         complete_journey = pd.concat([self.spiritual_journey, future_plan], ignore_index=True)
         
         print(f"\n🚀 완전한 신앙 여정 ({future_year} 계획 포함):")
-        print(complete_journey)
+        reporting.print_frame(complete_journey)
         
         return complete_journey
         
@@ -207,7 +208,7 @@ class PersonalSpiritualDNA:
         })
         
         print("💡 나의 영적 빛과 어둠 비율:")
-        print(self.light_balance)
+        reporting.print_frame(self.light_balance)
         
         current_ratio = light_experiences / dark_experiences if dark_experiences > 0 else float('inf')
         john_ratio = 2.5  # 요한복음의 빛:어둠 비율
@@ -253,7 +254,7 @@ class PersonalSpiritualDNA:
         })
         
         print("⚖️ 나의 은혜와 진리 균형 점검:")
-        print(self.grace_truth_balance)
+        reporting.print_frame(self.grace_truth_balance)
         
         grace_score = grace_actions * 8 / 10  # 만족도 가중
         truth_score = truth_studies * 7 / 10
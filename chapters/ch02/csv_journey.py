@@ -10,6 +10,7 @@ import numpy as np
 from datetime import datetime, timedelta
 from pathlib import Path
 import random
+from utils import reporting
 
 class PersonalCSVJourney:
     """개인의 CSV 여정 클래스"""
@@ -56,7 +57,7 @@ class PersonalCSVJourney:
         })
         
         print("📝 원본 기록 (갈대상자 내용물):")
-        print(self.journey_data)
+        reporting.print_frame(self.journey_data)
 
         
         # CSV로 저장 (갈대상자에 담기)
@@ -332,7 +333,7 @@ class PersonalCSVJourney:
             ]
         })
         
-        print(comparison.to_string(index=False))
+        reporting.print_frame(comparison, index=False)
         
         return comparison
 
@@ -14,6 +14,7 @@ import sys
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
+from utils import reporting
 from utils.bible_utils import load_john_concepts
 
 class LambDiscoveryAnalyzer:
@@ -67,7 +68,7 @@ class LambDiscoveryAnalyzer:
             ]
         })
         
-        print(behold_data.to_string(index=False))
+        reporting.print_frame(behold_data, index=False)
         
         print("\n💡 통찰:")
         print("   '보라'는 단순한 시각적 관찰이 아닌")
@@ -149,7 +150,7 @@ class LambDiscoveryAnalyzer:
             ]
         })
         
-        print(comparison.to_string(index=False))
+        reporting.print_frame(comparison, index=False)
         
         print("\n🔗 공통점:")
         print("   1. 물가에서의 발견 (데이터의 흐름)")
@@ -181,7 +182,7 @@ class LambDiscoveryAnalyzer:
             ]
         })
         
-        print(bearing_pattern.to_string(index=False))
+        reporting.print_frame(bearing_pattern, index=False)
         
         print("\n✝️ 영적 통찰:")
         print("   어린양이 세상 죄를 지고 가듯,")
@@ -229,7 +230,7 @@ class LambDiscoveryAnalyzer:
             'significance': [5, 7, 8, 10, 5, 7, 8, 10]
         })
         
-        print(timeline.to_string(index=False))
+        reporting.print_frame(timeline, index=False)
         
         # 시각적 타임라인
         print("\n📊 중요도 시각화:")
@@ -246,7 +247,7 @@ class LambDiscoveryAnalyzer:
         
         # 1. 어린양 참조 구절들
         print("📖 어린양 관련 성경 구절:")
-        print(self.lamb_references[['verse_ref', 'lamb_type', 'csv_parallel']])
+        reporting.print_frame(self.lamb_references[['verse_ref', 'lamb_type', 'csv_parallel']])
         print("\n" + "="*50 + "\n")
         
         # 2. '보라' 패턴 분석
@@ -14,6 +14,7 @@ import sys
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
+from utils import reporting
 from utils.bible_utils import get_hebrew_meaning
 
 class MosesRescueAnalyzer:
@@ -48,7 +49,7 @@ class MosesRescueAnalyzer:
         
         print(f"✅ 갈대 상자가 준비되었습니다: {filepath}")
         print(f"📦 담긴 데이터:")
-        print(self.moses_family_data)
+        reporting.print_frame(self.moses_family_data)
         
         # 파일 정보
         file_size = Path(filepath).stat().st_size
@@ -116,7 +117,7 @@ class MosesRescueAnalyzer:
         missing_report = missing_report[missing_report['결측치_개수'] > 0]
         
         print("⚠️ 발견된 결측치 (숨겨진 모세):")
-        print(missing_report)
+        reporting.print_frame(missing_report)
         
         print("\n💭 영적 통찰:")
         print("   갈대 숲에 숨겨진 모세처럼,")
@@ -176,7 +177,7 @@ class MosesRescueAnalyzer:
             ]
         })
         
-        print(name_meanings.to_string(index=False))
+        reporting.print_frame(name_meanings, index=False)
         
         print("\n✨ 통찰: 각 이름이 데이터 처리 과정의 한 단계를 상징합니다.")
         
@@ -5,6 +5,7 @@
 
 import pandas as pd
 import numpy as np
+from utils import reporting
 
 
 def analyze_burning_bush():
@@ -21,7 +22,7 @@ def analyze_burning_bush():
 
     print("🔥 하나님의 이름 계시")
     print("=" * 50)
-    print(divine_names)
+    reporting.print_frame(divine_names)
 
     # 모세의 반응 단계
     moses_response = pd.Series({
@@ -44,7 +45,7 @@ def analyze_burning_bush():
     })
 
     print("\n⛰️ 거룩한 땅:")
-    print(holy_ground)
+    reporting.print_frame(holy_ground)
 
     return divine_names, moses_response, holy_ground
 
@@ -64,7 +65,7 @@ def analyze_divine_revelation():
     })
 
     print("\n✨ 하나님의 자기 계시 구조:")
-    print(revelation_structure)
+    reporting.print_frame(revelation_structure)
 
     return revelation_structure
 
@@ -81,7 +82,7 @@ def compare_theophanies():
     })
 
     print("\n🌟 구약의 주요 신현 사건:")
-    print(theophanies)
+    reporting.print_frame(theophanies)
 
     return theophanies
 
@@ -5,6 +5,7 @@
 
 import pandas as pd
 import numpy as np
+from utils import reporting
 
 
 def analyze_water_jars():
@@ -21,7 +22,7 @@ def analyze_water_jars():
 
     print("💧 6개 돌 항아리 분석")
     print("=" * 50)
-    print(jars_df)
+    reporting.print_frame(jars_df)
 
     total_capacity = jars_df['용량_리터'].sum()
     print(f"\n총 용량: {total_capacity} 리터")
@@ -54,7 +55,7 @@ def analyze_transformation_process():
     })
 
     print("\n🍷 변환 과정 분석:")
-    print(process)
+    reporting.print_frame(process)
 
     # 품질 변화
     quality = pd.Series({
@@ -65,7 +66,7 @@ def analyze_transformation_process():
     })
 
     print("\n📊 품질 지수:")
-    print(quality)
+    reporting.print_frame(quality)
     print(f"품질 향상: {quality.iloc[-1] - quality.iloc[0]} 포인트")
 
     return process, quality
@@ -81,7 +82,7 @@ def compare_water_blood_transformation():
     })
 
     print("\n⚖️ 물 변환 비교:")
-    print(comparison.set_index('항목'))
+    reporting.print_frame(comparison.set_index('항목'))
 
     return comparison
 
@@ -101,7 +102,7 @@ def analyze_wedding_context():
     })
 
     print("\n🎊 혼인잔치 문화적 배경:")
-    print(cultural_context)
+    reporting.print_frame(cultural_context)
 
     # 시간대별 포도주 소비 패턴 (가상)
     consumption = pd.Series({
@@ -115,7 +116,7 @@ def analyze_wedding_context():
     })
 
     print("\n📉 일반적 포도주 소비 패턴:")
-    print(consumption)
+    reporting.print_frame(consumption)
 
     return cultural_context, consumption
 
@@ -137,14 +138,14 @@ def analyze_disciples_faith():
     })
 
     print("\n📈 제자들의 믿음 성장:")
-    print(faith_growth)
+    reporting.print_frame(faith_growth)
 
     # 믿음 성장률
     growth_rate = faith_growth['믿음수준'].pct_change() * 100
     faith_growth['성장률%'] = growth_rate.fillna(0).round(1)
 
     print("\n믿음 성장률:")
-    print(faith_growth[['사건', '믿음수준', '성장률%']])
+    reporting.print_frame(faith_growth[['사건', '믿음수준', '성장률%']])
 
     return faith_growth
 
@@ -8,6 +8,7 @@ Chapter 03. 신(神)의 능력과 표적 — Series와 DataFrame의 변환
 
 import pandas as pd
 import numpy as np
+from utils import reporting
 
 
 def main():
@@ -59,7 +60,7 @@ def create_dialogue_series():
         '하나님': gods_responses
     })
 
-    print(dialogue_df)
+    reporting.print_frame(dialogue_df)
     return dialogue_df
 
 
@@ -123,13 +124,13 @@ def practice_transformations():
     # 방법1: to_frame()
     df1 = names.to_frame('히브리어')
     print("to_frame() 결과:")
-    print(df1)
+    reporting.print_frame(df1)
 
     # 방법2: reset_index()
     df2 = names.reset_index()
     df2.columns = ['한글', '히브리어']
     print("\nreset_index() 결과:")
-    print(df2)
+    reporting.print_frame(df2)
 
     return df2
 
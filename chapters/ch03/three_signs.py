@@ -5,6 +5,7 @@
 
 import pandas as pd
 import numpy as np
+from utils import reporting
 
 
 def create_signs_matrix():
@@ -24,7 +25,7 @@ def create_signs_matrix():
 
     print("🔮 세 가지 표적 상세 분석")
     print("=" * 60)
-    print(signs_detail)
+    reporting.print_frame(signs_detail)
 
     return signs_detail
 
@@ -53,7 +54,7 @@ def analyze_sign_progression():
     })
 
     print("\n📊 표적의 점진적 강화:")
-    print(progression_df)
+    reporting.print_frame(progression_df)
     print(f"\n평균 영향력: {impact.mean():.1f}")
     print(f"증가율: {(impact.iloc[-1] / impact.iloc[0] - 1) * 100:.0f}%")
 
@@ -70,7 +71,7 @@ def compare_exodus_john_signs():
     })
 
     print("\n✝️ 모세와 예수의 첫 표적 비교:")
-    print(comparison)
+    reporting.print_frame(comparison)
 
     # 요한복음 7표적
     john_signs = pd.Series({
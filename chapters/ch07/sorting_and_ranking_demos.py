@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+from utils import reporting
 
 def demo_sort_values():
     """sort_values 데모: 재앙의 심각성 순서"""
@@ -11,17 +12,17 @@ def demo_sort_values():
         '피해_점수': [8, 6, 4, 7, 9], # 1-10
         '발생_순서': [1, 2, 3, 4, 5]
     })
-    print(plague_impact)
+    reporting.print_frame(plague_impact)
 
     # '피해_점수'를 기준으로 내림차순 정렬
     sorted_by_damage = plague_impact.sort_values(by='피해_점수', ascending=False)
     print("\n🔄 '피해_점수' 내림차순 정렬:")
-    print(sorted_by_damage)
+    reporting.print_frame(sorted_by_damage)
 
     # '발생_순서'를 기준으로 오름차순 정렬
     sorted_by_order = plague_impact.sort_values(by='발생_순서', ascending=True)
     print("\n🔄 '발생_순서' 오름차순 정렬:")
-    print(sorted_by_order)
+    reporting.print_frame(sorted_by_order)
 
     return plague_impact
 
@@ -37,12 +38,12 @@ def demo_sort_index():
 
     # 인덱스 순서를 섞음
     shuffled_verses = bible_verses.sample(frac=1, random_state=42)
-    print(shuffled_verses)
+    reporting.print_frame(shuffled_verses)
 
     # 인덱스를 기준으로 정렬
     sorted_by_index = shuffled_verses.sort_index()
     print("\n🔄 인덱스 기준으로 정렬:")
-    print(sorted_by_index)
+    reporting.print_frame(sorted_by_index)
 
     return bible_verses
 
@@ -56,22 +57,22 @@ def demo_rank():
         '성숙도_점수': [85, 92, 88, 70, 95], # 0-100
         '봉사_헌신도': [90, 85, 88, 75, 98]
     })
-    print(spiritual_growth)
+    reporting.print_frame(spiritual_growth)
 
     # '성숙도_점수'에 따른 순위 (내림차순, 동일 점수는 평균 순위 부여)
     spiritual_growth['성숙도_순위'] = spiritual_growth['성숙도_점수'].rank(ascending=False, method='average')
     print("\n🔄 '성숙도_점수' 순위:")
-    print(spiritual_growth[['인물', '성숙도_점수', '성숙도_순위']].sort_values(by='성숙도_순위'))
+    reporting.print_frame(spiritual_growth[['인물', '성숙도_점수', '성숙도_순위']].sort_values(by='성숙도_순위'))
 
     # '봉사_헌신도'에 따른 순위 (오름차순, 동일 점수는 가장 낮은 순위 부여)
     spiritual_growth['헌신도_순위'] = spiritual_growth['봉사_헌신도'].rank(ascending=True, method='min')
     print("\n🔄 '봉사_헌신도' 순위:")
-    print(spiritual_growth[['인물', '봉사_헌신도', '헌신도_순위']].sort_values(by='헌신도_순위'))
+    reporting.print_frame(spiritual_growth[['인물', '봉사_헌신도', '헌신도_순위']].sort_values(by='헌신도_순위'))
 
     # 가장 높은 순위 (숫자가 작을수록 높음) 2명 찾기 (성숙도 기준)
     top_2_mature = spiritual_growth.nsmallest(2, '성숙도_순위')
     print("\n✨ 가장 성숙도가 높은 2명:")
-    print(top_2_mature[['인물', '성숙도_점수', '성숙도_순위']])
+    reporting.print_frame(top_2_mature[['인물', '성숙도_점수', '성숙도_순위']])
 
     return spiritual_growth
 
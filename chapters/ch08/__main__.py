@@ -18,6 +18,7 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
 # 절대 임포트 사용
+from utils import reporting
 from chapters.ch08.goshen_data import GoshenDataGenerator
 from chapters.ch08.masking_operations import MaskingOperations
 from chapters.ch08.query_filtering import QueryFiltering
@@ -50,7 +51,7 @@ def run_goshen_data_generation():
         generator = GoshenDataGenerator()
         data = generator.generate_goshen_data()
         print("\n✅ 고센 데이터 생성 완료:")
-        print(data.head())
+        reporting.print_frame(data.head())
         return data
     except Exception as e:
         print(f"❌ 고센 데이터 생성 중 오류 발생: {e}")
@@ -71,8 +72,8 @@ def run_masking_operations(df):
         masked_df = masker.apply_masking('plague_affected', condition_value=True, mask_value='Unaffected')
         where_df = masker.apply_where('is_israelite', condition_value=False, where_value='Egyptian')
         print("\n✅ 마스킹 연산 적용 완료 (일부):")
-        print(masked_df.head())
-        print(where_df.head())
+        reporting.print_frame(masked_df.head())
+        reporting.print_frame(where_df.head())
         return {'masked_df': masked_df, 'where_df': where_df}
     except Exception as e:
         print(f"❌ 마스킹 연산 중 오류 발생: {e}")
@@ -92,7 +93,7 @@ def run_query_filtering(df):
         query_filter = QueryFiltering(df)
         filtered_df = query_filter.apply_query("population_density > 500 and is_israelite == True")
         print("\n✅ 쿼리 필터링 적용 완료 (일부):")
-        print(filtered_df.head())
+        reporting.print_frame(filtered_df.head())
         return filtered_df
     except Exception as e:
         print(f"❌ 쿼리 필터링 중 오류 발생: {e}")
@@ -112,7 +113,7 @@ def run_distinction_analysis(df):
         analyzer = DistinctionAnalysis(df)
         analysis_results = analyzer.analyze_distinctions('is_israelite', 'plague_affected')
         print("\n✅ 구분 분석 완료:")
-        print(analysis_results)
+        reporting.print_frame(analysis_results)
         return analysis_results
     except Exception as e:
         print(f"❌ 구분 분석 중 오류 발생: {e}")
@@ -1,7 +1,10 @@
 import pandas as pd
+from typing import Optional
+from utils import reporting
+from utils.instrumentation import InstrumentedAnalyzerMixin
 from .officials_son_data import OfficialsSonDataGenerator
 
-class OfficialsSonAggregationAnalyzer:
+class OfficialsSonAggregationAnalyzer(InstrumentedAnalyzerMixin):
     """
     요한복음 4장의 왕의 신하의 아들 치유 데이터를 집계하여 분석하는 클래스.
     신하의 믿음 성장과 예수님 말씀의 능력을 통계적으로 탐구합니다.
@@ -10,13 +13,17 @@ class OfficialsSonAggregationAnalyzer:
     Statistically explores the official's growth in faith and the power of Jesus' word.
     """
 
-    def __init__(self):
+    def __init__(self, num_records: Optional[int] = None):
         """
         분석기 초기화 및 데이터 생성.
         Initializes the analyzer and generates data.
+
+        Args:
+            num_records (int, optional): 생성기에 넘길 레코드 수 (생략 시 기본 데이터).
+                Number of records passed to the data generator (defaults to the base data).
         """
         self.data_generator = OfficialsSonDataGenerator()
-        self.healing_df = self.data_generator.generate_detailed_healing_data()
+        self.healing_df = self.data_generator.generate_detailed_healing_data(num_records)
 
     def analyze_faith_level_summary(self):
         """
@@ -32,7 +39,7 @@ class OfficialsSonAggregationAnalyzer:
         print("Summarizing the changes in the royal official's faith level numerically.")
 
         summary = self.healing_df['officials_faith_level'].describe()
-        print(summary)
+        reporting.print_frame(summary)
 
         print("\n💡 통찰 (Insight): `describe()`는 믿음이 예수님의 말씀을 통해 어떻게 성장하고 확신에 이르는지 보여줍니다.")
         print("Insight: `describe()` shows how faith grows and leads to conviction through Jesus' word.")
@@ -1,5 +1,7 @@
 import pandas as pd
 import numpy as np
+from typing import Optional
+from utils.synthetic import frame_preview, tile_frame
 
 class OfficialsSonDataGenerator:
     """
@@ -24,21 +26,25 @@ class OfficialsSonDataGenerator:
         return pd.DataFrame({
             'event_order': [1, 2, 3, 4, 5],
             'event_name_kr': ['간청', '예수님 말씀', '믿고 돌아감', '종들의 보고', '완치 확인'],
-            'event_name_en': ['Plea', 'Jesus', 'Word', 'Believed & Departed', 'Servants', 'Report', 'Healing Confirmed'],
+            'event_name_en': ['Plea', "Jesus' Word", 'Believed & Departed', "Servants' Report", 'Healing Confirmed'],
             'time_elapsed_hours': [0, 0.5, 1, 23, 24], # 예수님 말씀 시점부터 경과 시간
             'son_fever_level': [40.0, 40.0, 39.5, 36.5, 36.5], # 아들의 열 수준 (섭씨)
             'officials_faith_level': [70, 85, 95, 100, 100] # 신하의 믿음 수준 (0-100)
         })
 
-    def generate_detailed_healing_data(self) -> pd.DataFrame:
+    def generate_detailed_healing_data(self, num_records: Optional[int] = None) -> pd.DataFrame:
         """
         상세한 치유 여정 데이터를 생성합니다.
         Generates detailed healing journey data.
 
+        Args:
+            num_records (int, optional): 생성할 레코드 수. 생략하면 치유 사건 5개, 주면 같은 행을 반복해 늘립니다.
+                Number of records; defaults to the 5 healing events, otherwise the rows are repeated.
+
         Returns:
             pd.DataFrame: 상세 치유 여정 데이터
         """
-        df = self.healing_events_info.copy()
+        df = tile_frame(self.healing_events_info, num_records)
 
         # 믿음 수준에 약간의 노이즈 추가 (시뮬레이션)
         np.random.seed(43) # 재현성을 위해 시드 고정
@@ -49,7 +55,7 @@ class OfficialsSonDataGenerator:
         # 개역한글: 요한복음 4:53 - "아비가 예수께서 네 아들이 살았다 하신 그 시각인 줄 알고 자기와 그 온 집이 다 믿으니라"
         print("✨ 요한복음 4장 왕의 신하의 아들 치유 데이터가 생성되었습니다.")
         print("신하의 믿음 여정과 아들의 병세 변화를 시뮬레이션합니다.")
-        print(df.to_string(index=False))
+        print(frame_preview(df))
         print("\n---")
         print("영적 통찰: 예수님의 말씀은 시공간을 초월하여 역사하며, 믿음은 그 말씀을 통해 자라납니다.")
         print("Spiritual Insight: Jesus' word transcends time and space, and faith grows through that word.")
@@ -1,7 +1,10 @@
 import pandas as pd
+from typing import Optional
+from utils import reporting
+from utils.instrumentation import InstrumentedAnalyzerMixin
 from .plagues_data import PlaguesDataGenerator
 
-class PlaguesAggregationAnalyzer:
+class PlaguesAggregationAnalyzer(InstrumentedAnalyzerMixin):
     """
     출애굽기 9장의 재앙 데이터를 집계하여 분석하는 클래스.
     파라오의 견고한 마음과 하나님의 권능을 통계적으로 탐구합니다.
@@ -10,13 +13,17 @@ class PlaguesAggregationAnalyzer:
     Statistically explores Pharaoh's hardened heart and God's power.
     """
 
-    def __init__(self):
+    def __init__(self, num_records: Optional[int] = None):
         """
         분석기 초기화 및 데이터 생성.
         Initializes the analyzer and generates data.
+
+        Args:
+            num_records (int, optional): 생성기에 넘길 레코드 수 (생략 시 기본 데이터).
+                Number of records passed to the data generator (defaults to the base data).
         """
         self.data_generator = PlaguesDataGenerator()
-        self.plague_df = self.data_generator.generate_detailed_plague_data()
+        self.plague_df = self.data_generator.generate_detailed_plague_data(num_records)
 
     def analyze_summary_statistics(self):
         """
@@ -32,7 +39,7 @@ class PlaguesAggregationAnalyzer:
         print("Summarizing the severity of plagues in Egypt numerically.")
 
         summary = self.plague_df['actual_damage_egypt'].describe()
-        print(summary)
+        reporting.print_frame(summary)
 
         print("\n💡 통찰 (Insight): `describe()`는 재앙의 평균적인 심각도, 최소/최대 피해 범위 등을 한눈에 보여줍니다.")
         print("Insight: `describe()` provides an at-a-glance summary of average severity, min/max damage range, etc.")
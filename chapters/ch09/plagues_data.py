@@ -1,5 +1,7 @@
 import pandas as pd
 import numpy as np
+from typing import Optional
+from utils.synthetic import frame_preview, tile_frame
 
 class PlaguesDataGenerator:
     """
@@ -32,15 +34,19 @@ class PlaguesDataGenerator:
             'pharaoh_heart_hardening': [True, True, True] # 파라오 마음 견고해짐 여부
         })
 
-    def generate_detailed_plague_data(self) -> pd.DataFrame:
+    def generate_detailed_plague_data(self, num_records: Optional[int] = None) -> pd.DataFrame:
         """
         상세한 재앙 데이터를 생성합니다.
         Generates detailed plague data.
 
+        Args:
+            num_records (int, optional): 생성할 레코드 수. 생략하면 재앙 3개, 주면 재앙 정보를 반복해 늘립니다.
+                Number of records; defaults to the 3 plagues, otherwise the plague rows are repeated.
+
         Returns:
             pd.DataFrame: 상세 재앙 데이터
         """
-        df = self.plagues_info.copy()
+        df = tile_frame(self.plagues_info, num_records)
 
         # 재앙별 실제 피해율 (시뮬레이션)
         np.random.seed(42) # 재현성을 위해 시드 고정
@@ -59,7 +65,7 @@ class PlaguesDataGenerator:
         # 개역한글: 출애굽기 9:7 - "바로가 보내어 본즉 이스라엘의 생축은 하나도 죽지 아니하였더라"
         print("✨ 출애굽기 9장 재앙 데이터가 생성되었습니다.")
         print("각 재앙이 애굽과 고센에 미친 영향을 시뮬레이션합니다.")
-        print(df.to_string(index=False))
+        print(frame_preview(df))
         print("\n---")
         print("영적 통찰: 하나님은 재앙 속에서도 당신의 백성을 명확히 구분하고 보호하셨습니다.")
         print("Spiritual Insight: God clearly distinguished and protected His people even amidst the plagues.")
@@ -1,6 +1,8 @@
 
 import pandas as pd
 import numpy as np
+from typing import Optional
+from utils.synthetic import frame_preview, tile_frame
 
 class LightOfTheWorldDataGenerator:
     """
@@ -30,7 +32,7 @@ class LightOfTheWorldDataGenerator:
             'spiritual_growth_factor': [5, 4, 4, 3, -5, -4, -4, -3] # 영적 성장에 기여하는 정도
         })
 
-    def generate_light_darkness_data(self) -> pd.DataFrame:
+    def generate_light_darkness_data(self, num_records: Optional[int] = None) -> pd.DataFrame:
         """
         상세한 빛과 어둠 데이터를 생성합니다.
         각 개념이 삶과 영적 성장에 미치는 영향을 시뮬레이션합니다.
@@ -38,10 +40,14 @@ class LightOfTheWorldDataGenerator:
         Generates detailed light and darkness data.
         Simulates the impact of each concept on life and spiritual growth.
 
+        Args:
+            num_records (int, optional): 생성할 레코드 수. 생략하면 개념 8개, 주면 같은 행을 반복해 늘립니다.
+                Number of records; defaults to the 8 concepts, otherwise the rows are repeated.
+
         Returns:
             pd.DataFrame: 상세 빛과 어둠 데이터
         """
-        df = self.concepts_info.copy()
+        df = tile_frame(self.concepts_info, num_records)
 
         # 데이터에 약간의 변동성 추가
         np.random.seed(812) # 재현성을 위해 시드 고정
@@ -53,7 +59,7 @@ class LightOfTheWorldDataGenerator:
         # 개역한글: 요한복음 1:5 - "빛이 어두움에 비취되 어두움이 깨닫지 못하더라"
         print("✨ 요한복음 8장 12절 기반 빛과 어둠 데이터가 생성되었습니다.")
         print("각 개념이 삶과 영적 성장에 미치는 영향을 시뮬레이션합니다.")
-        print(df.to_string(index=False))
+        print(frame_preview(df))
         print("\n---")
         print("영적 통찰: 빛과 어둠은 삶과 영적 성장에 극명하게 다른 영향을 미칩니다. 예수님은 생명의 빛이십니다.")
         print("Spiritual Insight: Light and darkness have distinctly different impacts on life and spiritual growth. Jesus is the Light of Life.")
@@ -1,8 +1,11 @@
 
 import pandas as pd
+from typing import Optional
+from utils import reporting
+from utils.instrumentation import InstrumentedAnalyzerMixin
 from .light_of_the_world_data import LightOfTheWorldDataGenerator
 
-class LightOfTheWorldGroupbyAnalyzer:
+class LightOfTheWorldGroupbyAnalyzer(InstrumentedAnalyzerMixin):
     """
     요한복음 8장 12절의 "나는 세상의 빛이니" 말씀을 기반으로 빛과 어둠의 데이터를 그룹별로 분석하는 클래스.
     빛을 따르는 삶과 어둠에 거하는 삶의 영적 특성을 `groupby()`를 활용하여 탐구합니다.
@@ -11,13 +14,17 @@ class LightOfTheWorldGroupbyAnalyzer:
     Explores the spiritual characteristics of lives following the light versus those dwelling in darkness using `groupby()`.
     """
 
-    def __init__(self):
+    def __init__(self, num_records: Optional[int] = None):
         """
         분석기 초기화 및 데이터 생성.
         Initializes the analyzer and generates data.
+
+        Args:
+            num_records (int, optional): 생성기에 넘길 레코드 수 (생략 시 기본 데이터).
+                Number of records passed to the data generator (defaults to the base data).
         """
         self.data_generator = LightOfTheWorldDataGenerator()
-        self.light_dark_df = self.data_generator.generate_light_darkness_data()
+        self.light_dark_df = self.data_generator.generate_light_darkness_data(num_records)
 
     def analyze_impact_by_category(self):
         """
@@ -33,7 +40,7 @@ class LightOfTheWorldGroupbyAnalyzer:
         print("Comparing the average impact on life of two groups: Light and Darkness.")
 
         impact_by_category = self.light_dark_df.groupby('category')['impact_on_life'].mean()
-        print(impact_by_category)
+        reporting.print_frame(impact_by_category)
 
         print("\n💡 통찰 (Insight): `groupby()`를 통해 빛을 따르는 삶이 훨씬 긍정적인 영향을 미침을 데이터적으로 확인할 수 있습니다.")
         print("Insight: `groupby()` allows us to numerically confirm that a life following the light has a significantly more positive impact.")
@@ -53,7 +60,7 @@ class LightOfTheWorldGroupbyAnalyzer:
         print("Calculating the total contribution of light and darkness concepts to spiritual growth.")
 
         growth_by_category = self.light_dark_df.groupby('category')['spiritual_growth_factor'].sum()
-        print(growth_by_category)
+        reporting.print_frame(growth_by_category)
 
         print("\n💡 통찰 (Insight): `groupby()`와 `sum()`을 통해 빛의 개념들이 영적 성장에 필수적임을 이해할 수 있습니다.")
         print("Insight: `groupby()` and `sum()` help understand that concepts of light are essential for spiritual growth.")
@@ -73,7 +80,7 @@ class LightOfTheWorldGroupbyAnalyzer:
         print("Confirming how many times each light and darkness concept appears in the data.")
 
         concept_counts = self.light_dark_df.groupby('concept_name_en')['category'].count()
-        print(concept_counts)
+        reporting.print_frame(concept_counts)
 
         print("\n💡 통찰 (Insight): `groupby()`와 `count()`를 통해 어떤 개념이 더 자주 언급되는지 파악하여 영적 중요도를 엿볼 수 있습니다.")
         print("Insight: `groupby()` and `count()` help gauge spiritual importance by identifying which concepts are mentioned more frequently.")
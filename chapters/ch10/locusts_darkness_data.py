@@ -1,6 +1,8 @@
 
 import pandas as pd
 import numpy as np
+from typing import Optional
+from utils.synthetic import frame_preview, tile_frame
 
 class LocustsDarknessDataGenerator:
     """
@@ -36,7 +38,26 @@ class LocustsDarknessDataGenerator:
             'pharaoh_response_en': ['Repentance(temporary)', 'Hardened']
         })
 
-    def generate_plague_impact_data(self) -> pd.DataFrame:
+    @staticmethod
+    def _draw_default_impacts(impact_df: pd.DataFrame, is_egypt: np.ndarray) -> tuple:
+        """
+        기본 4행의 피해 점수를 처음 구현과 같은 순서로 뽑습니다 (시드 10에서 기존 impact_score 그대로).
+        재앙마다 애굽/고센 행의 난수 4개를 뽑고, 그 뒤 고센 행마다 다시 하나씩 뽑아 고센 점수로 씁니다.
+
+        Draws the default 4-row impacts in the original order so seed 10 keeps the published impact_score.
+        """
+        egypt_draws = []
+        for _ in range(len(impact_df) // 2):
+            egypt_draws.append(np.random.randint(20, 40))
+            for _ in range(3): # 원래 루프의 고센/애굽 보조 난수 (점수에는 쓰이지 않음)
+                np.random.randint(0, 5)
+
+        egypt_impact = impact_df['duration_days'].to_numpy() * np.repeat(egypt_draws, 2)
+        goshen_impact = np.zeros(len(impact_df), dtype=egypt_impact.dtype)
+        goshen_impact[~is_egypt] = [np.random.randint(0, 5) for _ in range(int((~is_egypt).sum()))]
+        return egypt_impact, goshen_impact
+
+    def generate_plague_impact_data(self, num_records: Optional[int] = None) -> pd.DataFrame:
         """
         상세한 재앙 영향 데이터를 생성합니다.
         애굽과 고센에 미친 영향을 그룹별로 시뮬레이션합니다.
@@ -44,54 +65,43 @@ class LocustsDarknessDataGenerator:
         Generates detailed plague impact data.
         Simulates the impact on Egypt and Goshen by group.
 
+        Args:
+            num_records (int, optional): 생성할 레코드 수. 생략하면 재앙 2개 x 지역 2곳(4행), 주면 같은 행을 반복해 늘립니다.
+                Number of records; defaults to 2 plagues x 2 locations, otherwise the rows are repeated.
+
         Returns:
             pd.DataFrame: 상세 재앙 영향 데이터
         """
-        df = self.plagues_info.copy()
+        df = self.plagues_info
+
+        # 재앙마다 애굽 행과 고센 행
+        by_location = df.loc[df.index.repeat(2)].reset_index(drop=True)
+        by_location['location'] = np.tile(['Egypt', 'Goshen'], len(df))
+        impact_df = tile_frame(by_location, num_records)
 
         # 애굽과 고센의 피해 시뮬레이션
         np.random.seed(10) # 재현성을 위해 시드 고정
-        egypt_impact = []
-        goshen_impact = []
-        location = []
-        plague_name = []
-        plague_name_en = []
-        pharaoh_response = []
-
-        for _, row in df.iterrows():
-            # 애굽 데이터
-            egypt_impact.append(row['duration_days'] * np.random.randint(20, 40))
-            goshen_impact.append(np.random.randint(0, 5)) # 고센은 피해가 적거나 없음
-            location.append('Egypt')
-            plague_name.append(row['plague_name_kr'])
-            plague_name_en.append(row['plague_name_en'])
-            pharaoh_response.append(row['pharaoh_response_kr'])
-
-            # 고센 데이터
-            egypt_impact.append(np.random.randint(0, 5)) # 고센 데이터에서는 애굽 피해는 무의미
-            goshen_impact.append(np.random.randint(0, 5)) # 고센은 피해가 적거나 없음
-            location.append('Goshen')
-            plague_name.append(row['plague_name_kr'])
-            plague_name_en.append(row['plague_name_en'])
-            pharaoh_response.append(row['pharaoh_response_kr'])
+        is_egypt = impact_df['location'].to_numpy() == 'Egypt'
+        if num_records is None:
+            egypt_impact, goshen_impact = self._draw_default_impacts(impact_df, is_egypt)
+        else:
+            egypt_impact = impact_df['duration_days'].to_numpy() * np.random.randint(20, 40, size=len(impact_df))
+            goshen_impact = np.random.randint(0, 5, size=len(impact_df)) # 고센은 피해가 적거나 없음
 
         impact_df = pd.DataFrame({
-            'plague_name_kr': plague_name,
-            'plague_name_en': plague_name_en,
-            'location': location,
-            'impact_score': egypt_impact if location[0] == 'Egypt' else goshen_impact, # 실제 피해 점수
-            'pharaoh_response': pharaoh_response
+            'plague_name_kr': impact_df['plague_name_kr'],
+            'plague_name_en': impact_df['plague_name_en'],
+            'location': impact_df['location'],
+            'impact_score': np.where(is_egypt, egypt_impact, goshen_impact), # 실제 피해 점수
+            'pharaoh_response': impact_df['pharaoh_response_kr']
         })
 
-        # impact_score를 location에 따라 올바르게 할당
-        impact_df['impact_score'] = impact_df.apply(lambda x: x['impact_score'] if x['location'] == 'Egypt' else np.random.randint(0, 5), axis=1)
-
         # KJV: Exodus 10:23 - "...but all the children of Israel had light in their dwellings."
         # ESV: Exodus 10:23 - "...but all the people of Israel had light in their dwellings."
         # 개역한글: 출애굽기 10:23 - "...이스라엘 자손의 거하는 곳에는 광명이 있었더라"
         print("✨ 출애굽기 10장 재앙 영향 데이터가 생성되었습니다.")
         print("메뚜기 재앙과 흑암 재앙이 애굽과 고센에 미친 영향을 시뮬레이션합니다.")
-        print(impact_df.to_string(index=False))
+        print(frame_preview(impact_df))
         print("\n---")
         print("영적 통찰: 하나님은 재앙 속에서도 당신의 백성을 명확히 구분하고 보호하셨습니다.")
         print("Spiritual Insight: God clearly distinguished and protected His people even amidst the plagues.")
@@ -1,8 +1,11 @@
 
 import pandas as pd
+from typing import Optional
+from utils import reporting
+from utils.instrumentation import InstrumentedAnalyzerMixin
 from .locusts_darkness_data import LocustsDarknessDataGenerator
 
-class LocustsDarknessGroupbyAnalyzer:
+class LocustsDarknessGroupbyAnalyzer(InstrumentedAnalyzerMixin):
     """
     출애굽기 10장의 메뚜기 재앙과 흑암 재앙 데이터를 그룹별로 분석하는 클래스.
     애굽과 고센의 구별, 재앙별 영향 등을 `groupby()`를 활용하여 탐구합니다.
@@ -11,13 +14,17 @@ class LocustsDarknessGroupbyAnalyzer:
     Explores the distinction between Egypt and Goshen, and plague-specific impacts using `groupby()`.
     """
 
-    def __init__(self):
+    def __init__(self, num_records: Optional[int] = None):
         """
         분석기 초기화 및 데이터 생성.
         Initializes the analyzer and generates data.
+
+        Args:
+            num_records (int, optional): 생성기에 넘길 레코드 수 (생략 시 기본 데이터).
+                Number of records passed to the data generator (defaults to the base data).
         """
         self.data_generator = LocustsDarknessDataGenerator()
-        self.plague_df = self.data_generator.generate_plague_impact_data()
+        self.plague_df = self.data_generator.generate_plague_impact_data(num_records)
 
     def analyze_impact_by_location(self):
         """
@@ -33,7 +40,7 @@ class LocustsDarknessGroupbyAnalyzer:
         print("Comparing the average impact of plagues on two groups: Egypt and Goshen.")
 
         impact_by_location = self.plague_df.groupby('location')['impact_score'].mean()
-        print(impact_by_location)
+        reporting.print_frame(impact_by_location)
 
         print("\n💡 통찰 (Insight): `groupby()`를 통해 하나님께서 당신의 백성을 어떻게 구별하여 보호하셨는지 데이터적으로 확인할 수 있습니다.")
         print("Insight: `groupby()` allows us to numerically confirm how God distinguished and protected His people.")
@@ -54,7 +61,7 @@ class LocustsDarknessGroupbyAnalyzer:
 
         egypt_plagues = self.plague_df[self.plague_df['location'] == 'Egypt']
         impact_by_plague_type = egypt_plagues.groupby('plague_name_en')['impact_score'].sum()
-        print(impact_by_plague_type)
+        reporting.print_frame(impact_by_plague_type)
 
         print("\n💡 통찰 (Insight): `groupby()`와 `sum()`을 통해 각 재앙이 애굽에 미친 파괴적인 규모를 이해할 수 있습니다.")
         print("Insight: `groupby()` and `sum()` help understand the destructive scale of each plague on Egypt.")
@@ -74,7 +81,7 @@ class LocustsDarknessGroupbyAnalyzer:
         print("Checking how many plagues occurred based on Pharaoh's response (temporary repentance/hardened heart).")
 
         response_counts = self.plague_df.groupby('pharaoh_response')['plague_name_en'].nunique()
-        print(response_counts)
+        reporting.print_frame(response_counts)
 
         print("\n💡 통찰 (Insight): `groupby()`와 `nunique()`를 통해 파라오의 완악함이 재앙의 반복에 어떻게 기여했는지 엿볼 수 있습니다.")
         print("Insight: `groupby()` and `nunique()` offer a glimpse into how Pharaoh's stubbornness contributed to the repetition of plagues.")
@@ -1,8 +1,11 @@
 
 import pandas as pd
+from typing import Optional
+from utils import reporting
+from utils.instrumentation import InstrumentedAnalyzerMixin
 from .feeding_five_thousand_data import FeedingFiveThousandDataGenerator
 
-class FeedingFiveThousandConcatAnalyzer:
+class FeedingFiveThousandConcatAnalyzer(InstrumentedAnalyzerMixin):
     """
     요한복음 6장의 오병이어 기적 데이터를 `concat()`을 사용하여 분석하는 클래스.
     초기 자원과 기적 후 남은 조각을 연결하여 예수님의 능력을 탐구합니다.
@@ -11,13 +14,17 @@ class FeedingFiveThousandConcatAnalyzer:
     Explores Jesus' power by concatenating initial resources and leftover fragments after the miracle.
     """
 
-    def __init__(self):
+    def __init__(self, num_records: Optional[int] = None):
         """
         분석기 초기화 및 데이터 생성.
         Initializes the analyzer and generates data.
+
+        Args:
+            num_records (int, optional): 생성기에 넘길 레코드 수 (생략 시 기본 데이터).
+                Number of records passed to the data generator (defaults to the base data).
         """
         self.data_generator = FeedingFiveThousandDataGenerator()
-        self.initial_resources_df, self.after_miracle_df = self.data_generator.generate_miracle_data()
+        self.initial_resources_df, self.after_miracle_df = self.data_generator.generate_miracle_data(num_records)
 
     def analyze_concatenation_vertical(self):
         """
@@ -36,7 +43,7 @@ class FeedingFiveThousandConcatAnalyzer:
         print("Connecting pre- and post-miracle resource data vertically to observe the overall resource change.")
 
         concatenated_df = pd.concat([self.initial_resources_df, self.after_miracle_df], ignore_index=True)
-        print(concatenated_df.to_string(index=False))
+        reporting.print_frame(concatenated_df, index=False)
 
         print("\n💡 통찰 (Insight): `concat()`을 통해 예수님의 능력으로 자원이 얼마나 증폭되었는지 한눈에 시각적으로 확인할 수 있습니다.")
         print("Insight: `concat()` visually demonstrates how resources were amplified by Jesus' power.")
@@ -69,7 +76,7 @@ class FeedingFiveThousandConcatAnalyzer:
             self.initial_resources_df.groupby('resource_type')['quantity_initial'].sum().reset_index(),
             people_count_df
         ], axis=1)
-        print(combined_df.to_string(index=False))
+        reporting.print_frame(combined_df, index=False)
 
         print("\n💡 통찰 (Insight): `concat(axis=1)`은 서로 다른 관점의 데이터를 나란히 놓고 비교할 때 유용합니다.")
         print("Insight: `concat(axis=1)` is useful for comparing data from different perspectives side-by-side.")
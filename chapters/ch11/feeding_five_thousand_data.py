@@ -1,6 +1,8 @@
 
 import pandas as pd
 import numpy as np
+from typing import Optional
+from utils.synthetic import frame_preview, tile_frame
 
 class FeedingFiveThousandDataGenerator:
     """
@@ -31,7 +33,7 @@ class FeedingFiveThousandDataGenerator:
             'description_en': ['Barley Loaf', 'Barley Loaf', 'Barley Loaf', 'Barley Loaf', 'Barley Loaf', 'Fish', 'Fish']
         })
 
-    def generate_miracle_data(self) -> (pd.DataFrame, pd.DataFrame):
+    def generate_miracle_data(self, num_records: Optional[int] = None) -> (pd.DataFrame, pd.DataFrame):
         """
         상세한 오병이어 기적 데이터를 생성합니다.
         초기 자원 데이터와 기적 후 남은 조각 데이터를 분리하여 반환합니다.
@@ -39,19 +41,27 @@ class FeedingFiveThousandDataGenerator:
         Generates detailed data for the miracle of feeding the five thousand.
         Returns separate DataFrames for initial resources and leftover fragments after the miracle.
 
+        Args:
+            num_records (int, optional): 초기 자원 레코드 수. 생략하면 떡 5개와 물고기 2마리(7행)이고,
+                남은 조각은 7:12 비율로 함께 늘어납니다.
+                Number of initial resource records; defaults to 7, leftovers scale at 7:12.
+
         Returns:
             tuple: (pd.DataFrame, pd.DataFrame) - (initial_resources_df, after_miracle_df)
         """
-        initial_resources_df = self.resources_info.copy()
+        base = self.resources_info
+        initial_resources_df = tile_frame(base, num_records, steps={'resource_id': len(base)})
 
-        # 기적 후 남은 조각 데이터 시뮬레이션
+        # 기적 후 남은 조각 데이터 시뮬레이션 (자원 7개당 열두 바구니)
+        num_leftovers = 12 if num_records is None else num_records * 12 // len(base)
+        first_id = len(initial_resources_df) + 1
         after_miracle_data = {
-            'resource_id': [8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19],
-            'resource_type': ['leftover'] * 12,
-            'quantity_initial': [1] * 12, # 각 바구니에 남은 조각
-            'source': ['basket'] * 12,
-            'description_kr': ['남은 조각'] * 12,
-            'description_en': ['Leftover Fragment'] * 12
+            'resource_id': np.arange(first_id, first_id + num_leftovers),
+            'resource_type': 'leftover',
+            'quantity_initial': 1, # 각 바구니에 남은 조각
+            'source': 'basket',
+            'description_kr': '남은 조각',
+            'description_en': 'Leftover Fragment'
         }
         after_miracle_df = pd.DataFrame(after_miracle_data)
 
@@ -61,9 +71,9 @@ class FeedingFiveThousandDataGenerator:
         print("✨ 요한복음 6장 오병이어 기적 데이터가 생성되었습니다.")
         print("초기 자원과 기적 후 남은 조각 데이터를 분리하여 시뮬레이션합니다.")
         print("\n--- 초기 자원 데이터 (Initial Resources Data) ---")
-        print(initial_resources_df.to_string(index=False))
+        print(frame_preview(initial_resources_df))
         print("\n--- 기적 후 남은 조각 데이터 (Leftover Fragments Data) ---")
-        print(after_miracle_df.to_string(index=False))
+        print(frame_preview(after_miracle_df))
         print("\n---")
         print("영적 통찰: 예수님의 능력은 작은 것을 통해 풍성함을 만드십니다. 부족함이 아닌 가능성을 보십니다.")
         print("Spiritual Insight: Jesus' power creates abundance from scarcity. He sees potential, not lack.")
@@ -1,8 +1,11 @@
 
 import pandas as pd
+from typing import Optional
+from utils import reporting
+from utils.instrumentation import InstrumentedAnalyzerMixin
 from .passover_preparation_data import PassoverPreparationDataGenerator
 
-class PassoverMergeJoinAnalyzer:
+class PassoverMergeJoinAnalyzer(InstrumentedAnalyzerMixin):
     """
     출애굽기 11장의 유월절 데이터를 `merge()`와 `join()`을 사용하여 분석하는 클래스.
     재앙 예고와 유월절 규례를 병합하여 하나님의 구원 계획을 탐구합니다.
@@ -11,13 +14,17 @@ class PassoverMergeJoinAnalyzer:
     Explores God's salvation plan by merging plague announcements and Passover ordinances.
     """
 
-    def __init__(self):
+    def __init__(self, num_records: Optional[int] = None):
         """
         분석기 초기화 및 데이터 생성.
         Initializes the analyzer and generates data.
+
+        Args:
+            num_records (int, optional): 생성기에 넘길 레코드 수 (생략 시 기본 데이터).
+                Number of records passed to the data generator (defaults to the base data).
         """
         self.data_generator = PassoverPreparationDataGenerator()
-        self.plague_announce_df, self.passover_rules_df = self.data_generator.generate_detailed_passover_data()
+        self.plague_announce_df, self.passover_rules_df = self.data_generator.generate_detailed_passover_data(num_records)
 
     def analyze_inner_merge(self):
         """
@@ -37,7 +44,7 @@ class PassoverMergeJoinAnalyzer:
 
         # event_id를 키로 사용하여 inner merge
         merged_df = pd.merge(self.plague_announce_df, self.passover_rules_df, on='event_id', how='inner')
-        print(merged_df.to_string(index=False))
+        reporting.print_frame(merged_df, index=False)
 
         print("\n💡 통찰 (Insight): `inner merge`는 유월절 어린 양의 피라는 '키'를 통해 심판과 구원이 동시에 일어나는 하나님의 완벽한 계획을 보여줍니다.")
         print("Insight: `inner merge` reveals God's perfect plan where judgment and salvation occur simultaneously through the 'key' of the Passover lamb's blood.")
@@ -66,7 +73,7 @@ class PassoverMergeJoinAnalyzer:
             lsuffix='_rule', rsuffix='_announce',
             how='left'
         )
-        print(joined_df.to_string())
+        reporting.print_frame(joined_df, full=True)
 
         print("\n💡 통찰 (Insight): `left join`은 이스라엘 백성이 지켜야 할 규례를 중심으로 하나님의 구원 계획이 어떻게 펼쳐졌는지 이해하는 데 도움을 줍니다.")
         print("Insight: `left join` helps understand how God's salvation plan unfolded, centered on the ordinances Israel had to observe.")
@@ -1,6 +1,8 @@
 
 import pandas as pd
 import numpy as np
+from typing import Optional
+from utils.synthetic import frame_preview, tile_frame
 
 class PassoverPreparationDataGenerator:
     """
@@ -31,7 +33,7 @@ class PassoverPreparationDataGenerator:
             'divine_protection': [True, True, True, True] # 유월절 규례를 지키면 보호받음
         })
 
-    def generate_detailed_passover_data(self) -> (pd.DataFrame, pd.DataFrame):
+    def generate_detailed_passover_data(self, num_records: Optional[int] = None) -> (pd.DataFrame, pd.DataFrame):
         """
         상세한 유월절 데이터를 생성합니다.
         재앙 예고와 유월절 규례 데이터를 분리하여 반환합니다.
@@ -39,10 +41,14 @@ class PassoverPreparationDataGenerator:
         Generates detailed Passover data.
         Returns separate DataFrames for plague announcement and Passover ordinances.
 
+        Args:
+            num_records (int, optional): 재앙 예고와 규례를 합친 레코드 수. 생략하면 사건 4개, 주면 같은 행을 반복해 늘립니다.
+                Number of announcement and ordinance records combined; defaults to the 4 events, otherwise the rows are repeated.
+
         Returns:
             tuple: (pd.DataFrame, pd.DataFrame) - (plague_announcement_df, passover_rules_df)
         """
-        df = self.events_info.copy()
+        df = tile_frame(self.events_info, num_records)
 
         # 재앙 예고 데이터
         plague_announcement_df = df[df['event_type'] == 'Plague Announcement'].copy()
@@ -59,9 +65,9 @@ class PassoverPreparationDataGenerator:
         print("✨ 출애굽기 11장 유월절 준비 데이터가 생성되었습니다.")
         print("열 번째 재앙 예고와 유월절 규례 데이터를 분리하여 시뮬레이션합니다.")
         print("\n--- 재앙 예고 데이터 (Plague Announcement Data) ---")
-        print(plague_announcement_df.to_string(index=False))
+        print(frame_preview(plague_announcement_df))
         print("\n--- 유월절 규례 데이터 (Passover Rules Data) ---")
-        print(passover_rules_df.to_string(index=False))
+        print(frame_preview(passover_rules_df))
         print("\n---")
         print("영적 통찰: 유월절 어린 양의 피는 심판과 구원을 연결하는 핵심 키입니다.")
         print("Spiritual Insight: The blood of the Passover lamb is the key connecting judgment and salvation.")
@@ -1,6 +1,8 @@
 
 import pandas as pd
 import numpy as np
+from typing import Optional
+from utils.synthetic import frame_preview, tile_frame
 
 class JesusWalksWaterDataGenerator:
     """
@@ -32,7 +34,7 @@ class JesusWalksWaterDataGenerator:
             'jesus_presence': [False, False, True, True, True, True]
         })
 
-    def generate_jesus_walks_water_data(self) -> pd.DataFrame:
+    def generate_jesus_walks_water_data(self, num_records: Optional[int] = None) -> pd.DataFrame:
         """
         상세한 예수님께서 물 위를 걸으신 사건 데이터를 생성합니다.
         제자들의 감정 변화와 사건의 흐름을 포함합니다.
@@ -40,10 +42,14 @@ class JesusWalksWaterDataGenerator:
         Generates detailed data for Jesus walking on water.
         Includes disciples' emotional changes and the flow of events.
 
+        Args:
+            num_records (int, optional): 생성할 레코드 수. 생략하면 사건 6개, 주면 같은 행을 반복해 늘립니다.
+                Number of records; defaults to the 6 events, otherwise the rows are repeated.
+
         Returns:
             pd.DataFrame: 상세 사건 데이터
         """
-        df = self.events_info.copy()
+        df = tile_frame(self.events_info, num_records)
 
         # 감정 수준에 약간의 노이즈 추가
         np.random.seed(620) # 재현성을 위해 시드 고정
@@ -54,7 +60,7 @@ class JesusWalksWaterDataGenerator:
         # 개역한글: 요한복음 6:21 - "이에 기뻐서 배로 영접하니 배가 곧 그들의 가려던 땅에 이르더라"
         print("✨ 요한복음 6장 예수님께서 물 위를 걸으신 사건 데이터가 생성되었습니다.")
         print("제자들의 감정 변화와 예수님의 현현을 시뮬레이션합니다.")
-        print(df.to_string(index=False))
+        print(frame_preview(df))
         print("\n---")
         print("영적 통찰: 세상의 반복되는 두려움 속에서도 예수님은 유일한 평안과 구원을 주십니다.")
         print("Spiritual Insight: Even amidst the world's recurring fears, Jesus alone provides unique peace and salvation.")
@@ -1,8 +1,11 @@
 
 import pandas as pd
+from typing import Optional
+from utils import reporting
+from utils.instrumentation import InstrumentedAnalyzerMixin
 from .jesus_walks_water_data import JesusWalksWaterDataGenerator
 
-class JesusWalksWaterDuplicatesUniqueAnalyzer:
+class JesusWalksWaterDuplicatesUniqueAnalyzer(InstrumentedAnalyzerMixin):
     """
     요한복음 6장의 예수님께서 물 위를 걸으신 사건 데이터를 `duplicated()`, `drop_duplicates()`, `unique()`, `nunique()`를 사용하여 분석하는 클래스.
     제자들의 중복된 두려움과 예수님의 고유한 평안을 탐구합니다.
@@ -11,13 +14,17 @@ class JesusWalksWaterDuplicatesUniqueAnalyzer:
     Explores duplicated fears of the disciples and Jesus' unique peace.
     """
 
-    def __init__(self):
+    def __init__(self, num_records: Optional[int] = None):
         """
         분석기 초기화 및 데이터 생성.
         Initializes the analyzer and generates data.
+
+        Args:
+            num_records (int, optional): 생성기에 넘길 레코드 수 (생략 시 기본 데이터).
+                Number of records passed to the data generator (defaults to the base data).
         """
         self.data_generator = JesusWalksWaterDataGenerator()
-        self.jesus_walks_df = self.data_generator.generate_jesus_walks_water_data()
+        self.jesus_walks_df = self.data_generator.generate_jesus_walks_water_data(num_records)
 
     def analyze_duplicated_emotions(self):
         """
@@ -33,7 +40,7 @@ class JesusWalksWaterDuplicatesUniqueAnalyzer:
         print("Using `duplicated()` to find recurring fears among the disciples.")
 
         duplicated_emotion = self.jesus_walks_df['disciple_emotion'].duplicated()
-        print(self.jesus_walks_df[duplicated_emotion].to_string(index=False))
+        reporting.print_frame(self.jesus_walks_df[duplicated_emotion], index=False)
 
         print("\n💡 통찰 (Insight): `duplicated()`는 인간의 연약함과 반복되는 두려움의 패턴을 데이터적으로 보여줍니다.")
         print("Insight: `duplicated()` numerically illustrates human weakness and recurring patterns of fear.")
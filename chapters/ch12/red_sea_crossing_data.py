@@ -1,6 +1,8 @@
 
 import pandas as pd
 import numpy as np
+from typing import Optional
+from utils.synthetic import frame_preview, tile_frame
 
 class RedSeaCrossingDataGenerator:
     """
@@ -41,7 +43,7 @@ class RedSeaCrossingDataGenerator:
             'divine_intervention': [False, False, True, True, False, True, True]
         })
 
-    def generate_red_sea_event_data(self) -> pd.DataFrame:
+    def generate_red_sea_event_data(self, num_records: Optional[int] = None) -> pd.DataFrame:
         """
         상세한 홍해 사건 데이터를 생성합니다.
         이스라엘과 애굽 군대의 상황을 포함합니다.
@@ -49,10 +51,14 @@ class RedSeaCrossingDataGenerator:
         Generates detailed Red Sea event data.
         Includes situations for Israelites and Egyptian army.
 
+        Args:
+            num_records (int, optional): 생성할 레코드 수. 생략하면 사건 7개, 주면 같은 행을 반복해 늘립니다.
+                Number of records; defaults to the 7 events, otherwise the rows are repeated.
+
         Returns:
             pd.DataFrame: 상세 홍해 사건 데이터
         """
-        df = self.events_info.copy()
+        df = tile_frame(self.events_info, num_records)
 
         # 감정 수준에 약간의 노이즈 추가
         np.random.seed(14) # 재현성을 위해 시드 고정
@@ -63,7 +69,7 @@ class RedSeaCrossingDataGenerator:
         # 개역한글: 출애굽기 14:29 - "이스라엘 자손은 바다 가운데 육지로 행하고 물은 그들의 좌우에 벽이 되니"
         print("✨ 출애굽기 14장 홍해 사건 데이터가 생성되었습니다.")
         print("이스라엘 백성과 애굽 군대의 상황, 감정, 결과를 시뮬레이션합니다.")
-        print(df.to_string(index=False))
+        print(frame_preview(df))
         print("\n---")
         print("영적 통찰: 홍해 사건은 하나님의 유일한 구원과 애굽의 중복된 완악함을 극명하게 보여줍니다.")
         print("Spiritual Insight: The Red Sea event vividly demonstrates God's unique salvation and Egypt's persistent stubbornness.")
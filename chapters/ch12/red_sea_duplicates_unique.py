@@ -1,9 +1,12 @@
 
 
 import pandas as pd
+from typing import Optional
+from utils import reporting
+from utils.instrumentation import InstrumentedAnalyzerMixin
 from .red_sea_crossing_data import RedSeaCrossingDataGenerator
 
-class RedSeaDuplicatesUniqueAnalyzer:
+class RedSeaDuplicatesUniqueAnalyzer(InstrumentedAnalyzerMixin):
     """
     출애굽기 14장의 홍해 사건 데이터를 `duplicated()`, `drop_duplicates()`, `unique()`, `nunique()`를 사용하여 분석하는 클래스.
     중복된 두려움과 고유한 구원의 순간을 탐구합니다.
@@ -12,13 +15,17 @@ class RedSeaDuplicatesUniqueAnalyzer:
     Explores duplicated fears and unique moments of salvation.
     """
 
-    def __init__(self):
+    def __init__(self, num_records: Optional[int] = None):
         """
         분석기 초기화 및 데이터 생성.
         Initializes the analyzer and generates data.
+
+        Args:
+            num_records (int, optional): 생성기에 넘길 레코드 수 (생략 시 기본 데이터).
+                Number of records passed to the data generator (defaults to the base data).
         """
         self.data_generator = RedSeaCrossingDataGenerator()
-        self.red_sea_df = self.data_generator.generate_red_sea_event_data()
+        self.red_sea_df = self.data_generator.generate_red_sea_event_data(num_records)
 
     def analyze_duplicated_emotions(self):
         """
@@ -36,7 +43,7 @@ class RedSeaDuplicatesUniqueAnalyzer:
         # 'emotion_level'이 5 이상인 'event_description_en'의 중복 여부 확인
         fear_events = self.red_sea_df[self.red_sea_df['emotion_level'] >= 5]
         duplicated_fear = fear_events['event_description_en'].duplicated()
-        print(fear_events[duplicated_fear].to_string(index=False))
+        reporting.print_frame(fear_events[duplicated_fear], index=False)
 
         print("\n💡 통찰 (Insight): `duplicated()`는 인간의 연약함과 반복되는 죄의 패턴을 데이터적으로 보여줍니다.")
         print("Insight: `duplicated()` numerically illustrates human weakness and recurring patterns of sin.")
@@ -56,7 +63,7 @@ class RedSeaDuplicatesUniqueAnalyzer:
         print("Extracting key unique turning points of the Red Sea event using `drop_duplicates()`.")
 
         unique_events = self.red_sea_df.drop_duplicates(subset=['event_description_en', 'group_status'])
-        print(unique_events[['event_description_en', 'group_status', 'divine_intervention']].to_string(index=False))
+        reporting.print_frame(unique_events[['event_description_en', 'group_status', 'divine_intervention']], index=False)
 
         print("\n💡 통찰 (Insight): `drop_duplicates()`는 불필요한 노이즈를 제거하고 하나님의 유일한 구원 계획을 선명하게 드러냅니다.")
         print("Insight: `drop_duplicates()` removes unnecessary noise and clearly reveals God's unique salvation plan.")
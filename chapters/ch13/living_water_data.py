@@ -2,6 +2,8 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from typing import Optional
+from utils.synthetic import frame_preview, tile_frame
 
 class LivingWaterDataGenerator:
     """
@@ -37,7 +39,7 @@ class LivingWaterDataGenerator:
             'fulfillment_level': [2, 5, 3, 9, 4, 7, 10] # 1-10 스케일 (10: 완전한 채움)
         })
 
-    def generate_living_water_data(self) -> pd.DataFrame:
+    def generate_living_water_data(self, num_records: Optional[int] = None) -> pd.DataFrame:
         """
         상세한 생수의 강 데이터를 생성합니다.
         영적 갈증과 채움의 변화를 시계열로 구성합니다.
@@ -45,20 +47,26 @@ class LivingWaterDataGenerator:
         Generates detailed living water data.
         Structures spiritual thirst and fulfillment changes as a time series.
 
+        Args:
+            num_records (int, optional): 생성할 레코드 수. 생략하면 4일간의 사건 7개, 주면 4일 주기를 이어 붙여 늘립니다.
+                Number of records; defaults to 7 events over 4 days, otherwise the 4-day cycle is continued.
+
         Returns:
             pd.DataFrame: 상세 생수의 강 데이터
         """
-        df = self.spiritual_journey_events.copy()
+        events = self.spiritual_journey_events
 
-        # 'event_datetime' 열을 datetime 객체로 변환
-        df['event_datetime'] = pd.to_datetime(df['event_datetime'])
+        # 'event_datetime' 열을 datetime 객체로 변환 (기본 사건만 변환한 뒤 주기마다 4일씩 이동)
+        events = events.assign(event_datetime=pd.to_datetime(events['event_datetime']))
+        df = tile_frame(events, num_records,
+                        steps={'event_id': len(events), 'event_datetime': pd.Timedelta(days=4)})
 
         # KJV: John 7:38 - "He that believeth on me, as the scripture hath said, out of his belly shall flow rivers of living water."
         # ESV: John 7:38 - "Whoever believes in me, as the Scripture has said, 'Out of his heart will flow rivers of living water.'"
         # 개역한글: 요한복음 7:38 - "나를 믿는 자는 성경에 이름과 같이 그 배에서 생수의 강이 흘러나리라 하시니"
         print("✨ 요한복음 7장 생수의 강 데이터가 생성되었습니다.")
         print("영적 갈증과 말씀으로 인한 채움을 시계열로 시뮬레이션합니다.")
-        print(df.to_string(index=False))
+        print(frame_preview(df))
         print("\n---")
         print("영적 통찰: `to_datetime()`은 영적 여정의 흐름을 정확히 기록하여, 말씀이 갈증을 어떻게 채우는지 보여줍니다.")
         print("Spiritual Insight: `to_datetime()` accurately records the flow of the spiritual journey, showing how the Word satisfies thirst.")
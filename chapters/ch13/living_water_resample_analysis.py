@@ -1,8 +1,11 @@
 
 import pandas as pd
+from typing import Optional
+from utils import reporting
+from utils.instrumentation import InstrumentedAnalyzerMixin
 from .living_water_data import LivingWaterDataGenerator
 
-class LivingWaterResampleAnalyzer:
+class LivingWaterResampleAnalyzer(InstrumentedAnalyzerMixin):
     """
     요한복음 7장의 생수의 강 데이터를 `resample()`을 사용하여 분석하는 클래스.
     영적 갈증과 채움의 변화를 시간 간격별로 탐구합니다.
@@ -11,13 +14,17 @@ class LivingWaterResampleAnalyzer:
     Explores changes in spiritual thirst and fulfillment over time intervals.
     """
 
-    def __init__(self):
+    def __init__(self, num_records: Optional[int] = None):
         """
         분석기 초기화 및 데이터 생성.
         Initializes the analyzer and generates data.
+
+        Args:
+            num_records (int, optional): 생성기에 넘길 레코드 수 (생략 시 기본 데이터).
+                Number of records passed to the data generator (defaults to the base data).
         """
         self.data_generator = LivingWaterDataGenerator()
-        self.living_water_df = self.data_generator.generate_living_water_data()
+        self.living_water_df = self.data_generator.generate_living_water_data(num_records)
         self.living_water_df = self.living_water_df.set_index('event_datetime') # DatetimeIndex 설정
 
     def analyze_daily_resample(self):
@@ -34,7 +41,7 @@ class LivingWaterResampleAnalyzer:
         print("Calculating daily averages of spiritual thirst and fulfillment to understand daily changes.")
 
         daily_avg = self.living_water_df[['thirst_level', 'fulfillment_level']].resample('D').mean()
-        print(daily_avg.to_string())
+        reporting.print_frame(daily_avg, full=True)
 
         print("\n💡 통찰 (Insight): `resample('D').mean()`은 매일매일 말씀으로 채워지는 삶의 패턴을 보여주며, 영적 갈증이 해소되는 과정을 시계열적으로 이해하게 합니다.")
         print("Insight: `resample('D').mean()` shows the daily pattern of a life filled with the Word, helping to understand the process of spiritual thirst being quenched over time.")
@@ -54,7 +61,7 @@ class LivingWaterResampleAnalyzer:
         print("Calculating the daily count of spiritual events to understand activity frequency.")
 
         daily_counts = self.living_water_df['event_type'].resample('D').count()
-        print(daily_counts.to_string())
+        reporting.print_frame(daily_counts, full=True)
 
         print("\n💡 통찰 (Insight): `resample('D').count()`는 영적 활동의 꾸준함과 말씀에 대한 반응의 빈도를 보여줍니다.")
         print("Insight: `resample('D').count()` reveals the consistency of spiritual activities and the frequency of response to the Word.")
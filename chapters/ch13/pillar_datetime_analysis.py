@@ -1,8 +1,11 @@
 
 import pandas as pd
+from typing import Optional
+from utils import reporting
+from utils.instrumentation import InstrumentedAnalyzerMixin
 from .pillar_guidance_data import PillarGuidanceDataGenerator
 
-class PillarDatetimeAnalyzer:
+class PillarDatetimeAnalyzer(InstrumentedAnalyzerMixin):
     """
     출애굽기 13장의 구름기둥과 불기둥 인도 데이터를 날짜/시간 기능을 사용하여 분석하는 클래스.
     하나님의 인도하심의 패턴과 시간성을 탐구합니다.
@@ -11,13 +14,17 @@ class PillarDatetimeAnalyzer:
     Explores the patterns and temporality of God's guidance.
     """
 
-    def __init__(self):
+    def __init__(self, num_records: Optional[int] = None):
         """
         분석기 초기화 및 데이터 생성.
         Initializes the analyzer and generates data.
+
+        Args:
+            num_records (int, optional): 생성기에 넘길 레코드 수 (생략 시 기본 데이터).
+                Number of records passed to the data generator (defaults to the base data).
         """
         self.data_generator = PillarGuidanceDataGenerator()
-        self.guidance_df = self.data_generator.generate_pillar_guidance_data()
+        self.guidance_df = self.data_generator.generate_pillar_guidance_data(num_records)
 
     def convert_to_datetime(self):
         """
@@ -34,7 +41,7 @@ class PillarDatetimeAnalyzer:
 
         # 이미 generate_pillar_guidance_data에서 'event_datetime'을 생성했으므로, 여기서는 확인만 합니다.
         # If 'event_datetime' is already created in generate_pillar_guidance_data, we just verify it here.
-        print(self.guidance_df[['event_date', 'event_time', 'event_datetime']].head().to_string(index=False))
+        reporting.print_frame(self.guidance_df[['event_date', 'event_time', 'event_datetime']].head(), index=False)
         print(f"\n'event_datetime' 열의 데이터 타입: {self.guidance_df['event_datetime'].dtype}")
 
         print("\n💡 통찰 (Insight): `pd.to_datetime()`은 시간의 흐름을 정확하게 기록하여 하나님의 인도하심의 연속성을 파악하게 합니다.")
@@ -55,7 +62,7 @@ class PillarDatetimeAnalyzer:
         print("Setting 'event_datetime' as the index facilitates time-based data access.")
 
         df_indexed = self.guidance_df.set_index('event_datetime')
-        print(df_indexed.head().to_string())
+        reporting.print_frame(df_indexed.head(), full=True)
         print(f"\n인덱스의 데이터 타입: {df_indexed.index.dtype}")
 
         print("\n💡 통찰 (Insight): `DatetimeIndex`는 하나님의 인도하심이 특정 시점에 국한되지 않고 지속적이었음을 보여주는 시간의 척도가 됩니다.")
@@ -80,7 +87,7 @@ class PillarDatetimeAnalyzer:
             lambda x: 'Day' if 6 <= x < 18 else 'Night'
         )
         frequency = self.guidance_df.groupby(['time_of_day_category', 'guidance_type']).size().unstack(fill_value=0)
-        print(frequency)
+        reporting.print_frame(frequency)
 
         print("\n💡 통찰 (Insight): `dt.hour`와 `groupby()`를 통해 하나님의 인도하심이 낮과 밤, 모든 시간에 걸쳐 세밀하게 이루어졌음을 알 수 있습니다.")
         print("Insight: `dt.hour` and `groupby()` reveal that God's guidance was meticulously provided throughout both day and night.")
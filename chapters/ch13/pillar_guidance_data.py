@@ -2,6 +2,8 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from typing import Optional
+from utils.synthetic import frame_preview, tile_frame
 
 class PillarGuidanceDataGenerator:
     """
@@ -47,7 +49,7 @@ class PillarGuidanceDataGenerator:
             ]
         })
 
-    def generate_pillar_guidance_data(self) -> pd.DataFrame:
+    def generate_pillar_guidance_data(self, num_records: Optional[int] = None) -> pd.DataFrame:
         """
         상세한 구름기둥과 불기둥 인도 데이터를 생성합니다.
         날짜와 시간 정보를 포함하여 시계열 데이터로 구성합니다.
@@ -55,20 +57,29 @@ class PillarGuidanceDataGenerator:
         Generates detailed pillar of cloud and fire guidance data.
         Structures it as time-series data including date and time information.
 
+        Args:
+            num_records (int, optional): 생성할 레코드 수. 생략하면 4일간의 사건 7개, 주면 4일 주기를 이어 붙여 늘립니다.
+                Number of records; defaults to 7 events over 4 days, otherwise the 4-day cycle is continued.
+
         Returns:
             pd.DataFrame: 상세 구름기둥/불기둥 인도 데이터
         """
-        df = self.guidance_events.copy()
+        events = self.guidance_events.copy()
 
-        # 'event_datetime' 열 생성
-        df['event_datetime'] = pd.to_datetime(df['event_date'] + ' ' + df['event_time'])
+        # 'event_datetime' 열 생성 (기본 사건만 변환한 뒤 주기마다 4일씩 이동)
+        events['event_datetime'] = pd.to_datetime(events['event_date'] + ' ' + events['event_time'])
+        df = tile_frame(events, num_records,
+                        steps={'event_id': len(events), 'event_datetime': pd.Timedelta(days=4)})
+        if num_records is not None:
+            # 이동한 날짜에 맞춰 날짜 문자열 갱신 (시각은 주기마다 같음)
+            df['event_date'] = np.datetime_as_string(df['event_datetime'].to_numpy(), unit='D')
 
         # KJV: Exodus 13:22 - "He took not away the pillar of the cloud by day, nor the pillar of fire by night, from before the people."
         # ESV: Exodus 13:22 - "The pillar of cloud by day and the pillar of fire by night did not depart from before the people."
         # 개역한글: 출애굽기 13:22 - "낮에는 구름 기둥, 밤에는 불 기둥이 백성 앞에서 떠나지 아니하니라"
         print("✨ 출애굽기 13장 구름기둥/불기둥 인도 데이터가 생성되었습니다.")
         print("광야 여정의 시간 흐름에 따른 하나님의 인도하심을 시뮬레이션합니다.")
-        print(df[['event_datetime', 'guidance_type', 'movement_status', 'israel_response']].to_string(index=False))
+        print(frame_preview(df, columns=['event_datetime', 'guidance_type', 'movement_status', 'israel_response']))
         print("\n---")
         print("영적 통찰: 하나님은 시간의 흐름 속에서 변함없이 당신의 백성을 인도하십니다. 날짜/시간 데이터는 그 신실하심을 보여줍니다.")
         print("Spiritual Insight: God faithfully guides His people through the flow of time. Date/time data reveals His faithfulness.")
@@ -1,8 +1,11 @@
 
 import pandas as pd
+from typing import Optional
+from utils import reporting
+from utils.instrumentation import InstrumentedAnalyzerMixin
 from .door_of_salvation_data import DoorOfSalvationDataGenerator
 
-class DoorMultiIndexAccessAnalyzer:
+class DoorMultiIndexAccessAnalyzer(InstrumentedAnalyzerMixin):
     """
     요한복음 10장 9절의 "나는 문이니" 데이터를 `MultiIndex`를 사용하여 분석하는 클래스.
     예수님을 통한 길과 다른 길의 다층적인 의미를 구조화하고 접근합니다.
@@ -11,13 +14,17 @@ class DoorMultiIndexAccessAnalyzer:
     Structures and accesses multi-layered meanings of the path through Jesus versus other paths.
     """
 
-    def __init__(self):
+    def __init__(self, num_records: Optional[int] = None):
         """
         분석기 초기화 및 데이터 생성.
         Initializes the analyzer and generates data.
+
+        Args:
+            num_records (int, optional): 생성기에 넘길 레코드 수 (생략 시 기본 데이터).
+                Number of records passed to the data generator (defaults to the base data).
         """
         self.data_generator = DoorOfSalvationDataGenerator()
-        self.door_df = self.data_generator.generate_door_of_salvation_data()
+        self.door_df = self.data_generator.generate_door_of_salvation_data(num_records)
 
     def create_and_access_multiindex(self):
         """
@@ -35,11 +42,11 @@ class DoorMultiIndexAccessAnalyzer:
         # MultiIndex 생성
         multi_indexed_df = self.door_df.set_index(['path_type', 'entry_method'])
         print("\n--- 멀티인덱스 DataFrame (Multi-indexed DataFrame) ---")
-        print(multi_indexed_df.to_string())
+        reporting.print_frame(multi_indexed_df, full=True)
 
         # 멀티인덱스를 사용하여 특정 데이터 접근 (예: 예수님을 통한 믿음의 길)
         print("\n--- 멀티인덱스로 특정 데이터 접근 (Accessing Data with MultiIndex - Jesus, Faith) ---")
-        print(multi_indexed_df.loc[('Jesus', 'Faith')].to_string())
+        reporting.print_frame(multi_indexed_df.loc[('Jesus', 'Faith')], full=True)
 
         print("\n💡 통찰 (Insight): `MultiIndex`는 예수님이라는 문을 통해 얻는 구원과 풍성한 삶의 다층적인 의미를 구조화하여 보여줍니다.")
         print("Insight: `MultiIndex` structures and displays the multi-layered meanings of salvation and abundant life found through Jesus, the Door.")
@@ -63,7 +70,7 @@ class DoorMultiIndexAccessAnalyzer:
         # 모든 예수님을 통한 길 데이터 접근
         jesus_path_data = multi_indexed_df.loc['Jesus']
         print("\n--- 모든 예수님을 통한 길 데이터 (All Jesus' Path Data) ---")
-        print(jesus_path_data.to_string())
+        reporting.print_frame(jesus_path_data, full=True)
 
         # 예수님을 통한 길의 평균 만족도와 평안 수준
         avg_fulfillment_jesus = jesus_path_data['fulfillment_level'].mean()
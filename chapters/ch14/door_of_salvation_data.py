@@ -1,6 +1,8 @@
 
 import pandas as pd
 import numpy as np
+from typing import Optional
+from utils.synthetic import frame_preview, tile_frame
 
 class DoorOfSalvationDataGenerator:
     """
@@ -32,7 +34,7 @@ class DoorOfSalvationDataGenerator:
             'peace_level': [10, 9, 10, 2, 1, 0] # 0-10 스케일 (10: 완전한 평안)
         })
 
-    def generate_door_of_salvation_data(self) -> pd.DataFrame:
+    def generate_door_of_salvation_data(self, num_records: Optional[int] = None) -> pd.DataFrame:
         """
         상세한 구원의 문 데이터를 생성합니다.
         예수님을 통한 길과 다른 길의 결과 및 접근 방식을 포함합니다.
@@ -40,10 +42,14 @@ class DoorOfSalvationDataGenerator:
         Generates detailed data for the door of salvation.
         Includes outcomes and approaches of the path through Jesus versus other paths.
 
+        Args:
+            num_records (int, optional): 생성할 레코드 수. 생략하면 길 6개, 주면 같은 행을 반복해 늘립니다.
+                Number of records; defaults to the 6 paths, otherwise the rows are repeated.
+
         Returns:
             pd.DataFrame: 상세 구원의 문 데이터
         """
-        df = self.paths_info.copy()
+        df = tile_frame(self.paths_info, num_records)
 
         # 만족도 수준에 약간의 노이즈 추가
         np.random.seed(109) # 재현성을 위해 시드 고정
@@ -55,7 +61,7 @@ class DoorOfSalvationDataGenerator:
         # 개역한글: 요한복음 14:6 - "예수께서 가라사대 내가 곧 길이요 진리요 생명이니 나로 말미암지 않고는 아버지께로 올 자가 없느니라"
         print("✨ 요한복음 10장 9절 기반 구원의 문 데이터가 생성되었습니다.")
         print("예수님을 통한 길과 다른 길의 결과 및 접근 방식을 시뮬레이션합니다.")
-        print(df.to_string(index=False))
+        print(frame_preview(df))
         print("\n---")
         print("영적 통찰: 예수님은 구원과 풍성한 삶으로 들어가는 유일한 문입니다. 다른 길은 혼란과 허무를 가져옵니다.")
         print("Spiritual Insight: Jesus is the only door to salvation and abundant life. Other paths lead to confusion and emptiness.")
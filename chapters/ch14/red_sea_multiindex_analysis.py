@@ -1,8 +1,11 @@
 
 import pandas as pd
+from typing import Optional
+from utils import reporting
+from utils.instrumentation import InstrumentedAnalyzerMixin
 from .red_sea_path_data import RedSeaPathDataGenerator
 
-class RedSeaMultiIndexAnalyzer:
+class RedSeaMultiIndexAnalyzer(InstrumentedAnalyzerMixin):
     """
     출애굽기 14장의 홍해 길 데이터를 `MultiIndex`를 사용하여 분석하는 클래스.
     시간, 그룹, 길의 상태 등 다층적인 정보를 구조화하고 접근합니다.
@@ -11,13 +14,17 @@ class RedSeaMultiIndexAnalyzer:
     Structures and accesses multi-layered information such as time, group, and path condition.
     """
 
-    def __init__(self):
+    def __init__(self, num_records: Optional[int] = None):
         """
         분석기 초기화 및 데이터 생성.
         Initializes the analyzer and generates data.
+
+        Args:
+            num_records (int, optional): 생성기에 넘길 레코드 수 (생략 시 기본 데이터).
+                Number of records passed to the data generator (defaults to the base data).
         """
         self.data_generator = RedSeaPathDataGenerator()
-        self.red_sea_df = self.data_generator.generate_red_sea_path_data()
+        self.red_sea_df = self.data_generator.generate_red_sea_path_data(num_records)
 
     def create_and_access_multiindex(self):
         """
@@ -35,11 +42,11 @@ class RedSeaMultiIndexAnalyzer:
         # MultiIndex 생성
         multi_indexed_df = self.red_sea_df.set_index(['time_of_day', 'group_status'])
         print("\n--- 멀티인덱스 DataFrame (Multi-indexed DataFrame) ---")
-        print(multi_indexed_df.to_string())
+        reporting.print_frame(multi_indexed_df, full=True)
 
         # 멀티인덱스를 사용하여 특정 데이터 접근 (예: Night 시간의 Israelites 데이터)
         print("\n--- 멀티인덱스로 특정 데이터 접근 (Accessing Data with MultiIndex - Night, Israelites) ---")
-        print(multi_indexed_df.loc[('Night', 'Israelites')].to_string())
+        reporting.print_frame(multi_indexed_df.loc[('Night', 'Israelites')], full=True)
 
         print("\n💡 통찰 (Insight): `MultiIndex`는 하나님의 인도하심이 시간과 대상에 따라 어떻게 세밀하게 구별되었는지 보여줍니다.")
         print("Insight: `MultiIndex` reveals how God's guidance was meticulously distinguished by time and target.")
@@ -63,7 +70,7 @@ class RedSeaMultiIndexAnalyzer:
         # 모든 이스라엘 백성 데이터 접근
         israelites_data = multi_indexed_df.loc[(slice(None), 'Israelites'), :]
         print("\n--- 모든 이스라엘 백성 데이터 (All Israelites Data) ---")
-        print(israelites_data.to_string())
+        reporting.print_frame(israelites_data, full=True)
 
         # 이스라엘 백성의 평균 안전 수준
         avg_safety_israelites = israelites_data['safety_level'].mean()
@@ -1,6 +1,8 @@
 
 import pandas as pd
 import numpy as np
+from typing import Optional
+from utils.synthetic import frame_preview, tile_frame
 
 class RedSeaPathDataGenerator:
     """
@@ -41,7 +43,7 @@ class RedSeaPathDataGenerator:
             'progress_km': [1, 2, 3, 4, 1, 2, 5, 0] # 진행 거리
         })
 
-    def generate_red_sea_path_data(self) -> pd.DataFrame:
+    def generate_red_sea_path_data(self, num_records: Optional[int] = None) -> pd.DataFrame:
         """
         상세한 홍해 길 데이터를 생성합니다.
         시간, 그룹, 길의 상태 등 다층적인 정보를 포함합니다.
@@ -49,10 +51,14 @@ class RedSeaPathDataGenerator:
         Generates detailed Red Sea path data.
         Includes multi-layered information such as time, group, and path condition.
 
+        Args:
+            num_records (int, optional): 생성할 레코드 수. 생략하면 구간 8개, 주면 같은 행을 반복해 늘립니다.
+                Number of records; defaults to the 8 segments, otherwise the rows are repeated.
+
         Returns:
             pd.DataFrame: 상세 홍해 길 데이터
         """
-        df = self.path_events.copy()
+        df = tile_frame(self.path_events, num_records)
 
         # 안전 수준에 약간의 노이즈 추가
         np.random.seed(1429) # 재현성을 위해 시드 고정
@@ -63,7 +69,7 @@ class RedSeaPathDataGenerator:
         # 개역한글: 출애굽기 14:29 - "이스라엘 자손은 바다 가운데 육지로 행하고 물은 그들의 좌우에 벽이 되니"
         print("✨ 출애굽기 14장 홍해 길 데이터가 생성되었습니다.")
         print("홍해를 건너는 길의 다층적인 상황과 그룹별 경험을 시뮬레이션합니다.")
-        print(df.to_string(index=False))
+        print(frame_preview(df))
         print("\n---")
         print("영적 통찰: 홍해의 길은 단순한 길이 아니라, 하나님의 세밀한 인도와 구별된 보호가 담긴 다층적인 길입니다.")
         print("Spiritual Insight: The Red Sea path is not just a road, but a multi-layered path containing God's meticulous guidance and distinct protection.")
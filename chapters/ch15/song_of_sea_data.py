@@ -1,6 +1,8 @@
 
 import pandas as pd
 import numpy as np
+from typing import Optional
+from utils.synthetic import frame_preview, tile_frame
 
 class SongOfTheSeaDataGenerator:
     """
@@ -44,7 +46,7 @@ class SongOfTheSeaDataGenerator:
             'time_period': ['Past', 'Past', 'Past', 'Past', 'Future', 'Future', 'Present', 'Present']
         })
 
-    def generate_song_of_sea_data(self) -> pd.DataFrame:
+    def generate_song_of_sea_data(self, num_records: Optional[int] = None) -> pd.DataFrame:
         """
         상세한 바다의 노래 데이터를 생성합니다.
         하나님의 속성, 이스라엘의 반응, 애굽의 운명 등 다양한 관점을 포함합니다.
@@ -52,10 +54,14 @@ class SongOfTheSeaDataGenerator:
         Generates detailed Song of the Sea data.
         Includes various perspectives such as God's attributes, Israel's response, and Egypt's fate.
 
+        Args:
+            num_records (int, optional): 생성할 레코드 수. 생략하면 노래 요소 8개, 주면 같은 행을 반복해 늘립니다.
+                Number of records; defaults to the 8 song elements, otherwise the rows are repeated.
+
         Returns:
             pd.DataFrame: 상세 바다의 노래 데이터
         """
-        df = self.song_elements.copy()
+        df = tile_frame(self.song_elements, num_records)
 
         # 강도에 약간의 노이즈 추가
         np.random.seed(152) # 재현성을 위해 시드 고정
@@ -66,7 +72,7 @@ class SongOfTheSeaDataGenerator:
         # 개역한글: 출애굽기 15:21 - "미리암이 그들에게 화답하여 가로되 너희는 여호와를 찬송하라 그는 높고 영화로우시며..."
         print("✨ 출애굽기 15장 바다의 노래 데이터가 생성되었습니다.")
         print("하나님의 구원 역사를 다양한 관점에서 재구성할 데이터를 시뮬레이션합니다.")
-        print(df.to_string(index=False))
+        print(frame_preview(df))
         print("\n---")
         print("영적 통찰: 바다의 노래는 단순한 찬양이 아니라, 하나님의 위대한 구원 역사를 다양한 관점에서 재구성하고 선포하는 것입니다.")
         print("Spiritual Insight: The Song of the Sea is not just a hymn, but a reshaping and proclamation of God's great salvation history from various perspectives.")
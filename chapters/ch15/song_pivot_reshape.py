@@ -1,8 +1,11 @@
 
 import pandas as pd
+from typing import Optional
+from utils import reporting
+from utils.instrumentation import InstrumentedAnalyzerMixin
 from .song_of_sea_data import SongOfTheSeaDataGenerator
 
-class SongPivotReshapeAnalyzer:
+class SongPivotReshapeAnalyzer(InstrumentedAnalyzerMixin):
     """
     출애굽기 15장의 바다의 노래 데이터를 `pivot_table()`과 `melt()`를 사용하여 분석하는 클래스.
     하나님의 구원 역사를 다양한 관점으로 재구성하고 탐구합니다.
@@ -11,13 +14,17 @@ class SongPivotReshapeAnalyzer:
     Reconfigures and explores God's salvation history from various perspectives.
     """
 
-    def __init__(self):
+    def __init__(self, num_records: Optional[int] = None):
         """
         분석기 초기화 및 데이터 생성.
         Initializes the analyzer and generates data.
+
+        Args:
+            num_records (int, optional): 생성기에 넘길 레코드 수 (생략 시 기본 데이터).
+                Number of records passed to the data generator (defaults to the base data).
         """
         self.data_generator = SongOfTheSeaDataGenerator()
-        self.song_df = self.data_generator.generate_song_of_sea_data()
+        self.song_df = self.data_generator.generate_song_of_sea_data(num_records)
 
     def analyze_pivot_table(self):
         """
@@ -34,7 +41,7 @@ class SongPivotReshapeAnalyzer:
 
         # 'attribute_of_God'를 인덱스로, 'israel_response'를 컬럼으로 하는 pivot_table 생성
         pivoted_song = pd.pivot_table(self.song_df, values='intensity', index='attribute_of_God', columns='israel_response', aggfunc='sum', fill_value=0)
-        print(pivoted_song.to_string())
+        reporting.print_frame(pivoted_song, full=True)
 
         print("\n💡 통찰 (Insight): `pivot_table()`은 하나님의 위대한 속성이 이스라엘 백성의 어떤 반응을 이끌어냈는지 요약하여 보여줍니다.")
         print("Insight: `pivot_table()` summarizes how God's great attributes elicited specific responses from the Israelites.")
@@ -55,7 +62,7 @@ class SongPivotReshapeAnalyzer:
 
         # 'event_id', 'event_type'을 고정하고 나머지 컬럼을 'category'와 'value'로 melt
         melted_song = self.song_df.melt(id_vars=['event_id', 'event_type'], var_name='category', value_name='value')
-        print(melted_song.head().to_string(index=False))
+        reporting.print_frame(melted_song.head(), index=False)
 
         print("\n💡 통찰 (Insight): `melt()`는 구원 역사의 각 요소(하나님의 속성, 이스라엘 반응, 애굽 운명)를 개별적으로 분석하여 하나님의 일하심의 세밀함을 추적하게 합니다.")
         print("Insight: `melt()` allows individual analysis of each element (God's attributes, Israel's response, Egypt's fate) in salvation history, tracking the meticulousness of God's work.")
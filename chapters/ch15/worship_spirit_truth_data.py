@@ -1,6 +1,8 @@
 
 import pandas as pd
 import numpy as np
+from typing import Optional
+from utils.synthetic import frame_preview, tile_frame
 
 class WorshipSpiritTruthDataGenerator:
     """
@@ -41,7 +43,7 @@ class WorshipSpiritTruthDataGenerator:
             'divine_acceptance': [True, True, True, True, False, False, True, True] # 하나님이 받으시는 예배 여부
         })
 
-    def generate_worship_data(self) -> pd.DataFrame:
+    def generate_worship_data(self, num_records: Optional[int] = None) -> pd.DataFrame:
         """
         상세한 예배 데이터를 생성합니다.
         예배의 본질과 다양한 형태를 포함합니다.
@@ -49,10 +51,14 @@ class WorshipSpiritTruthDataGenerator:
         Generates detailed worship data.
         Includes the essence and various forms of worship.
 
+        Args:
+            num_records (int, optional): 생성할 레코드 수. 생략하면 예배 요소 8개, 주면 같은 행을 반복해 늘립니다.
+                Number of records; defaults to the 8 worship elements, otherwise the rows are repeated.
+
         Returns:
             pd.DataFrame: 상세 예배 데이터
         """
-        df = self.worship_elements.copy()
+        df = tile_frame(self.worship_elements, num_records)
 
         # 수준에 약간의 노이즈 추가
         np.random.seed(424) # 재현성을 위해 시드 고정
@@ -64,7 +70,7 @@ class WorshipSpiritTruthDataGenerator:
         # 개역한글: 요한복음 4:24 - "하나님은 영이시니 예배하는 자가 신령과 진정으로 예배할지니라"
         print("✨ 요한복음 4장 신령과 진정으로 드리는 예배 데이터가 생성되었습니다.")
         print("예배의 본질과 다양한 형태를 시뮬레이션합니다.")
-        print(df.to_string(index=False))
+        print(frame_preview(df))
         print("\n---")
         print("영적 통찰: 예배는 단순히 외적인 행위가 아니라, 영적인 상태와 진실된 마음이라는 다층적인 요소를 포함합니다.")
         print("Spiritual Insight: Worship includes multi-layered elements of spiritual state and sincere heart, not just outward actions.")
@@ -1,8 +1,11 @@
 
 import pandas as pd
+from typing import Optional
+from utils import reporting
+from utils.instrumentation import InstrumentedAnalyzerMixin
 from .worship_spirit_truth_data import WorshipSpiritTruthDataGenerator
 
-class WorshipStackUnstackAnalyzer:
+class WorshipStackUnstackAnalyzer(InstrumentedAnalyzerMixin):
     """
     요한복음 4장의 예배 데이터를 `stack()`과 `unstack()`을 사용하여 분석하는 클래스.
     예배의 본질과 다양한 형태를 인덱스와 컬럼 간에 전환하며 탐구합니다.
@@ -11,13 +14,17 @@ class WorshipStackUnstackAnalyzer:
     Explores the essence and various forms of worship by pivoting between index and columns.
     """
 
-    def __init__(self):
+    def __init__(self, num_records: Optional[int] = None):
         """
         분석기 초기화 및 데이터 생성.
         Initializes the analyzer and generates data.
+
+        Args:
+            num_records (int, optional): 생성기에 넘길 레코드 수 (생략 시 기본 데이터).
+                Number of records passed to the data generator (defaults to the base data).
         """
         self.data_generator = WorshipSpiritTruthDataGenerator()
-        self.worship_df = self.data_generator.generate_worship_data()
+        self.worship_df = self.data_generator.generate_worship_data(num_records)
 
     def analyze_stack_unstack(self):
         """
@@ -38,17 +45,17 @@ class WorshipStackUnstackAnalyzer:
         # 'worship_type'과 'element_en'을 멀티인덱스로 설정
         multi_indexed_worship = self.worship_df.set_index(['worship_type', 'element_en'])
         print("\n--- 멀티인덱스 DataFrame (Multi-indexed DataFrame) ---")
-        print(multi_indexed_worship.to_string())
+        reporting.print_frame(multi_indexed_worship, full=True)
 
         # 멀티인덱스를 stack하여 컬럼을 인덱스 레벨로 변환
         print("\n--- 데이터 Stack (Stacking Data) ---")
         stacked_worship = multi_indexed_worship[['essence_level', 'expression_level']].stack()
-        print(stacked_worship.head().to_string())
+        reporting.print_frame(stacked_worship.head(), full=True)
 
         # stack된 데이터를 unstack하여 인덱스 레벨을 컬럼으로 변환
         print("\n--- 데이터 Unstack (Unstacking Data) ---")
         unstacked_worship = stacked_worship.unstack()
-        print(unstacked_worship.head().to_string())
+        reporting.print_frame(unstacked_worship.head(), full=True)
 
         print("\n💡 통찰 (Insight): `stack()`과 `unstack()`은 예배의 본질과 외적 표현이 어떻게 상호작용하는지 다층적으로 이해하게 합니다.")
         print("Insight: `stack()` and `unstack()` help understand how the essence and outward expression of worship interact in a multi-layered way.")
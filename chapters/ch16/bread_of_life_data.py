@@ -1,7 +1,9 @@
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
+from typing import Optional
+from utils.synthetic import date_range, frame_preview
 
 class BreadOfLifeDataGenerator:
     """
@@ -15,24 +17,27 @@ class BreadOfLifeDataGenerator:
     def __init__(self):
         self.spiritual_journey_data = self._load_spiritual_journey_data()
 
-    def _load_spiritual_journey_data(self):
+    def _load_spiritual_journey_data(self, num_days: int = 30):
         """
         영적 여정의 주요 지표에 대한 기본 정보를 로드합니다.
         Loads basic information about key indicators of the spiritual journey.
+
+        Args:
+            num_days (int): 시뮬레이션할 일수 (기본값: 30일)
         """
         # KJV: John 6:35 - "...I am the bread of life: he that cometh to me shall never hunger; and he that believeth on me shall never thirst."
         # ESV: John 6:35 - "...I am the bread of life; whoever comes to me shall not hunger, and whoever believes in me shall never thirst."
         # 개역한글: 요한복음 6:35 - "...내가 곧 생명의 떡이니 내게 오는 자는 결코 주리지 아니할 터이요 나를 믿는 자는 영원히 목마르지 아니하리라"
-        dates = [datetime(2024, 5, 1) + timedelta(days=i) for i in range(30)]
+        dates = date_range(datetime(2024, 5, 1), periods=num_days, freq='D')
         return pd.DataFrame({
             'date': dates,
-            'spiritual_hunger': np.random.randint(1, 10, size=30), # 1-10 스케일 (10: 극심한 갈증)
-            'word_intake_hours': np.random.randint(0, 2, size=30), # 말씀 섭취 시간 (시간)
-            'prayer_time_minutes': np.random.randint(10, 60, size=30), # 기도 시간 (분)
-            'spiritual_fulfillment': np.random.randint(1, 10, size=30) # 1-10 스케일 (10: 완전한 채움)
+            'spiritual_hunger': np.random.randint(1, 10, size=num_days), # 1-10 스케일 (10: 극심한 갈증)
+            'word_intake_hours': np.random.randint(0, 2, size=num_days), # 말씀 섭취 시간 (시간)
+            'prayer_time_minutes': np.random.randint(10, 60, size=num_days), # 기도 시간 (분)
+            'spiritual_fulfillment': np.random.randint(1, 10, size=num_days) # 1-10 스케일 (10: 완전한 채움)
         })
 
-    def generate_bread_of_life_data(self) -> pd.DataFrame:
+    def generate_bread_of_life_data(self, num_records: Optional[int] = None) -> pd.DataFrame:
         """
         상세한 생명의 떡 데이터를 생성합니다.
         영적 갈증, 채움, 말씀 섭취를 시계열로 구성합니다.
@@ -40,10 +45,17 @@ class BreadOfLifeDataGenerator:
         Generates detailed Bread of Life data.
         Structures spiritual hunger, fulfillment, and Word intake as a time series.
 
+        Args:
+            num_records (int, optional): 생성할 일수. 생략하면 기본 30일, 주면 그 일수만큼 새로 생성합니다.
+                Number of days; defaults to the 30 loaded days, otherwise that many days are generated.
+
         Returns:
             pd.DataFrame: 상세 생명의 떡 데이터
         """
-        df = self.spiritual_journey_data.copy()
+        if num_records is None:
+            df = self.spiritual_journey_data.copy()
+        else:
+            df = self._load_spiritual_journey_data(num_records)
 
         # 말씀 섭취와 기도 시간에 따른 영적 채움 수준 조정
         df['spiritual_fulfillment'] = np.clip(
@@ -58,7 +70,7 @@ class BreadOfLifeDataGenerator:
         # 개역한글: 요한복음 6:51 - "나는 하늘에서 내려온 산 떡이니 사람이 이 떡을 먹으면 영생하리라..."
         print("✨ 요한복음 6장 생명의 떡 데이터가 생성되었습니다.")
         print("영적 갈증, 채움, 말씀 섭취를 시계열로 시뮬레이션합니다.")
-        print(df.to_string(index=False))
+        print(frame_preview(df))
         print("\n---")
         print("영적 통찰: 생명의 떡이신 예수님을 통해 영적 갈증이 해소되고 영원한 채움을 얻는 패턴을 시간 데이터로 볼 수 있습니다.")
         print("Spiritual Insight: Through Jesus, the Bread of Life, we can see a pattern of spiritual hunger being quenched and eternal fulfillment gained over time.")
@@ -1,8 +1,11 @@
 
 import pandas as pd
+from typing import Optional
+from utils import reporting
+from utils.instrumentation import InstrumentedAnalyzerMixin
 from .bread_of_life_data import BreadOfLifeDataGenerator
 
-class BreadWindowFunctionsAnalyzer:
+class BreadWindowFunctionsAnalyzer(InstrumentedAnalyzerMixin):
     """
     요한복음 6장의 생명의 떡 데이터를 윈도우 함수를 사용하여 분석하는 클래스.
     영적 갈증과 채움의 변화 추세를 `rolling()` 연산으로 탐구합니다.
@@ -11,13 +14,17 @@ class BreadWindowFunctionsAnalyzer:
     Explores trends in spiritual hunger and fulfillment using `rolling()` operations.
     """
 
-    def __init__(self):
+    def __init__(self, num_records: Optional[int] = None):
         """
         분석기 초기화 및 데이터 생성.
         Initializes the analyzer and generates data.
+
+        Args:
+            num_records (int, optional): 생성기에 넘길 레코드 수 (생략 시 기본 데이터).
+                Number of records passed to the data generator (defaults to the base data).
         """
         self.data_generator = BreadOfLifeDataGenerator()
-        self.bread_df = self.data_generator.generate_bread_of_life_data()
+        self.bread_df = self.data_generator.generate_bread_of_life_data(num_records)
         self.bread_df = self.bread_df.set_index('date') # 날짜를 인덱스로 설정
 
     def analyze_rolling_mean_fulfillment(self):
@@ -34,7 +41,7 @@ class BreadWindowFunctionsAnalyzer:
         print("Calculating the 7-day rolling mean of spiritual fulfillment to identify weekly trends in spiritual state.")
 
         self.bread_df['rolling_mean_fulfillment'] = self.bread_df['spiritual_fulfillment'].rolling(window=7, min_periods=1).mean()
-        print(self.bread_df[['spiritual_fulfillment', 'rolling_mean_fulfillment']].to_string())
+        reporting.print_frame(self.bread_df[['spiritual_fulfillment', 'rolling_mean_fulfillment']], full=True)
 
         print("\n💡 통찰 (Insight): `rolling().mean()`은 생명의 떡이신 예수님을 통해 영적 채움이 지속적으로 유지되는 패턴을 보여줍니다.")
         print("Insight: `rolling().mean()` reveals the pattern of continuous spiritual fulfillment maintained through Jesus, the Bread of Life.")
@@ -54,7 +61,7 @@ class BreadWindowFunctionsAnalyzer:
         print("Calculating the 5-day rolling standard deviation of spiritual hunger to identify variability in spiritual state.")
 
         self.bread_df['rolling_std_hunger'] = self.bread_df['spiritual_hunger'].rolling(window=5, min_periods=1).std()
-        print(self.bread_df[['spiritual_hunger', 'rolling_std_hunger']].to_string())
+        reporting.print_frame(self.bread_df[['spiritual_hunger', 'rolling_std_hunger']], full=True)
 
         print("\n💡 통찰 (Insight): `rolling().std()`는 말씀 섭취와 기도 생활을 통해 영적 갈증의 변동성이 줄어들고 안정적인 상태에 이르는 과정을 보여줍니다.")
         print("Insight: `rolling().std()` shows how the variability of spiritual hunger decreases and a stable state is reached through Word intake and prayer life.")
@@ -2,6 +2,8 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from typing import Optional
+from utils.synthetic import date_range, frame_preview
 
 class MannaOrdinanceDataGenerator:
     """
@@ -15,23 +17,26 @@ class MannaOrdinanceDataGenerator:
     def __init__(self):
         self.manna_events = self._load_manna_events()
 
-    def _load_manna_events(self):
+    def _load_manna_events(self, num_days: int = 30):
         """
         만나 규례의 주요 사건에 대한 기본 정보를 로드합니다.
         Loads basic information about key events of the manna ordinance.
+
+        Args:
+            num_days (int): 시뮬레이션할 일수 (기본값: 30일)
         """
         # KJV: Exodus 16:4 - "...I will rain bread from heaven for you; and the people shall go out and gather a certain rate every day..."
         # ESV: Exodus 16:4 - "...I will rain bread from heaven for you, and the people shall go out and gather a day's portion every day..."
         # 개역한글: 출애굽기 16:4 - "...하늘에서 너희를 위하여 양식을 비같이 내리리니 백성이 나가서 일용할 것을 날마다 거둘 것이라"
         return pd.DataFrame({
-            'day_num': range(1, 31), # 30일간의 광야 여정 시뮬레이션
-            'date': pd.to_datetime([f'2024-04-{d:02d}' for d in range(1, 31)]),
-            'manna_gathered_kg': np.random.randint(100, 150, size=30), # 매일 거둔 만나 양
-            'israel_obedience': np.random.randint(7, 10, size=30), # 1-10 스케일 (10: 완전 순종)
-            'israel_complaint': np.random.randint(1, 4, size=30) # 1-10 스케일 (10: 극심한 불평)
+            'day_num': np.arange(1, num_days + 1), # 기본 30일간의 광야 여정 시뮬레이션
+            'date': date_range('2024-04-01', periods=num_days, freq='D'),
+            'manna_gathered_kg': np.random.randint(100, 150, size=num_days), # 매일 거둔 만나 양
+            'israel_obedience': np.random.randint(7, 10, size=num_days), # 1-10 스케일 (10: 완전 순종)
+            'israel_complaint': np.random.randint(1, 4, size=num_days) # 1-10 스케일 (10: 극심한 불평)
         })
 
-    def generate_manna_data(self) -> pd.DataFrame:
+    def generate_manna_data(self, num_records: Optional[int] = None) -> pd.DataFrame:
         """
         상세한 만나 데이터를 생성합니다.
         날짜 정보를 포함하여 시계열 데이터로 구성합니다.
@@ -39,29 +44,36 @@ class MannaOrdinanceDataGenerator:
         Generates detailed manna data.
         Structures it as time-series data including date information.
 
+        Args:
+            num_records (int, optional): 생성할 일수. 생략하면 기본 30일, 주면 그 일수만큼 새로 생성합니다.
+                Number of days; defaults to the 30 loaded days, otherwise that many days are generated.
+
         Returns:
             pd.DataFrame: 상세 만나 데이터
         """
-        df = self.manna_events.copy()
+        if num_records is None:
+            df = self.manna_events.copy()
+        else:
+            df = self._load_manna_events(num_records)
 
         # 안식일(7일째, 14일째, 21일째, 28일째)에는 만나를 거두지 않음
         # 안식일 전날(6일째, 13일째, 20일째, 27일째)에는 두 배로 거둠
-        for i in range(len(df)):
-            if (df.loc[i, 'day_num'] % 7) == 0: # 안식일
-                df.loc[i, 'manna_gathered_kg'] = 0
-                df.loc[i, 'israel_obedience'] = 10 # 안식일 규례 준수
-                df.loc[i, 'israel_complaint'] = 1 # 불평 없음
-            elif (df.loc[i, 'day_num'] % 7) == 6: # 안식일 전날
-                df.loc[i, 'manna_gathered_kg'] *= 2
-                df.loc[i, 'israel_obedience'] = 9 # 이틀치 거둠
-                df.loc[i, 'israel_complaint'] = 2 # 불평 적음
+        sabbath = (df['day_num'] % 7) == 0 # 안식일
+        df.loc[sabbath, 'manna_gathered_kg'] = 0
+        df.loc[sabbath, 'israel_obedience'] = 10 # 안식일 규례 준수
+        df.loc[sabbath, 'israel_complaint'] = 1 # 불평 없음
+
+        sabbath_eve = (df['day_num'] % 7) == 6 # 안식일 전날
+        df.loc[sabbath_eve, 'manna_gathered_kg'] *= 2
+        df.loc[sabbath_eve, 'israel_obedience'] = 9 # 이틀치 거둠
+        df.loc[sabbath_eve, 'israel_complaint'] = 2 # 불평 적음
 
         # KJV: Exodus 16:20 - "...some of them left of it till the morning, and it bred worms, and stank..."
         # ESV: Exodus 16:20 - "But they did not listen to Moses. Some left part of it till the morning, and it bred worms and stank."
         # 개역한글: 출애굽기 16:20 - "그들이 모세의 말을 청종치 아니하고 더러는 아침까지 두었더니 벌레가 생기고 냄새가 난지라"
         print("✨ 출애굽기 16장 만나 규례 데이터가 생성되었습니다.")
         print("매일의 만나 공급, 이스라엘의 순종/불순종을 시계열로 시뮬레이션합니다.")
-        print(df.to_string(index=False))
+        print(frame_preview(df))
         print("\n---")
         print("영적 통찰: 만나의 규례는 하나님의 매일의 공급과 순종의 중요성을 보여줍니다. 시간 데이터는 그 패턴을 드러냅니다.")
         print("Spiritual Insight: The manna ordinance reveals God's daily provision and the importance of obedience. Time data reveals its patterns.")
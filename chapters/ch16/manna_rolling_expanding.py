@@ -1,8 +1,11 @@
 
 import pandas as pd
+from typing import Optional
+from utils import reporting
+from utils.instrumentation import InstrumentedAnalyzerMixin
 from .manna_ordinance_data import MannaOrdinanceDataGenerator
 
-class MannaRollingExpandingAnalyzer:
+class MannaRollingExpandingAnalyzer(InstrumentedAnalyzerMixin):
     """
     출애굽기 16장의 만나 데이터를 `rolling()`과 `expanding()`을 사용하여 분석하는 클래스.
     만나 공급의 주기적 패턴과 이스라엘의 누적된 불평을 탐구합니다.
@@ -11,13 +14,17 @@ class MannaRollingExpandingAnalyzer:
     Explores periodic patterns of manna provision and Israel's accumulated complaints.
     """
 
-    def __init__(self):
+    def __init__(self, num_records: Optional[int] = None):
         """
         분석기 초기화 및 데이터 생성.
         Initializes the analyzer and generates data.
+
+        Args:
+            num_records (int, optional): 생성기에 넘길 레코드 수 (생략 시 기본 데이터).
+                Number of records passed to the data generator (defaults to the base data).
         """
         self.data_generator = MannaOrdinanceDataGenerator()
-        self.manna_df = self.data_generator.generate_manna_data()
+        self.manna_df = self.data_generator.generate_manna_data(num_records)
         self.manna_df = self.manna_df.set_index('date') # 날짜를 인덱스로 설정
 
     def analyze_rolling_mean_manna(self):
@@ -34,7 +41,7 @@ class MannaRollingExpandingAnalyzer:
         print("Calculating the 7-day rolling mean of manna gathered to identify weekly patterns.")
 
         self.manna_df['rolling_mean_manna'] = self.manna_df['manna_gathered_kg'].rolling(window=7, min_periods=1).mean()
-        print(self.manna_df[['manna_gathered_kg', 'rolling_mean_manna']].to_string())
+        reporting.print_frame(self.manna_df[['manna_gathered_kg', 'rolling_mean_manna']], full=True)
 
         print("\n💡 통찰 (Insight): `rolling().mean()`은 안식일 규례로 인한 만나 공급의 주기적인 패턴을 보여주며, 하나님의 세밀한 공급 계획을 드러냅니다.")
         print("Insight: `rolling().mean()` reveals the periodic pattern of manna provision due to the Sabbath ordinance, showcasing God's meticulous provision plan.")
@@ -54,7 +61,7 @@ class MannaRollingExpandingAnalyzer:
         print("Calculating the accumulated complaints of the Israelites over the entire wilderness journey using `expanding().sum()`.")
 
         self.manna_df['expanding_sum_complaint'] = self.manna_df['israel_complaint'].expanding(min_periods=1).sum()
-        print(self.manna_df[['israel_complaint', 'expanding_sum_complaint']].to_string())
+        reporting.print_frame(self.manna_df[['israel_complaint', 'expanding_sum_complaint']], full=True)
 
         print("\n💡 통찰 (Insight): `expanding().sum()`은 인간의 연약함과 불순종이 시간이 지남에 따라 어떻게 쌓여가는지 데이터적으로 보여줍니다.")
         print("Insight: `expanding().sum()` numerically illustrates how human weakness and disobedience accumulate over time.")
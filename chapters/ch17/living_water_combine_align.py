@@ -1,9 +1,12 @@
 
 import pandas as pd
 from datetime import datetime, timedelta
+from typing import Optional
+from utils import reporting
+from utils.instrumentation import InstrumentedAnalyzerMixin
 from .living_water_flow_data import LivingWaterFlowDataGenerator
 
-class LivingWaterCombineAlignAnalyzer:
+class LivingWaterCombineAlignAnalyzer(InstrumentedAnalyzerMixin):
     """
     요한복음 7장의 생수의 강 데이터를 `align()`과 `merge_asof()`를 사용하여 분석하는 클래스.
     말씀 섭취와 기도 강도 데이터를 결합하여 영적 흐름을 통합적으로 탐구합니다.
@@ -12,13 +15,17 @@ class LivingWaterCombineAlignAnalyzer:
     Integratively explores spiritual flow by combining Word intake and prayer intensity data.
     """
 
-    def __init__(self):
+    def __init__(self, num_records: Optional[int] = None):
         """
         분석기 초기화 및 데이터 생성.
         Initializes the analyzer and generates data.
+
+        Args:
+            num_records (int, optional): 생성기에 넘길 레코드 수 (생략 시 기본 데이터).
+                Number of records passed to the data generator (defaults to the base data).
         """
         self.data_generator = LivingWaterFlowDataGenerator()
-        self.living_water_df = self.data_generator.generate_living_water_flow_data()
+        self.living_water_df = self.data_generator.generate_living_water_flow_data(num_records)
         self.living_water_df = self.living_water_df.set_index('timestamp') # 날짜를 인덱스로 설정
 
     def analyze_align_data(self):
@@ -48,7 +55,7 @@ class LivingWaterCombineAlignAnalyzer:
             'word_intake_score': aligned_word['word_intake_score'],
             'prayer_intensity_score': aligned_prayer['prayer_intensity_score']
         })
-        print(combined_aligned_df.head(20).to_string())
+        reporting.print_frame(combined_aligned_df.head(20), full=True)
 
         print("\n💡 통찰 (Insight): `align()`은 서로 다른 영적 활동들이 시간적으로 어떻게 상호작용하는지 통합적으로 이해하는 데 도움을 줍니다.")
         print("Insight: `align()` helps integratively understand how different spiritual activities interact over time.")
@@ -73,7 +80,7 @@ class LivingWaterCombineAlignAnalyzer:
 
         # `merge_asof`는 시간적으로 가장 가까운 이전 값을 기준으로 병합
         merged_asof_df = pd.merge_asof(df_flow_reset, df_word_reset, on='timestamp', direction='nearest', suffixes=('_flow', '_word'))
-        print(merged_asof_df.head(20).to_string(index=False))
+        reporting.print_frame(merged_asof_df.head(20), index=False)
 
         print("\n💡 통찰 (Insight): `merge_asof()`는 말씀 섭취가 영적 흐름에 미치는 시간적 영향을 분석하여 생수의 강이 흐르는 패턴을 보여줍니다.")
         print("Insight: `merge_asof()` analyzes the temporal impact of Word intake on spiritual flow, revealing the pattern of living water flowing.")
@@ -1,7 +1,9 @@
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
+from typing import Optional
+from utils.synthetic import date_range, frame_preview
 
 class WaterFromRockDataGenerator:
     """
@@ -15,23 +17,26 @@ class WaterFromRockDataGenerator:
     def __init__(self):
         self.rock_events = self._load_rock_events()
 
-    def _load_rock_events(self):
+    def _load_rock_events(self, num_hours: int = 24 * 5):
         """
         반석에서 난 물 사건의 주요 단계에 대한 기본 정보를 로드합니다.
         Loads basic information about key stages of the water from the rock event.
+
+        Args:
+            num_hours (int): 시간 단위 관측 수 (기본값: 5일간의 데이터)
         """
         # KJV: Exodus 17:3 - "And the people thirsted there for water; and the people murmured against Moses..."
         # ESV: Exodus 17:3 - "But the people thirsted there for water, and the people grumbled against Moses..."
         # 개역한글: 출애굽기 17:3 - "거기서 백성이 물이 없으므로 모세를 대하여 원망하여 가로되..."
-        dates = [datetime(2024, 6, 1) + timedelta(hours=i) for i in range(24 * 5)] # 5일간의 데이터
+        dates = date_range(datetime(2024, 6, 1), periods=num_hours, freq='h')
         return pd.DataFrame({
             'timestamp': dates,
             'thirst_level': np.random.randint(5, 10, size=len(dates)), # 1-10 스케일 (10: 극심한 갈증)
             'israel_complaint_level': np.random.randint(1, 5, size=len(dates)), # 1-10 스케일 (10: 극심한 불평)
-            'water_supply_status': ['None'] * len(dates) # 초기에는 물 공급 없음
+            'water_supply_status': 'None' # 초기에는 물 공급 없음
         })
 
-    def generate_water_from_rock_data(self) -> pd.DataFrame:
+    def generate_water_from_rock_data(self, num_records: Optional[int] = None) -> pd.DataFrame:
         """
         상세한 반석에서 난 물 데이터를 생성합니다.
         갈증, 불평, 물 공급 상태를 시계열로 구성합니다.
@@ -39,10 +44,17 @@ class WaterFromRockDataGenerator:
         Generates detailed water from the rock data.
         Structures thirst, complaints, and water supply status as a time series.
 
+        Args:
+            num_records (int, optional): 생성할 시간 단위 관측 수. 생략하면 기본 5일(120시간), 주면 그만큼 새로 생성합니다.
+                Number of hourly observations; defaults to the loaded 5 days, otherwise that many hours are generated.
+
         Returns:
             pd.DataFrame: 상세 반석에서 난 물 데이터
         """
-        df = self.rock_events.copy()
+        if num_records is None:
+            df = self.rock_events.copy()
+        else:
+            df = self._load_rock_events(num_records)
 
         # 특정 시점에 물 공급 발생 시뮬레이션
         # 3일째 12시에 물 공급 시작
@@ -56,7 +68,7 @@ class WaterFromRockDataGenerator:
         # 개역한글: 출애굽기 17:6 - "...네가 반석을 치라 그리하면 그곳에서 물이 나리니 백성이 마시리라"
         print("✨ 출애굽기 17장 반석에서 난 물 데이터가 생성되었습니다.")
         print("이스라엘의 갈증, 불평, 하나님의 기적적인 공급을 시계열로 시뮬레이션합니다.")
-        print(df.to_string(index=False))
+        print(frame_preview(df))
         print("\n---")
         print("영적 통찰: 하나님의 공급은 인간의 불평 속에서도 기적적으로 나타나며, 시간의 흐름 속에서 그 신실하심을 보여줍니다.")
         print("Spiritual Insight: God's provision miraculously appears even amidst human complaints, demonstrating His faithfulness over time.")
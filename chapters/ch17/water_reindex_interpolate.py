@@ -2,9 +2,12 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from typing import Optional
+from utils import reporting
+from utils.instrumentation import InstrumentedAnalyzerMixin
 from .water_from_rock_data import WaterFromRockDataGenerator
 
-class WaterReindexInterpolateAnalyzer:
+class WaterReindexInterpolateAnalyzer(InstrumentedAnalyzerMixin):
     """
     출애굽기 17장의 반석에서 난 물 데이터를 `reindex()`와 `interpolate()`를 사용하여 분석하는 클래스.
     누락된 시간대를 채우고 갈증 수준을 보간하여 하나님의 공급을 탐구합니다.
@@ -13,13 +16,17 @@ class WaterReindexInterpolateAnalyzer:
     Explores God's provision by filling missing timestamps and interpolating thirst levels.
     """
 
-    def __init__(self):
+    def __init__(self, num_records: Optional[int] = None):
         """
         분석기 초기화 및 데이터 생성.
         Initializes the analyzer and generates data.
+
+        Args:
+            num_records (int, optional): 생성기에 넘길 레코드 수 (생략 시 기본 데이터).
+                Number of records passed to the data generator (defaults to the base data).
         """
         self.data_generator = WaterFromRockDataGenerator()
-        self.water_df = self.data_generator.generate_water_from_rock_data()
+        self.water_df = self.data_generator.generate_water_from_rock_data(num_records)
         self.water_df = self.water_df.set_index('timestamp') # 날짜를 인덱스로 설정
 
     def analyze_reindex_and_interpolate(self):
@@ -50,9 +57,9 @@ class WaterReindexInterpolateAnalyzer:
         reindexed_df['complaint_level_interpolated'] = reindexed_df['israel_complaint_level'].interpolate(method='linear')
 
         print("\n--- 원본 데이터 (일부 누락) ---")
-        print(df_sparse[['thirst_level', 'israel_complaint_level']].head(20).to_string())
+        reporting.print_frame(df_sparse[['thirst_level', 'israel_complaint_level']].head(20), full=True)
         print("\n--- 재색인 및 보간된 데이터 (Reindexed & Interpolated Data) ---")
-        print(reindexed_df[['thirst_level', 'thirst_level_interpolated', 'israel_complaint_level', 'complaint_level_interpolated']].head(20).to_string())
+        reporting.print_frame(reindexed_df[['thirst_level', 'thirst_level_interpolated', 'israel_complaint_level', 'complaint_level_interpolated']].head(20), full=True)
 
         print("\n💡 통찰 (Insight): `reindex()`와 `interpolate()`는 파편화된 정보 속에서도 하나님의 신실한 인도하심이 끊이지 않았음을 연속적인 흐름으로 보여줍니다.")
         print("Insight: `reindex()` and `interpolate()` show that God's faithful guidance was continuous, even amidst fragmented information.")
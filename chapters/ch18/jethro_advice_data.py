@@ -1,6 +1,8 @@
 
 import pandas as pd
 import numpy as np
+from typing import Optional
+from utils.synthetic import frame_preview, tile_frame
 
 class JethroAdviceDataGenerator:
     """
@@ -31,7 +33,7 @@ class JethroAdviceDataGenerator:
             'people_satisfaction': [5, 4, 3, 3, 2, 7, 8, 8, 9, 9] # 1-10 스케일 (10: 매우 만족)
         })
 
-    def generate_jethro_advice_data(self) -> pd.DataFrame:
+    def generate_jethro_advice_data(self, num_records: Optional[int] = None) -> pd.DataFrame:
         """
         상세한 이드로의 조언 데이터를 생성합니다.
         모세의 업무 과부하와 조언에 따른 변화를 시뮬레이션합니다.
@@ -39,10 +41,14 @@ class JethroAdviceDataGenerator:
         Generates detailed Jethro's advice data.
         Simulates Moses' workload and changes after the advice.
 
+        Args:
+            num_records (int, optional): 생성할 일수. 생략하면 기본 10일, 주면 10일 주기를 이어 붙여 늘립니다.
+                Number of days; defaults to 10, otherwise the 10-day cycle is continued.
+
         Returns:
             pd.DataFrame: 상세 이드로의 조언 데이터
         """
-        df = self.jethro_events.copy()
+        df = tile_frame(self.jethro_events, num_records, steps={'day': len(self.jethro_events)})
 
         # 피로도와 만족도에 약간의 노이즈 추가
         np.random.seed(1824) # 재현성을 위해 시드 고정
@@ -54,7 +60,7 @@ class JethroAdviceDataGenerator:
         # 개역한글: 출애굽기 18:24 - "모세가 그 장인의 말을 듣고 그 말대로 하여"
         print("✨ 출애굽기 18장 이드로의 조언 데이터가 생성되었습니다.")
         print("모세의 재판 업무 과부하와 이드로의 조언에 따른 변화를 시뮬레이션합니다.")
-        print(df.to_string(index=False))
+        print(frame_preview(df))
         print("\n---")
         print("영적 통찰: 이드로의 조언은 복잡한 작업을 효율적으로 분담하고 연결하는 지혜를 보여줍니다. 이는 데이터 처리 파이프라인과 유사합니다.")
         print("Spiritual Insight: Jethro's advice demonstrates the wisdom of efficiently delegating and connecting complex tasks, similar to data processing pipelines.")
@@ -1,8 +1,11 @@
 
 import pandas as pd
+from typing import Optional
+from utils import reporting
+from utils.instrumentation import InstrumentedAnalyzerMixin
 from .jethro_advice_data import JethroAdviceDataGenerator
 
-class JethroPipelineAnalyzer:
+class JethroPipelineAnalyzer(InstrumentedAnalyzerMixin):
     """
     출애굽기 18장의 이드로의 조언 데이터를 `assign()`과 `pipe()`를 사용하여 분석하는 클래스.
     모세의 업무 효율성 변화를 함수형 파이프라인으로 탐구합니다.
@@ -11,13 +14,17 @@ class JethroPipelineAnalyzer:
     Explores changes in Moses' work efficiency through functional pipelines.
     """
 
-    def __init__(self):
+    def __init__(self, num_records: Optional[int] = None):
         """
         분석기 초기화 및 데이터 생성.
         Initializes the analyzer and generates data.
+
+        Args:
+            num_records (int, optional): 생성기에 넘길 레코드 수 (생략 시 기본 데이터).
+                Number of records passed to the data generator (defaults to the base data).
         """
         self.data_generator = JethroAdviceDataGenerator()
-        self.jethro_df = self.data_generator.generate_jethro_advice_data()
+        self.jethro_df = self.data_generator.generate_jethro_advice_data(num_records)
 
     def analyze_with_assign_chaining(self):
         """
@@ -37,7 +44,7 @@ class JethroPipelineAnalyzer:
             .assign(moses_load_ratio = lambda x: x['cases_handled_moses'] / x['total_cases']) \
             .assign(efficiency_score = lambda x: x['total_cases'] / (x['moses_fatigue_level'] + 1)) \
             .sort_values('day')
-        print(processed_df.to_string(index=False))
+        reporting.print_frame(processed_df, index=False)
 
         print("\n💡 통찰 (Insight): `assign()`과 메서드 체이닝은 복잡한 데이터 처리 과정을 간결하고 가독성 높게 연결하여 이드로의 조언이 가져온 변화를 명확히 보여줍니다.")
         print("Insight: `assign()` and method chaining concisely and readably connect complex data processing steps, clearly showing the changes brought by Jethro's advice.")
@@ -73,9 +80,9 @@ class JethroPipelineAnalyzer:
         pipeline_result_after = self.jethro_df.pipe(calculate_efficiency_metrics).pipe(filter_and_sort_by_period, 'After Advice')
 
         print("\n--- 조언 전 효율성 (Efficiency Before Advice) ---")
-        print(pipeline_result_before.to_string(index=False))
+        reporting.print_frame(pipeline_result_before, index=False)
         print("\n--- 조언 후 효율성 (Efficiency After Advice) ---")
-        print(pipeline_result_after.to_string(index=False))
+        reporting.print_frame(pipeline_result_after, index=False)
 
         print("\n💡 통찰 (Insight): `pipe()`는 복잡한 데이터 처리 로직을 여러 함수로 나누어 가독성과 재사용성을 높이며, 이드로의 조언이 가져온 효율성 증대를 명확히 보여줍니다.")
         print("Insight: `pipe()` enhances readability and reusability by dividing complex data processing logic into multiple functions, clearly demonstrating the efficiency gains from Jethro's advice.")
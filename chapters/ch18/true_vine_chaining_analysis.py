@@ -1,8 +1,11 @@
 
 import pandas as pd
+from typing import Optional
+from utils import reporting
+from utils.instrumentation import InstrumentedAnalyzerMixin
 from .true_vine_data import TrueVineDataGenerator
 
-class TrueVineChainingAnalyzer:
+class TrueVineChainingAnalyzer(InstrumentedAnalyzerMixin):
     """
     요한복음 15장의 참 포도나무 데이터를 메서드 체이닝을 사용하여 분석하는 클래스.
     가지의 연결 상태, 가지치기 여부, 열매 수확량 등을 간결하게 탐구합니다.
@@ -11,13 +14,17 @@ class TrueVineChainingAnalyzer:
     Concise exploration of branch connection status, pruning status, fruit yield, etc.
     """
 
-    def __init__(self):
+    def __init__(self, num_records: Optional[int] = None):
         """
         분석기 초기화 및 데이터 생성.
         Initializes the analyzer and generates data.
+
+        Args:
+            num_records (int, optional): 생성기에 넘길 레코드 수 (생략 시 기본 데이터).
+                Number of records passed to the data generator (defaults to the base data).
         """
         self.data_generator = TrueVineDataGenerator()
-        self.vine_df = self.data_generator.generate_true_vine_data()
+        self.vine_df = self.data_generator.generate_true_vine_data(num_records)
 
     def analyze_fruitful_branches(self):
         """
@@ -36,7 +43,7 @@ class TrueVineChainingAnalyzer:
             .query('connection_to_vine == "Strong" and fruit_yield > 0') \
             .assign(fruitfulness_score = lambda x: x['fruit_yield'] * x['spiritual_health']) \
             .sort_values('fruitfulness_score', ascending=False)
-        print(fruitful_branches.to_string(index=False))
+        reporting.print_frame(fruitful_branches, index=False)
 
         print("\n💡 통찰 (Insight): 메서드 체이닝은 열매 맺는 삶의 여러 영적 조건(연결, 열매, 건강)을 간결하게 연결하여 분석하게 합니다.")
         print("Insight: Method chaining concisely connects various spiritual conditions (connection, fruit, health) of a fruitful life for analysis.")
@@ -59,7 +66,7 @@ class TrueVineChainingAnalyzer:
             .assign(pruning_factor = lambda x: x['pruning_status'].apply(lambda s: 1.5 if s == 'Pruned' else 1.0)) \
             .assign(adjusted_fruit_yield = lambda x: x['fruit_yield'] * x['pruning_factor']) \
             .sort_values('adjusted_fruit_yield', ascending=False)
-        print(pruning_effect_df[['branch_id', 'pruning_status', 'fruit_yield', 'adjusted_fruit_yield']].to_string(index=False))
+        reporting.print_frame(pruning_effect_df[['branch_id', 'pruning_status', 'fruit_yield', 'adjusted_fruit_yield']], index=False)
 
         print("\n💡 통찰 (Insight): 메서드 체이닝은 가지치기라는 영적 과정을 데이터적으로 모델링하여 더 많은 열매를 맺게 하는 하나님의 섭리를 보여줍니다.")
         print("Insight: Method chaining models the spiritual process of pruning, revealing God's providence in bearing more fruit.")
@@ -1,6 +1,8 @@
 
 import pandas as pd
 import numpy as np
+from typing import Optional
+from utils.synthetic import frame_preview, tile_frame
 
 class SinaiCovenantDataGenerator:
     """
@@ -42,7 +44,7 @@ class SinaiCovenantDataGenerator:
             'is_valid': [True, True, False, True, True, False, True, True, False, True, True, False] # 언약 준수 여부
         })
 
-    def generate_covenant_data(self) -> pd.DataFrame:
+    def generate_covenant_data(self, num_records: Optional[int] = None) -> pd.DataFrame:
         """
         상세한 시내산 언약 데이터를 생성합니다.
         언약의 규례, 이스라엘의 반응, 결과 등을 포함합니다.
@@ -50,17 +52,21 @@ class SinaiCovenantDataGenerator:
         Generates detailed Sinai Covenant data.
         Includes covenant ordinances, Israel's responses, and outcomes.
 
+        Args:
+            num_records (int, optional): 생성할 레코드 수. 생략하면 규례 12개, 주면 같은 행을 반복해 늘립니다.
+                Number of records; defaults to the 12 ordinances, otherwise the rows are repeated.
+
         Returns:
             pd.DataFrame: 상세 시내산 언약 데이터
         """
-        df = self.covenant_elements.copy()
+        df = tile_frame(self.covenant_elements, num_records)
 
         # KJV: Exodus 19:8 - "And all the people answered together, and said, All that the LORD hath spoken we will do..."
         # ESV: Exodus 19:8 - "All the people answered together and said, 'All that the LORD has spoken we will do.'..."
         # 개역한글: 출애굽기 19:8 - "백성이 일제히 응답하여 가로되 여호와의 명하신 대로 우리가 다 행하리이다"
         print("✨ 출애굽기 19장 시내산 언약 데이터가 생성되었습니다.")
         print("언약의 규례, 이스라엘의 반응, 결과 등을 시뮬레이션합니다.")
-        print(df.to_string(index=False))
+        print(frame_preview(df))
         print("\n---")
         print("영적 통찰: 시내산 언약은 하나님의 백성으로서 지켜야 할 명확한 규례(스키마)와 그에 따른 결과(유효성)를 보여줍니다.")
         print("Spiritual Insight: The Sinai Covenant reveals clear ordinances (schema) for God's people and corresponding outcomes (validation).")
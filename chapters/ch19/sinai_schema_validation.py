@@ -1,8 +1,10 @@
 
 import pandas as pd
+from typing import Optional
+from utils.instrumentation import InstrumentedAnalyzerMixin
 from .sinai_covenant_data import SinaiCovenantDataGenerator
 
-class SinaiSchemaValidationAnalyzer:
+class SinaiSchemaValidationAnalyzer(InstrumentedAnalyzerMixin):
     """
     출애굽기 19장의 시내산 언약 데이터를 스키마 정의와 유효성 검증을 사용하여 분석하는 클래스.
     하나님의 언약처럼 데이터의 무결성과 신뢰성을 탐구합니다.
@@ -11,13 +13,17 @@ class SinaiSchemaValidationAnalyzer:
     Explores data integrity and reliability, like God's covenant.
     """
 
-    def __init__(self):
+    def __init__(self, num_records: Optional[int] = None):
         """
         분석기 초기화 및 데이터 생성.
         Initializes the analyzer and generates data.
+
+        Args:
+            num_records (int, optional): 생성기에 넘길 레코드 수 (생략 시 기본 데이터).
+                Number of records passed to the data generator (defaults to the base data).
         """
         self.data_generator = SinaiCovenantDataGenerator()
-        self.covenant_df = self.data_generator.generate_covenant_data()
+        self.covenant_df = self.data_generator.generate_covenant_data(num_records)
 
         # 언약 스키마 정의
         self.covenant_schema = {
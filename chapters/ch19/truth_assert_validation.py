@@ -1,9 +1,11 @@
 
 import pandas as pd
 from pandas.testing import assert_frame_equal
+from typing import Optional
+from utils.instrumentation import InstrumentedAnalyzerMixin
 from .truth_life_data import TruthLifeDataGenerator
 
-class TruthAssertValidationAnalyzer:
+class TruthAssertValidationAnalyzer(InstrumentedAnalyzerMixin):
     """
     요한복음 14장 6절의 진리 데이터를 `assert_frame_equal()`을 사용하여 분석하는 클래스.
     예수님 말씀의 절대적인 유효성을 데이터적으로 검증합니다.
@@ -12,13 +14,17 @@ class TruthAssertValidationAnalyzer:
     Numerically validates the absolute truth of Jesus' words.
     """
 
-    def __init__(self):
+    def __init__(self, num_records: Optional[int] = None):
         """
         분석기 초기화 및 데이터 생성.
         Initializes the analyzer and generates data.
+
+        Args:
+            num_records (int, optional): 생성기에 넘길 레코드 수 (생략 시 기본 데이터).
+                Number of records passed to the data generator (defaults to the base data).
         """
         self.data_generator = TruthLifeDataGenerator()
-        self.truth_df = self.data_generator.generate_truth_life_data()
+        self.truth_df = self.data_generator.generate_truth_life_data(num_records)
 
     def validate_with_assert_frame_equal(self):
         """
@@ -1,6 +1,8 @@
 
 import pandas as pd
 import numpy as np
+from typing import Optional
+from utils.synthetic import frame_preview, tile_frame
 
 class TruthLifeDataGenerator:
     """
@@ -31,7 +33,7 @@ class TruthLifeDataGenerator:
             'peace_level': [10, 9, 10, 2, 1, 0] # 0-10 스케일 (10: 완전한 평안)
         })
 
-    def generate_truth_life_data(self) -> pd.DataFrame:
+    def generate_truth_life_data(self, num_records: Optional[int] = None) -> pd.DataFrame:
         """
         상세한 예수님 말씀의 진리 데이터를 생성합니다.
         다양한 삶의 길과 그에 따른 결과를 포함합니다.
@@ -39,10 +41,14 @@ class TruthLifeDataGenerator:
         Generates detailed data for Jesus' words of truth and life.
         Includes various life paths and their corresponding outcomes.
 
+        Args:
+            num_records (int, optional): 생성할 레코드 수. 생략하면 길 6개, 주면 같은 행을 반복해 늘립니다.
+                Number of records; defaults to the 6 paths, otherwise the rows are repeated.
+
         Returns:
             pd.DataFrame: 상세 예수님 말씀의 진리 데이터
         """
-        df = self.path_elements.copy()
+        df = tile_frame(self.path_elements, num_records)
 
         # 만족도 수준에 약간의 노이즈 추가
         np.random.seed(146) # 재현성을 위해 시드 고정
@@ -54,7 +60,7 @@ class TruthLifeDataGenerator:
         # 개역한글: 요한복음 8:32 - "진리를 알지니 진리가 너희를 자유케 하리라"
         print("✨ 요한복음 14장 6절 기반 진리 데이터가 생성되었습니다.")
         print("다양한 삶의 길과 그에 따른 결과를 시뮬레이션합니다.")
-        print(df.to_string(index=False))
+        print(frame_preview(df))
         print("\n---")
         print("영적 통찰: 예수님은 구원과 영원한 생명으로 이끄는 유일한 길이요 진리입니다. 다른 길은 혼란과 사망을 가져옵니다.")
         print("Spiritual Insight: Jesus is the only way and truth leading to salvation and eternal life. Other paths bring confusion and death.")
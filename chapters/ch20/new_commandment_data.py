@@ -1,6 +1,8 @@
 
 import pandas as pd
 import numpy as np
+from typing import Optional
+from utils.synthetic import frame_preview, tile_frame
 
 class NewCommandmentDataGenerator:
     """
@@ -33,7 +35,7 @@ class NewCommandmentDataGenerator:
             'is_disciple_like': [True, True, True, False, True, True, False, True, False, True]
         })
 
-    def generate_new_commandment_data(self) -> pd.DataFrame:
+    def generate_new_commandment_data(self, num_records: Optional[int] = None) -> pd.DataFrame:
         """
         상세한 새 계명(사랑) 데이터를 생성합니다.
         사랑 실천 수준, 행동 유형, 영적 영향력, 데이터 품질 문제를 포함합니다.
@@ -41,27 +43,33 @@ class NewCommandmentDataGenerator:
         Generates detailed New Commandment (love) data.
         Includes love practice levels, action types, spiritual impact, and data quality issues.
 
+        Args:
+            num_records (int, optional): 생성할 레코드 수. 생략하면 사랑 실천 10개, 주면 같은 행을 반복해 늘립니다.
+                Number of records; defaults to the 10 love actions, otherwise the rows are repeated.
+
         Returns:
             pd.DataFrame: 상세 새 계명 데이터
         """
-        df = self.love_actions_info.copy()
+        df = tile_frame(self.love_actions_info, num_records)
 
         # 데이터 품질 문제 시뮬레이션
         np.random.seed(1334) # 재현성을 위해 시드 고정
+        # 기본 10개 행동 중 몇 번째인지 (반복해 늘린 경우에도 같은 위치에 문제를 심음)
+        position = np.arange(len(df)) % len(self.love_actions_info)
         # 결측치 추가
-        df.loc[3, 'love_level'] = np.nan # 4번째 행동 (비판) 사랑 수준 누락
-        df.loc[6, 'spiritual_impact_score'] = np.nan # 7번째 행동 (무관심) 영적 영향력 누락
+        df.loc[position == 3, 'love_level'] = np.nan # 4번째 행동 (비판) 사랑 수준 누락
+        df.loc[position == 6, 'spiritual_impact_score'] = np.nan # 7번째 행동 (무관심) 영적 영향력 누락
         # 잘못된 타입 추가
-        df.loc[1, 'love_level'] = 8 # 2번째 행동 (용서) 잘못된 타입
+        df.loc[position == 1, 'love_level'] = 8 # 2번째 행동 (용서) 잘못된 타입
         # 이상치 추가
-        df.loc[2, 'love_level'] = 1 # 3번째 행동 (나눔) 극단적으로 낮은 점수
+        df.loc[position == 2, 'love_level'] = 1 # 3번째 행동 (나눔) 극단적으로 낮은 점수
 
         # KJV: John 13:35 - "By this shall all men know that ye are my disciples, if ye have love one to another."
         # ESV: John 13:35 - "By this all people will know that you are my disciples, if you have love for one another."
         # 개역한글: 요한복음 13:35 - "너희가 서로 사랑하면 이로써 모든 사람이 너희가 내 제자인 줄 알리라"
         print("✨ 요한복음 13장 새 계명(사랑) 데이터가 생성되었습니다.")
         print("사랑 실천 수준, 행동 유형, 영적 영향력, 데이터 품질 문제를 시뮬레이션합니다.")
-        print(df.to_string(index=False))
+        print(frame_preview(df))
         print("\n---")
         print("영적 통찰: 새 계명인 사랑은 모든 율법을 아우르는 최상의 품질 기준이자, 제자됨의 유효성 검증 기준이 됩니다.")
         print("Spiritual Insight: The New Commandment of love is the highest quality standard encompassing all laws, and a validation criterion for discipleship.")
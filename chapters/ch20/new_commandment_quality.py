@@ -1,9 +1,12 @@
 
 import pandas as pd
 import numpy as np
+from typing import Optional
+from utils import reporting
+from utils.instrumentation import InstrumentedAnalyzerMixin
 from .new_commandment_data import NewCommandmentDataGenerator
 
-class NewCommandmentQualityAnalyzer:
+class NewCommandmentQualityAnalyzer(InstrumentedAnalyzerMixin):
     """
     요한복음 13장의 새 계명(사랑) 데이터를 데이터 품질 관점(결측치, 타입, 이상치)에서 분석하는 클래스.
     사랑이라는 최상의 품질 기준으로 깨끗하고 신뢰할 수 있는 데이터를 구축하는 과정을 탐구합니다.
@@ -12,13 +15,17 @@ class NewCommandmentQualityAnalyzer:
     Explores the process of building clean and reliable data based on love as the highest quality standard.
     """
 
-    def __init__(self):
+    def __init__(self, num_records: Optional[int] = None):
         """
         분석기 초기화 및 데이터 생성.
         Initializes the analyzer and generates data.
+
+        Args:
+            num_records (int, optional): 생성기에 넘길 레코드 수 (생략 시 기본 데이터).
+                Number of records passed to the data generator (defaults to the base data).
         """
         self.data_generator = NewCommandmentDataGenerator()
-        self.new_commandment_df = self.data_generator.generate_new_commandment_data()
+        self.new_commandment_df = self.data_generator.generate_new_commandment_data(num_records)
 
     def handle_missing_values(self):
         """
@@ -37,7 +44,7 @@ class NewCommandmentQualityAnalyzer:
 
         # 결측치 확인
         print("\n--- 원본 데이터 결측치 (Original Data Missing Values) ---")
-        print(df_processed.isnull().sum())
+        reporting.print_frame(df_processed.isnull().sum())
 
         # 'love_level'의 결측치를 중앙값으로 채우기
         df_processed['love_level'] = pd.to_numeric(df_processed['love_level'], errors='coerce') # 잘못된 타입 먼저 처리
@@ -48,9 +55,9 @@ class NewCommandmentQualityAnalyzer:
         df_processed['spiritual_impact_score'] = df_processed['spiritual_impact_score'].fillna(0)
 
         print("\n--- 결측치 처리 후 데이터 (Data After Handling Missing Values) ---")
-        print(df_processed[['action_id', 'love_level', 'spiritual_impact_score']].to_string(index=False))
+        reporting.print_frame(df_processed[['action_id', 'love_level', 'spiritual_impact_score']], index=False)
         print("\n--- 결측치 처리 후 결측치 (Missing Values After Handling) ---")
-        print(df_processed.isnull().sum())
+        reporting.print_frame(df_processed.isnull().sum())
 
         print("\n💡 통찰 (Insight): `fillna()`는 사랑이라는 새 계명 실천에서 우리의 부족함을 채워 데이터의 완전성을 확보하게 합니다.")
         print("Insight: `fillna()` ensures data completeness by filling our deficiencies in practicing the New Commandment of love.")
@@ -84,9 +91,9 @@ class NewCommandmentQualityAnalyzer:
         df_converted['spiritual_impact_score'] = df_converted['spiritual_impact_score'].astype(int)
 
         print("\n--- 변환 후 데이터 타입 (Data Types After Conversion) ---")
-        print(df_converted.dtypes)
+        reporting.print_frame(df_converted.dtypes)
         print("\n--- 변환 후 데이터 (Data After Conversion) ---")
-        print(df_converted[['action_id', 'love_level', 'spiritual_impact_score']].to_string(index=False))
+        reporting.print_frame(df_converted[['action_id', 'love_level', 'spiritual_impact_score']], index=False)
 
         print("\n💡 통찰 (Insight): `astype()`은 사랑이라는 새 계명 실천이 가져오는 영적 영향력을 정확하게 측정하여 분석의 유효성을 확보하게 합니다.")
         print("Insight: `astype()` ensures the validity of analysis by accurately measuring the spiritual impact of practicing the New Commandment of love.")
@@ -116,7 +123,7 @@ class NewCommandmentQualityAnalyzer:
                                   (df_converted['love_level'] > outlier_threshold_upper)]
 
         print("\n--- 'love_level' 이상치 (Outliers in 'love_level') ---")
-        print(outliers[['action_id', 'action_type', 'love_level']].to_string(index=False))
+        reporting.print_frame(outliers[['action_id', 'action_type', 'love_level']], index=False)
 
         print("\n💡 통찰 (Insight): 이상치 탐지는 사랑 실천에서 극단적인 부족이나 과도한 자기희생을 식별하여 영적 삶의 균형을 점검하게 합니다.")
         print("Insight: Outlier detection helps identify extreme deficiencies or excessive self-sacrifice in practicing love, prompting a check on spiritual balance.")
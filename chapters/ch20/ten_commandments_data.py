@@ -1,6 +1,8 @@
 
 import pandas as pd
 import numpy as np
+from typing import Optional
+from utils.synthetic import frame_preview, tile_frame
 
 class TenCommandmentsDataGenerator:
     """
@@ -43,7 +45,7 @@ class TenCommandmentsDataGenerator:
             ]
         })
 
-    def generate_commandments_data(self) -> pd.DataFrame:
+    def generate_commandments_data(self, num_records: Optional[int] = None) -> pd.DataFrame:
         """
         상세한 십계명 데이터를 생성합니다.
         준수 수준, 결과, 데이터 품질 문제(결측치, 잘못된 타입, 이상치)를 포함합니다.
@@ -51,27 +53,33 @@ class TenCommandmentsDataGenerator:
         Generates detailed Ten Commandments data.
         Includes obedience levels, outcomes, and data quality issues (missing values, incorrect types, outliers).
 
+        Args:
+            num_records (int, optional): 생성할 레코드 수. 생략하면 계명 10개, 주면 같은 행을 반복해 늘립니다.
+                Number of records; defaults to the 10 commandments, otherwise the rows are repeated.
+
         Returns:
             pd.DataFrame: 상세 십계명 데이터
         """
-        df = self.commandments_info.copy()
+        df = tile_frame(self.commandments_info, num_records)
 
         # 데이터 품질 문제 시뮬레이션
         np.random.seed(2003) # 재현성을 위해 시드 고정
+        # 기본 십계명 중 몇 번째인지 (반복해 늘린 경우에도 같은 계명에 문제를 심음)
+        position = np.arange(len(df)) % len(self.commandments_info)
         # 결측치 추가
-        df.loc[2, 'obedience_score'] = np.nan # 3번째 계명 (이름 망령되이) 누락
-        df.loc[5, 'consequence_score'] = np.nan # 6번째 계명 (살인) 결과 누락
+        df.loc[position == 2, 'obedience_score'] = np.nan # 3번째 계명 (이름 망령되이) 누락
+        df.loc[position == 5, 'consequence_score'] = np.nan # 6번째 계명 (살인) 결과 누락
         # 잘못된 타입 추가
-        df.loc[3, 'obedience_score'] = 'six' # 4번째 계명 (안식일) 잘못된 타입
+        df.loc[position == 3, 'obedience_score'] = 'six' # 4번째 계명 (안식일) 잘못된 타입
         # 이상치 추가
-        df.loc[8, 'obedience_score'] = 1 # 9번째 계명 (거짓 증거) 극단적으로 낮은 점수
+        df.loc[position == 8, 'obedience_score'] = 1 # 9번째 계명 (거짓 증거) 극단적으로 낮은 점수
 
         # KJV: Exodus 20:17 - "Thou shalt not covet thy neighbour's house..."
         # ESV: Exodus 20:17 - "You shall not covet your neighbor's house..."
         # 개역한글: 출애굽기 20:17 - "네 이웃의 집을 탐내지 말지니라"
         print("✨ 출애굽기 20장 십계명 데이터가 생성되었습니다.")
         print("십계명 준수 수준, 결과, 데이터 품질 문제(결측치, 잘못된 타입, 이상치)를 시뮬레이션합니다.")
-        print(df.to_string(index=False))
+        print(frame_preview(df))
         print("\n---")
         print("영적 통찰: 십계명은 하나님의 백성으로서 지켜야 할 근본적인 규약이자 삶의 표준입니다. 이는 데이터 품질 규약과 같습니다.")
         print("Spiritual Insight: The Ten Commandments are fundamental standards for God's people, akin to data quality standards.")
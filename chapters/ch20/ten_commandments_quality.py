@@ -1,9 +1,12 @@
 
 import pandas as pd
 import numpy as np
+from typing import Optional
+from utils import reporting
+from utils.instrumentation import InstrumentedAnalyzerMixin
 from .ten_commandments_data import TenCommandmentsDataGenerator
 
-class TenCommandmentsQualityAnalyzer:
+class TenCommandmentsQualityAnalyzer(InstrumentedAnalyzerMixin):
     """
     출애굽기 20장의 십계명 데이터를 데이터 품질 관점(결측치, 타입, 이상치)에서 분석하는 클래스.
     십계명처럼 깨끗하고 신뢰할 수 있는 데이터를 구축하는 과정을 탐구합니다.
@@ -12,13 +15,17 @@ class TenCommandmentsQualityAnalyzer:
     Explores the process of building clean and reliable data, like the Ten Commandments.
     """
 
-    def __init__(self):
+    def __init__(self, num_records: Optional[int] = None):
         """
         분석기 초기화 및 데이터 생성.
         Initializes the analyzer and generates data.
+
+        Args:
+            num_records (int, optional): 생성기에 넘길 레코드 수 (생략 시 기본 데이터).
+                Number of records passed to the data generator (defaults to the base data).
         """
         self.data_generator = TenCommandmentsDataGenerator()
-        self.commandments_df = self.data_generator.generate_commandments_data()
+        self.commandments_df = self.data_generator.generate_commandments_data(num_records)
 
     def handle_missing_values(self):
         """
@@ -37,7 +44,7 @@ class TenCommandmentsQualityAnalyzer:
 
         # 결측치 확인
         print("\n--- 원본 데이터 결측치 (Original Data Missing Values) ---")
-        print(df_processed.isnull().sum())
+        reporting.print_frame(df_processed.isnull().sum())
 
         # 'obedience_score'의 결측치를 평균값으로 채우기
         df_processed['obedience_score'] = pd.to_numeric(df_processed['obedience_score'], errors='coerce') # 잘못된 타입 먼저 처리
@@ -48,9 +55,9 @@ class TenCommandmentsQualityAnalyzer:
         df_processed['consequence_score'] = df_processed['consequence_score'].fillna(0)
 
         print("\n--- 결측치 처리 후 데이터 (Data After Handling Missing Values) ---")
-        print(df_processed[['commandment_id', 'obedience_score', 'consequence_score']].to_string(index=False))
+        reporting.print_frame(df_processed[['commandment_id', 'obedience_score', 'consequence_score']], index=False)
         print("\n--- 결측치 처리 후 결측치 (Missing Values After Handling) ---")
-        print(df_processed.isnull().sum())
+        reporting.print_frame(df_processed.isnull().sum())
 
         print("\n💡 통찰 (Insight): `fillna()`는 하나님의 은혜처럼 우리의 부족함을 채워 데이터의 완전성을 확보하게 합니다.")
         print("Insight: `fillna()` ensures data completeness by filling our deficiencies, much like God's grace.")
@@ -83,9 +90,9 @@ class TenCommandmentsQualityAnalyzer:
         df_converted['commandment_id'] = df_converted['commandment_id'].astype(str)
 
         print("\n--- 변환 후 데이터 타입 (Data Types After Conversion) ---")
-        print(df_converted.dtypes)
+        reporting.print_frame(df_converted.dtypes)
         print("\n--- 변환 후 데이터 (Data After Conversion) ---")
-        print(df_converted[['commandment_id', 'obedience_score', 'consequence_score']].to_string(index=False))
+        reporting.print_frame(df_converted[['commandment_id', 'obedience_score', 'consequence_score']], index=False)
 
         print("\n💡 통찰 (Insight): `astype()`은 십계명처럼 데이터가 올바른 규격에 맞는지 확인하여 분석의 유효성을 확보하게 합니다.")
         print("Insight: `astype()` ensures data conforms to correct specifications, like the Ten Commandments, securing analytical validity.")
@@ -113,7 +120,7 @@ class TenCommandmentsQualityAnalyzer:
         outliers = df_converted[abs(df_converted['z_score_obedience']) > 2]
 
         print("\n--- 'obedience_score' 이상치 (Outliers in 'obedience_score') ---")
-        print(outliers[['commandment_id', 'obedience_score', 'z_score_obedience']].to_string(index=False))
+        reporting.print_frame(outliers[['commandment_id', 'obedience_score', 'z_score_obedience']], index=False)
 
         print("\n💡 통찰 (Insight): 이상치 탐지는 십계명 준수에서 극단적인 불순종이나 과도한 순종(자기 의)을 식별하여 영적 삶의 균형을 점검하게 합니다.")
         print("Insight: Outlier detection helps identify extreme disobedience or excessive self-righteousness in keeping the Ten Commandments, prompting a check on spiritual balance.")
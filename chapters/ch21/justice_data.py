@@ -1,6 +1,7 @@
 
 import pandas as pd
 import numpy as np
+from utils import reporting
 
 class JusticeDataGenerator:
     """
@@ -45,7 +46,7 @@ class JusticeDataGenerator:
 
         print("✨ 출애굽기 21-23장 공의의 법도 데이터가 생성되었습니다.")
         print(f"{self.num_cases}개의 재판 사례를 시뮬레이션합니다.")
-        print(df.head().to_string())
+        reporting.print_frame(df.head(), full=True)
         print("\n---")
         print("영적 통찰: 공의의 법도는 공동체의 질서와 정의를 유지하기 위한 하나님의 구체적인 지침입니다.")
         print("Spiritual Insight: The ordinances of justice are God's specific guidelines for maintaining order and justice in the community.")
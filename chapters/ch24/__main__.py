@@ -11,6 +11,7 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
 # 절대 임포트 사용
+from utils import reporting
 from chapters.ch24.covenant_data import CovenantDataGenerator
 from chapters.ch24.data_snapshotter import DataSnapshotter
 from chapters.ch24.version_tracker import VersionTracker
@@ -43,7 +44,7 @@ def run_covenant_data_generation():
         generator = CovenantDataGenerator()
         data = generator.generate_covenant_data()
         print("\n✅ 피의 언약 데이터 생성 완료:")
-        print(data.head())
+        reporting.print_frame(data.head())
         return data
     except Exception as e:
         print(f"❌ 피의 언약 데이터 생성 중 오류 발생: {e}")
@@ -63,7 +64,7 @@ def run_data_snapshotting(df):
         snapshotter = DataSnapshotter(df)
         snapshot_initial = snapshotter.create_snapshot("initial_covenant_state")
         print("\n✅ 초기 언약 상태 스냅샷 생성 완료 (일부):")
-        print(snapshot_initial.head())
+        reporting.print_frame(snapshot_initial.head())
         return snapshot_initial
     except Exception as e:
         print(f"❌ 데이터 스냅샷 중 오류 발생: {e}")
@@ -86,7 +87,7 @@ def run_version_tracking(df):
         modified_df.loc[modified_df['event_type'] == 'Disobedience', 'obedience_score'] = 1 # 불순종 시 점수 하락
         updated_df = tracker.update_version(modified_df, "Disobedience event recorded")
         print("\n✅ 데이터 버전 추적 및 업데이트 완료 (일부):")
-        print(updated_df.head())
+        reporting.print_frame(updated_df.head())
         return updated_df
     except Exception as e:
         print(f"❌ 버전 추적 중 오류 발생: {e}")
@@ -110,7 +111,7 @@ def run_checkpoint_saving(df):
         # 저장된 파일 불러오기 시연
         loaded_csv = saver.load_checkpoint("ch24_covenant_checkpoint.csv", file_format='csv')
         print("\n✅ CSV 체크포인트 불러오기 완료 (일부):")
-        print(loaded_csv.head())
+        reporting.print_frame(loaded_csv.head())
         
         # 생성된 파일 삭제 (정리)
         if os.path.exists(csv_path):
@@ -1,19 +1,33 @@
 import pandas as pd
 import os
 
+from utils import data_io
+
+# 형식 이름 → 안내 메시지에 쓰는 표시 이름
+FORMAT_LABELS = {'csv': 'CSV', 'parquet': 'Parquet', 'feather': 'Feather', 'excel': 'Excel',
+                 'jsonl': 'JSON Lines', 'pickle': 'pickle'}
+
 class CheckpointSaver:
     """
-    데이터프레임을 CSV 또는 Parquet 파일로 체크포인트 저장하는 클래스.
+    데이터프레임을 CSV, Parquet 등 utils.data_io가 지원하는 형식의 파일로 체크포인트 저장하는 클래스.
     데이터의 무결성과 재현성을 보장하는 데 활용됩니다.
 
-    Class to save DataFrame checkpoints to CSV or Parquet files.
+    Class to save DataFrame checkpoints to CSV, Parquet or any other format supported by utils.data_io.
     Utilized to ensure data integrity and reproducibility.
     """
 
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, dtype_backend: str = None):
+        """
+        Args:
+            df (pd.DataFrame): 체크포인트로 저장할 데이터프레임.
+            dtype_backend (str, optional): 불러올 때의 dtype 백엔드 ('pyarrow'이면 문자열도 Arrow string으로).
+                생략하면 기본 numpy dtype.
+        """
         self.df = df.copy()
+        self.dtype_backend = dtype_backend
 
-    def save_checkpoint(self, filename: str, file_format: str = 'csv', index: bool = False) -> str:
+    def save_checkpoint(self, filename: str, file_format: str = 'csv', index: bool = False,
+                        compression: str = 'infer') -> str:
         """
         데이터프레임을 지정된 형식의 파일로 저장합니다.
 
@@ -21,23 +35,23 @@ class CheckpointSaver:
 
         Args:
             filename (str): 저장할 파일 이름 (확장자 포함).
-            file_format (str): 'csv' 또는 'parquet'.
+            file_format (str): 'csv', 'parquet', 'feather', 'excel', 'jsonl', 'pickle' 중 하나.
+                None이면 확장자로 판별.
             index (bool): DataFrame 인덱스를 파일에 쓸지 여부.
+            compression (str): 형식별 압축 (예: CSV 'gzip', Parquet 'zstd'). 'infer'이면 확장자나 형식 기본값.
 
         Returns:
             str: 저장된 파일의 전체 경로.
         """
         full_path = os.path.join(os.getcwd(), filename) # 현재 작업 디렉토리에 저장
 
-        if file_format == 'csv':
-            self.df.to_csv(full_path, index=index)
-            print(f"CheckpointSaver: CSV 체크포인트 '{filename}' 저장 완료.")
-        elif file_format == 'parquet':
-            self.df.to_parquet(full_path, index=index)
-            print(f"CheckpointSaver: Parquet 체크포인트 '{filename}' 저장 완료.")
-        else:
-            print(f"경고: 지원하지 않는 파일 형식 '{file_format}'입니다. 저장을 건너뜁니다.")
+        try:
+            file_format = file_format or data_io.detect_format(full_path)
+            data_io.save(self.df, full_path, format=file_format, compression=compression, index=index)
+        except ValueError as e:
+            print(f"경고: {e}. 저장을 건너뜁니다.")
             return ""
+        print(f"CheckpointSaver: {FORMAT_LABELS.get(file_format, file_format)} 체크포인트 '{filename}' 저장 완료.")
         return full_path
 
     def load_checkpoint(self, filename: str, file_format: str = 'csv') -> pd.DataFrame:
@@ -48,7 +62,7 @@ class CheckpointSaver:
 
         Args:
             filename (str): 불러올 파일 이름 (확장자 포함).
-            file_format (str): 'csv' 또는 'parquet'.
+            file_format (str): 'csv', 'parquet' 등 형식 이름. None이면 확장자나 파일 앞부분(매직 바이트)으로 판별.
 
         Returns:
             pd.DataFrame: 불러온 데이터프레임.
@@ -59,15 +73,13 @@ class CheckpointSaver:
             print(f"경고: 파일 '{filename}'을 찾을 수 없습니다.")
             return pd.DataFrame()
 
-        if file_format == 'csv':
-            loaded_df = pd.read_csv(full_path)
-            print(f"CheckpointSaver: CSV 체크포인트 '{filename}' 불러오기 완료.")
-        elif file_format == 'parquet':
-            loaded_df = pd.read_parquet(full_path)
-            print(f"CheckpointSaver: Parquet 체크포인트 '{filename}' 불러오기 완료.")
-        else:
-            print(f"경고: 지원하지 않는 파일 형식 '{file_format}'입니다. 불러오기를 건너뜁니다.")
+        try:
+            file_format = file_format or data_io.detect_format(full_path)
+            loaded_df = data_io.load(full_path, format=file_format, dtype_backend=self.dtype_backend)
+        except ValueError as e:
+            print(f"경고: {e}. 불러오기를 건너뜁니다.")
             return pd.DataFrame()
+        print(f"CheckpointSaver: {FORMAT_LABELS.get(file_format, file_format)} 체크포인트 '{filename}' 불러오기 완료.")
         return loaded_df
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+from utils.synthetic import date_range
 
 class CovenantDataGenerator:
     """
@@ -25,7 +26,7 @@ class CovenantDataGenerator:
             pd.DataFrame: 샘플 데이터.
         """
         np.random.seed(24)
-        dates = pd.date_range(start='1446-01-01', periods=num_records, freq='D') # Exodus era
+        dates = date_range('1446-01-01', periods=num_records, freq='D') # Exodus era (나노초 범위 밖이라 초 단위)
         data = {
             'event_date': dates,
             'event_type': np.random.choice(['Law Proclaimed', 'Blood Sprinkled', 'Feast', 'Disobedience', 'Repentance'], size=num_records, p=[0.2, 0.2, 0.2, 0.2, 0.2]),
@@ -17,6 +17,7 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
 # 절대 임포트 사용
+from utils import reporting
 from chapters.ch26.veil_data import VeilDataGenerator
 from chapters.ch26.column_masking import ColumnMaskingProcessor
 from chapters.ch26.anonymization_techniques import AnonymizationTechniques
@@ -48,7 +49,7 @@ def run_veil_data_generation():
         generator = VeilDataGenerator()
         data = generator.generate_veil_data()
         print("\n✅ 휘장 데이터 생성 완료:")
-        print(data.head())
+        reporting.print_frame(data.head())
         return data
     except Exception as e:
         print(f"❌ 휘장 데이터 생성 중 오류 발생: {e}")
@@ -68,7 +69,7 @@ def run_column_masking_analysis(df):
         processor = ColumnMaskingProcessor(df)
         masked_df = processor.apply_masking()
         print("\n✅ 컬럼 마스킹 적용 완료 (일부):")
-        print(masked_df.head())
+        reporting.print_frame(masked_df.head())
         return masked_df
     except Exception as e:
         print(f"❌ 컬럼 마스킹 분석 중 오류 발생: {e}")
@@ -88,7 +89,7 @@ def run_anonymization_techniques(df):
         anonymizer = AnonymizationTechniques(df)
         anonymized_df = anonymizer.apply_anonymization()
         print("\n✅ 익명화 기법 적용 완료 (일부):")
-        print(anonymized_df.head())
+        reporting.print_frame(anonymized_df.head())
         return anonymized_df
     except Exception as e:
         print(f"❌ 익명화 기법 적용 중 오류 발생: {e}")
@@ -108,10 +109,10 @@ def run_toggle_visibility(df):
         toggler = VisibilityToggler(df)
         hidden_df = toggler.hide_columns(['sensitive_info'])
         print("\n✅ 'sensitive_info' 컬럼 숨김:")
-        print(hidden_df.head())
+        reporting.print_frame(hidden_df.head())
         shown_df = toggler.show_columns(['sensitive_info'])
         print("\n✅ 'sensitive_info' 컬럼 다시 표시:")
-        print(shown_df.head())
+        reporting.print_frame(shown_df.head())
         return shown_df
     except Exception as e:
         print(f"❌ 표시/비표시 토글 중 오류 발생: {e}")
@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+from utils.synthetic import numbered_labels
 
 class VeilDataGenerator:
     """
@@ -10,23 +11,26 @@ class VeilDataGenerator:
     Generates a DataFrame with sensitive and general information.
     """
 
-    def generate_veil_data(self) -> pd.DataFrame:
+    def generate_veil_data(self, num_records: int = 10) -> pd.DataFrame:
         """
         컬럼 가림/익명화에 사용될 샘플 데이터를 생성합니다.
 
         Generates sample data to be used for column hiding/anonymization.
 
+        Args:
+            num_records (int): 생성할 데이터 레코드 수.
+
         Returns:
             pd.DataFrame: 샘플 데이터
         """
         np.random.seed(26)
         data = {
-            'user_id': range(1, 11),
-            'username': [f'user_{i}' for i in range(1, 11)],
-            'email': [f'user{i}@example.com' for i in range(1, 11)],
-            'sensitive_info': np.random.randint(1000, 9999, size=10),
-            'public_data': np.random.rand(10) * 100,
-            'status': np.random.choice(['active', 'inactive'], size=10)
+            'user_id': np.arange(1, num_records + 1),
+            'username': numbered_labels('user_', 1, num_records + 1),
+            'email': numbered_labels('user', 1, num_records + 1, suffix='@example.com'),
+            'sensitive_info': np.random.randint(1000, 9999, size=num_records),
+            'public_data': np.random.rand(num_records) * 100,
+            'status': np.random.choice(['active', 'inactive'], size=num_records)
         }
         df = pd.DataFrame(data)
         print("VeilDataGenerator: 샘플 데이터 생성 완료.")
@@ -18,6 +18,7 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
 # 절대 임포트 사용
+from utils import reporting
 from chapters.ch27.altar_data import AltarDataGenerator
 from chapters.ch27.derived_variables import DerivedVariableCreator
 from chapters.ch27.conditional_processing import ConditionalProcessor
@@ -49,7 +50,7 @@ def run_altar_data_generation():
         generator = AltarDataGenerator()
         data = generator.generate_altar_data()
         print("\n✅ 번제단 데이터 생성 완료:")
-        print(data.head())
+        reporting.print_frame(data.head())
         return data
     except Exception as e:
         print(f"❌ 번제단 데이터 생성 중 오류 발생: {e}")
@@ -69,7 +70,7 @@ def run_derived_variables_creation(df):
         creator = DerivedVariableCreator(df)
         df_with_derived = creator.create_variables()
         print("\n✅ 파생변수 생성 완료 (일부):")
-        print(df_with_derived.head())
+        reporting.print_frame(df_with_derived.head())
         return df_with_derived
     except Exception as e:
         print(f"❌ 파생변수 생성 중 오류 발생: {e}")
@@ -89,7 +90,7 @@ def run_conditional_processing(df):
         processor = ConditionalProcessor(df)
         processed_df = processor.apply_conditions()
         print("\n✅ 조건부 처리 적용 완료 (일부):")
-        print(processed_df.head())
+        reporting.print_frame(processed_df.head())
         return processed_df
     except Exception as e:
         print(f"❌ 조건부 처리 중 오류 발생: {e}")
@@ -109,7 +110,7 @@ def run_preprocessing_pipeline(df):
         pipeline = PreprocessingPipeline(df)
         final_df = pipeline.run_pipeline()
         print("\n✅ 전처리 파이프라인 실행 완료 (일부):")
-        print(final_df.head())
+        reporting.print_frame(final_df.head())
         return final_df
     except Exception as e:
         print(f"❌ 전처리 파이프라인 실행 중 오류 발생: {e}")
@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+from utils.synthetic import date_range
 
 class AltarDataGenerator:
     """
@@ -10,22 +11,25 @@ class AltarDataGenerator:
     Generates data to be used for derived variable creation and preprocessing.
     """
 
-    def generate_altar_data(self) -> pd.DataFrame:
+    def generate_altar_data(self, num_records: int = 10) -> pd.DataFrame:
         """
         파생변수 생성 및 전처리에 사용될 샘플 데이터를 생성합니다.
 
         Generates sample data to be used for derived variable creation and preprocessing.
 
+        Args:
+            num_records (int): 생성할 데이터 레코드 수.
+
         Returns:
             pd.DataFrame: 샘플 데이터
         """
         np.random.seed(27)
         data = {
-            'id': range(1, 11),
-            'value1': np.random.randint(10, 100, size=10),
-            'value2': np.random.rand(10) * 50,
-            'category': np.random.choice(['A', 'B', 'C'], size=10),
-            'timestamp': pd.to_datetime('2023-01-01') + pd.to_timedelta(np.arange(10), unit='D')
+            'id': np.arange(1, num_records + 1),
+            'value1': np.random.randint(10, 100, size=num_records),
+            'value2': np.random.rand(num_records) * 50,
+            'category': np.random.choice(['A', 'B', 'C'], size=num_records),
+            'timestamp': date_range('2023-01-01', periods=num_records, freq='D')
         }
         df = pd.DataFrame(data)
         print("AltarDataGenerator: 샘플 데이터 생성 완료.")
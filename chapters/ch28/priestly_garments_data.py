@@ -10,23 +10,26 @@ class PriestlyGarmentsDataGenerator:
     Generates data to be used for categorical labeling and DataFrame styling.
     """
 
-    def generate_garments_data(self) -> pd.DataFrame:
+    def generate_garments_data(self, num_records: int = 10) -> pd.DataFrame:
         """
         범주형 라벨링 및 데이터프레임 스타일링에 사용될 샘플 데이터를 생성합니다.
 
         Generates sample data to be used for categorical labeling and DataFrame styling.
 
+        Args:
+            num_records (int): 생성할 데이터 레코드 수.
+
         Returns:
             pd.DataFrame: 샘플 데이터
         """
         np.random.seed(28)
         data = {
-            'priest_id': range(1, 11),
-            'garment_type': np.random.choice(['Ephod', 'Breastplate', 'Robe', 'Tunic'], size=10),
-            'material_quality': np.random.randint(1, 10, size=10), # 1-10 scale
-            'color_purity': np.random.rand(10), # 0-1 scale
-            'gemstone_count': np.random.randint(0, 12, size=10),
-            'status': np.random.choice(['Clean', 'Worn', 'New'], size=10)
+            'priest_id': np.arange(1, num_records + 1),
+            'garment_type': np.random.choice(['Ephod', 'Breastplate', 'Robe', 'Tunic'], size=num_records),
+            'material_quality': np.random.randint(1, 10, size=num_records), # 1-10 scale
+            'color_purity': np.random.rand(num_records), # 0-1 scale
+            'gemstone_count': np.random.randint(0, 12, size=num_records),
+            'status': np.random.choice(['Clean', 'Worn', 'New'], size=num_records)
         }
         df = pd.DataFrame(data)
         print("PriestlyGarmentsDataGenerator: 샘플 데이터 생성 완료.")
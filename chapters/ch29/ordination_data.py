@@ -10,22 +10,25 @@ class OrdinationDataGenerator:
     Generates data to be used for data sampling and train/test splitting.
     """
 
-    def generate_ordination_data(self) -> pd.DataFrame:
+    def generate_ordination_data(self, num_records: int = 100) -> pd.DataFrame:
         """
         데이터 샘플링 및 훈련/테스트 분할에 사용될 샘플 데이터를 생성합니다.
 
         Generates sample data to be used for data sampling and train/test splitting.
 
+        Args:
+            num_records (int): 생성할 데이터 레코드 수.
+
         Returns:
             pd.DataFrame: 샘플 데이터
         """
         np.random.seed(29)
         data = {
-            'disciple_id': range(1, 101),
-            'faith_score': np.random.randint(50, 100, size=100),
-            'service_hours': np.random.randint(10, 100, size=100),
-            'calling_type': np.random.choice(['Apostle', 'Prophet', 'Evangelist', 'Pastor', 'Teacher'], size=100),
-            'is_ordained': np.random.choice([True, False], p=[0.3, 0.7], size=100)
+            'disciple_id': np.arange(1, num_records + 1),
+            'faith_score': np.random.randint(50, 100, size=num_records),
+            'service_hours': np.random.randint(10, 100, size=num_records),
+            'calling_type': np.random.choice(['Apostle', 'Prophet', 'Evangelist', 'Pastor', 'Teacher'], size=num_records),
+            'is_ordained': np.random.choice([True, False], p=[0.3, 0.7], size=num_records)
         }
         df = pd.DataFrame(data)
         print("OrdinationDataGenerator: 샘플 데이터 생성 완료.")
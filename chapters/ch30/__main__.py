@@ -19,6 +19,7 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
 # 절대 임포트 사용
+from utils import reporting
 from chapters.ch30.incense_altar_data import IncenseAltarDataGenerator
 from chapters.ch30.date_range_generator import DateRangeGenerator
 from chapters.ch30.period_converter import PeriodConverter
@@ -50,7 +51,7 @@ def run_incense_altar_data_generation():
         generator = IncenseAltarDataGenerator()
         data = generator.generate_incense_data()
         print("\n✅ 분향단 데이터 생성 완료:")
-        print(data.head())
+        reporting.print_frame(data.head())
         return data
     except Exception as e:
         print(f"❌ 분향단 데이터 생성 중 오류 발생: {e}")
@@ -10,6 +10,7 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
 # 절대 임포트 사용
+from utils import reporting
 from chapters.ch31.craftsmen_data import CraftsmenDataGenerator
 from chapters.ch31.vectorization_optimizer import VectorizationOptimizer
 from chapters.ch31.eval_query_accelerator import EvalQueryAccelerator
@@ -42,7 +43,7 @@ def run_craftsmen_data_generation():
         generator = CraftsmenDataGenerator()
         data = generator.generate_craftsmen_data()
         print("\n✅ 장인 데이터 생성 완료:")
-        print(data.head())
+        reporting.print_frame(data.head())
         return data
     except Exception as e:
         print(f"❌ 장인 데이터 생성 중 오류 발생: {e}")
@@ -62,7 +63,7 @@ def run_vectorization_optimization(df):
         optimizer = VectorizationOptimizer(df)
         optimized_df = optimizer.calculate_total_time_vectorized()
         print("\n✅ 벡터화 연산 최적화 적용 완료 (일부):")
-        print(optimized_df.head())
+        reporting.print_frame(optimized_df.head())
         return optimized_df
     except Exception as e:
         print(f"❌ 벡터화 연산 최적화 중 오류 발생: {e}")
@@ -83,8 +84,8 @@ def run_eval_query_acceleration(df):
         eval_result = accelerator.apply_eval("total_time_minutes > 100 and material_cost > 500")
         query_result = accelerator.apply_query("craftsman == 'Bezalel' and total_time_minutes > 150")
         print("\n✅ eval()/query() 가속 적용 완료 (일부):")
-        print(eval_result.head())
-        print(query_result.head())
+        reporting.print_frame(eval_result.head())
+        reporting.print_frame(query_result.head())
         return {'eval_result': eval_result, 'query_result': query_result}
     except Exception as e:
         print(f"❌ eval()/query() 가속 중 오류 발생: {e}")
@@ -104,7 +105,12 @@ def run_dtype_tuning(df):
         tuner = DtypeTuner(df)
         optimized_df = tuner.optimize_dtypes()
         print("\n✅ 데이터 타입 최적화 적용 완료 (일부):")
-        print(optimized_df.head())
+        reporting.print_frame(optimized_df.head())
+
+        # Arrow 전략: 문자열을 Arrow string/dictionary로, 정수를 가장 작은 Arrow 정수로
+        arrow_df = tuner.optimize_dtypes(strategy='arrow')
+        print("\n🏹 Arrow dtype 전략 (Arrow-backed dtypes):")
+        reporting.print_frame(arrow_df.dtypes)
         return optimized_df
     except Exception as e:
         print(f"❌ 데이터 타입 최적화 중 오류 발생: {e}")
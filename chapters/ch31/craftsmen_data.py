@@ -1,6 +1,15 @@
+from pathlib import Path
+from typing import Optional, Union
+
 import pandas as pd
 import numpy as np
 
+from utils.synthetic import CHUNK_SIZE, generate_chunked
+
+CRAFTSMEN = ['Bezalel', 'Oholiab', 'Other']
+CRAFTSMEN_P = [0.3, 0.3, 0.4]
+TASK_TYPES = ['Gold Work', 'Silver Work', 'Bronze Work', 'Wood Carving', 'Embroidery']
+
 class CraftsmenDataGenerator:
     """
     브살렐과 오홀리압 챕터(ch31)를 위한 샘플 데이터를 생성하는 클래스.
@@ -25,8 +34,8 @@ class CraftsmenDataGenerator:
             pd.DataFrame: 샘플 데이터.
         """
         np.random.seed(31)
-        craftsmen = np.random.choice(['Bezalel', 'Oholiab', 'Other'], size=num_tasks, p=[0.3, 0.3, 0.4])
-        task_types = np.random.choice(['Gold Work', 'Silver Work', 'Bronze Work', 'Wood Carving', 'Embroidery'], size=num_tasks)
+        craftsmen = np.random.choice(CRAFTSMEN, size=num_tasks, p=CRAFTSMEN_P)
+        task_types = np.random.choice(TASK_TYPES, size=num_tasks)
         
         data = {
             'task_id': range(1, num_tasks + 1),
@@ -40,6 +49,48 @@ class CraftsmenDataGenerator:
         print("CraftsmenDataGenerator: 샘플 데이터 생성 완료.")
         return df
 
+    def generate_craftsmen_chunk(self, rng: np.random.Generator, start: int, stop: int) -> pd.DataFrame:
+        """
+        작업 start+1..stop번의 레코드를 주어진 난수 생성기로 생성합니다 (청크 생성용).
+
+        Generates task records start+1..stop with the given random generator (used for chunked generation).
+        """
+        size = stop - start
+        return pd.DataFrame({
+            'task_id': np.arange(start + 1, stop + 1),
+            'craftsman': rng.choice(CRAFTSMEN, size=size, p=CRAFTSMEN_P),
+            'task_type': rng.choice(TASK_TYPES, size=size),
+            'time_spent_minutes': rng.integers(10, 300, size=size),
+            'material_cost': rng.random(size) * 1000 + 50,
+            'quality_score': rng.integers(70, 100, size=size),
+        })
+
+    def generate_craftsmen_data_chunked(self, num_tasks: int, chunk_size: int = CHUNK_SIZE, seed: int = 31,
+                                        workers: Optional[int] = None,
+                                        output_dir: Optional[Union[str, Path]] = None) -> Union[pd.DataFrame, Path]:
+        """
+        작업 레코드를 청크로 나눠 여러 프로세스에서 생성합니다.
+        청크마다 SeedSequence에서 나온 독립 난수 생성기를 쓰므로 워커 수와 관계없이 결과가 같습니다.
+        (전역 np.random.seed를 쓰는 generate_craftsmen_data와는 다른 난수 스트림입니다.)
+
+        Generates task records in chunks across processes. Each chunk uses an independent
+        generator spawned from a SeedSequence, so the output is identical for any worker count.
+
+        Args:
+            num_tasks (int): 생성할 작업 레코드 수.
+            chunk_size (int): 청크당 행 수 (결과를 결정하므로 같은 결과를 원하면 고정).
+            seed (int): 루트 시드.
+            workers (int, optional): 워커 프로세스 수 (생략 시 CPU 수).
+            output_dir (str | Path, optional): 주면 청크별 Parquet 파일(part-00000.parquet, ...)로 저장.
+
+        Returns:
+            pd.DataFrame 또는 Path: 샘플 데이터, 또는 Parquet 디렉토리 경로.
+        """
+        result = generate_chunked(self.generate_craftsmen_chunk, num_tasks, chunk_size=chunk_size,
+                                  seed=seed, workers=workers, output_dir=output_dir)
+        print(f"CraftsmenDataGenerator: {num_tasks:,}개 작업 청크 생성 완료.")
+        return result
+
 if __name__ == "__main__":
     generator = CraftsmenDataGenerator()
     df = generator.generate_craftsmen_data()
@@ -1,6 +1,60 @@
 import pandas as pd
 import numpy as np
 
+# 고유값 비율이 이보다 낮은 문자열 컬럼은 category(Arrow 전략에서는 dictionary)로 변환
+CATEGORY_RATIO = 0.5
+
+# 최적화 전략: 'numpy'는 int8/float32/category, 'arrow'는 pyarrow 기반 dtype (pd.ArrowDtype)
+STRATEGIES = ('numpy', 'arrow')
+
+
+def _smallest_int(min_val, max_val, candidates):
+    """[min_val, max_val]을 담는 가장 작은 정수 타입 (candidates는 작은 순서의 (numpy 타입, 결과) 쌍)"""
+    for np_type, result in candidates:
+        if min_val >= np.iinfo(np_type).min and max_val <= np.iinfo(np_type).max:
+            return result
+    return candidates[-1][1]
+
+
+def _arrow_dtype(series: pd.Series):
+    """컬럼 하나에 맞는 Arrow dtype (바꿀 필요가 없거나 모르는 타입이면 None)
+
+    정수는 값 범위에 맞는 가장 작은 Arrow 정수, 실수는 float32, 불리언은 비트 단위 bool,
+    문자열은 고유값이 적으면 dictionary(작은 정수 인덱스 + 고유 문자열), 많으면 Arrow string입니다.
+    Arrow 타입은 모두 결측값을 그대로 담으므로 정수에 결측이 있어도 float로 바뀌지 않습니다.
+    """
+    import pyarrow as pa
+
+    dtype = series.dtype
+    if isinstance(dtype, pd.ArrowDtype):
+        return None
+    if pd.api.types.is_bool_dtype(dtype):
+        return pd.ArrowDtype(pa.bool_())
+    if pd.api.types.is_integer_dtype(dtype):
+        if series.isna().all():
+            return pd.ArrowDtype(pa.int8())
+        return pd.ArrowDtype(_smallest_int(series.min(), series.max(), [
+            (np.int8, pa.int8()), (np.int16, pa.int16()), (np.int32, pa.int32()), (np.int64, pa.int64())]))
+    if pd.api.types.is_float_dtype(dtype):
+        return pd.ArrowDtype(pa.float32())
+    if pd.api.types.is_datetime64_dtype(dtype):
+        return pd.ArrowDtype(pa.timestamp(np.datetime_data(dtype)[0]))
+    if isinstance(dtype, pd.CategoricalDtype):
+        if not dtype.categories.map(type).eq(str).all():
+            return None  # 문자열이 아닌 범주는 그대로 둠
+        num_categories = len(dtype.categories)
+    elif pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+        if not series.dropna().map(type).eq(str).all():
+            return None  # 문자열이 아닌 값이 섞인 컬럼은 그대로 둠
+        num_categories = series.nunique()
+        if num_categories / max(len(series), 1) >= CATEGORY_RATIO:
+            return pd.ArrowDtype(pa.string())
+    else:
+        return None
+    index_type = _smallest_int(0, num_categories, [(np.int8, pa.int8()), (np.int16, pa.int16()), (np.int32, pa.int32())])
+    return pd.ArrowDtype(pa.dictionary(index_type, pa.string()))
+
+
 class DtypeTuner:
     """
     데이터프레임의 데이터 타입(`dtype`)을 최적화하여 메모리 사용량을 줄이고
@@ -13,20 +67,38 @@ class DtypeTuner:
     def __init__(self, df: pd.DataFrame):
         self.df = df.copy()
 
-    def optimize_dtypes(self) -> pd.DataFrame:
+    def optimize_dtypes(self, strategy: str = 'numpy') -> pd.DataFrame:
         """
         데이터프레임의 숫자형 컬럼을 더 효율적인 `dtype`으로 변환하고,
         객체형 컬럼을 `category` dtype으로 변환하여 메모리를 최적화합니다.
+        strategy='arrow'이면 pyarrow 기반 dtype(작은 Arrow 정수, Arrow string/dictionary, 비트 단위 bool)을 사용해
+        고유값이 많은 문자열 컬럼도 파이썬 객체 없이 연속된 버퍼 하나로 저장합니다.
 
         Converts numerical columns of the DataFrame to more efficient `dtype`s and
         object-type columns to `category` dtype to optimize memory.
+        With strategy='arrow', columns are mapped to pyarrow-backed dtypes (small Arrow integers,
+        Arrow string/dictionary, bit-packed bool), so even high-cardinality strings avoid Python objects.
+
+        Args:
+            strategy (str): 'numpy' 또는 'arrow'.
 
         Returns:
             pd.DataFrame: 데이터 타입이 최적화된 데이터프레임.
         """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"지원하지 않는 전략입니다: {strategy} (가능: {', '.join(STRATEGIES)})")
+
         optimized_df = self.df.copy()
         original_memory_usage = optimized_df.memory_usage(deep=True).sum()
-        
+
+        if strategy == 'arrow':
+            optimized_df = optimized_df.astype({col: dtype for col, dtype in
+                                                ((col, _arrow_dtype(optimized_df[col])) for col in optimized_df.columns)
+                                                if dtype is not None})
+            new_memory_usage = optimized_df.memory_usage(deep=True).sum()
+            print(f"DtypeTuner: Arrow 데이터 타입 최적화 완료. 메모리 절감율: {(1 - new_memory_usage / original_memory_usage) * 100:.2f}%")
+            return optimized_df
+
         for col in optimized_df.columns:
             col_type = optimized_df[col].dtype
 
@@ -47,7 +119,7 @@ class DtypeTuner:
                 # 문자열 컬럼을 category로 변환 (고유값이 적을 경우)
                 num_unique_values = len(optimized_df[col].unique())
                 num_total_values = len(optimized_df[col])
-                if num_unique_values / num_total_values < 0.5: # 고유값 비율이 50% 미만일 때 category로 변환
+                if num_unique_values / num_total_values < CATEGORY_RATIO: # 고유값 비율이 50% 미만일 때 category로 변환
                     optimized_df[col] = optimized_df[col].astype('category')
         
         new_memory_usage = optimized_df.memory_usage(deep=True).sum()
@@ -72,3 +144,7 @@ if __name__ == "__main__":
 
     print("\n최적화된 데이터 정보:")
     optimized_df.info(memory_usage='deep')
+
+    arrow_df = tuner.optimize_dtypes(strategy='arrow')
+    print("\nArrow 전략으로 최적화된 데이터 정보:")
+    arrow_df.info(memory_usage='deep')
@@ -10,6 +10,7 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
 # 절대 임포트 사용
+from utils import reporting
 from chapters.ch33.grace_data import GraceDataGenerator
 from chapters.ch33.merge_indicator_resolver import MergeIndicatorResolver
 from chapters.ch33.merge_validator import MergeValidator
@@ -42,7 +43,7 @@ def run_grace_data_generation():
         generator = GraceDataGenerator()
         df1, df2 = generator.generate_grace_data()
         print("\n✅ 은혜 데이터 생성 완료 (데이터셋 1 일부):")
-        print(df1.head())
+        reporting.print_frame(df1.head())
         return df1, df2
     except Exception as e:
         print(f"❌ 은혜 데이터 생성 중 오류 발생: {e}")
@@ -62,7 +63,7 @@ def run_merge_indicator_resolution(df1, df2):
         resolver = MergeIndicatorResolver(df1, df2)
         merged_df = resolver.resolve_with_indicator(on='id', how='outer')
         print("\n✅ `indicator` 파라미터 해소 완료 (일부):")
-        print(merged_df.head())
+        reporting.print_frame(merged_df.head())
         return merged_df
     except Exception as e:
         print(f"❌ `indicator` 파라미터 해소 중 오류 발생: {e}")
@@ -83,7 +84,7 @@ def run_merge_validation(df1, df2):
         # 1대1 결합 유효성 검사 시도
         merged_df = validator.validate_merge(on='id', how='inner', validate='one_to_one')
         print("\n✅ `validate` 파라미터 유효성 검사 완료 (일부):")
-        print(merged_df.head())
+        reporting.print_frame(merged_df.head())
         return merged_df
     except Exception as e:
         print(f"❌ `validate` 파라미터 유효성 검사 중 오류 발생: {e}")
@@ -106,7 +107,7 @@ def run_column_conflict_resolution(df1, df2):
         resolver = ColumnConflictResolver(df1_conflict, df2_conflict)
         merged_df = resolver.resolve_column_conflicts(on='id', how='inner', suffixes=['_left', '_right'])
         print("\n✅ 컬럼 이름 충돌 해결 완료 (일부):")
-        print(merged_df.head())
+        reporting.print_frame(merged_df.head())
         return merged_df
     except Exception as e:
         print(f"❌ 컬럼 이름 충돌 해결 중 오류 발생: {e}")
@@ -18,6 +18,7 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
 # 절대 임포트 사용
+from utils import reporting
 from chapters.ch34.new_tablets_data import NewTabletsDataGenerator
 from chapters.ch34.min_max_normalizer import MinMaxNormalizer
 from chapters.ch34.zscore_standardizer import ZscoreStandardizer
@@ -50,7 +51,7 @@ def run_new_tablets_data_generation():
         generator = NewTabletsDataGenerator()
         data = generator.generate_tablets_data()
         print("\n✅ 새 돌판 데이터 생성 완료:")
-        print(data.head())
+        reporting.print_frame(data.head())
         return data
     except Exception as e:
         print(f"❌ 새 돌판 데이터 생성 중 오류 발생: {e}")
@@ -70,7 +71,7 @@ def run_min_max_normalization(df):
         normalizer = MinMaxNormalizer(df)
         normalized_df = normalizer.apply_min_max_scaling('obedience_score')
         print("\n✅ Min-Max 정규화 적용 완료 (일부):")
-        print(normalized_df.head())
+        reporting.print_frame(normalized_df.head())
         return normalized_df
     except Exception as e:
         print(f"❌ Min-Max 정규화 중 오류 발생: {e}")
@@ -90,7 +91,7 @@ def run_zscore_standardization(df):
         standardizer = ZscoreStandardizer(df)
         standardized_df = standardizer.apply_zscore_standardization('divine_favor')
         print("\n✅ Z-score 표준화 적용 완료 (일부):")
-        print(standardized_df.head())
+        reporting.print_frame(standardized_df.head())
         return standardized_df
     except Exception as e:
         print(f"❌ Z-score 표준화 중 오류 발생: {e}")
@@ -117,7 +118,7 @@ def run_string_normalization(df):
         
         normalized_string_df = normalizer.apply_string_normalization('commandment_text')
         print("\n✅ 문자열 정규화 적용 완료 (일부):")
-        print(normalized_string_df.head())
+        reporting.print_frame(normalized_string_df.head())
         return normalized_string_df
     except Exception as e:
         print(f"❌ 문자열 정규화 중 오류 발생: {e}")
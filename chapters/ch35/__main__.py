@@ -14,6 +14,7 @@ from datetime import datetime
 import pandas as pd
 import numpy as np
 import os
+import shutil
 
 # 프로젝트 루트 추가
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -24,6 +25,7 @@ from chapters.ch35.offering_data import OfferingDataGenerator
 from chapters.ch35.csv_io_handler import CsvIOHandler
 from chapters.ch35.parquet_io_handler import ParquetIOHandler
 from chapters.ch35.excel_io_handler import ExcelIOHandler
+from utils import data_io, reporting
 
 def print_chapter_header():
     '''챕터 헤더 출력'''
@@ -52,7 +54,7 @@ def run_offering_data_generation():
         generator = OfferingDataGenerator()
         data = generator.generate_offering_data()
         print("\n✅ 자원 봉헌 데이터 생성 완료:")
-        print(data.head())
+        reporting.print_frame(data.head())
         return data
     except Exception as e:
         print(f"❌ 자원 봉헌 데이터 생성 중 오류 발생: {e}")
@@ -74,8 +76,16 @@ def run_csv_io_operations(df):
         saved_path = handler.save_data(csv_filename)
         loaded_df = handler.load_data(csv_filename)
         print("\n✅ CSV 파일 입출력 완료 (불러온 데이터 일부):")
-        print(loaded_df.head())
-        
+        reporting.print_frame(loaded_df.head())
+
+        # 청크 단위 스트리밍: 한 번에 한 청크만 메모리에 두고 봉헌 종류별 합계를 계산
+        print("\n📦 청크 단위 스트리밍 집계 (Chunked streaming aggregation):")
+        chunk_totals = handler.process_chunks(
+            csv_filename,
+            lambda chunk: chunk.groupby('offering_type', as_index=False)['value_shekels'].sum(),
+            chunksize=max(1, len(df) // 3))
+        reporting.print_frame(chunk_totals.groupby('offering_type')['value_shekels'].sum())
+
         if os.path.exists(saved_path): os.remove(saved_path)
         return loaded_df
     except Exception as e:
@@ -98,9 +108,18 @@ def run_parquet_io_operations(df):
         saved_path = handler.save_data(parquet_filename)
         loaded_df = handler.load_data(parquet_filename)
         print("\n✅ Parquet 파일 입출력 완료 (불러온 데이터 일부):")
-        print(loaded_df.head())
-        
+        reporting.print_frame(loaded_df.head())
+
+        # 월별 파티션 데이터셋: 필요한 달과 컬럼만 읽음
+        print("\n🗂️ 월별 파티션 데이터셋 (Month-partitioned dataset):")
+        dataset_dir = "ch35_offering_dataset"
+        dataset_path = handler.save_dataset(dataset_dir, month_from='offering_date')
+        first_month = handler.load_dataset(dataset_dir, columns=['offering_type', 'value_shekels', 'month'],
+                                           filters=[('month', '==', '1446-01')])
+        reporting.print_frame(first_month.head())
+
         if os.path.exists(saved_path): os.remove(saved_path)
+        if os.path.exists(dataset_path): shutil.rmtree(dataset_path)
         return loaded_df
     except Exception as e:
         print(f"❌ Parquet 파일 입출력 중 오류 발생: {e}")
@@ -122,14 +141,42 @@ def run_excel_io_operations(df):
         saved_path = handler.save_data(excel_filename)
         loaded_df = handler.load_data(excel_filename)
         print("\n✅ Excel 파일 입출력 완료 (불러온 데이터 일부):")
-        print(loaded_df.head())
-        
+        reporting.print_frame(loaded_df.head())
+
+        # Parquet 캐시: 같은 통합 문서를 다시 읽으면 Excel 파싱을 건너뜀
+        print("\n⚡ Excel Parquet 캐시 (Excel workbook cache):")
+        cache_dir = "ch35_excel_cache"
+        cached_handler = ExcelIOHandler(cache_dir=cache_dir)
+        for _ in range(2):
+            sheets = cached_handler.load_all_sheets(excel_filename)
+        print(f"시트: {list(sheets)}")
+
         if os.path.exists(saved_path): os.remove(saved_path)
+        if os.path.exists(cache_dir): shutil.rmtree(cache_dir)
         return loaded_df
     except Exception as e:
         print(f"❌ Excel 파일 입출력 중 오류 발생: {e}")
         return None
 
+def run_format_comparison(df):
+    '''형식 비교 섹션 실행'''
+    print("\n⚖️ === 파일 형식 비교 ===")
+    print("`utils.data_io.benchmark_formats()`로 같은 데이터를 형식마다 저장하고 불러와 시간, 파일 크기, 메모리를 비교합니다.")
+    print("Compares write/read time, file size and peak memory per format with `utils.data_io.benchmark_formats()`.")
+
+    if df is None:
+        print("⚠️ 데이터가 없어 형식 비교를 건너뜁니다.")
+        return None
+
+    try:
+        comparison = data_io.benchmark_formats(df, repeat=1)
+        print("\n✅ 형식 비교 완료 (읽기 시간 순):")
+        reporting.print_frame(comparison, index=False)
+        return comparison
+    except Exception as e:
+        print(f"❌ 형식 비교 중 오류 발생: {e}")
+        return None
+
 def show_blending_insights(original_df, csv_df, parquet_df, excel_df):
     '''블렌딩 모드 통합 통찰 출력'''
     print("\n🎨 === 블렌딩 모드: 출애굽 × 요한복음의 통합 통찰 ===")
@@ -216,13 +263,16 @@ def run_chapter35(interactive: bool = True):
     excel_df = run_excel_io_operations(original_df) # 원본 데이터에 적용
     results['excel_data'] = excel_df
 
-    # 5. 블렌딩 통찰
+    # 5. 형식 비교
+    results['format_comparison'] = run_format_comparison(original_df)
+
+    # 6. 블렌딩 통찰
     show_blending_insights(original_df, csv_df, parquet_df, excel_df)
 
-    # 6. 다음 챕터 미리보기
+    # 7. 다음 챕터 미리보기
     show_next_chapter_preview()
 
-    # 7. 마무리 기도
+    # 8. 마무리 기도
     print("\n🙏 === 마무리 기도 (Closing Prayer) ===")
     prayer = (
         "\"주님, 자원 봉헌처럼 저의 모든 자원을 주님께 드리고, 오병이어처럼 주님 안에서 놀랍게 확장되게 하소서.\n"
@@ -1,17 +1,98 @@
-import pandas as pd
+import bz2
+import gzip
+import lzma
 import os
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+import pandas as pd
+
+from utils import data_io
+
+# 스트리밍 저장에서 지원하는 압축 형식과 확장자 (compression='infer'일 때)
+STREAM_COMPRESSIONS = {'gzip': '.gz', 'bz2': '.bz2', 'xz': '.xz', 'zstd': '.zst'}
+
+# 청크 단위 읽기의 기본 청크 크기와 dtype 추론에 쓰는 표본 행 수
+DEFAULT_CHUNKSIZE = 100_000
+DEFAULT_SAMPLE_ROWS = 10_000
+
+
+def _open_text_stream(path: str, compression: Optional[str]):
+    """압축 형식에 맞는 텍스트 쓰기 스트림 (청크를 이어 써도 하나의 압축 스트림이 되도록 한 번만 엶)"""
+    if compression is None:
+        return open(path, 'w', encoding='utf-8', newline='')
+    if compression == 'gzip':
+        return gzip.open(path, 'wt', encoding='utf-8', newline='')
+    if compression == 'bz2':
+        return bz2.open(path, 'wt', encoding='utf-8', newline='')
+    if compression == 'xz':
+        return lzma.open(path, 'wt', encoding='utf-8', newline='')
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("zstd 압축에는 zstandard 패키지가 필요합니다: pip install zstandard") from e
+        return zstandard.open(path, 'wt', encoding='utf-8', newline='')
+    raise ValueError(f"지원하지 않는 압축 형식입니다: {compression} (가능: {sorted(STREAM_COMPRESSIONS)})")
+
+
+def _resolve_compression(path: str, compression: Optional[str]) -> Optional[str]:
+    """compression='infer'이면 확장자(.gz, .bz2, .xz, .zst)로 압축 형식 결정"""
+    if compression != 'infer':
+        return compression
+    for name, suffix in STREAM_COMPRESSIONS.items():
+        if path.endswith(suffix):
+            return name
+    return None
+
+
+# dtype_backend='pyarrow'일 때 고정 dtype → Arrow dtype 이름 (문자열은 파이썬 객체 대신 Arrow string)
+PINNED_ARROW_DTYPES = {'Int64': 'int64', 'boolean': 'bool', 'float64': 'double', 'object': 'string'}
+
+
+def _pinned_dtype(dtype, dtype_backend: Optional[str] = None):
+    """표본에서 추론한 dtype을 이후 청크에도 안전한 dtype으로 고정
+
+    정수/불리언은 뒤 청크에 결측이 나와도 바뀌지 않도록 nullable(Int64/boolean)로,
+    문자열은 object로 고정해 청크마다 dtype이 달라지지 않게 합니다.
+    dtype_backend='pyarrow'이면 같은 역할의 Arrow dtype으로 고정합니다.
+    """
+    if pd.api.types.is_bool_dtype(dtype):
+        pinned = 'boolean'
+    elif pd.api.types.is_integer_dtype(dtype):
+        pinned = 'Int64'
+    elif pd.api.types.is_float_dtype(dtype):
+        pinned = 'float64'
+    else:
+        pinned = 'object'
+    if dtype_backend != 'pyarrow':
+        return pinned
+
+    # 'string[pyarrow]' 별칭은 StringDtype이므로 read_csv(dtype_backend='pyarrow')와 같은 pd.ArrowDtype으로 만듦
+    import pyarrow as pa
+    return pd.ArrowDtype(pa.type_for_alias(PINNED_ARROW_DTYPES[pinned]))
+
 
 class CsvIOHandler:
     """
     데이터프레임을 CSV 파일로 읽고 쓰는 클래스.
     `to_csv()`와 `read_csv()` 메서드를 활용하여 CSV 파일 입출력을 처리합니다.
+    메모리보다 큰 파일은 `iter_chunks()`, `save_chunks()`, `process_chunks()`로 청크 단위로 처리합니다.
 
     Class to read and write DataFrames to/from CSV files.
     Handles CSV file input/output using `to_csv()` and `read_csv()` methods.
+    Files larger than memory are streamed chunk by chunk with `iter_chunks()`, `save_chunks()` and `process_chunks()`.
+    With dtype_backend='pyarrow', every load returns pyarrow-backed columns (strings become Arrow strings).
     """
 
-    def __init__(self, df: pd.DataFrame = None):
+    def __init__(self, df: pd.DataFrame = None, dtype_backend: Optional[str] = None):
+        """
+        Args:
+            df (pd.DataFrame, optional): 저장할 데이터프레임.
+            dtype_backend (str, optional): 불러올 때의 dtype 백엔드 ('pyarrow' 또는 'numpy_nullable').
+                생략하면 기본 numpy dtype (문자열은 object).
+        """
         self.df = df
+        self.dtype_backend = dtype_backend
 
     def save_data(self, filename: str, index: bool = False, **kwargs) -> str:
         """
@@ -32,7 +113,7 @@ class CsvIOHandler:
             return ""
         
         full_path = os.path.join(os.getcwd(), filename)
-        self.df.to_csv(full_path, index=index, **kwargs)
+        data_io.save(self.df, full_path, format='csv', index=index, **kwargs)
         print(f"CsvIOHandler: CSV 파일 '{filename}' 저장 완료.")
         return full_path
 
@@ -54,10 +135,131 @@ class CsvIOHandler:
             print(f"경고: 파일 '{filename}'을 찾을 수 없습니다. 빈 데이터프레임을 반환합니다.")
             return pd.DataFrame()
 
-        loaded_df = pd.read_csv(full_path, **kwargs)
+        kwargs.setdefault('dtype_backend', self.dtype_backend)
+        loaded_df = data_io.load(full_path, format='csv', **kwargs)
         print(f"CsvIOHandler: CSV 파일 '{filename}' 불러오기 완료.")
         return loaded_df
 
+    def infer_dtypes(self, filename: str, sample_rows: int = DEFAULT_SAMPLE_ROWS,
+                     usecols: Optional[List[str]] = None, **kwargs) -> Dict[str, object]:
+        """
+        파일 앞부분 표본으로 컬럼별 dtype을 한 번 추론해 고정합니다.
+
+        Infers column dtypes once from a sample of the file and pins them.
+
+        Args:
+            filename (str): CSV 파일 이름.
+            sample_rows (int): 표본 행 수.
+            usecols (list, optional): 읽을 컬럼.
+            **kwargs: `pd.read_csv()`에 전달할 추가 인자.
+
+        Returns:
+            dict: {컬럼: dtype} (정수 → Int64, 불리언 → boolean, 실수 → float64,
+                그 외와 표본에서 모두 결측인 컬럼 → object,
+                dtype_backend='pyarrow'이면 같은 역할의 pd.ArrowDtype - int64, bool, double, string)
+        """
+        dtype_backend = kwargs.pop('dtype_backend', self.dtype_backend)
+        sample = pd.read_csv(os.path.join(os.getcwd(), filename), nrows=sample_rows, usecols=usecols, **kwargs)
+        parsed = set(sample.select_dtypes(include=['datetime', 'datetimetz']).columns)
+        # 표본에서 모두 결측인 컬럼은 float64로 추론되지만 뒤에 문자열이 나올 수 있으므로 문자열로 고정
+        empty = set(sample.columns[sample.isna().all()])
+        return {column: _pinned_dtype(object if column in empty else dtype, dtype_backend)
+                for column, dtype in sample.dtypes.items() if column not in parsed}
+
+    def iter_chunks(self, filename: str, chunksize: int = DEFAULT_CHUNKSIZE, usecols: Optional[List[str]] = None,
+                    dtype: Optional[Dict[str, str]] = None, sample_rows: int = DEFAULT_SAMPLE_ROWS,
+                    **kwargs) -> Iterator[pd.DataFrame]:
+        """
+        CSV 파일을 chunksize행씩 읽어 같은 dtype의 청크를 차례로 돌려줍니다 (메모리에는 한 청크만).
+
+        Yields chunks of `chunksize` rows with identical dtypes (only one chunk is held in memory).
+
+        Args:
+            filename (str): 불러올 파일 이름 (.gz/.bz2/.xz/.zst 압축 파일 가능).
+            chunksize (int): 청크당 행 수.
+            usecols (list, optional): 읽을 컬럼 (나머지 컬럼은 파싱하지 않음).
+            dtype (dict, optional): 컬럼별 dtype. 생략하면 `infer_dtypes()`로 표본에서 추론해 고정.
+            sample_rows (int): dtype 추론에 쓸 표본 행 수.
+            **kwargs: `pd.read_csv()`에 전달할 추가 인자 (예: parse_dates).
+
+        Yields:
+            pd.DataFrame: 청크.
+        """
+        full_path = os.path.join(os.getcwd(), filename)
+        if not os.path.exists(full_path):
+            print(f"경고: 파일 '{filename}'을 찾을 수 없습니다. 청크 없이 종료합니다.")
+            return
+
+        if self.dtype_backend is not None:
+            kwargs.setdefault('dtype_backend', self.dtype_backend)
+        if dtype is None:
+            dtype = self.infer_dtypes(filename, sample_rows=sample_rows, usecols=usecols, **kwargs)
+
+        with pd.read_csv(full_path, chunksize=chunksize, usecols=usecols, dtype=dtype, **kwargs) as reader:
+            yield from reader
+
+    def save_chunks(self, chunks: Iterable[pd.DataFrame], filename: str, index: bool = False,
+                    compression: Optional[str] = 'infer', **kwargs) -> str:
+        """
+        청크들을 하나의 CSV 파일에 차례로 이어 씁니다 (머리글은 첫 청크에만).
+
+        Appends chunks to a single CSV file one by one (header only for the first chunk).
+
+        Args:
+            chunks (Iterable[pd.DataFrame]): 저장할 청크들 (제너레이터면 한 번에 한 청크만 메모리에 있음).
+            filename (str): 저장할 파일 이름.
+            index (bool): DataFrame 인덱스를 파일에 쓸지 여부.
+            compression (str, optional): 'gzip', 'bz2', 'xz', 'zstd', None 또는 'infer'(확장자로 결정).
+            **kwargs: `pd.DataFrame.to_csv()`에 전달할 추가 인자.
+
+        Returns:
+            str: 저장된 파일의 전체 경로.
+        """
+        full_path = os.path.join(os.getcwd(), filename)
+        columns = None
+        num_chunks = num_rows = 0
+        with _open_text_stream(full_path, _resolve_compression(full_path, compression)) as stream:
+            for chunk in chunks:
+                if columns is None:
+                    columns = list(chunk.columns)
+                elif list(chunk.columns) != columns:
+                    raise ValueError(f"청크 {num_chunks}의 컬럼이 첫 청크와 다릅니다: {list(chunk.columns)} != {columns}")
+                chunk.to_csv(stream, index=index, header=num_chunks == 0, **kwargs)
+                num_chunks += 1
+                num_rows += len(chunk)
+
+        print(f"CsvIOHandler: CSV 파일 '{filename}' 청크 {num_chunks}개 ({num_rows:,}행) 저장 완료.")
+        return full_path
+
+    def process_chunks(self, filename: str, func: Callable[[pd.DataFrame], pd.DataFrame],
+                       output_filename: Optional[str] = None, chunksize: int = DEFAULT_CHUNKSIZE,
+                       compression: Optional[str] = 'infer', **kwargs):
+        """
+        CSV 파일을 청크 단위로 읽어 각 청크에 func를 적용합니다.
+        output_filename을 주면 결과를 바로 이어 써서 메모리 사용량이 파일 크기와 무관합니다.
+
+        Applies `func` to each chunk. With `output_filename` the results are streamed to a new CSV,
+        so memory use does not depend on the file size.
+
+        Args:
+            filename (str): 입력 CSV 파일 이름.
+            func (Callable): 청크 → 처리된 DataFrame (예: 필터, 파생 컬럼, 청크별 집계).
+            output_filename (str, optional): 결과를 저장할 CSV 파일 이름.
+            chunksize (int): 청크당 행 수.
+            compression (str, optional): 출력 압축 형식 (`save_chunks()` 참고).
+            **kwargs: `iter_chunks()`에 전달할 추가 인자 (usecols, dtype 등).
+
+        Returns:
+            str 또는 pd.DataFrame: 출력 파일 경로, 또는 output_filename이 없으면 청크 결과를 이어 붙인 데이터프레임
+            (청크별 집계처럼 결과가 작을 때 사용).
+        """
+        results = map(func, self.iter_chunks(filename, chunksize=chunksize, **kwargs))
+        if output_filename is not None:
+            return self.save_chunks(results, output_filename, compression=compression)
+
+        results = list(results)
+        return pd.concat(results, ignore_index=True) if results else pd.DataFrame()
+
 if __name__ == "__main__":
     # 샘플 데이터 생성
     data = {
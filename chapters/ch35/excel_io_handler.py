@@ -1,17 +1,65 @@
-import pandas as pd
+import hashlib
+import json
 import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional
+
+import pandas as pd
+
+from utils import data_io
+from utils.data_io import select_excel_engine as select_engine
+
+# Parquet 캐시의 시트 목록 파일과 시트 파일 이름 (시트 이름 대신 순번을 써서 파일명 문제를 피함)
+CACHE_MANIFEST = 'sheets.json'
+CACHE_SHEET_PATTERN = 'sheet-{index:03d}.parquet'
+
+
+def workbook_digest(path: str, options: Optional[dict] = None, chunk_size: int = 1 << 20) -> str:
+    """통합 문서 내용(과 읽기 옵션)의 SHA-256 해시 - 이름이나 수정 시각이 바뀌어도 내용이 같으면 같은 키"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    if options:
+        digest.update(repr(sorted(options.items())).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _read_sheet(path: str, sheet_name, engine: Optional[str], kwargs: dict) -> pd.DataFrame:
+    """시트 하나 읽기 (워커 프로세스에서 실행)"""
+    return pd.read_excel(path, sheet_name=sheet_name, engine=engine, **kwargs)
+
+
+def _pick_sheet(sheets: Dict[str, pd.DataFrame], sheet_name) -> pd.DataFrame:
+    """시트 이름 또는 순번으로 시트 하나 고르기 (`pd.read_excel()`처럼 없으면 ValueError)"""
+    names = list(sheets)
+    if isinstance(sheet_name, int):
+        if not 0 <= sheet_name < len(names):
+            raise ValueError(f"시트 순번 {sheet_name}이(가) 없습니다 (시트 {len(names)}개).")
+        return sheets[names[sheet_name]]
+    if sheet_name not in sheets:
+        raise ValueError(f"시트 '{sheet_name}'이(가) 없습니다.")
+    return sheets[sheet_name]
+
 
 class ExcelIOHandler:
     """
     데이터프레임을 Excel 파일로 읽고 쓰는 클래스.
     `to_excel()`와 `read_excel()` 메서드를 활용하여 Excel 파일 입출력을 처리합니다.
+    읽기 엔진은 `select_engine()`(utils.data_io)으로 설치된 가장 빠른 것을 고르고, cache_dir을 주면
+    한 번 파싱한 통합 문서를 내용 해시별 Parquet으로 저장해 다음부터는 Excel 파싱을 건너뜁니다.
 
     Class to read and write DataFrames to/from Excel files.
     Handles Excel file input/output using `to_excel()` and `read_excel()` methods.
+    The fastest installed reader is chosen by `select_engine()`, and with `cache_dir` each parsed
+    workbook is cached as Parquet keyed by its content hash so repeated loads skip Excel parsing.
     """
 
-    def __init__(self, df: pd.DataFrame = None):
+    def __init__(self, df: pd.DataFrame = None, cache_dir: Optional[str] = None):
         self.df = df
+        self.cache_dir = cache_dir
 
     def save_data(self, filename: str, index: bool = False, **kwargs) -> str:
         """
@@ -32,32 +80,121 @@ class ExcelIOHandler:
             return ""
         
         full_path = os.path.join(os.getcwd(), filename)
-        self.df.to_excel(full_path, index=index, **kwargs)
+        data_io.save(self.df, full_path, format='excel', index=index, **kwargs)
         print(f"ExcelIOHandler: Excel 파일 '{filename}' 저장 완료.")
         return full_path
 
-    def load_data(self, filename: str, **kwargs) -> pd.DataFrame:
+    def load_data(self, filename: str, sheet_name=0, engine: Optional[str] = None, **kwargs) -> pd.DataFrame:
         """
         Excel 파일에서 데이터를 불러와 데이터프레임으로 반환합니다.
+        cache_dir이 있으면 통합 문서 전체를 Parquet 캐시에서 (없으면 파싱 후 캐시에 저장) 가져옵니다.
 
         Loads data from an Excel file and returns it as a DataFrame.
+        With `cache_dir` set, the whole workbook is served from (or stored in) the Parquet cache.
 
         Args:
             filename (str): 불러올 파일 이름.
+            sheet_name (str, int, list 또는 None): 시트 이름 또는 순번. `pd.read_excel()`처럼 목록이면
+                {요청한 이름/순번: 데이터프레임}, None이면 모든 시트의 {시트 이름: 데이터프레임}.
+            engine (str, optional): 읽기 엔진. 생략하면 `select_engine()`이 고름.
             **kwargs: `pd.read_excel()`에 전달할 추가 인자.
 
         Returns:
-            pd.DataFrame: 불러온 데이터프레임.
+            pd.DataFrame 또는 dict: 불러온 데이터프레임 (sheet_name이 목록이나 None이면 딕셔너리).
         """
         full_path = os.path.join(os.getcwd(), filename)
         if not os.path.exists(full_path):
             print(f"경고: 파일 '{filename}'을 찾을 수 없습니다. 빈 데이터프레임을 반환합니다.")
             return pd.DataFrame()
 
-        loaded_df = pd.read_excel(full_path, **kwargs)
-        print(f"ExcelIOHandler: Excel 파일 '{filename}' 불러오기 완료.")
+        if self.cache_dir is not None:
+            sheets = self.load_all_sheets(filename, engine=engine, **kwargs)
+            if sheet_name is None:
+                return sheets
+            if isinstance(sheet_name, list):
+                return {name: _pick_sheet(sheets, name) for name in sheet_name}
+            return _pick_sheet(sheets, sheet_name)
+
+        engine = engine or select_engine(full_path)
+        loaded_df = data_io.load(full_path, format='excel', sheet_name=sheet_name, engine=engine, **kwargs)
+        print(f"ExcelIOHandler: Excel 파일 '{filename}' 불러오기 완료 (엔진: {engine or 'pandas 기본값'}).")
         return loaded_df
 
+    def load_all_sheets(self, filename: str, engine: Optional[str] = None, workers: Optional[int] = None,
+                        **kwargs) -> Dict[str, pd.DataFrame]:
+        """
+        통합 문서의 모든 시트를 불러옵니다. 시트들은 여러 프로세스에서 동시에 파싱합니다
+        (openpyxl 파싱은 순수 파이썬이라 스레드로는 빨라지지 않음).
+
+        Loads every sheet of the workbook, parsing sheets concurrently in worker processes.
+
+        Args:
+            filename (str): 불러올 파일 이름.
+            engine (str, optional): 읽기 엔진. 생략하면 `select_engine()`이 고름.
+            workers (int, optional): 워커 프로세스 수 (생략 시 CPU 수, 1이면 현재 프로세스에서 차례로).
+            **kwargs: `pd.read_excel()`에 전달할 추가 인자 (캐시 키에 포함).
+
+        Returns:
+            dict: {시트 이름: 데이터프레임} (통합 문서의 시트 순서).
+        """
+        full_path = os.path.join(os.getcwd(), filename)
+        if not os.path.exists(full_path):
+            print(f"경고: 파일 '{filename}'을 찾을 수 없습니다. 빈 딕셔너리를 반환합니다.")
+            return {}
+
+        cache_path = None
+        if self.cache_dir is not None:
+            cache_path = Path(os.getcwd(), self.cache_dir, workbook_digest(full_path, kwargs)[:16])
+            sheets = self._read_cache(cache_path)
+            if sheets is not None:
+                print(f"ExcelIOHandler: Excel 파일 '{filename}' 캐시에서 불러오기 완료 (시트 {len(sheets)}개).")
+                return sheets
+
+        engine = engine or select_engine(full_path)
+        with pd.ExcelFile(full_path, engine=engine) as workbook:
+            sheet_names = workbook.sheet_names
+
+        tasks = [(full_path, name, engine, kwargs) for name in sheet_names]
+        if workers == 1 or len(tasks) <= 1:
+            frames = [_read_sheet(*task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                frames = list(pool.map(_read_sheet, *zip(*tasks)))
+        sheets = dict(zip(sheet_names, frames))
+
+        if cache_path is not None:
+            self._write_cache(cache_path, sheets)
+        print(f"ExcelIOHandler: Excel 파일 '{filename}' 시트 {len(sheets)}개 불러오기 완료 (엔진: {engine or 'pandas 기본값'}).")
+        return sheets
+
+    @staticmethod
+    def _read_cache(cache_path: Path) -> Optional[Dict[str, pd.DataFrame]]:
+        """캐시 디렉토리의 시트들 (없거나 읽을 수 없으면 None)"""
+        try:
+            with open(cache_path / CACHE_MANIFEST, 'r', encoding='utf-8') as f:
+                sheet_names = json.load(f)['sheets']
+            return {name: pd.read_parquet(cache_path / CACHE_SHEET_PATTERN.format(index=index))
+                    for index, name in enumerate(sheet_names)}
+        except (ImportError, OSError, ValueError, KeyError):
+            return None
+
+    @staticmethod
+    def _write_cache(cache_path: Path, sheets: Dict[str, pd.DataFrame]):
+        """시트들을 Parquet 캐시로 저장 (시트 목록은 마지막에 써서 중간에 실패한 캐시는 쓰이지 않음)
+
+        index_col 같은 읽기 옵션이 만든 인덱스도 함께 저장해 캐시에서 읽은 시트가 파싱한 시트와 같게 합니다.
+        숫자와 문자가 섞인 열처럼 Parquet으로 쓸 수 없는 시트가 있으면 캐시하지 않습니다.
+        """
+        try:
+            cache_path.mkdir(parents=True, exist_ok=True)
+            for index, df in enumerate(sheets.values()):
+                df.to_parquet(cache_path / CACHE_SHEET_PATTERN.format(index=index), index=True)
+            with open(cache_path / CACHE_MANIFEST, 'w', encoding='utf-8') as f:
+                json.dump({'sheets': list(sheets)}, f, ensure_ascii=False)
+        except (ImportError, OSError, ValueError, TypeError) as e:
+            print(f"경고: Excel 캐시를 저장하지 못했습니다 ({e}). 다음에도 Excel을 파싱합니다.")
+            shutil.rmtree(cache_path, ignore_errors=True)
+
 if __name__ == "__main__":
     # 샘플 데이터 생성
     data = {
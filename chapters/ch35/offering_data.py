@@ -32,7 +32,9 @@ class OfferingDataGenerator:
             'quantity': np.random.randint(1, 100, size=num_records),
             'value_shekels': np.random.rand(num_records) * 1000 + 10,
             'voluntary': np.random.choice([True, False], size=num_records, p=[0.8, 0.2]),
-            'offering_date': pd.to_datetime('1446-01-01') + pd.to_timedelta(np.random.randint(0, 365, size=num_records), unit='D')
+            # 1446년은 나노초 범위(1677~2262년) 밖이므로 초 단위 datetime64로 생성
+            'offering_date': (np.datetime64('1446-01-01', 's')
+                              + np.random.randint(0, 365, size=num_records).astype('timedelta64[D]'))
         }
         df = pd.DataFrame(data)
 
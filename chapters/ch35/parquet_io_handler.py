@@ -1,17 +1,46 @@
-import pandas as pd
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence
+
+import pandas as pd
+
+from utils import data_io
+
+# 데이터셋 모드의 행 그룹 최대 행 수 (행 그룹마다 min/max 통계가 있어 필터가 행 그룹 단위로 건너뜀)
+DEFAULT_ROW_GROUP_SIZE = 100_000
+
+# month_from으로 만드는 월 파티션 컬럼 이름 (값은 'YYYY-MM')
+MONTH_COLUMN = 'month'
+
+# 데이터셋 파일 이름 ({i}는 pyarrow가 파티션 디렉토리마다 채우는 번호)
+DATASET_FILE_TEMPLATE = 'part-{i}.parquet'
+
 
 class ParquetIOHandler:
     """
     데이터프레임을 Parquet 파일로 읽고 쓰는 클래스.
     `to_parquet()`와 `read_parquet()` 메서드를 활용하여 Parquet 파일 입출력을 처리합니다.
+    `save_dataset()`/`load_dataset()`은 컬럼 값으로 디렉토리를 나눈(hive 파티션) 데이터셋을 쓰고,
+    필요한 컬럼과 필터에 맞는 파티션/행 그룹만 여러 스레드로 읽습니다.
 
     Class to read and write DataFrames to/from Parquet files.
     Handles Parquet file input/output using `to_parquet()` and `read_parquet()` methods.
+    `save_dataset()`/`load_dataset()` write hive-partitioned datasets and read back only the
+    partitions and row groups that match the requested columns and filters, using a thread pool.
+    With dtype_backend='pyarrow', Arrow columns are handed to pandas as-is (no object-column materialization).
     """
 
-    def __init__(self, df: pd.DataFrame = None):
+    def __init__(self, df: pd.DataFrame = None, dtype_backend: Optional[str] = None):
+        """
+        Args:
+            df (pd.DataFrame, optional): 저장할 데이터프레임.
+            dtype_backend (str, optional): 불러올 때의 dtype 백엔드. 'pyarrow'이면 Arrow 버퍼를 그대로
+                pd.ArrowDtype 컬럼으로 사용해 문자열도 파이썬 객체로 바꾸지 않음. 생략하면 기본 numpy dtype.
+        """
         self.df = df
+        self.dtype_backend = dtype_backend
+        # 마지막 load_dataset()이 실제로 읽은 파일/행 그룹/행 수 (가지치기 확인용)
+        self.last_scan = {}
 
     def save_data(self, filename: str, index: bool = False, **kwargs) -> str:
         """
@@ -32,7 +61,7 @@ class ParquetIOHandler:
             return ""
         
         full_path = os.path.join(os.getcwd(), filename)
-        self.df.to_parquet(full_path, index=index, **kwargs)
+        data_io.save(self.df, full_path, format='parquet', index=index, **kwargs)
         print(f"ParquetIOHandler: Parquet 파일 '{filename}' 저장 완료.")
         return full_path
 
@@ -54,10 +83,113 @@ class ParquetIOHandler:
             print(f"경고: 파일 '{filename}'을 찾을 수 없습니다. 빈 데이터프레임을 반환합니다.")
             return pd.DataFrame()
 
-        loaded_df = pd.read_parquet(full_path, **kwargs)
+        kwargs.setdefault('dtype_backend', self.dtype_backend)
+        loaded_df = data_io.load(full_path, format='parquet', **kwargs)
         print(f"ParquetIOHandler: Parquet 파일 '{filename}' 불러오기 완료.")
         return loaded_df
 
+    def save_dataset(self, directory: str, partition_cols: Optional[Sequence[str]] = None,
+                     month_from: Optional[str] = None, row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+                     **kwargs) -> str:
+        """
+        데이터프레임을 파티션 데이터셋(디렉토리)으로 저장합니다.
+        예: partition_cols=['offering_type'], month_from='offering_date'
+            → directory/offering_type=Gold/month=1446-01/part-0.parquet
+
+        Saves the DataFrame as a hive-partitioned Parquet dataset.
+
+        Args:
+            directory (str): 저장할 디렉토리 이름 (같은 파티션의 기존 파일은 덮어씀).
+            partition_cols (list, optional): 디렉토리로 나눌 컬럼 (파일에는 저장되지 않고 경로에 기록).
+            month_from (str, optional): 날짜 컬럼 이름. 주면 'YYYY-MM' 값의 month 컬럼을 만들어 마지막 파티션으로 추가.
+            row_group_size (int): 행 그룹당 최대 행 수.
+            **kwargs: `pyarrow.dataset.write_dataset()`에 전달할 추가 인자.
+
+        Returns:
+            str: 저장된 디렉토리의 전체 경로.
+        """
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        if self.df is None:
+            print("경고: 저장할 데이터프레임이 없습니다. 저장을 건너뜁니다.")
+            return ""
+
+        df = self.df
+        partition_cols = list(partition_cols or [])
+        if month_from is not None:
+            df = df.assign(**{MONTH_COLUMN: df[month_from].dt.strftime('%Y-%m')})
+            partition_cols.append(MONTH_COLUMN)
+
+        full_path = os.path.join(os.getcwd(), directory)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        partitioning = (ds.partitioning(pa.schema([table.schema.field(col) for col in partition_cols]), flavor='hive')
+                        if partition_cols else None)
+        ds.write_dataset(table, full_path, format='parquet', partitioning=partitioning,
+                         basename_template=DATASET_FILE_TEMPLATE,
+                         max_rows_per_group=row_group_size, min_rows_per_group=min(row_group_size, len(table)),
+                         max_rows_per_file=kwargs.pop('max_rows_per_file', 0),
+                         existing_data_behavior='delete_matching', **kwargs)
+        print(f"ParquetIOHandler: Parquet 데이터셋 '{directory}' 저장 완료 (파티션: {partition_cols or '없음'}).")
+        return full_path
+
+    def load_dataset(self, directory: str, columns: Optional[List[str]] = None, filters=None,
+                     workers: Optional[int] = None) -> pd.DataFrame:
+        """
+        파티션 데이터셋에서 필요한 컬럼과 조건에 맞는 행만 불러옵니다.
+        파티션 조건에 맞지 않는 디렉토리는 열지 않고, 파일 안에서도 통계(min/max)로
+        조건을 만족할 수 없는 행 그룹은 읽지 않습니다. 남은 파일들은 스레드 풀에서 동시에 읽습니다.
+
+        Loads only the requested columns and matching rows from a partitioned dataset.
+        Partitions are pruned by path, row groups by their min/max statistics, and the
+        remaining files are read concurrently in a thread pool.
+
+        Args:
+            directory (str): 데이터셋 디렉토리 이름.
+            columns (list, optional): 읽을 컬럼 (파티션 컬럼 포함 가능). 생략하면 전체.
+            filters (list, optional): `pd.read_parquet()`과 같은 형식의 조건
+                (예: [('month', 'in', ['1446-01', '1446-02']), ('quantity', '>', 50)]).
+            workers (int, optional): 읽기 스레드 수 (생략 시 ThreadPoolExecutor 기본값).
+
+        Returns:
+            pd.DataFrame: 불러온 데이터프레임 (파일 경로 순서). 읽은 파일/행 그룹 수는 `last_scan`에 기록.
+        """
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+
+        full_path = os.path.join(os.getcwd(), directory)
+        if not os.path.exists(full_path):
+            print(f"경고: 데이터셋 '{directory}'을 찾을 수 없습니다. 빈 데이터프레임을 반환합니다.")
+            return pd.DataFrame()
+
+        dataset = ds.dataset(full_path, format='parquet', partitioning='hive')
+        expression = pq.filters_to_expression(filters) if filters else None
+        fragments = sorted(dataset.get_fragments(filter=expression), key=lambda fragment: fragment.path)
+
+        def read(fragment):
+            if expression is not None:
+                fragment = fragment.subset(filter=expression, schema=dataset.schema)
+            return fragment.num_row_groups, fragment.to_table(schema=dataset.schema, columns=columns,
+                                                              filter=expression)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(read, fragments))
+
+        tables = [table for _, table in results]
+        table = pa.concat_tables(tables) if tables else dataset.schema.empty_table().select(columns or dataset.schema.names)
+        if self.dtype_backend == 'pyarrow':
+            loaded_df = table.to_pandas(types_mapper=pd.ArrowDtype)
+        else:
+            loaded_df = table.to_pandas()
+            if self.dtype_backend is not None:
+                loaded_df = loaded_df.convert_dtypes(dtype_backend=self.dtype_backend)
+        self.last_scan = {'files': len(fragments), 'row_groups': sum(groups for groups, _ in results),
+                          'rows': len(loaded_df)}
+        print(f"ParquetIOHandler: Parquet 데이터셋 '{directory}' 불러오기 완료 "
+              f"(파일 {self.last_scan['files']}개, 행 그룹 {self.last_scan['row_groups']}개, {len(loaded_df):,}행).")
+        return loaded_df
+
 if __name__ == "__main__":
     # 샘플 데이터 생성
     data = {
@@ -13,6 +13,7 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
 # 절대 임포트 사용
+from utils import reporting
 from chapters.ch36.craftsmen_data import CraftsmenDataGenerator
 from chapters.ch36.tabernacle_construction_data import TabernacleConstructionDataGenerator
 from chapters.ch36.advanced_joining import AdvancedJoining
@@ -46,9 +47,9 @@ def run_chapter36(interactive: bool = True):
     construction_df = TabernacleConstructionDataGenerator().generate_construction_data()
 
     print("\n--- 장인 데이터 ---")
-    print(craftsmen_df.head())
+    reporting.print_frame(craftsmen_df.head())
     print("\n--- 성막 건축 데이터 ---")
-    print(construction_df.head())
+    reporting.print_frame(construction_df.head())
 
     if interactive:
         input("\n▶️ 데이터 조인을 시작하려면 Enter를 눌러주세요...")
@@ -57,7 +58,7 @@ def run_chapter36(interactive: bool = True):
     joining = AdvancedJoining(construction_df, craftsmen_df)
     merged_df = joining.merge_dataframes(left_on='assigned_craftsman_id', right_on='craftsman_id')
     print("\n--- 조인된 데이터 ---")
-    print(merged_df.head())
+    reporting.print_frame(merged_df.head())
 
     if interactive:
         input("\n▶️ 데이터 재구성을 시작하려면 Enter를 눌러주세요...")
@@ -66,7 +67,7 @@ def run_chapter36(interactive: bool = True):
     reshaping = AdvancedReshaping(merged_df)
     pivot_df = reshaping.create_pivot_table(values='quantity_needed', index='name', columns='component', aggfunc='sum')
     print("\n--- 재구성된 데이터 (피벗 테이블) ---")
-    print(pivot_df)
+    reporting.print_frame(pivot_df)
 
     print("\n🎉 Chapter 36 완료!")
 
@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+from utils.synthetic import numbered_labels
 
 class CraftsmenDataGenerator:
     """
@@ -15,7 +16,7 @@ class CraftsmenDataGenerator:
         
         data = {
             'craftsman_id': range(1, num_records + 1),
-            'name': ['Bezalel', 'Oholiab'] + [f'Craftsman_{i}' for i in range(num_records - 2)],
+            'name': np.concatenate([['Bezalel', 'Oholiab'], numbered_labels('Craftsman_', 0, num_records - 2)])[:num_records],
             'skill': np.random.choice(['Goldwork', 'Weaving', 'Woodwork', 'Engraving', 'Stonework'], size=num_records),
             'wisdom_score': np.random.randint(80, 101, size=num_records),
             'dedication_hours': np.random.randint(40, 81, size=num_records)
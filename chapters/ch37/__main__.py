@@ -7,7 +7,6 @@ Chapter 37 통합 실행 스크립트
 import sys
 from pathlib import Path
 import pandas as pd
-import utils.font_config # 한글 폰트 설정을 위해 추가
 
 # 프로젝트 루트 추가
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -17,6 +16,7 @@ sys.path.append(str(PROJECT_ROOT))
 from chapters.ch37.holy_utensils_data import HolyUtensilsDataGenerator
 from chapters.ch37.light_of_world_data import LightOfWorldDataGenerator
 from chapters.ch37.visualizations import Visualizations
+from utils.font_config import ensure_korean_font # 한글 폰트는 시각화 직전에 설정
 
 def print_chapter_header():
     '''챕터 헤더 출력'''
@@ -54,6 +54,7 @@ def run_chapter37(interactive: bool = True):
         input("\n▶️ 데이터 시각화를 시작하려면 Enter를 눌러주세요...")
 
     # 데이터 시각화
+    ensure_korean_font()
     vis_utensils = Visualizations(utensils_df)
     vis_utensils.plot_bar(x='utensil', y='weight_kg', title='성막 기구별 무게', filename='ch37_utensil_weights.png')
 
@@ -13,6 +13,7 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
 # 절대 임포트 사용
+from utils import reporting
 from chapters.ch38.construction_costs_data import ConstructionCostsDataGenerator
 from chapters.ch38.salvation_sacrifices_data import SalvationSacrificesDataGenerator
 from chapters.ch38.cost_analysis import CostAnalysis
@@ -45,9 +46,9 @@ def run_chapter38(interactive: bool = True):
     sacrifices_df = SalvationSacrificesDataGenerator().generate_sacrifices_data()
 
     print("\n--- 성막 건축 비용 데이터 ---")
-    print(costs_df.head())
+    reporting.print_frame(costs_df.head())
     print("\n--- 구원의 희생 데이터 ---")
-    print(sacrifices_df.head())
+    reporting.print_frame(sacrifices_df.head())
 
     if interactive:
         input("\n▶️ 비용 분석을 시작하려면 Enter를 눌러주세요...")
@@ -56,7 +57,7 @@ def run_chapter38(interactive: bool = True):
     analysis = CostAnalysis(costs_df)
     cost_summary = analysis.analyze_costs_by_item()
     print("\n--- 항목별 비용 분석 결과 ---")
-    print(cost_summary)
+    reporting.print_frame(cost_summary)
 
     print("\n🎉 Chapter 38 완료!")
 
@@ -13,6 +13,7 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
 # 절대 임포트 사용
+from utils import reporting
 from chapters.ch39.priestly_garments_data import PriestlyGarmentsDataGenerator
 from chapters.ch39.the_way_data import TheWayDataGenerator
 from chapters.ch39.time_series_analysis import TimeSeriesAnalysis
@@ -45,9 +46,9 @@ def run_chapter39(interactive: bool = True):
     the_way_df = TheWayDataGenerator().generate_the_way_data()
 
     print("\n--- 제사장의 옷 제작 데이터 ---")
-    print(garments_df.head())
+    reporting.print_frame(garments_df.head())
     print("\n--- 길, 진리, 생명 데이터 ---")
-    print(the_way_df.head())
+    reporting.print_frame(the_way_df.head())
 
     if interactive:
         input("\n▶️ 시계열 분석을 시작하려면 Enter를 눌러주세요...")
@@ -56,11 +57,11 @@ def run_chapter39(interactive: bool = True):
     ts_analysis = TimeSeriesAnalysis(garments_df, date_column='date')
     resampled_df = ts_analysis.resample_data(rule='W', agg_func={'progress_percentage': 'mean'})
     print("\n--- 주별 제작 진행률 평균 ---")
-    print(resampled_df)
+    reporting.print_frame(resampled_df)
 
     rolling_avg = ts_analysis.rolling_average(window=7, column='progress_percentage')
     print("\n--- 7일 이동 평균 진행률 ---")
-    print(rolling_avg.tail())
+    reporting.print_frame(rolling_avg.tail())
 
     print("\n🎉 Chapter 39 완료!")
 
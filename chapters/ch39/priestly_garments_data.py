@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+from utils.synthetic import date_range
 
 class PriestlyGarmentsDataGenerator:
     """
@@ -13,7 +14,7 @@ class PriestlyGarmentsDataGenerator:
         """
         np.random.seed(39)
         
-        dates = pd.date_range(start='2023-01-01', periods=num_days, freq='D')
+        dates = date_range('2023-01-01', periods=num_days, freq='D')
         
         data = {
             'date': dates,
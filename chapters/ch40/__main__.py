@@ -13,6 +13,7 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.append(str(PROJECT_ROOT))
 
 # 절대 임포트 사용
+from utils import reporting
 from chapters.ch40.tabernacle_dedication_data import TabernacleDedicationDataGenerator
 from chapters.ch40.disciples_mission_data import DisciplesMissionDataGenerator
 from chapters.ch40.data_pipeline import DataPipeline
@@ -45,9 +46,9 @@ def run_chapter40(interactive: bool = True):
     mission_df = DisciplesMissionDataGenerator().generate_mission_data()
 
     print("\n--- 성막 봉헌 데이터 ---")
-    print(dedication_df.head())
+    reporting.print_frame(dedication_df.head())
     print("\n--- 제자들의 사명 데이터 ---")
-    print(mission_df.head())
+    reporting.print_frame(mission_df.head())
 
     if interactive:
         input("\n▶️ 데이터 파이프라인을 시작하려면 Enter를 눌러주세요...")
@@ -70,7 +71,7 @@ def run_chapter40(interactive: bool = True):
     final_df = pipeline.run_pipeline(*pipeline_steps)
 
     print("\n--- 파이프라인 실행 후 데이터 ---")
-    print(final_df)
+    reporting.print_frame(final_df)
 
     print("\n🎉 Chapter 40 완료!")
 
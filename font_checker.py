@@ -1,27 +1,41 @@
 """
 시스템에 설치된 한글 폰트 확인
+
+한 번 찾은 한글 폰트(이름, 경로)는 폰트 디렉토리 수정 시각과 함께 캐시에 저장되어
+다음 실행부터는 전체 폰트 스캔 없이 바로 사용합니다. 다시 스캔하려면 `--rescan`.
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+# 한글 폰트 탐색 결과 캐시 파일
+FONT_CACHE_PATH = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'jesusbornd' / 'korean_font.json'
+
+# 여러 한글 폰트가 있을 때의 우선순위
+PREFERRED_KOREAN_FONTS = ['Malgun Gothic', 'NanumGothic', 'NanumBarunGothic', 'AppleGothic']
 
 
 def check_korean_fonts():
     """시스템에 설치된 한글 폰트 찾기"""
+    import matplotlib.font_manager as fm
+
     font_list = fm.findSystemFonts()
     korean_fonts = []
 
+    # 한글 폰트 키워드로 필터링
+    korean_keywords = [
+        'Gothic', 'Malgun', 'Batang', 'Dotum', 'Gulim', 'Gungsuh',
+        'Nanum', 'NotoSans', 'Apple', '맑은', '굴림', '바탕', '궁서'
+    ]
+
     for font_path in font_list:
         try:
             font_prop = fm.FontProperties(fname=font_path)
             font_name = font_prop.get_name()
 
-            # 한글 폰트 키워드로 필터링
-            korean_keywords = [
-                'Gothic', 'Malgun', 'Batang', 'Dotum', 'Gulim', 'Gungsuh',
-                'Nanum', 'NotoSans', 'Apple', '맑은', '굴림', '바탕', '궁서'
-            ]
-
             if any(keyword in font_name for keyword in korean_keywords):
                 korean_fonts.append((font_name, font_path))
 
@@ -31,18 +45,112 @@ def check_korean_fonts():
     return korean_fonts
 
 
-def test_fonts():
+def _font_directories():
+    """시스템/사용자 폰트 디렉토리 목록 (존재하는 것만)"""
+    import matplotlib.font_manager as fm
+
+    directories = list(fm.X11FontDirectories) + list(fm.OSXFontDirectories)
+    if sys.platform == 'win32':
+        directories.append(os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'Fonts'))
+        directories.append(os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Microsoft', 'Windows', 'Fonts'))
+    return [d for d in dict.fromkeys(directories) if os.path.isdir(d)]
+
+
+def _font_directory_stamp():
+    """폰트 디렉토리와 그 바로 아래 하위 디렉토리들의 수정 시각
+
+    폰트 패키지 설치/삭제는 보통 이 디렉토리들의 mtime을 바꾸므로 캐시 무효화 기준으로 사용합니다.
+    """
+    stamp = {}
+    for directory in _font_directories():
+        try:
+            stamp[directory] = os.stat(directory).st_mtime_ns
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stamp[entry.path] = entry.stat(follow_symlinks=False).st_mtime_ns
+        except OSError:
+            continue
+    return stamp
+
+
+def _pick_korean_font(korean_fonts):
+    """우선순위에 따라 (이름, 경로) 하나 선택"""
+    for preferred in PREFERRED_KOREAN_FONTS:
+        for name, path in korean_fonts:
+            if name == preferred:
+                return name, path
+    return korean_fonts[0] if korean_fonts else None
+
+
+def _load_font_cache():
+    try:
+        with open(FONT_CACHE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_font_cache(font, stamp):
+    try:
+        FONT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(FONT_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump({
+                'name': font[0] if font else None,
+                'path': font[1] if font else None,
+                'directories': stamp,
+            }, f, ensure_ascii=False, indent=2)
+    except OSError:
+        pass
+
+
+def resolve_korean_font(rescan: bool = False, korean_fonts=None):
+    """사용할 한글 폰트 (이름, 경로) 조회
+
+    캐시가 있고 폰트 디렉토리가 바뀌지 않았으면 캐시 값을 바로 반환하고,
+    그렇지 않거나 rescan=True이면 전체 스캔 후 캐시를 갱신합니다.
+
+    Args:
+        rescan: 캐시를 무시하고 시스템 폰트를 다시 스캔할지 여부
+        korean_fonts: 이미 스캔한 check_korean_fonts() 결과 (주면 다시 스캔하지 않고 이 목록에서 선택)
+
+    Returns:
+        tuple: (폰트 이름, 폰트 파일 경로) 또는 한글 폰트가 없으면 None
+    """
+    stamp = _font_directory_stamp()
+
+    if not rescan:
+        cached = _load_font_cache()
+        if cached is not None and cached.get('directories') == stamp:
+            if cached.get('name') is None:
+                return None
+            if os.path.exists(cached.get('path') or ''):
+                return cached['name'], cached['path']
+
+    if korean_fonts is None:
+        korean_fonts = check_korean_fonts()
+    font = _pick_korean_font(korean_fonts)
+    _save_font_cache(font, stamp)
+    return font
+
+
+def test_fonts(rescan: bool = False):
     """한글 폰트 테스트"""
-    korean_fonts = check_korean_fonts()
+    import matplotlib.pyplot as plt
+
+    korean_fonts = None
+    if rescan:
+        korean_fonts = check_korean_fonts()
+        print("🔍 시스템에서 발견된 한글 폰트들:")
+        for i, (name, path) in enumerate(korean_fonts[:10], 1):  # 상위 10개만
+            print(f"  {i}. {name}")
 
-    print("🔍 시스템에서 발견된 한글 폰트들:")
-    for i, (name, path) in enumerate(korean_fonts[:10], 1):  # 상위 10개만
-        print(f"  {i}. {name}")
+    # 방금 스캔한 목록을 넘겨 같은 스캔을 반복하지 않음
+    font = resolve_korean_font(rescan=rescan, korean_fonts=korean_fonts)
 
-    if korean_fonts:
-        # 첫 번째 폰트로 테스트
-        best_font = korean_fonts[0][0]
-        print(f"\n✅ 추천 폰트: {best_font}")
+    if font:
+        best_font = font[0]
+        print(f"\n✅ 추천 폰트: {best_font} ({font[1]})")
 
         # 간단한 한글 테스트
         plt.rcParams['font.family'] = [best_font]
@@ -62,4 +170,8 @@ def test_fonts():
 
 
 if __name__ == "__main__":
-    test_fonts()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="JesusBornd 한글 폰트 확인")
+    parser.add_argument("--rescan", action="store_true", help="캐시를 무시하고 시스템 폰트를 다시 스캔")
+    args = parser.parse_args()
+
+    test_fonts(rescan=args.rescan)
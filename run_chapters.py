@@ -0,0 +1,490 @@
+"""
+JesusBornd 전체 챕터 일괄 실행기
+chapters/chNN/__main__.py의 run_chapterNN(interactive=False)를 프로세스 풀에서 병렬로 실행하고,
+챕터별 결과 딕셔너리와 실행 시간, 최대 메모리(RSS)를 보고합니다.
+결과는 챕터가 임포트로 닿는 모듈(build.py와 같은 의존 그래프)과 설정/입력 데이터의 해시를 키로
+캐시되어, 바뀐 챕터만 다시 실행합니다. 캐시는 결과 딕셔너리만 담으므로 캐시된 챕터는 PNG/CSV 등
+산출물 파일을 다시 만들지 않습니다 (산출물이 필요하면 --no-cache 또는 build.py).
+
+"모든 것을 적당하게 하고 질서대로 하라" (고전 14:40)
+
+사용법:
+    python run_chapters.py                      # 모든 챕터
+    python run_chapters.py 1 9 37 --workers 4   # 일부 챕터만, 워커 4개
+    python run_chapters.py --output-dir build --log-dir build/logs --report build/report.json
+    python run_chapters.py --no-cache           # 캐시를 무시하고 모두 다시 실행
+    python run_chapters.py 9 10 --steps steps.csv   # analyze_* 단계별 시간/메모리 기록
+"""
+
+import argparse
+import ast
+import builtins
+import contextlib
+import hashlib
+import importlib
+import importlib.metadata
+import io
+import json
+import os
+import pickle
+import re
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from utils import instrumentation, reporting
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PROJECT_ROOT = Path(__file__).parent
+CHAPTERS_DIR = PROJECT_ROOT / 'chapters'
+
+# 챕터 결과 캐시 디렉토리 (키 = 챕터 의존 모듈 + 실행 환경 + 설정/데이터의 해시)
+RESULT_CACHE_DIR = PROJECT_ROOT / 'data' / 'processed' / 'chapter_results'
+
+# utils.bible_utils를 거쳐 읽히는 설정/원본/예제 데이터 (data/processed는 산출물이므로 제외)
+# bible_utils에 의존하는 챕터만 이 파일들에 의존
+DATA_INPUTS = ('config.yml', 'data/raw/**/*', 'data/examples/**/*')
+DATA_READER = Path('utils') / 'bible_utils.py'
+
+# 결과 피클 호환성에 영향을 주는 패키지 버전
+_VERSIONED_PACKAGES = ('pandas', 'numpy')
+
+# 개인 분석 등에서 이름을 묻는 챕터에 넘겨줄 기본 이름
+DEFAULT_USER_NAME = "신앙인"
+
+
+@dataclass
+class ChapterRun:
+    """챕터 한 개의 실행 결과"""
+    chapter: str
+    status: str  # 'ok' | 'error'
+    wall_time: float
+    peak_rss_mb: Optional[float]
+    results: Any = None
+    error: Optional[str] = None
+    log_path: Optional[str] = None
+    cached: bool = False
+    steps: List[Dict] = field(default_factory=list)
+
+    def summary(self) -> Dict:
+        """보고서용 요약 (results, steps 제외)"""
+        summary = asdict(self)
+        summary.pop('results')
+        summary.pop('steps')
+        summary['result_keys'] = sorted(self.results) if isinstance(self.results, dict) else None
+        return summary
+
+
+def batch_quiet_default() -> bool:
+    """배치 실행의 기본 모드
+
+    JESUSBORND_QUIET 환경 변수(1/0)가 있으면 그 값을, 없으면 config.yml의
+    debug.verbose_analysis가 true가 아닐 때 조용한 모드를 사용합니다.
+    """
+    env = os.environ.get('JESUSBORND_QUIET')
+    if env is not None:
+        return env.lower() in ('1', 'true', 'yes')
+
+    from utils.bible_utils import load_config
+
+    try:
+        return not load_config()['debug']['verbose_analysis']
+    except (OSError, KeyError, TypeError):
+        return True
+
+
+def discover_chapters(chapters_dir: Path = CHAPTERS_DIR) -> List[str]:
+    """run_chapterNN 진입점이 있는 챕터 번호들 ('01', '02', ...)
+
+    모듈을 임포트하지 않고 __main__.py 소스에서 함수 정의만 확인합니다.
+    """
+    found = []
+    for main_path in sorted(chapters_dir.glob('ch[0-9][0-9]/__main__.py')):
+        number = main_path.parent.name[2:]
+        if re.search(rf'^def run_chapter{number}\(', main_path.read_text(encoding='utf-8'), re.MULTILINE):
+            found.append(number)
+    return found
+
+
+def _hash_files(digest, paths: Iterable[Path]):
+    """파일 경로(프로젝트 기준 상대 경로)와 내용을 순서대로 해시에 누적"""
+    for path in sorted(p for p in paths if p.is_file()):
+        digest.update(path.relative_to(PROJECT_ROOT).as_posix().encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(path.read_bytes())
+        digest.update(b'\0')
+
+
+def _resolve_module(name: str) -> List[Path]:
+    """프로젝트 안의 모듈 이름을 파일로 변환 (부모 패키지의 __init__.py 포함, 외부 모듈은 빈 리스트)"""
+    parts = name.split('.')
+    files = []
+    for depth in range(1, len(parts) + 1):
+        base = PROJECT_ROOT.joinpath(*parts[:depth])
+        if (base / '__init__.py').is_file():
+            files.append(base / '__init__.py')
+        elif base.with_suffix('.py').is_file():
+            files.append(base.with_suffix('.py'))
+        elif not base.is_dir():
+            return files if depth > 1 else []
+    return files
+
+
+def _imported_modules(path: Path, module_name: str) -> Set[str]:
+    """소스 파일에서 임포트하는 모듈 이름들 (함수 안의 지연 임포트, 상대 임포트 포함)"""
+    tree = ast.parse(path.read_text(encoding='utf-8'), filename=str(path))
+    package = module_name if path.name == '__init__.py' else module_name.rpartition('.')[0]
+
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = package.split('.')[:len(package.split('.')) - node.level + 1]
+                module = '.'.join(base + ([node.module] if node.module else []))
+            else:
+                module = node.module
+            names.add(module)
+            names.update(f'{module}.{alias.name}' for alias in node.names)  # from pkg import submodule
+    return names
+
+
+def module_dependencies(entry: Path) -> List[Path]:
+    """진입 파일에서 시작해 프로젝트 내부 모듈 의존성을 따라간 파일 목록 (진입 파일 포함)"""
+    seen: Dict[Path, str] = {}
+    stack = [(entry, '.'.join(entry.relative_to(PROJECT_ROOT).with_suffix('').parts))]
+    while stack:
+        path, module_name = stack.pop()
+        if path in seen:
+            continue
+        seen[path] = module_name
+        for name in _imported_modules(path, module_name):
+            for dep in _resolve_module(name):
+                if dep not in seen:
+                    dep_name = '.'.join(dep.relative_to(PROJECT_ROOT).with_suffix('').parts)
+                    stack.append((dep, dep_name.removesuffix('.__init__')))
+    return sorted(seen)
+
+
+def reads_shared_data(modules: Iterable[Path]) -> bool:
+    """의존 모듈 중에 설정/데이터를 읽는 utils.bible_utils가 있는지"""
+    return PROJECT_ROOT / DATA_READER in modules
+
+
+def shared_inputs_digest() -> str:
+    """모든 챕터가 공유하는 실행 환경(파이썬/패키지 버전)의 해시"""
+    digest = hashlib.sha256()
+    digest.update(f"python {sys.version_info[:2]}".encode('utf-8'))
+    for package in _VERSIONED_PACKAGES:
+        try:
+            digest.update(f"{package} {importlib.metadata.version(package)}".encode('utf-8'))
+        except importlib.metadata.PackageNotFoundError:
+            pass
+    return digest.hexdigest()
+
+
+def data_inputs_digest() -> str:
+    """utils.bible_utils를 거쳐 읽히는 설정/데이터 파일(DATA_INPUTS)의 해시"""
+    digest = hashlib.sha256()
+    for pattern in DATA_INPUTS:
+        _hash_files(digest, PROJECT_ROOT.glob(pattern))
+    return digest.hexdigest()
+
+
+def chapter_cache_key(chapter: str, shared_digest: Optional[str] = None,
+                      data_digest: Optional[str] = None) -> str:
+    """챕터 결과 캐시 키
+
+    진입점에서 임포트를 따라간 프로젝트 모듈(build.py의 빌드 그래프와 같은 의존성)과 실행 환경,
+    bible_utils에 닿는 챕터는 설정/데이터 해시까지 합칩니다. 임포트되지 않는 파일이나
+    다른 챕터만 쓰는 utils 모듈이 바뀌어도 키는 그대로입니다.
+    """
+    modules = module_dependencies(CHAPTERS_DIR / f'ch{chapter}' / '__main__.py')
+    digest = hashlib.sha256()
+    digest.update((shared_digest or shared_inputs_digest()).encode('utf-8'))
+    _hash_files(digest, modules)
+    if reads_shared_data(modules):
+        digest.update((data_digest or data_inputs_digest()).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _cache_path(chapter: str, key: str) -> Path:
+    return RESULT_CACHE_DIR / f'ch{chapter}-{key[:16]}.pkl'
+
+
+def load_cached_run(chapter: str, key: str) -> Optional[ChapterRun]:
+    """캐시된 챕터 결과 (없거나 읽을 수 없으면 None)
+
+    결과 딕셔너리만 복원하며, 챕터가 만들었던 산출물 파일은 다시 생성하지 않습니다.
+    """
+    path = _cache_path(chapter, key)
+    try:
+        with open(path, 'rb') as f:
+            entry = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+
+    if entry.get('key') != key:
+        return None
+    return ChapterRun(chapter=chapter, status='ok', wall_time=0.0, peak_rss_mb=None,
+                      results=entry['results'], cached=True)
+
+
+def save_cached_run(run: ChapterRun, key: str):
+    """성공한 챕터 결과를 캐시에 저장 (같은 챕터의 이전 캐시는 삭제)"""
+    if run.status != 'ok':
+        return
+
+    RESULT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    for stale in RESULT_CACHE_DIR.glob(f'ch{run.chapter}-*.pkl'):
+        stale.unlink()
+
+    path = _cache_path(run.chapter, key)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'wb') as f:
+        pickle.dump({'key': key, 'results': run.results}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """현재 프로세스의 최대 RSS (MB, resource 모듈이 없으면 None)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024  # macOS는 바이트, Linux는 KB
+
+
+def _picklable(results: Any) -> Any:
+    """프로세스 경계를 넘길 수 있도록 피클되지 않는 값은 repr로 대체"""
+    try:
+        pickle.dumps(results)
+        return results
+    except Exception:
+        pass
+
+    if isinstance(results, dict):
+        return {key: _picklable(value) for key, value in results.items()}
+    return repr(results)
+
+
+def _no_input(prompt: str = '') -> str:
+    """비대화형 실행용 input(): 항상 기본값(빈 문자열) 선택"""
+    return ''
+
+
+def run_chapter(chapter: str, log_dir: Optional[Path] = None, output_dir: Optional[Path] = None,
+                user_name: str = DEFAULT_USER_NAME, quiet: Optional[bool] = None,
+                instrument: bool = False) -> ChapterRun:
+    """챕터 한 개를 비대화형으로 실행 (워커 프로세스에서 호출)
+
+    챕터 출력은 캡처해서 log_dir/chNN.log에 저장하고(생략 시 버림),
+    run_chapterNN이 user_name을 받으면 넘겨줍니다. 혹시 남은 input() 호출은 기본값으로 응답합니다.
+    챕터가 현재 디렉토리에 쓰는 파일(PNG, CSV 등)은 output_dir에 생성됩니다.
+
+    조용한 모드(quiet, 생략 시 batch_quiet_default())에서는 print 출력을 버리고
+    DataFrame 렌더링을 몇 행/열로 줄이며, 챕터 클래스들의 메서드별 JSON 이벤트만 로그에 남깁니다.
+    instrument=True이면 analyze_* 단계별 계측 기록(utils.instrumentation)을 steps에 담아 반환합니다.
+    """
+    if quiet is None:
+        quiet = batch_quiet_default()
+
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
+    if log_dir is not None:
+        log_dir = Path(log_dir).resolve()
+
+    original_cwd = os.getcwd()
+    if output_dir is not None:
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        os.chdir(output_dir)
+
+    original_input = builtins.input
+    builtins.input = _no_input
+    output = io.StringIO()
+    start = time.perf_counter()
+    results, error = None, None
+
+    quiet_output = reporting.quiet_output(events=output) if quiet else contextlib.nullcontext()
+    steps = instrumentation.instrumented_run() if instrument else contextlib.nullcontext()
+
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        try:
+            with quiet_output, steps:
+                module = importlib.import_module(f'chapters.ch{chapter}.__main__')
+                if quiet:
+                    reporting.instrument_package(f'chapters.ch{chapter}')
+                entry = getattr(module, f'run_chapter{chapter}')
+                kwargs = {'interactive': False}
+                if 'user_name' in entry.__code__.co_varnames[:entry.__code__.co_argcount]:
+                    kwargs['user_name'] = user_name
+                results = entry(**kwargs)
+                reporting.emit_event(f'run_chapter{chapter}', duration=time.perf_counter() - start)
+        except Exception:
+            error = traceback.format_exc()
+            print(error)
+        finally:
+            builtins.input = original_input
+            os.chdir(original_cwd)
+
+    wall_time = time.perf_counter() - start
+
+    log_path = None
+    if log_dir is not None:
+        log_path = Path(log_dir) / f'ch{chapter}.log'
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log_path.write_text(output.getvalue(), encoding='utf-8')
+
+    return ChapterRun(
+        chapter=chapter,
+        status='error' if error else 'ok',
+        wall_time=wall_time,
+        peak_rss_mb=_peak_rss_mb(),
+        results=_picklable(results),
+        error=error.strip().splitlines()[-1] if error else None,
+        log_path=str(log_path) if log_path else None,
+        steps=[asdict(record) for record in instrumentation.registry.records] if instrument else [],
+    )
+
+
+def _normalize_chapter(chapter) -> str:
+    """1, '1', 'ch01', '01' → '01'"""
+    return f"{int(str(chapter).lower().removeprefix('ch')):02d}"
+
+
+def run_chapters(chapters: Optional[Iterable] = None, workers: Optional[int] = None,
+                 log_dir: Optional[Path] = None, output_dir: Optional[Path] = None,
+                 use_cache: bool = True, quiet: Optional[bool] = None,
+                 instrument: bool = False) -> Dict[str, ChapterRun]:
+    """여러 챕터를 프로세스 풀에서 병렬 실행
+
+    각 챕터는 새 워커 프로세스에서 실행되므로(max_tasks_per_child=1) 전역 상태가 섞이지 않고,
+    최대 RSS도 챕터별로 측정됩니다. 의존 모듈/설정/데이터가 그대로인 챕터는 캐시된 결과를
+    사용합니다. 결과 딕셔너리만 캐시되므로, 캐시된 챕터는 output_dir에 산출물 파일(PNG, CSV 등)을
+    다시 만들지 않습니다 - 산출물이 필요하면 use_cache=False로 실행하거나 build.py를 사용하세요.
+
+    Args:
+        chapters: 실행할 챕터 번호들 (생략 시 진입점이 있는 모든 챕터)
+        workers: 워커 프로세스 수 (생략 시 CPU 수)
+        log_dir: 챕터별 출력 로그 디렉토리 (생략 시 출력 버림)
+        output_dir: 챕터가 생성하는 파일을 둘 디렉토리 (생략 시 현재 디렉토리)
+        use_cache: False이면 캐시를 무시하고 모두 다시 실행 (결과는 캐시에 갱신)
+        quiet: 조용한 모드 여부 (생략 시 JESUSBORND_QUIET 또는 config.yml의 debug.verbose_analysis 반대값)
+        instrument: True이면 단계별 계측을 켜고 캐시를 사용하지 않음 (결과의 steps에 기록)
+
+    Returns:
+        Dict[str, ChapterRun]: 챕터 번호 순서의 실행 결과
+    """
+    available = discover_chapters()
+    if chapters is None:
+        chapters = available
+    else:
+        chapters = [_normalize_chapter(chapter) for chapter in chapters]
+        missing = [chapter for chapter in chapters if chapter not in available]
+        if missing:
+            raise ValueError(f"run_chapterNN 진입점이 없는 챕터입니다: {missing}")
+
+    shared_digest, data_digest = shared_inputs_digest(), data_inputs_digest()
+    keys = {chapter: chapter_cache_key(chapter, shared_digest, data_digest) for chapter in chapters}
+
+    runs = {}
+    if use_cache and not instrument:
+        for chapter in chapters:
+            cached = load_cached_run(chapter, keys[chapter])
+            if cached is not None:
+                runs[chapter] = cached
+
+    pending = [chapter for chapter in chapters if chapter not in runs]
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1) as pool:
+            futures = {chapter: pool.submit(run_chapter, chapter, log_dir, output_dir,
+                                            quiet=quiet, instrument=instrument)
+                       for chapter in pending}
+            for chapter, future in futures.items():
+                runs[chapter] = future.result()
+                save_cached_run(runs[chapter], keys[chapter])
+
+    return {chapter: runs[chapter] for chapter in chapters}
+
+
+def print_report(runs: Dict[str, ChapterRun], total_time: Optional[float] = None):
+    """챕터별 상태/시간/메모리 표 출력"""
+    print(f"{'챕터':<6}{'상태':<8}{'시간(s)':>10}{'최대 RSS(MB)':>14}  오류")
+    print("-" * 60)
+    for chapter, run in runs.items():
+        rss = f"{run.peak_rss_mb:.1f}" if run.peak_rss_mb is not None else "-"
+        status = "💾 cache" if run.cached else ("✅ ok" if run.status == 'ok' else "❌ error")
+        print(f"ch{chapter:<4}{status:<8}{run.wall_time:>10.2f}{rss:>14}  {run.error or ''}")
+
+    failed = sum(run.status != 'ok' for run in runs.values())
+    cached = sum(run.cached for run in runs.values())
+    print("-" * 60)
+    print(f"총 {len(runs)}개 챕터, 캐시 {cached}개, 실패 {failed}개"
+          + (f", 전체 {total_time:.2f}초" if total_time is not None else ""))
+    if cached:
+        print("💾 캐시된 챕터는 결과만 복원했고 산출물 파일은 다시 만들지 않았습니다 (필요하면 --no-cache).")
+
+
+def save_steps(runs: Dict[str, ChapterRun], path: Path):
+    """챕터별 계측 기록을 하나의 CSV/JSON으로 저장 (chapter 열 추가)"""
+    rows = [{'chapter': chapter, **step} for chapter, run in runs.items() for step in run.steps]
+    if Path(path).suffix == '.json':
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, ensure_ascii=False, indent=2)
+    else:
+        instrumentation.records_frame(rows, extra_columns=['chapter']).to_csv(path, index=False, encoding='utf-8')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JesusBornd 전체 챕터 일괄 실행기 (비대화형, 병렬)")
+    parser.add_argument("chapters", nargs="*", help="실행할 챕터 번호 (예: 1 9 ch37, 생략 시 전체)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="워커 프로세스 수 (기본값: CPU 수)")
+    parser.add_argument("--output-dir", type=Path, default=None, help="챕터가 생성하는 파일을 둘 디렉토리 (기본값: 현재 디렉토리)")
+    parser.add_argument("--log-dir", type=Path, default=None, help="챕터별 출력 로그를 저장할 디렉토리")
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument("-q", "--quiet", dest="quiet", action="store_const", const=True, default=None,
+                           help="챕터 출력 대신 단계별 JSON 이벤트만 기록 (기본값: debug.verbose_analysis가 false이면 켜짐)")
+    verbosity.add_argument("-v", "--verbose", dest="quiet", action="store_const", const=False,
+                           help="챕터의 배너와 DataFrame 출력을 그대로 기록")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="결과 캐시를 무시하고 모든 챕터를 다시 실행 (캐시된 챕터는 산출물 파일을 만들지 않으므로 산출물이 필요할 때)")
+    parser.add_argument("--steps", type=Path, default=None,
+                        help="analyze_* 단계별 시간/CPU/할당 메모리/행 수를 저장할 파일 (.csv 또는 .json)")
+    parser.add_argument("--report", type=Path, default=None, help="실행 요약을 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    runs = run_chapters(args.chapters or None, workers=args.workers,
+                        log_dir=args.log_dir, output_dir=args.output_dir, use_cache=not args.no_cache, quiet=args.quiet,
+                        instrument=args.steps is not None)
+    total_time = time.perf_counter() - start
+
+    print_report(runs, total_time)
+
+    if args.steps:
+        save_steps(runs, args.steps)
+        print(f"📁 단계별 계측 저장: {args.steps}")
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({
+                'total_time': total_time,
+                'workers': args.workers or os.cpu_count(),
+                'chapters': [run.summary() for run in runs.values()],
+            }, f, ensure_ascii=False, indent=2)
+        print(f"📁 실행 요약 저장: {args.report}")
+
+    return 0 if all(run.status == 'ok' for run in runs.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""
+챕터 데이터 생성기 규모 테스트
+"너희 믿음이 더욱 자라고" (살후 1:3)
+"""
+
+import pytest
+import pandas as pd
+
+from chapters.ch09.plagues_aggregation import PlaguesAggregationAnalyzer
+from chapters.ch09.officials_son_aggregation import OfficialsSonAggregationAnalyzer
+from chapters.ch10.locusts_darkness_data import LocustsDarknessDataGenerator
+from chapters.ch11.feeding_five_thousand_data import FeedingFiveThousandDataGenerator
+from chapters.ch13.living_water_data import LivingWaterDataGenerator
+from chapters.ch13.pillar_guidance_data import PillarGuidanceDataGenerator
+from chapters.ch16.manna_ordinance_data import MannaOrdinanceDataGenerator
+from chapters.ch16.manna_rolling_expanding import MannaRollingExpandingAnalyzer
+from chapters.ch20.ten_commandments_data import TenCommandmentsDataGenerator
+from chapters.ch24.covenant_data import CovenantDataGenerator
+
+NUM_RECORDS = 1_000
+
+
+@pytest.fixture(autouse=True)
+def _quiet_generators(capsys):
+    """생성기/분석기의 안내 출력은 검사하지 않음"""
+    yield
+    capsys.readouterr()
+
+
+class TestScaledGenerators:
+    """num_records로 늘린 생성기 테스트"""
+
+    @pytest.mark.parametrize('generate', [
+        lambda n: LocustsDarknessDataGenerator().generate_plague_impact_data(n),
+        lambda n: LivingWaterDataGenerator().generate_living_water_data(n),
+        lambda n: PillarGuidanceDataGenerator().generate_pillar_guidance_data(n),
+        lambda n: MannaOrdinanceDataGenerator().generate_manna_data(n),
+        lambda n: TenCommandmentsDataGenerator().generate_commandments_data(n),
+    ])
+    def test_num_records_sets_row_count(self, generate):
+        """생략하면 기본 표, 주면 정확히 그 행 수"""
+        default = generate(None)
+        scaled = generate(NUM_RECORDS)
+
+        assert len(default) < NUM_RECORDS
+        assert len(scaled) == NUM_RECORDS
+        assert list(scaled.columns) == list(default.columns)
+
+    def test_default_matches_base_table(self):
+        """기본 크기에서는 기존 재앙 3개 그대로"""
+        analyzer = PlaguesAggregationAnalyzer()
+        assert analyzer.plague_df['plague_name_en'].tolist() == ['Livestock', 'Boils', 'Hail']
+
+    def test_default_locusts_impact_unchanged(self):
+        """기본 크기에서는 벡터화 이전과 같은 난수 순서 (시드 10의 impact_score 그대로)"""
+        df = LocustsDarknessDataGenerator().generate_plague_impact_data()
+
+        assert df['location'].tolist() == ['Egypt', 'Goshen', 'Egypt', 'Goshen']
+        assert df['impact_score'].tolist() == [29, 1, 108, 0]
+        assert df['impact_score'].dtype == 'int64'
+
+    def test_analyzers_pass_num_records(self):
+        """분석기는 num_records를 생성기에 넘기고 그대로 분석"""
+        analyzer = OfficialsSonAggregationAnalyzer(num_records=NUM_RECORDS)
+        assert len(analyzer.healing_df) == NUM_RECORDS
+        assert analyzer.run_all_analyses()
+
+    def test_time_series_continue(self):
+        """시계열 생성기는 반복할 때 날짜를 이어 붙임"""
+        df = LivingWaterDataGenerator().generate_living_water_data(NUM_RECORDS)
+        assert df['event_datetime'].is_monotonic_increasing
+        assert df['event_id'].is_unique
+
+        guidance = PillarGuidanceDataGenerator().generate_pillar_guidance_data(14)
+        assert (guidance['event_datetime'].dt.strftime('%Y-%m-%d') == guidance['event_date']).all()
+
+    def test_manna_sabbath_rule(self):
+        """벡터화한 안식일 규례: 7일째는 거두지 않고 6일째는 두 배"""
+        df = MannaRollingExpandingAnalyzer(num_records=70).manna_df
+        assert (df.loc[df['day_num'] % 7 == 0, 'manna_gathered_kg'] == 0).all()
+        assert (df.loc[df['day_num'] % 7 == 6, 'manna_gathered_kg'] >= 200).all()
+
+    def test_quality_issues_repeat(self):
+        """데이터 품질 문제는 반복된 십계명마다 같은 위치에 심어짐"""
+        df = TenCommandmentsDataGenerator().generate_commandments_data(30)
+        assert df['obedience_score'].isna().sum() == 3
+        assert (df['obedience_score'] == 'six').sum() == 3
+
+    def test_leftovers_follow_initial_resources(self):
+        """남은 조각 id는 초기 자원 다음부터 이어짐"""
+        initial, leftovers = FeedingFiveThousandDataGenerator().generate_miracle_data(70)
+        assert initial['resource_id'].tolist() == list(range(1, 71))
+        assert leftovers['resource_id'].iloc[0] == 71
+        assert len(leftovers) == 120
+
+    def test_dates_beyond_nanosecond_range(self):
+        """출애굽 시대(1446년) 날짜도 생성 (초 단위)"""
+        df = CovenantDataGenerator().generate_covenant_data(NUM_RECORDS)
+        assert df['event_date'].iloc[0] == pd.Timestamp('1446-01-01')
+        assert len(df) == NUM_RECORDS
+
+
+class TestChunkedGeneration:
+    """청크 단위 병렬 생성 테스트"""
+
+    def test_identical_for_any_worker_count(self, tmp_path):
+        """워커 수와 관계없이 같은 결과, Parquet 파일도 동일"""
+        from chapters.ch31.craftsmen_data import CraftsmenDataGenerator
+
+        generator = CraftsmenDataGenerator()
+        serial = generator.generate_craftsmen_data_chunked(2_500, chunk_size=1_000, workers=1)
+        parallel = generator.generate_craftsmen_data_chunked(2_500, chunk_size=1_000, workers=3)
+        pd.testing.assert_frame_equal(serial, parallel)
+        assert serial['task_id'].tolist() == list(range(1, 2_501))
+
+        for workers in (1, 2):
+            generator.generate_craftsmen_data_chunked(2_500, chunk_size=1_000, workers=workers,
+                                                      output_dir=tmp_path / f'w{workers}')
+        parts = sorted(path.name for path in (tmp_path / 'w1').iterdir())
+        assert parts == ['part-00000.parquet', 'part-00001.parquet', 'part-00002.parquet']
+        for name in parts:
+            assert (tmp_path / 'w1' / name).read_bytes() == (tmp_path / 'w2' / name).read_bytes()
+        pd.testing.assert_frame_equal(pd.read_parquet(tmp_path / 'w1'), serial)
@@ -0,0 +1,334 @@
+"""
+챕터 입출력 처리기 테스트 (ch24 체크포인트, ch35 CSV/Parquet/Excel, ch31 Arrow dtype)
+"모든 것을 품위 있게 하고 질서대로 하라" (고전 14:40)
+"""
+
+import gzip
+
+import numpy as np
+import pytest
+import pandas as pd
+
+from chapters.ch24.checkpoint_saver import CheckpointSaver
+from chapters.ch31.dtype_tuner import DtypeTuner
+from chapters.ch35 import excel_io_handler
+from chapters.ch35.csv_io_handler import CsvIOHandler
+from chapters.ch35.excel_io_handler import ExcelIOHandler
+from chapters.ch35.parquet_io_handler import ParquetIOHandler
+from chapters.ch35.offering_data import OfferingDataGenerator
+
+NUM_RECORDS = 2_500
+
+
+@pytest.fixture(autouse=True)
+def _quiet_handlers(capsys):
+    """처리기의 안내 출력은 검사하지 않음"""
+    yield
+    capsys.readouterr()
+
+
+@pytest.fixture(scope='module')
+def offerings():
+    return OfferingDataGenerator().generate_offering_data(NUM_RECORDS)
+
+
+def _chunks(df, size):
+    return (df.iloc[start:start + size] for start in range(0, len(df), size))
+
+
+class TestCsvStreaming:
+    """CsvIOHandler 청크 단위 스트리밍 테스트"""
+
+    def test_save_chunks_round_trip(self, tmp_path, offerings):
+        """청크로 이어 쓴 파일은 한 번에 쓴 파일과 같은 내용 (머리글은 한 번만)"""
+        path = CsvIOHandler().save_chunks(_chunks(offerings, 1_000), str(tmp_path / 'offerings.csv'))
+        whole = tmp_path / 'whole.csv'
+        offerings.to_csv(whole, index=False)
+        assert open(path).read() == whole.read_text()
+
+    def test_gzip_inferred_from_extension(self, tmp_path, offerings):
+        """.gz 확장자면 gzip 스트림 하나로 압축"""
+        path = CsvIOHandler().save_chunks(_chunks(offerings, 1_000), str(tmp_path / 'offerings.csv.gz'))
+        with gzip.open(path, 'rt') as f:
+            assert f.readline().strip() == ','.join(offerings.columns)
+        assert len(pd.read_csv(path)) == NUM_RECORDS
+
+    def test_zstd_compression(self, tmp_path, offerings):
+        pytest.importorskip('zstandard')
+        path = CsvIOHandler().save_chunks(_chunks(offerings, 1_000), str(tmp_path / 'offerings.csv.zst'))
+        assert len(pd.read_csv(path)) == NUM_RECORDS
+
+    def test_mismatched_columns_rejected(self, tmp_path, offerings):
+        chunks = [offerings.iloc[:10], offerings.iloc[10:20, :3]]
+        with pytest.raises(ValueError):
+            CsvIOHandler().save_chunks(chunks, str(tmp_path / 'bad.csv'))
+
+    def test_iter_chunks_pins_dtypes(self, tmp_path):
+        """표본에서 추론한 dtype을 고정: 뒤 청크에 결측이 나와도 정수 열은 Int64"""
+        df = pd.DataFrame({'tribe': ['Judah', 'Levi'] * 50, 'count': range(100)})
+        df = df.astype({'count': 'Int64'})
+        df.loc[90, 'count'] = pd.NA
+        path = tmp_path / 'tribes.csv'
+        df.to_csv(path, index=False)
+
+        chunks = list(CsvIOHandler().iter_chunks(str(path), chunksize=30, sample_rows=50))
+        assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+        assert {str(chunk['count'].dtype) for chunk in chunks} == {'Int64'}
+        assert chunks[-1]['count'].isna().sum() == 1
+
+    @pytest.mark.parametrize('dtype_backend', [None, 'pyarrow'])
+    def test_iter_chunks_all_na_sample_column(self, tmp_path, dtype_backend):
+        """표본에서 모두 결측인 열은 문자열로 고정: 뒤 청크에 글자가 나와도 오류 없음"""
+        df = pd.DataFrame({'count': range(25_000), 'note': [None] * 20_000 + ['아멘'] * 5_000})
+        path = tmp_path / 'notes.csv'
+        df.to_csv(path, index=False)
+
+        handler = CsvIOHandler(dtype_backend=dtype_backend)
+        chunks = list(handler.iter_chunks(str(path), chunksize=5_000, sample_rows=1_000))
+        assert len({str(chunk['note'].dtype) for chunk in chunks}) == 1
+        notes = pd.concat(chunks)['note']
+        assert notes.isna().sum() == 20_000
+        assert (notes.iloc[20_000:] == '아멘').all()
+
+    def test_iter_chunks_usecols_and_missing_file(self, tmp_path, offerings):
+        path = tmp_path / 'offerings.csv'
+        offerings.to_csv(path, index=False)
+        handler = CsvIOHandler()
+
+        chunk = next(handler.iter_chunks(str(path), chunksize=500, usecols=['offering_type', 'quantity']))
+        assert list(chunk.columns) == ['offering_type', 'quantity']
+        assert list(handler.iter_chunks(str(tmp_path / 'missing.csv'))) == []
+
+    def test_process_chunks(self, tmp_path, offerings):
+        """청크별 집계를 합치면 전체 집계와 같고, 출력 파일로도 스트리밍"""
+        path = tmp_path / 'offerings.csv'
+        offerings.to_csv(path, index=False)
+        handler = CsvIOHandler()
+
+        partial = handler.process_chunks(
+            str(path), lambda chunk: chunk.groupby('offering_type', as_index=False)['quantity'].sum(),
+            chunksize=700)
+        totals = partial.groupby('offering_type')['quantity'].sum()
+        expected = offerings.groupby('offering_type')['quantity'].sum()
+        assert totals.astype('int64').equals(expected.astype('int64'))
+
+        output = handler.process_chunks(str(path), lambda chunk: chunk[chunk['voluntary']],
+                                        output_filename=str(tmp_path / 'voluntary.csv.gz'), chunksize=700)
+        assert len(pd.read_csv(output)) == offerings['voluntary'].sum()
+
+
+class TestParquetDataset:
+    """ParquetIOHandler 파티션 데이터셋 테스트"""
+
+    def test_partitioned_round_trip(self, tmp_path, offerings):
+        """파티션 디렉토리로 나눠 쓰고 다시 읽으면 같은 행 (파티션 컬럼은 경로에서 복원)"""
+        handler = ParquetIOHandler(offerings)
+        path = handler.save_dataset(str(tmp_path / 'offerings'), partition_cols=['offering_type'],
+                                    month_from='offering_date')
+        assert (tmp_path / 'offerings' / 'offering_type=Gold' / 'month=1446-01').is_dir()
+
+        loaded = handler.load_dataset(path).sort_values('offerer_id', ignore_index=True)
+        expected = offerings.assign(month=offerings['offering_date'].dt.strftime('%Y-%m'))
+        pd.testing.assert_frame_equal(loaded[expected.columns], expected, check_dtype=False)
+
+    def test_partition_and_column_pruning(self, tmp_path, offerings):
+        """두 달치 한 종류만: 해당 파티션 파일만 열고 요청한 컬럼만 반환"""
+        handler = ParquetIOHandler(offerings)
+        path = handler.save_dataset(str(tmp_path / 'offerings'), partition_cols=['offering_type'],
+                                    month_from='offering_date')
+        loaded = handler.load_dataset(path, columns=['offerer_id', 'quantity'],
+                                      filters=[('month', 'in', ['1446-01', '1446-02']),
+                                               ('offering_type', '==', 'Gold')], workers=4)
+
+        months = offerings['offering_date'].dt.strftime('%Y-%m')
+        expected = offerings[months.isin(['1446-01', '1446-02']) & (offerings['offering_type'] == 'Gold')]
+        assert list(loaded.columns) == ['offerer_id', 'quantity']
+        assert sorted(loaded['offerer_id']) == sorted(expected['offerer_id'])
+        assert handler.last_scan['files'] == 2
+
+    def test_row_group_pruning(self, tmp_path, offerings):
+        """행 그룹 통계로 조건 밖의 행 그룹은 읽지 않음"""
+        handler = ParquetIOHandler(offerings)
+        path = handler.save_dataset(str(tmp_path / 'offerings'), row_group_size=500)
+        loaded = handler.load_dataset(path, columns=['offerer_id'], filters=[('offerer_id', '<=', 700)])
+
+        assert loaded['offerer_id'].tolist() == list(range(1, 701))
+        assert handler.last_scan == {'files': 1, 'row_groups': 2, 'rows': 700}
+
+    def test_no_match_and_missing_directory(self, tmp_path, offerings):
+        handler = ParquetIOHandler(offerings)
+        path = handler.save_dataset(str(tmp_path / 'offerings'), month_from='offering_date')
+
+        empty = handler.load_dataset(path, columns=['quantity'], filters=[('month', '==', '1999-01')])
+        assert empty.empty and list(empty.columns) == ['quantity']
+        assert handler.load_dataset(str(tmp_path / 'missing')).empty
+
+
+@pytest.fixture
+def offering_workbook(tmp_path, offerings):
+    """봉헌 종류별 시트가 있는 통합 문서"""
+    pytest.importorskip('openpyxl')
+    path = tmp_path / 'offerings.xlsx'
+    with pd.ExcelWriter(path, engine='openpyxl') as writer:
+        for offering_type, group in offerings.drop(columns='offering_date').groupby('offering_type'):
+            group.to_excel(writer, sheet_name=offering_type, index=False)
+    return path
+
+
+class TestExcelIngestion:
+    """ExcelIOHandler 엔진 선택, 시트 병렬 파싱, Parquet 캐시 테스트"""
+
+    def test_load_all_sheets_parallel_matches_serial(self, offering_workbook, offerings):
+        handler = ExcelIOHandler()
+        serial = handler.load_all_sheets(str(offering_workbook), workers=1)
+        parallel = handler.load_all_sheets(str(offering_workbook), workers=2)
+
+        assert list(serial) == sorted(offerings['offering_type'].unique())
+        for name in serial:
+            pd.testing.assert_frame_equal(serial[name], parallel[name])
+        assert sum(map(len, serial.values())) == NUM_RECORDS
+
+    def test_parquet_cache_skips_excel_parsing(self, tmp_path, offering_workbook, monkeypatch):
+        """같은 내용의 통합 문서는 두 번째부터 캐시에서 (파일 이름이 달라도)"""
+        handler = ExcelIOHandler(cache_dir=str(tmp_path / 'cache'))
+        first = handler.load_all_sheets(str(offering_workbook), workers=1)
+        assert len(list((tmp_path / 'cache').iterdir())) == 1
+
+        copy = tmp_path / 'offerings_copy.xlsx'
+        copy.write_bytes(offering_workbook.read_bytes())
+
+        def fail(*args, **kwargs):
+            raise AssertionError("Excel을 다시 파싱함")
+        monkeypatch.setattr(excel_io_handler.pd, 'read_excel', fail)
+
+        cached = handler.load_all_sheets(str(copy))
+        assert list(cached) == list(first)
+        pd.testing.assert_frame_equal(cached['Gold'], first['Gold'])
+        pd.testing.assert_frame_equal(handler.load_data(str(copy), sheet_name=1), first['Bronze'])
+
+    def test_cache_key_includes_read_options(self, tmp_path, offering_workbook):
+        handler = ExcelIOHandler(cache_dir=str(tmp_path / 'cache'))
+        handler.load_all_sheets(str(offering_workbook), workers=1)
+        limited = handler.load_all_sheets(str(offering_workbook), workers=1, usecols=['offerer_id'])
+
+        assert list(limited['Gold'].columns) == ['offerer_id']
+        assert len(list((tmp_path / 'cache').iterdir())) == 2
+
+
+    @pytest.mark.parametrize('options', [{}, {'index_col': 0}, {'index_col': [0, 1]}])
+    def test_cache_hit_matches_miss(self, tmp_path, offering_workbook, options):
+        """캐시에서 읽은 시트는 처음 파싱한 시트와 같음 (index_col로 만든 인덱스 포함)"""
+        handler = ExcelIOHandler(cache_dir=str(tmp_path / 'cache'))
+        miss = handler.load_all_sheets(str(offering_workbook), workers=1, **options)
+        hit = handler.load_all_sheets(str(offering_workbook), workers=1, **options)
+
+        assert list(hit) == list(miss)
+        for name in miss:
+            pd.testing.assert_frame_equal(hit[name], miss[name])
+
+
+    @pytest.mark.parametrize('sheet_name', [None, ['Gold', 0], 'Silver', 2])
+    def test_cached_load_data_sheet_name(self, tmp_path, offering_workbook, sheet_name):
+        """캐시를 써도 sheet_name(None, 목록, 이름, 순번)은 pd.read_excel()과 같은 결과"""
+        handler = ExcelIOHandler(cache_dir=str(tmp_path / 'cache'))
+        expected = pd.read_excel(offering_workbook, sheet_name=sheet_name)
+        for _ in range(2):
+            loaded = handler.load_data(str(offering_workbook), sheet_name=sheet_name)
+            if isinstance(expected, dict):
+                assert list(loaded) == list(expected)
+                for name in expected:
+                    pd.testing.assert_frame_equal(loaded[name], expected[name])
+            else:
+                pd.testing.assert_frame_equal(loaded, expected)
+
+        with pytest.raises(ValueError):
+            handler.load_data(str(offering_workbook), sheet_name='Myrrh')
+
+
+class TestCheckpointSaver:
+    """utils.data_io 위에서 동작하는 CheckpointSaver 테스트"""
+
+    @pytest.mark.parametrize('filename, file_format', [
+        ('covenant.csv', 'csv'), ('covenant.parquet', 'parquet'), ('covenant.feather', 'feather'),
+        ('covenant.jsonl.gz', None)])
+    def test_round_trip(self, tmp_path, monkeypatch, filename, file_format):
+        monkeypatch.chdir(tmp_path)
+        df = pd.DataFrame({'tribe': ['Judah', 'Levi'], 'count': [74600, 0]})
+        saver = CheckpointSaver(df)
+
+        assert saver.save_checkpoint(filename, file_format=file_format) == str(tmp_path / filename)
+        pd.testing.assert_frame_equal(saver.load_checkpoint(filename, file_format=file_format), df)
+
+    def test_unsupported_format_skipped(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        saver = CheckpointSaver(pd.DataFrame({'count': [1]}))
+        assert saver.save_checkpoint('covenant.xml', file_format='xml') == ""
+        assert not (tmp_path / 'covenant.xml').exists()
+
+
+@pytest.fixture
+def string_heavy(offerings):
+    """고유값이 많은 문자열 컬럼이 있는 봉헌 표"""
+    return offerings.assign(note=np.char.add('offering-', offerings['offerer_id'].astype(str).to_numpy()).astype(object))
+
+
+class TestArrowBackend:
+    """dtype_backend='pyarrow' 입출력과 DtypeTuner Arrow 전략 테스트"""
+
+    def test_parquet_round_trip_keeps_arrow_strings(self, tmp_path, string_heavy):
+        """Parquet에서 읽은 문자열은 object 대신 Arrow string이고 메모리도 훨씬 작음"""
+        path = ParquetIOHandler(string_heavy).save_data(str(tmp_path / 'offerings.parquet'))
+        arrow = ParquetIOHandler(dtype_backend='pyarrow').load_data(path)
+        default = ParquetIOHandler().load_data(path)
+
+        assert str(arrow['note'].dtype) == 'string[pyarrow]'
+        assert all(isinstance(dtype, pd.ArrowDtype) for dtype in arrow.dtypes)
+        assert arrow.memory_usage(deep=True).sum() < default.memory_usage(deep=True).sum() / 2
+        assert arrow['note'].tolist() == string_heavy['note'].tolist()
+
+    def test_parquet_dataset_arrow_backend(self, tmp_path, string_heavy):
+        handler = ParquetIOHandler(string_heavy, dtype_backend='pyarrow')
+        path = handler.save_dataset(str(tmp_path / 'offerings'), month_from='offering_date')
+        loaded = handler.load_dataset(path, columns=['note', 'quantity', 'month'])
+        assert {str(dtype) for dtype in loaded.dtypes} == {'string[pyarrow]', 'int64[pyarrow]'}
+
+    def test_csv_arrow_backend(self, tmp_path, string_heavy):
+        """전체 읽기와 청크 읽기 모두 Arrow dtype (청크 dtype은 Arrow로 고정)"""
+        handler = CsvIOHandler(string_heavy, dtype_backend='pyarrow')
+        path = handler.save_data(str(tmp_path / 'offerings.csv'))
+
+        loaded = handler.load_data(path)
+        assert str(loaded['note'].dtype) == 'string[pyarrow]'
+        assert str(loaded['quantity'].dtype) == 'int64[pyarrow]'
+
+        chunks = list(handler.iter_chunks(path, chunksize=1_000))
+        assert {tuple(map(str, chunk.dtypes)) for chunk in chunks} == {tuple(map(str, loaded.dtypes))}
+
+    @pytest.mark.parametrize('filename', ['covenant.csv', 'covenant.parquet', 'covenant.pkl'])
+    def test_checkpoint_arrow_backend(self, tmp_path, monkeypatch, filename):
+        """pickle처럼 읽기 함수가 dtype_backend를 모르는 형식도 읽은 뒤 변환"""
+        monkeypatch.chdir(tmp_path)
+        saver = CheckpointSaver(pd.DataFrame({'tribe': ['Judah', 'Levi'], 'count': [74600, 0]}),
+                                dtype_backend='pyarrow')
+        saver.save_checkpoint(filename, file_format=None)
+        loaded = saver.load_checkpoint(filename, file_format=None)
+        assert list(map(str, loaded.dtypes)) == ['string[pyarrow]', 'int64[pyarrow]']
+
+    def test_tuner_arrow_strategy(self, string_heavy):
+        tuner = DtypeTuner(string_heavy)
+        numpy_df = tuner.optimize_dtypes()
+        arrow_df = tuner.optimize_dtypes(strategy='arrow')
+
+        assert str(arrow_df['offering_type'].dtype).startswith('dictionary<values=string, indices=int8')
+        assert str(arrow_df['note'].dtype) == 'string[pyarrow]'
+        assert str(arrow_df['quantity'].dtype) == 'int8[pyarrow]'
+        assert str(arrow_df['offerer_id'].dtype) == 'int16[pyarrow]'
+        assert str(arrow_df['voluntary'].dtype) == 'bool[pyarrow]'
+        assert arrow_df.memory_usage(deep=True).sum() < numpy_df.memory_usage(deep=True).sum() / 2
+        assert arrow_df['note'].tolist() == string_heavy['note'].tolist()
+        assert (arrow_df.groupby('offering_type', observed=True)['quantity'].sum().to_dict()
+                == string_heavy.groupby('offering_type')['quantity'].sum().to_dict())
+
+    def test_tuner_rejects_unknown_strategy(self, offerings):
+        with pytest.raises(ValueError):
+            DtypeTuner(offerings).optimize_dtypes(strategy='polars')
@@ -27,9 +27,12 @@ def config_path():
     """설정 파일 경로 fixture"""
     return PROJECT_ROOT / "config.yml"
 
-@pytest.fixture
-def sample_tribes_data():
-    """샘플 12지파 데이터 fixture"""
+def _fresh_copy(df: pd.DataFrame) -> pd.DataFrame:
+    """세션 데이터의 테스트별 복사본 (예제 표는 작아서 복사가 싸고, 테스트가 수정해도 세션 원본은 그대로)"""
+    return df.copy()
+
+@pytest.fixture(scope="session")
+def _sample_tribes():
     return pd.DataFrame({
         'name': ['Reuben', 'Simeon', 'Levi', 'Judah'],
         'korean_name': ['르우벤', '시므온', '레위', '유다'],
@@ -39,9 +42,8 @@ def sample_tribes_data():
         'spiritual_theme': ['관계', '소통', '연합', '예배']
     })
 
-@pytest.fixture
-def sample_john_concepts():
-    """샘플 요한복음 개념 데이터 fixture"""
+@pytest.fixture(scope="session")
+def _sample_john_concepts():
     return pd.DataFrame({
         'concept': ['Word', 'Light', 'Darkness', 'Grace', 'Truth'],
         'korean_name': ['말씀', '빛', '어둠', '은혜', '진리'],
@@ -50,9 +52,8 @@ def sample_john_concepts():
         'theological_importance': [10, 9, 3, 9, 9]
     })
 
-@pytest.fixture
-def spiritual_journey_data():
-    """샘플 개인 신앙 여정 데이터 fixture"""
+@pytest.fixture(scope="session")
+def _spiritual_journey():
     return pd.DataFrame({
         '연도': [2020, 2021, 2022, 2023, 2024],
         '핵심사건': ['첫 교회 출석', '세례받음', '소그룹 참여', '헌신 결단', '큐티 시작'],
@@ -60,6 +61,74 @@ def spiritual_journey_data():
         '감사제목': ['새로운 시작', '거듭남', '소속감', '헌신', '성숙']
     })
 
+@pytest.fixture(scope="session")
+def _example_frames(test_data_path):
+    """data/examples의 모든 CSV (세션당 한 번, UTF-8로 로드)"""
+    return {path.name: pd.read_csv(path, encoding='utf-8') for path in sorted(test_data_path.glob("*.csv"))}
+
+@pytest.fixture
+def sample_tribes_data(_sample_tribes):
+    """샘플 12지파 데이터 fixture"""
+    return _fresh_copy(_sample_tribes)
+
+@pytest.fixture
+def sample_john_concepts(_sample_john_concepts):
+    """샘플 요한복음 개념 데이터 fixture"""
+    return _fresh_copy(_sample_john_concepts)
+
+@pytest.fixture
+def spiritual_journey_data(_spiritual_journey):
+    """샘플 개인 신앙 여정 데이터 fixture"""
+    return _fresh_copy(_spiritual_journey)
+
+@pytest.fixture
+def example_csvs(_example_frames):
+    """예제 CSV fixture: {파일 이름: DataFrame}"""
+    return {name: _fresh_copy(df) for name, df in _example_frames.items()}
+
+@pytest.fixture
+def tribes_df(_example_frames):
+    """12지파 예제 데이터 fixture (ch01_tribes.csv)"""
+    return _fresh_copy(_example_frames["ch01_tribes.csv"])
+
+@pytest.fixture
+def john_df(_example_frames):
+    """요한복음 개념 예제 데이터 fixture (ch01_john_concepts.csv)"""
+    return _fresh_copy(_example_frames["ch01_john_concepts.csv"])
+
+# 테스트용 축소 KJV 말뭉치 (book, chapter, verse, text)
+SAMPLE_BIBLE_ROWS = [
+    ('Genesis', 1, 1, 'In the beginning God created the heaven and the earth.'),
+    ('Genesis', 1, 3, 'And God said, Let there be light: and there was light.'),
+    (' Exodus', 1, 1, 'Now these are the names of the children of Israel, which came into Egypt.'),
+    ('Exodus', 1, 7, 'And the children of Israel were fruitful, and increased abundantly.'),
+    ('Exodus', 3, 1, 'Now Moses kept the flock of Jethro his father in law.'),
+    ('Exodus', 3, 2, 'And the angel of the LORD appeared unto him in a flame of fire.'),
+    ('Exodus', 3, 14, 'And God said unto Moses, I AM THAT I AM.'),
+    ('Exodus', 10, 23, 'But all the children of Israel had light in their dwellings.'),
+    ('John', 1, 1, 'In the beginning was the Word, and the Word was with God, and the Word was God.'),
+    ('John', 1, 4, 'In him was life; and the life was the light of men.'),
+    ('John', 1, 5, 'And the light shineth in darkness; and the darkness comprehended it not.'),
+    ('John', 1, 14, 'And the Word was made flesh, full of grace and truth.'),
+    ('John', 1, 17, 'For the law was given by Moses, but grace and truth came by Jesus Christ.'),
+]
+
+@pytest.fixture
+def sample_bible_root(tmp_path, monkeypatch):
+    """축소 bible_KJV.csv를 가진 임시 프로젝트 루트 fixture"""
+    from utils import bible_utils
+
+    raw_dir = tmp_path / "data" / "raw"
+    raw_dir.mkdir(parents=True)
+    pd.DataFrame(SAMPLE_BIBLE_ROWS, columns=['book', 'chapter', 'verse', 'text']).to_csv(
+        raw_dir / "bible_KJV.csv", index=False, encoding='utf-8'
+    )
+
+    monkeypatch.setattr(bible_utils, 'PROJECT_ROOT', tmp_path)
+    bible_utils.clear_corpus_cache()
+    yield tmp_path
+    bible_utils.clear_corpus_cache()
+
 # 테스트 마커 정의
 def pytest_configure(config):
     """pytest 설정"""
@@ -8,60 +8,173 @@ JesusBornd 통합 테스트 실행기
     python tests/run_tests.py --utils           # 유틸리티만
     python tests/run_tests.py --fast            # 빠른 테스트만
     python tests/run_tests.py --visual          # 시각화 테스트만
+    python tests/run_tests.py --workers 4       # 워커 4개로 나눠 실행
+
+테스트는 한 번만 수집해 중복을 없앤 뒤, 파일 단위로 샤드를 나눠 워커 프로세스에서 병렬 실행합니다.
 """
 
 import argparse
+import contextlib
+import io
+import multiprocessing
+import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-import subprocess
+from typing import Dict, List, Optional, Sequence
 
 # 프로젝트 루트 추가
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+# 스크립트로 실행하면 tests/가 sys.path에 들어가 tests/chapters 패키지가
+# 최상위 chapters(네임스페이스 패키지)를 가리므로 제거 (수집은 이 프로세스 안에서 함)
+sys.path[:] = [path for path in sys.path if Path(path or '.').resolve() != Path(__file__).resolve().parent]
+
+# 실행 모드별 선택 (경로들, 마커 식) - 겹치는 경로의 테스트는 한 번만 실행
+SELECTIONS = {
+    'all': (["tests/test_utils.py", "tests/test_data_integrity.py", "tests/chapters/test_ch01.py", "tests/"], None),
+    'utils': (["tests/test_utils.py"], None),
+    'fast': (["tests/"], "not slow"),
+    'visual': (["tests/"], "visualization"),
+    'integration': (["tests/"], "integration"),
+    'data': (["tests/test_data_integrity.py"], None),
+}
+
+@dataclass
+class ShardResult:
+    """샤드 하나의 실행 결과"""
+    index: int
+    tests: int
+    exit_code: int
+    duration: float
+    output: str
+
+    @property
+    def success(self) -> bool:
+        # 5 = 선택된 테스트 없음
+        return self.exit_code in (0, 5)
+
 def print_header(title: str):
     """테스트 섹션 헤더 출력"""
     print("\n" + "="*60)
     print(f"🧪 {title}")
     print("="*60)
 
-def run_pytest_command(args: list, description: str) -> bool:
-    """pytest 명령 실행"""
+class _Collector:
+    """수집이 끝난 테스트(마커 선택 후)의 node id를 기록하는 pytest 플러그인"""
+
+    def __init__(self):
+        self.node_ids: List[str] = []
+
+    def pytest_collection_finish(self, session):
+        self.node_ids = [item.nodeid for item in session.items]
+
+def collect_tests(paths: Sequence[str], markexpr: Optional[str] = None) -> List[str]:
+    """한 번의 수집으로 선택된 테스트 node id 목록 (겹치는 경로는 중복 제거, 수집 순서 유지)
+
+    Args:
+        paths: 테스트 경로들 (프로젝트 루트 기준, 예: ["tests/test_utils.py", "tests/"])
+        markexpr: pytest -m 마커 식 (예: "not slow")
+    """
+    import pytest
+
+    collector = _Collector()
+    args = ["--collect-only", "-q", "-p", "no:cacheprovider", f"--rootdir={PROJECT_ROOT}"]
+    args += [str(PROJECT_ROOT / path) for path in paths]
+    if markexpr:
+        args += ["-m", markexpr]
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        exit_code = pytest.main(args, plugins=[collector])
+    if exit_code not in (0, 5):
+        raise RuntimeError(f"테스트 수집 실패 (exit code {exit_code}): python -m pytest --collect-only {' '.join(paths)}")
+
+    return list(dict.fromkeys(collector.node_ids))
+
+def shard_tests(node_ids: Sequence[str], workers: int) -> List[List[str]]:
+    """테스트를 워커 수만큼 나누기
+
+    같은 파일의 테스트는 한 샤드에 모아 모듈/세션 fixture를 한 번만 만들고,
+    파일을 테스트 수가 많은 순서로 가장 적게 받은 샤드에 배정해 크기를 맞춥니다.
+    각 샤드 안에서는 원래 수집 순서를 유지합니다.
+    """
+    by_file: Dict[str, List[str]] = {}
+    for node_id in node_ids:
+        by_file.setdefault(node_id.split("::")[0], []).append(node_id)
+
+    shards: List[List[str]] = [[] for _ in range(max(1, min(workers, len(by_file))))]
+    for tests in sorted(by_file.values(), key=len, reverse=True):
+        min(shards, key=len).extend(tests)
+
+    order = {node_id: position for position, node_id in enumerate(node_ids)}
+    return [sorted(shard, key=order.__getitem__) for shard in shards if shard]
+
+def _run_shard(index: int, node_ids: List[str], pytest_args: List[str]) -> ShardResult:
+    """워커 프로세스에서 샤드 하나를 하나의 pytest 세션으로 실행 (출력은 모아서 반환)"""
+    import pytest
+
+    os.chdir(PROJECT_ROOT)
+    buffer = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+        exit_code = int(pytest.main(["-p", "no:cacheprovider", f"--rootdir={PROJECT_ROOT}", *pytest_args, *node_ids]))
+    return ShardResult(index, len(node_ids), exit_code, time.perf_counter() - start, buffer.getvalue())
+
+def run_sharded(paths: Sequence[str], markexpr: Optional[str], description: str,
+                workers: Optional[int] = None, verbose: bool = False) -> bool:
+    """한 번 수집한 테스트를 샤드로 나눠 워커 프로세스에서 병렬 실행
+
+    Args:
+        paths: 테스트 경로들
+        markexpr: pytest -m 마커 식
+        description: 출력용 이름
+        workers: 워커 프로세스 수 (생략 시 CPU 수)
+        verbose: pytest -v 출력
+    """
     print(f"\n🔍 {description} 시작...")
-    
-    start_time = time.time()
-    result = subprocess.run([sys.executable, "-m", "pytest"] + args, 
-                          capture_output=False, text=True)
-    execution_time = time.time() - start_time
-    
-    if result.returncode == 0:
-        print(f"✅ {description} 완료 ({execution_time:.1f}초)")
+    start = time.perf_counter()
+
+    node_ids = collect_tests(paths, markexpr)
+    if not node_ids:
+        print(f"⚠️ {description}: 선택된 테스트가 없습니다.")
         return True
+
+    shards = shard_tests(node_ids, workers or os.cpu_count() or 1)
+    print(f"📦 테스트 {len(node_ids)}개를 샤드 {len(shards)}개로 실행")
+
+    pytest_args = ["-v" if verbose else "-q", "--tb=short"]
+    results = []
+    # spawn: 수집하며 임포트한 모듈을 물려받지 않는 깨끗한 프로세스, 샤드마다 새 프로세스
+    with ProcessPoolExecutor(max_workers=len(shards), mp_context=multiprocessing.get_context("spawn"),
+                             max_tasks_per_child=1) as pool:
+        futures = [pool.submit(_run_shard, index, shard, pytest_args) for index, shard in enumerate(shards, 1)]
+        for future in futures:
+            result = future.result()
+            results.append(result)
+            status = "✅" if result.success else "❌"
+            print(f"\n{status} 샤드 {result.index}/{len(shards)}: 테스트 {result.tests}개 ({result.duration:.1f}초)")
+            print(result.output.rstrip())
+
+    execution_time = time.perf_counter() - start
+    success = all(result.success for result in results)
+    if success:
+        print(f"✅ {description} 완료 ({execution_time:.1f}초)")
     else:
         print(f"❌ {description} 실패 ({execution_time:.1f}초)")
-        return False
+    return success
 
-def run_all_tests() -> bool:
-    """모든 테스트 실행"""
+def run_all_tests(workers: Optional[int] = None, verbose: bool = False) -> bool:
+    """모든 테스트 실행 (유틸리티/데이터 무결성/Chapter 01/전체를 한 번에 수집해 중복 없이)"""
     print_header("전체 테스트 스위트 실행")
-    
-    tests = [
-        (["tests/test_utils.py", "-v"], "유틸리티 모듈 테스트"),
-        (["tests/test_data_integrity.py", "-v"], "데이터 무결성 테스트"), 
-        (["tests/chapters/test_ch01.py", "-v"], "Chapter 01 테스트"),
-        (["tests/", "-v", "--tb=short"], "전체 통합 테스트")
-    ]
-    
-    results = []
-    for args, description in tests:
-        success = run_pytest_command(args, description)
-        results.append((description, success))
-    
-    print_summary(results)
-    return all(result[1] for result in results)
+    paths, markexpr = SELECTIONS['all']
+    success = run_sharded(paths, markexpr, "전체 테스트", workers, verbose)
+    print_summary([("전체 테스트", success)])
+    return success
 
-def run_chapter_tests(chapter_num: int) -> bool:
+def run_chapter_tests(chapter_num: int, workers: Optional[int] = None, verbose: bool = False) -> bool:
     """특정 챕터 테스트"""
     print_header(f"Chapter {chapter_num:02d} 테스트")
     
@@ -71,32 +184,14 @@ def run_chapter_tests(chapter_num: int) -> bool:
         print(f"❌ Chapter {chapter_num:02d} 테스트 파일이 존재하지 않습니다.")
         return False
     
-    return run_pytest_command([str(test_file), "-v"], f"Chapter {chapter_num:02d}")
-
-def run_utils_tests() -> bool:
-    """유틸리티 테스트만"""
-    print_header("유틸리티 모듈 테스트")
-    return run_pytest_command(["tests/test_utils.py", "-v"], "유틸리티 모듈")
-
-def run_fast_tests() -> bool:
-    """빠른 테스트만 (slow 마커 제외)"""
-    print_header("빠른 테스트 (성능 테스트 제외)")
-    return run_pytest_command(["tests/", "-v", "-m", "not slow"], "빠른 테스트")
-
-def run_visual_tests() -> bool:
-    """시각화 테스트만"""
-    print_header("시각화 테스트")
-    return run_pytest_command(["tests/", "-v", "-m", "visualization"], "시각화")
-
-def run_integration_tests() -> bool:
-    """통합 테스트만"""
-    print_header("통합 테스트")
-    return run_pytest_command(["tests/", "-v", "-m", "integration"], "통합 테스트")
+    return run_sharded([str(test_file.relative_to(PROJECT_ROOT))], None, f"Chapter {chapter_num:02d}", workers, verbose)
 
-def run_data_integrity_tests() -> bool:
-    """데이터 무결성 테스트"""
-    print_header("데이터 무결성 검증")
-    return run_pytest_command(["tests/test_data_integrity.py", "-v"], "데이터 무결성")
+def run_selection(mode: str, title: str, description: str,
+                  workers: Optional[int] = None, verbose: bool = False) -> bool:
+    """SELECTIONS의 실행 모드 하나 (utils/fast/visual/integration/data)"""
+    print_header(title)
+    paths, markexpr = SELECTIONS[mode]
+    return run_sharded(paths, markexpr, description, workers, verbose)
 
 def print_summary(results: list):
     """테스트 결과 요약 출력"""
@@ -186,6 +281,7 @@ def main():
     group.add_argument("--integration", action="store_true", help="통합 테스트만 실행")
     group.add_argument("--data", action="store_true", help="데이터 무결성 테스트만 실행")
     
+    parser.add_argument("-w", "--workers", type=int, default=None, help="워커 프로세스 수 (기본값: CPU 수)")
     parser.add_argument("--no-check", action="store_true", help="환경 요구사항 확인 건너뛰기")
     parser.add_argument("--verbose", action="store_true", help="상세 출력")
     
@@ -204,21 +300,22 @@ def main():
     success = True
     
     try:
+        options = dict(workers=args.workers, verbose=args.verbose)
         if args.chapter:
-            success = run_chapter_tests(args.chapter)
+            success = run_chapter_tests(args.chapter, **options)
         elif args.utils:
-            success = run_utils_tests()
+            success = run_selection('utils', "유틸리티 모듈 테스트", "유틸리티 모듈", **options)
         elif args.fast:
-            success = run_fast_tests()
+            success = run_selection('fast', "빠른 테스트 (성능 테스트 제외)", "빠른 테스트", **options)
         elif args.visual:
-            success = run_visual_tests()
+            success = run_selection('visual', "시각화 테스트", "시각화", **options)
         elif args.integration:
-            success = run_integration_tests()
+            success = run_selection('integration', "통합 테스트", "통합 테스트", **options)
         elif args.data:
-            success = run_data_integrity_tests()
+            success = run_selection('data', "데이터 무결성 검증", "데이터 무결성", **options)
         else:
             # 기본값: 모든 테스트
-            success = run_all_tests()
+            success = run_all_tests(**options)
             
     except KeyboardInterrupt:
         print("\n\n⏸️ 사용자가 테스트를 중단했습니다.")
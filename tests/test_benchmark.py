@@ -0,0 +1,135 @@
+"""
+벤치마크 테스트
+"먼저 앉아 그 비용을 계산하지 아니하겠느냐" (눅 14:28)
+"""
+
+import json
+import sys
+
+import pandas as pd
+import pytest
+
+import benchmark
+
+
+class TestBenchmarkRun:
+    """측정과 결과 형식 테스트"""
+
+    def test_cases_cover_chapters(self):
+        """요청된 챕터 연산이 모두 등록됨"""
+        covered = {(case.chapter, case.operation) for case in benchmark.CASES.values()}
+        for chapter in ('09', '10', '38'):
+            assert (chapter, 'groupby') in covered
+        for chapter in ('11', '33', '36'):
+            assert (chapter, 'merge') in covered
+        for chapter in ('16', '30', '39'):
+            assert (chapter, 'rolling') in covered
+        assert {('15', 'pivot'), ('36', 'pivot'), ('31', 'dtype'), ('31', 'eval/query'), ('35', 'io')} <= covered
+
+    @pytest.mark.slow
+    def test_run_benchmarks(self, capsys):
+        """모든 연산이 작은 규모에서 실행되고 머신 정보와 함께 기록됨 (출력은 버림)"""
+        report = benchmark.run_benchmarks(scales=[2], repeat=2)
+
+        assert len(report['results']) == len(benchmark.CASES)
+        assert all(result['rows'] == 100 and len(result['times']) == 2 for result in report['results'])
+        assert all(result['best'] <= result['median'] for result in report['results'])
+        assert report['machine']['pandas']
+        assert capsys.readouterr().out == ''
+
+    @pytest.mark.parametrize('name', ['ch11_merge', 'ch15_pivot', 'ch16_rolling', 'ch36_pivot'])
+    def test_measure_excludes_formatting(self, name, monkeypatch):
+        """측정 시간에 DataFrame/Series 문자열 변환이 들어가지 않음"""
+        calls = []
+
+        def record(self, *args, **kwargs):
+            calls.append(type(self).__name__)
+            return ''
+
+        monkeypatch.setattr(pd.DataFrame, 'to_string', record)
+        monkeypatch.setattr(pd.Series, 'to_string', record)
+        benchmark.measure(benchmark.CASES[name], rows=100, repeat=1)
+
+        assert calls == []
+
+    def test_unknown_case(self):
+        """등록되지 않은 연산은 ValueError"""
+        with pytest.raises(ValueError):
+            benchmark.run_benchmarks(['ch99_groupby'], scales=[2])
+
+
+class TestBaselineComparison:
+    """기준선 비교 테스트"""
+
+    @staticmethod
+    def _report(best, rows=1000, machine=None):
+        return {'machine': machine or benchmark.machine_metadata(),
+                'results': [{'case': 'ch09_groupby', 'rows': rows, 'best': best}]}
+
+    def test_compare(self):
+        """허용 비율과 최소 차이를 모두 넘을 때만 회귀"""
+        baseline = self._report(0.100)
+
+        assert benchmark.compare(self._report(0.140), baseline) == []
+        assert benchmark.compare(self._report(0.002), self._report(0.001)) == []  # 잡음 수준
+        assert len(benchmark.compare(self._report(0.002), self._report(0.001), min_seconds=0.0)) == 1
+        assert benchmark.compare(self._report(0.500, rows=10), baseline) == []  # 기준선에 없는 행 수
+
+        regressions = benchmark.compare(self._report(0.200), baseline)
+        assert len(regressions) == 1
+        assert regressions[0]['ratio'] == pytest.approx(2.0)
+
+    def test_same_machine(self):
+        """머신 정보 키가 다르면 다른 머신"""
+        machine = benchmark.machine_metadata()
+        assert benchmark.same_machine(machine, dict(machine))
+        assert not benchmark.same_machine(machine, {**machine, 'cpu_count': -1})
+
+    def test_main_fails_on_regression(self, tmp_path, monkeypatch, capsys):
+        """기준선 저장 후 느려지면 종료 코드 1"""
+        baseline_path, output = tmp_path / 'baseline.json', tmp_path / 'latest.json'
+        argv = ['benchmark.py', '--cases', 'ch38_groupby', '--scales', '2', '--repeat', '1',
+                '--output', str(output), '--baseline', str(baseline_path)]
+
+        monkeypatch.setattr(sys, 'argv', argv + ['--save-baseline'])
+        assert benchmark.main() == 0
+        assert json.loads(baseline_path.read_text(encoding='utf-8'))['results'][0]['case'] == 'ch38_groupby'
+
+        baseline = json.loads(baseline_path.read_text(encoding='utf-8'))
+        baseline['results'][0]['best'] = 1e-9
+        baseline_path.write_text(json.dumps(baseline), encoding='utf-8')
+        monkeypatch.setattr(sys, 'argv', argv + ['--min-seconds', '0'])
+        assert benchmark.main() == 1
+        assert '기준선보다 느려진' in capsys.readouterr().out
+
+    def test_main_without_comparable_baseline(self, tmp_path, monkeypatch, capsys):
+        """기준선이 없거나 머신이 다르면 통과(0)가 아닌 별도 종료 코드"""
+        baseline_path = tmp_path / 'baseline.json'
+        argv = ['benchmark.py', '--cases', 'ch38_groupby', '--scales', '2', '--repeat', '1',
+                '--output', str(tmp_path / 'latest.json'), '--baseline', str(baseline_path)]
+
+        monkeypatch.setattr(sys, 'argv', argv)
+        assert benchmark.main() == benchmark.EXIT_NO_BASELINE
+        assert '기준선이 없습니다' in capsys.readouterr().out
+
+        baseline_path.write_text(json.dumps(self._report(1.0, rows=100, machine={'cpu_count': -1})),
+                                 encoding='utf-8')
+        assert benchmark.main() == benchmark.EXIT_NO_BASELINE
+        assert '머신/패키지 정보가 달라' in capsys.readouterr().out
+
+        monkeypatch.setattr(sys, 'argv', argv + ['--ignore-machine'])
+        assert benchmark.main() == 0
+
+    def test_main_after_saving_baseline(self, tmp_path, monkeypatch, capsys):
+        """--save-baseline으로 만든 기준선과 같은 머신의 다음 실행이 비교됨"""
+        baseline_path = tmp_path / 'baseline.json'
+        argv = ['benchmark.py', '--cases', 'ch38_groupby', '--scales', '2', '--repeat', '1',
+                '--output', str(tmp_path / 'latest.json'), '--baseline', str(baseline_path)]
+
+        monkeypatch.setattr(sys, 'argv', argv + ['--save-baseline'])
+        assert benchmark.main() == 0
+        assert baseline_path.exists()
+
+        monkeypatch.setattr(sys, 'argv', argv + ['--tolerance', '100'])
+        assert benchmark.main() == 0
+        assert '기준선 대비 회귀 없음' in capsys.readouterr().out
@@ -0,0 +1,108 @@
+"""
+증분 빌드 그래프 테스트
+"지혜로운 건축자와 같이 내가 터를 닦아 두매" (고전 3:10)
+"""
+
+import pytest
+
+import build
+from run_chapters import PROJECT_ROOT
+
+
+def _relative_deps(node):
+    return {path.relative_to(PROJECT_ROOT).as_posix() for path in node.deps}
+
+
+class TestBuildGraph:
+    """의존성 그래프 테스트"""
+
+    def test_chapter_module_dependencies(self):
+        """챕터 진입점에서 임포트를 따라가 의존 모듈을 수집"""
+        graph = build.build_graph(['27', '28'])
+
+        assert {'chapters/ch27/altar_data.py', 'chapters/ch27/derived_variables.py',
+                'chapters/ch27/conditional_processing.py',
+                'chapters/ch27/preprocessing_pipeline.py'} <= _relative_deps(graph['27'])
+        assert {'chapters/ch28/categorical_labeling.py', 'chapters/ch28/dataframe_styling.py',
+                'chapters/ch28/styled_report_generator.py'} <= _relative_deps(graph['28'])
+        assert not graph['27'].data  # 설정/데이터를 읽지 않는 챕터(utils.synthetic만 사용)는 데이터에 의존하지 않음
+
+    def test_utils_chapters_depend_on_data(self):
+        """utils를 쓰는 챕터는 utils 모듈과 설정/데이터에 의존"""
+        deps = _relative_deps(build.build_graph(['01'])['01'])
+
+        assert {'utils/bible_utils.py', 'config.yml', 'data/examples/ch01_tribes.csv'} <= deps
+
+    def test_unknown_chapter(self):
+        """진입점이 없는 챕터는 ValueError"""
+        with pytest.raises(ValueError):
+            build.build_graph(['21'])
+
+
+class TestStaleness:
+    """오래된 노드 판정 테스트"""
+
+    @pytest.fixture
+    def built_node(self, tmp_path, monkeypatch):
+        """방금 빌드된 것처럼 기록된 ch27 노드"""
+        monkeypatch.setattr(build, 'BUILD_DIR', tmp_path)
+        node = build.build_graph(['27'])['27']
+        node.output_dir.mkdir(parents=True)
+        (node.output_dir / 'results.json').write_text('{}', encoding='utf-8')
+
+        manifest = {'27': {
+            'status': 'ok',
+            'environment': build.shared_inputs_digest(),
+            'deps': {build._relative(path): build._file_hash(path) for path in node.deps},
+            'artifacts': ['results.json'],
+        }}
+        return node, manifest
+
+    def test_up_to_date(self, built_node):
+        node, manifest = built_node
+        assert build.stale_reason(node, manifest) is None
+
+    def test_changed_dependency(self, built_node):
+        node, manifest = built_node
+        manifest['27']['deps']['chapters/ch27/altar_data.py'] = '0' * 64
+
+        assert 'altar_data.py' in build.stale_reason(node, manifest)
+
+    def test_changed_environment(self, built_node, monkeypatch):
+        """파이썬/pandas/numpy 버전이 바뀌면 (run_chapters와 같은 환경 해시) 다시 빌드"""
+        node, manifest = built_node
+        monkeypatch.setattr(build, 'shared_inputs_digest', lambda: '0' * 64)
+
+        assert '실행 환경' in build.stale_reason(node, manifest)
+        assert build.stale_reason(node, manifest, environment=manifest['27']['environment']) is None
+
+    def test_missing_artifact(self, built_node):
+        node, manifest = built_node
+        (node.output_dir / 'results.json').unlink()
+
+        assert 'results.json' in build.stale_reason(node, manifest)
+
+    def test_failed_or_missing_record(self, built_node):
+        node, manifest = built_node
+        assert build.stale_reason(node, {}) is not None
+
+        manifest['27']['status'] = 'error'
+        assert build.stale_reason(node, manifest) is not None
+
+
+@pytest.mark.slow
+class TestIncrementalBuild:
+    """증분 빌드 통합 테스트"""
+
+    def test_second_build_is_noop(self, tmp_path, monkeypatch):
+        """한 번 빌드한 뒤에는 아무것도 다시 빌드하지 않음"""
+        monkeypatch.setattr(build, 'BUILD_DIR', tmp_path)
+
+        reasons = build.build(['09'], workers=1)
+        assert reasons['09'] is not None
+        entry = build.load_manifest()['09']
+        assert entry['status'] == 'ok', entry['error']
+        assert 'results.json' in entry['artifacts']
+
+        monkeypatch.setattr(build, 'ProcessPoolExecutor', lambda *a, **k: pytest.fail("최신 챕터를 다시 빌드했습니다."))
+        assert build.build(['09']) == {'09': None}
@@ -39,9 +39,9 @@ class TestTwelveTribesData:
     """12지파 데이터 무결성 테스트"""
     
     @pytest.fixture
-    def tribes_data(self, test_data_path):
-        """12지파 데이터 로드"""
-        return pd.read_csv(test_data_path / "ch01_tribes.csv", encoding='utf-8')
+    def tribes_data(self, tribes_df):
+        """12지파 데이터 (세션에서 한 번 읽은 ch01_tribes.csv)"""
+        return tribes_df
     
     def test_tribes_data_structure(self, tribes_data, biblical_assertions):
         """12지파 데이터 구조 검증"""
@@ -111,9 +111,9 @@ class TestJohnConceptsData:
     """요한복음 개념 데이터 무결성 테스트"""
     
     @pytest.fixture
-    def john_data(self, test_data_path):
-        """요한복음 개념 데이터 로드"""
-        return pd.read_csv(test_data_path / "ch01_john_concepts.csv", encoding='utf-8')
+    def john_data(self, john_df):
+        """요한복음 개념 데이터 (세션에서 한 번 읽은 ch01_john_concepts.csv)"""
+        return john_df
     
     def test_john_data_structure(self, john_data):
         """요한복음 데이터 구조 검증"""
@@ -198,7 +198,7 @@ class TestDataConsistency:
     """데이터 일관성 테스트"""
     
     def test_encoding_consistency(self, test_data_path):
-        """모든 CSV 파일의 인코딩 일관성 확인"""
+        """모든 CSV 파일의 인코딩 일관성 확인 (세션 fixture를 거치지 않고 파일을 직접 읽음)"""
         csv_files = list(test_data_path.glob("*.csv"))
         
         for csv_file in csv_files:
@@ -209,24 +209,20 @@ class TestDataConsistency:
             except UnicodeDecodeError:
                 pytest.fail(f"{csv_file.name}이 UTF-8 인코딩이 아닙니다.")
                 
-    def test_column_naming_consistency(self, test_data_path):
+    def test_column_naming_consistency(self, example_csvs):
         """컬럼명 명명 규칙 일관성 확인"""
-        csv_files = list(test_data_path.glob("*.csv"))
-        
-        for csv_file in csv_files:
-            df = pd.read_csv(csv_file, encoding='utf-8')
-            
+        for name, df in example_csvs.items():
             for col in df.columns:
                 # 컬럼명에 공백이나 특수문자 확인
-                assert not col.startswith(' '), f"{csv_file.name}의 '{col}' 컬럼명이 공백으로 시작합니다."
-                assert not col.endswith(' '), f"{csv_file.name}의 '{col}' 컬럼명이 공백으로 끝납니다."
+                assert not col.startswith(' '), f"{name}의 '{col}' 컬럼명이 공백으로 시작합니다."
+                assert not col.endswith(' '), f"{name}의 '{col}' 컬럼명이 공백으로 끝납니다."
 
 class TestBiblicalAccuracy:
     """성경적 정확성 테스트"""
     
-    def test_twelve_tribes_biblical_accuracy(self, test_data_path):
+    def test_twelve_tribes_biblical_accuracy(self, tribes_df):
         """12지파 성경적 정확성 확인"""
-        tribes_data = pd.read_csv(test_data_path / "ch01_tribes.csv", encoding='utf-8')
+        tribes_data = tribes_df
         
         # 성경에 기록된 순서대로 확인 (창세기 29-30, 35장 기준)
         biblical_order = [
@@ -245,9 +241,9 @@ class TestBiblicalAccuracy:
             assert actual_mother == mother, f"{name}의 어머니가 {actual_mother}입니다. {mother}여야 합니다."
             assert actual_order == order, f"{name}의 출생순서가 {actual_order}입니다. {order}여야 합니다."
             
-    def test_john_gospel_theological_accuracy(self, test_data_path):
+    def test_john_gospel_theological_accuracy(self, john_df):
         """요한복음 신학적 정확성 확인"""
-        john_data = pd.read_csv(test_data_path / "ch01_john_concepts.csv", encoding='utf-8')
+        john_data = john_df
         
         # 요한복음 1장의 신학적 중요도 검증
         word_importance = john_data[john_data['concept'] == 'Word']['theological_importance'].iloc[0]
@@ -276,23 +272,42 @@ class TestDataPerformance:
             assert load_time < performance_threshold['data_load_time'], \
                 f"{csv_file.name} 로딩이 {load_time:.2f}초 걸렸습니다. {performance_threshold['data_load_time']}초 이내여야 합니다."
                 
-    def test_data_memory_usage(self, test_data_path):
+    def test_data_memory_usage(self, example_csvs):
         """데이터 메모리 사용량 테스트"""
-        csv_files = list(test_data_path.glob("*.csv"))
-        
         total_memory = 0
-        for csv_file in csv_files:
-            df = pd.read_csv(csv_file, encoding='utf-8')
+        for name, df in example_csvs.items():
             memory_usage = df.memory_usage(deep=True).sum()
             total_memory += memory_usage
             
             # 개별 파일이 10MB를 초과하지 않아야 함 (예시 데이터이므로)
             assert memory_usage < 10 * 1024 * 1024, \
-                f"{csv_file.name}이 {memory_usage / (1024*1024):.1f}MB를 사용합니다. 10MB 이하여야 합니다."
+                f"{name}이 {memory_usage / (1024*1024):.1f}MB를 사용합니다. 10MB 이하여야 합니다."
         
         # 전체 메모리 사용량이 50MB를 초과하지 않아야 함
         assert total_memory < 50 * 1024 * 1024, \
             f"전체 데이터가 {total_memory / (1024*1024):.1f}MB를 사용합니다. 50MB 이하여야 합니다."
 
+class TestFixtureIsolation:
+    """세션 데이터 fixture의 테스트별 복사본 격리 테스트"""
+
+    def test_mutation_does_not_leak(self, tribes_df, _example_frames, sample_tribes_data, _sample_tribes):
+        """복사본을 수정해도 세션 원본(다음 테스트가 받을 데이터)은 그대로"""
+        original_order = _example_frames["ch01_tribes.csv"]['birth_order'].tolist()
+
+        tribes_df.loc[0, 'birth_order'] = 99
+        tribes_df['new_column'] = 1
+        sample_tribes_data.sort_values('name', ascending=False, inplace=True)
+        sample_tribes_data.iloc[0, 0] = 'Changed'
+
+        assert _example_frames["ch01_tribes.csv"]['birth_order'].tolist() == original_order
+        assert 'new_column' not in _example_frames["ch01_tribes.csv"].columns
+        assert _sample_tribes['name'].tolist() == ['Reuben', 'Simeon', 'Levi', 'Judah']
+
+    def test_copies_do_not_share_data(self, john_df, _example_frames):
+        """전역 copy-on-write 없이도 격리되도록 데이터까지 복사"""
+        assert not np.shares_memory(john_df['frequency_ch1'].to_numpy(),
+                                    _example_frames["ch01_john_concepts.csv"]['frequency_ch1'].to_numpy())
+        assert pd.get_option("mode.copy_on_write") is False, "테스트 프로세스 전체의 pandas 동작을 바꾸지 않음"
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -0,0 +1,198 @@
+"""
+챕터 일괄 실행기 테스트
+"모든 것을 적당하게 하고 질서대로 하라" (고전 14:40)
+"""
+
+import builtins
+import json
+
+import pytest
+
+import run_chapters
+
+
+class TestDiscovery:
+    """챕터 진입점 탐색 테스트"""
+
+    def test_discovers_chapter_entry_points(self):
+        """run_chapterNN이 정의된 챕터만 찾음"""
+        chapters = run_chapters.discover_chapters()
+
+        assert chapters[0] == '01'
+        assert '09' in chapters
+        assert '21' not in chapters  # ch21/__main__.py에는 진입점이 없음
+        assert chapters == sorted(chapters)
+
+    def test_normalize_chapter(self):
+        """챕터 번호 표기 정규화"""
+        assert [run_chapters._normalize_chapter(c) for c in (1, '9', 'ch37', '01')] == ['01', '09', '37', '01']
+
+    def test_unknown_chapter(self):
+        """진입점이 없는 챕터는 ValueError"""
+        with pytest.raises(ValueError):
+            run_chapters.run_chapters(['21'])
+
+    def test_batch_default_follows_config_and_env(self, monkeypatch):
+        """배치 기본값: 환경 변수 > config.yml의 debug.verbose_analysis"""
+        from utils.bible_utils import load_config
+
+        monkeypatch.delenv('JESUSBORND_QUIET', raising=False)
+        assert run_chapters.batch_quiet_default() == (not load_config()['debug']['verbose_analysis'])
+
+        monkeypatch.setenv('JESUSBORND_QUIET', '0')
+        assert run_chapters.batch_quiet_default() is False
+
+
+class TestHeadlessRun:
+    """비대화형 실행 테스트"""
+
+    def test_run_chapter_without_input(self, tmp_path, monkeypatch):
+        """input()을 부르는 챕터도 멈추지 않고 결과와 로그를 남김"""
+        def guard(*args):
+            pytest.fail("input()이 호출되었습니다.")
+
+        monkeypatch.setattr(builtins, 'input', guard)
+
+        run = run_chapters.run_chapter('01', log_dir=tmp_path / 'logs', output_dir=tmp_path / 'out')
+
+        assert run.status == 'ok', run.error
+        assert run.results['chapter'] == '01'
+        assert run.results['personal_analysis'] is not None  # user_name 전달
+        assert run.wall_time > 0
+        assert (tmp_path / 'logs' / 'ch01.log').read_text(encoding='utf-8')
+        assert builtins.input is guard  # 실행 후 원래 input() 복원
+
+    def test_quiet_run_logs_json_events(self, tmp_path):
+        """조용한 모드에서는 챕터 출력 대신 단계별 JSON 이벤트만 로그에 남김"""
+        run = run_chapters.run_chapter('09', log_dir=tmp_path, output_dir=tmp_path, quiet=True)
+
+        assert run.status == 'ok', run.error
+        events = [json.loads(line) for line in (tmp_path / 'ch09.log').read_text(encoding='utf-8').splitlines()]
+        steps = [event['step'] for event in events]
+        assert 'PlaguesAggregationAnalyzer.analyze_summary_statistics' in steps
+        assert steps[-1] == 'run_chapter09'
+
+    @pytest.mark.parametrize('chapter', ['07', '16', '31'])
+    def test_quiet_run_never_formats_frames(self, chapter, tmp_path, monkeypatch):
+        """조용한 모드에서는 챕터가 DataFrame/Series를 문자열로 렌더링하지 않음"""
+        import pandas as pd
+
+        rendered = []
+        for cls in (pd.DataFrame, pd.Series):
+            original = cls.to_string
+            monkeypatch.setattr(cls, 'to_string', lambda self, *a, _original=original, **k:
+                                rendered.append(type(self).__name__) or _original(self, *a, **k))
+
+        run = run_chapters.run_chapter(chapter, log_dir=tmp_path, output_dir=tmp_path, quiet=True)
+
+        assert run.status == 'ok', run.error
+        assert rendered == []
+
+    def test_instrumented_run_records_steps(self, tmp_path):
+        """계측 실행은 analyze_* 단계별 시간/메모리/행 수를 결과에 담음"""
+        run = run_chapters.run_chapter('09', log_dir=tmp_path, output_dir=tmp_path, instrument=True)
+
+        assert run.status == 'ok', run.error
+        steps = {step['step']: step for step in run.steps}
+        summary = steps['PlaguesAggregationAnalyzer.analyze_summary_statistics']
+        assert summary['rows_in'] == 3
+        assert summary['alloc_bytes'] > 0
+
+        run_chapters.save_steps({'09': run}, tmp_path / 'steps.csv')
+        assert '09,PlaguesAggregationAnalyzer.analyze_summary_statistics' in (tmp_path / 'steps.csv').read_text(encoding='utf-8')
+
+    @pytest.mark.slow
+    def test_run_chapters_in_pool(self, tmp_path, monkeypatch):
+        """프로세스 풀에서 여러 챕터를 실행하고 챕터별 시간/메모리 보고"""
+        monkeypatch.setattr(run_chapters, 'RESULT_CACHE_DIR', tmp_path / "cache")
+        runs = run_chapters.run_chapters([9, 'ch10'], workers=2, output_dir=tmp_path)
+
+        assert list(runs) == ['09', '10']
+        for run in runs.values():
+            assert run.status == 'ok', run.error
+            assert isinstance(run.results, dict)
+            assert run.peak_rss_mb is None or run.peak_rss_mb > 0
+            assert run.summary()['result_keys']
+            assert not run.cached
+
+        assert run_chapters.load_cached_run('09', run_chapters.chapter_cache_key('09')) is not None
+
+
+class TestResultCache:
+    """챕터 결과 캐시 테스트"""
+
+    @pytest.fixture
+    def fake_project(self, tmp_path, monkeypatch):
+        """설정/데이터/utils와 챕터 두 개를 가진 임시 프로젝트 (ch01만 bible_utils로 데이터를 읽음)"""
+        (tmp_path / "config.yml").write_text("project: test\n", encoding='utf-8')
+        (tmp_path / "data" / "examples").mkdir(parents=True)
+        (tmp_path / "data" / "examples" / "ch01_tribes.csv").write_text("name\nReuben\n", encoding='utf-8')
+        (tmp_path / "utils").mkdir()
+        for name in ('__init__', 'bible_utils', 'synthetic'):
+            (tmp_path / "utils" / f"{name}.py").write_text("", encoding='utf-8')
+
+        imports = {'01': "from utils import bible_utils\nfrom .analysis import x\n",
+                   '02': "from utils.synthetic import *\n"}
+        for chapter in ('01', '02'):
+            (tmp_path / "chapters" / f"ch{chapter}").mkdir(parents=True)
+            (tmp_path / "chapters" / f"ch{chapter}" / "__init__.py").write_text("", encoding='utf-8')
+            (tmp_path / "chapters" / f"ch{chapter}" / "__main__.py").write_text(
+                imports[chapter] + f"def run_chapter{chapter}(interactive=True):\n    return {{}}\n",
+                encoding='utf-8')
+        (tmp_path / "chapters" / "__init__.py").write_text("", encoding='utf-8')
+        (tmp_path / "chapters" / "ch01" / "analysis.py").write_text("x = 1\n", encoding='utf-8')
+
+        monkeypatch.setattr(run_chapters, 'PROJECT_ROOT', tmp_path)
+        monkeypatch.setattr(run_chapters, 'CHAPTERS_DIR', tmp_path / "chapters")
+        return tmp_path
+
+    def _keys(self):
+        return {ch: run_chapters.chapter_cache_key(ch) for ch in ('01', '02')}
+
+    def test_key_tracks_imported_modules(self, fake_project):
+        """챕터가 임포트하는 모듈이 바뀌면 그 챕터의 키만 바뀌고, 임포트되지 않는 파일은 무관"""
+        before = self._keys()
+
+        (fake_project / "chapters" / "ch01" / "analysis.py").write_text("x = 2\n", encoding='utf-8')
+        after = self._keys()
+        assert after['01'] != before['01']
+        assert after['02'] == before['02']
+
+        (fake_project / "chapters" / "ch02" / "scratch.py").write_text("y = 1\n", encoding='utf-8')
+        (fake_project / "utils" / "synthetic.py").write_text("z = 1\n", encoding='utf-8')
+        latest = self._keys()
+        assert latest['01'] == after['01']  # ch01은 utils.synthetic을 쓰지 않음
+        assert latest['02'] != after['02']
+
+    def test_key_tracks_data_through_bible_utils(self, fake_project):
+        """설정이나 데이터가 바뀌면 bible_utils로 읽는 챕터의 키만 바뀜"""
+        before = self._keys()
+
+        (fake_project / "data" / "examples" / "ch01_tribes.csv").write_text("name\nSimeon\n", encoding='utf-8')
+        after_data = self._keys()
+        (fake_project / "config.yml").write_text("project: changed\n", encoding='utf-8')
+        after_config = self._keys()
+
+        assert len({before['01'], after_data['01'], after_config['01']}) == 3
+        assert before['02'] == after_data['02'] == after_config['02']
+
+    def test_cached_chapters_are_not_rerun(self, tmp_path, monkeypatch):
+        """캐시가 있으면 프로세스 풀 없이 저장된 결과를 반환"""
+        monkeypatch.setattr(run_chapters, 'RESULT_CACHE_DIR', tmp_path / "cache")
+        key = run_chapters.chapter_cache_key('09')
+        run_chapters.save_cached_run(
+            run_chapters.ChapterRun('09', 'ok', 1.0, 100.0, results={'chapter': '09'}), key)
+
+        monkeypatch.setattr(run_chapters, 'ProcessPoolExecutor',
+                            lambda *a, **k: pytest.fail("캐시된 챕터를 다시 실행했습니다."))
+        runs = run_chapters.run_chapters(['09'])
+
+        assert runs['09'].cached
+        assert runs['09'].results == {'chapter': '09'}
+
+    def test_failed_runs_are_not_cached(self, tmp_path, monkeypatch):
+        """실패한 실행은 캐시하지 않음"""
+        monkeypatch.setattr(run_chapters, 'RESULT_CACHE_DIR', tmp_path / "cache")
+        run_chapters.save_cached_run(run_chapters.ChapterRun('09', 'error', 1.0, None, error='boom'), 'k' * 64)
+
+        assert run_chapters.load_cached_run('09', 'k' * 64) is None
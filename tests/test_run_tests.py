@@ -0,0 +1,46 @@
+"""
+테스트 실행기 테스트
+"모든 것을 시험하여 좋은 것을 취하고" (살전 5:21)
+"""
+
+from tests import run_tests
+
+
+class TestSharding:
+    """테스트 샤딩 테스트"""
+
+    NODE_IDS = (
+        [f"tests/test_utils.py::test_{i}" for i in range(6)]
+        + [f"tests/test_build.py::test_{i}" for i in range(3)]
+        + [f"tests/chapters/test_ch01.py::test_{i}" for i in range(3)]
+        + ["tests/test_run_chapters.py::test_0"]
+    )
+
+    def test_files_stay_together(self):
+        """같은 파일의 테스트는 한 샤드에 모임 (세션/모듈 fixture 재사용)"""
+        shards = run_tests.shard_tests(self.NODE_IDS, workers=3)
+
+        assert sorted(node for shard in shards for node in shard) == sorted(self.NODE_IDS)
+        shard_of_file = {}
+        for index, shard in enumerate(shards):
+            for node in shard:
+                assert shard_of_file.setdefault(node.split("::")[0], index) == index
+
+    def test_balanced_and_ordered(self):
+        """큰 파일부터 가장 작은 샤드에 배정하고 샤드 안에서는 수집 순서 유지"""
+        shards = run_tests.shard_tests(self.NODE_IDS, workers=2)
+
+        assert sorted(map(len, shards)) == [6, 7]
+        for shard in shards:
+            assert shard == [node for node in self.NODE_IDS if node in shard]
+
+    def test_more_workers_than_files(self):
+        """워커가 파일보다 많으면 파일 수만큼만 샤드"""
+        assert len(run_tests.shard_tests(self.NODE_IDS, workers=16)) == 4
+        assert run_tests.shard_tests([], workers=4) == []
+
+    def test_all_selection_deduplicated(self):
+        """'all' 모드는 겹치는 경로를 한 번의 수집으로 실행 (tests/가 나머지를 포함)"""
+        paths, markexpr = run_tests.SELECTIONS['all']
+        assert "tests/" in paths and markexpr is None
+        assert run_tests.SELECTIONS['fast'][1] == "not slow"
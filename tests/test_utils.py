@@ -5,9 +5,13 @@
 
 import pytest
 import pandas as pd
+import numpy as np
 import time
+import json
+import sys
 from pathlib import Path
-from utils import bible_utils
+import utils
+from utils import bible_utils, data_io, instrumentation, reporting, synthetic, translation_store, word_index
 
 from utils.bible_utils import (
     load_config,
@@ -37,6 +41,56 @@ class TestDataLoading:
         assert config['project']['name'] == "JesusBornd Pandas Edition"
         assert 'version' in config['project']
         
+    def test_load_config_cached(self, tmp_path, monkeypatch, config_path):
+        """설정은 캐시되고 파일이 바뀔 때만 다시 읽음"""
+        import os
+        fake_config = tmp_path / "config.yml"
+        fake_config.write_text(config_path.read_text(encoding='utf-8'), encoding='utf-8')
+        monkeypatch.setattr(bible_utils, 'PROJECT_ROOT', tmp_path)
+
+        first = load_config()
+        assert load_config() is first
+
+        fake_config.write_text("analysis:\n  patterns:\n    leah_stages: [a, b]\n", encoding='utf-8')
+        stat = fake_config.stat()
+        os.utime(fake_config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert bible_utils.get_analysis_patterns().leah_stages == ('a', 'b')
+        reloaded = bible_utils.reload_config()
+        assert reloaded is not first and load_config() is reloaded
+
+    def test_config_is_read_only(self):
+        """공유 설정은 수정할 수 없음"""
+        import copy
+        import pickle
+        config = load_config()
+
+        with pytest.raises(TypeError):
+            config['project'] = {}
+        with pytest.raises(TypeError):
+            config['analysis']['patterns'].update({})
+        with pytest.raises(TypeError):
+            config['visualization']['figure_size'].append(1)
+        with pytest.raises(TypeError):
+            config['visualization']['figure_size'][0] = 1
+
+        # 리스트 값은 읽기 전용이어도 YAML의 리스트와 같게 비교됨
+        assert config['visualization']['figure_size'] == [10, 6]
+        assert isinstance(config['visualization']['figure_size'], list)
+
+        editable = copy.deepcopy(config)
+        editable['project'] = {}
+        editable['visualization']['figure_size'].append(1)
+        assert type(editable['visualization']['figure_size']) is list
+        assert pickle.loads(pickle.dumps(config)) == config
+
+    def test_get_analysis_patterns(self):
+        """analysis.patterns 타입 접근자"""
+        patterns = bible_utils.get_analysis_patterns()
+
+        assert patterns.leah_stages == ('관계', '소통', '연합', '예배')
+        assert '빛' in patterns.john_contrasts
+
     def test_load_twelve_tribes(self, biblical_assertions):
         """12지파 데이터 로드 테스트"""
         tribes_df = load_twelve_tribes()
@@ -85,12 +139,297 @@ class TestDataLoading:
         assert load_time < performance_threshold['data_load_time'], \
             f"데이터 로드 시간이 {load_time:.2f}초입니다. {performance_threshold['data_load_time']}초 이내여야 합니다."
 
+class TestCorpusCache:
+    """KJV 말뭉치 캐시 테스트"""
+
+    def test_load_bible_parses_once(self, sample_bible_root, monkeypatch):
+        """같은 프로세스에서는 CSV를 한 번만 파싱"""
+        first = bible_utils.load_bible()
+
+        def fail_read_csv(*args, **kwargs):
+            raise AssertionError("캐시된 말뭉치를 다시 파싱했습니다.")
+
+        monkeypatch.setattr(bible_utils.pd, 'read_csv', fail_read_csv)
+        assert bible_utils.load_bible() is first
+        assert first['book'].dtype == 'category'
+
+    def test_load_corpus_shares_cache(self, sample_bible_root):
+        """공개 load_corpus()는 load_bible()/get_bible_index()와 같은 캐시 객체를 반환"""
+        df, index = bible_utils.load_corpus()
+
+        assert df is bible_utils.load_bible()
+        assert index is bible_utils.get_bible_index()
+        assert utils.load_corpus is bible_utils.load_corpus
+
+    def test_cold_start_uses_sidecar(self, sample_bible_root, monkeypatch):
+        """캐시를 비운 뒤에도 Parquet 사이드카에서 로드"""
+        pytest.importorskip("pyarrow")
+        original = bible_utils.load_bible()
+        assert (sample_bible_root / "data" / "processed" / "bible_KJV.parquet").exists()
+
+        bible_utils.clear_corpus_cache()
+        monkeypatch.setattr(bible_utils.pd, 'read_csv', lambda *a, **k: pytest.fail("CSV를 다시 파싱했습니다."))
+        reloaded = bible_utils.load_bible()
+
+        pd.testing.assert_frame_equal(reloaded, original)
+
+    def test_format_version_change_invalidates_sidecar(self, sample_bible_root, monkeypatch):
+        """스탬프의 형식 버전이 다르면 (예: 정렬 이전 사이드카) 사이드카를 버리고 다시 파싱"""
+        pytest.importorskip("pyarrow")
+        bible_utils.load_bible()
+        stamp_path = sample_bible_root / "data" / "processed" / "bible_KJV.json"
+        stamp = json.loads(stamp_path.read_text(encoding='utf-8'))
+        assert stamp['format_version'] == bible_utils._CORPUS_FORMAT_VERSION
+
+        stamp['format_version'] = bible_utils._CORPUS_FORMAT_VERSION - 1
+        stamp_path.write_text(json.dumps(stamp), encoding='utf-8')
+        bible_utils.clear_corpus_cache()
+        parsed = []
+        monkeypatch.setattr(bible_utils, 'parse_bible_csv',
+                            lambda path, parse=bible_utils.parse_bible_csv: parsed.append(path) or parse(path))
+
+        assert len(bible_utils.load_bible()) == 13
+        assert len(parsed) == 1
+        assert json.loads(stamp_path.read_text(encoding='utf-8'))['format_version'] == bible_utils._CORPUS_FORMAT_VERSION
+
+    def test_source_change_invalidates_cache(self, sample_bible_root):
+        """원본 CSV가 바뀌면 캐시와 사이드카를 새로 만듦"""
+        assert len(bible_utils.load_bible()) == 13
+
+        csv_path = sample_bible_root / "data" / "raw" / "bible_KJV.csv"
+        with open(csv_path, 'a', encoding='utf-8') as f:
+            f.write("John,1,29,Behold the Lamb of God.\n")
+
+        bible_utils.clear_corpus_cache()
+        assert len(bible_utils.load_bible()) == 14
+
+    def test_load_exodus_is_slice(self, sample_bible_root):
+        """출애굽기는 공백/대소문자와 무관하게 연속 슬라이스로 반환"""
+        exodus = bible_utils.load_exodus()
+
+        assert len(exodus) == 6
+        assert set(exodus['book'].astype(str)) == {'Exodus'}
+        assert exodus['text'].iloc[0].startswith("Now these are the names")
+
+class TestIterVerses:
+    """스트리밍 구절 읽기 테스트"""
+
+    def test_streams_whole_corpus_in_chunks(self, sample_bible_root):
+        """chunksize 단위로 나누어 읽고 합치면 전체 구절"""
+        chunks = list(bible_utils.iter_verses(chunksize=4))
+
+        assert [len(chunk) for chunk in chunks] == [4, 4, 4, 1]
+        combined = pd.concat(chunks)
+        assert list(combined.columns) == ['book', 'chapter', 'verse', 'text']
+        assert combined['chapter'].dtype == 'int16'
+
+    def test_book_filter_and_columns(self, sample_bible_root):
+        """책 필터는 공백/대소문자를 무시하고, 요청한 컬럼만 반환"""
+        chunks = list(bible_utils.iter_verses(books=['exodus'], columns=['chapter', 'verse'], chunksize=3))
+
+        combined = pd.concat(chunks)
+        assert list(combined.columns) == ['chapter', 'verse']
+        assert len(combined) == 6
+        assert all(not chunk.empty for chunk in chunks)
+
+    def test_as_tuples(self, sample_bible_root):
+        """as_tuples=True이면 구절 튜플을 하나씩 반환"""
+        verses = list(bible_utils.iter_verses(books=['John'], columns=['verse', 'text'], as_tuples=True))
+
+        assert len(verses) == 5
+        assert verses[0].verse == 1
+        assert verses[0].text.startswith("In the beginning was the Word")
+
+    def test_unknown_column(self, sample_bible_root):
+        """없는 컬럼 요청은 ValueError"""
+        with pytest.raises(ValueError):
+            next(bible_utils.iter_verses(columns=['testament']))
+
+class TestTranslationStore:
+    """다중 번역본 정렬 저장소 테스트"""
+
+    @pytest.fixture
+    def two_translations(self, sample_bible_root):
+        """KJV 샘플 + 일부 구절만 있는 한글 번역본"""
+        rows = [
+            ('John', 1, 1, '태초에 말씀이 계시니라'),
+            ('john ', 1, 5, '빛이 어둠에 비치되 어둠이 깨닫지 못하더라'),
+            ('John', 1, 6, '하나님께로부터 보내심을 받은 사람이 있으니'),
+        ]
+        pd.DataFrame(rows, columns=['book', 'chapter', 'verse', 'text']).to_csv(
+            sample_bible_root / "data" / "raw" / "bible_개역개정.csv", index=False, encoding='utf-8'
+        )
+        translation_store._STORE_CACHE.clear()
+        yield ['개역개정', 'KJV']
+        translation_store._STORE_CACHE.clear()
+
+    def test_verses_are_aligned(self, two_translations):
+        """두 번역본이 하나의 키 배열에 맞춰 정렬되고 없는 구절은 None"""
+        store = translation_store.get_translation_store(two_translations)
+
+        assert store.translations == two_translations
+        assert len(store) == 14  # KJV 13절 + 한글에만 있는 요 1:6
+        assert isinstance(store.keys, np.memmap)
+
+        verse = store.get_verse('John', 1, 1)
+        assert verse['개역개정'] == '태초에 말씀이 계시니라'
+        assert verse['KJV'].startswith('In the beginning was the Word')
+        assert store.get_verse('John', 1, 6)['KJV'] is None
+        assert store.get_verse('Exodus', 3, 14)['개역개정'] is None
+
+    def test_parallel_passage(self, two_translations):
+        """구간 조회는 번역본별 열로 나란히 반환"""
+        store = translation_store.get_translation_store(two_translations)
+        passage = store.get_passage('john', 1, 4, 1, 6, translations=['KJV', '개역개정'])
+
+        assert list(passage.columns) == ['book', 'chapter', 'verse', 'KJV', '개역개정']
+        assert passage['verse'].tolist() == [4, 5, 6]
+        assert passage['개역개정'].iloc[1].startswith('빛이 어둠에')
+
+    def test_store_reused_until_source_changes(self, two_translations, sample_bible_root, monkeypatch):
+        """원본이 그대로면 저장소를 재사용하고, 바뀌면 다시 생성"""
+        store = translation_store.get_translation_store(two_translations)
+        translation_store._STORE_CACHE.clear()
+
+        with monkeypatch.context() as m:
+            m.setattr(translation_store, 'parse_bible_csv', lambda *a: pytest.fail("다시 파싱했습니다."))
+            assert len(translation_store.get_translation_store(two_translations)) == len(store)
+
+        with open(sample_bible_root / "data" / "raw" / "bible_KJV.csv", 'a', encoding='utf-8') as f:
+            f.write("John,1,29,Behold the Lamb of God.\n")
+        rebuilt = translation_store.get_translation_store(two_translations)
+        assert len(rebuilt) == 15
+        assert store.get_verse('John', 1, 1)['KJV'].startswith('In the beginning')  # 이전 매핑도 유효
+
+    def test_failed_rebuild_invalidates_store(self, two_translations, sample_bible_root, monkeypatch):
+        """다시 만들다 실패하면 이전 매니페스트가 남지 않아 섞인 저장소를 재사용하지 않음"""
+        translation_store.get_translation_store(two_translations)
+        store_dir = translation_store._store_dir()
+        assert translation_store._store_is_current(store_dir, two_translations)
+
+        parse = translation_store.parse_bible_csv
+
+        def fail_on_kjv(path):
+            if path.stem == 'bible_KJV':
+                raise OSError("읽기 실패")
+            return parse(path)
+
+        monkeypatch.setattr(translation_store, 'parse_bible_csv', fail_on_kjv)
+        with pytest.raises(OSError):
+            translation_store.build_translation_store(two_translations, store_dir)  # 개역개정 파일만 교체됨
+
+        assert not (store_dir / 'manifest.json').exists()
+        assert not translation_store._store_is_current(store_dir, two_translations)
+
+    def test_books_aligned_across_languages(self, two_translations, sample_bible_root):
+        """한글 책 이름('요한복음')도 영문('John')과 같은 책으로 정렬되고 어느 이름으로도 조회됨"""
+        pd.DataFrame([('요한복음', 1, 1, '태초에 말씀이 계시니라'), ('출애굽기', 3, 14, '나는 스스로 있는 자이니라')],
+                     columns=['book', 'chapter', 'verse', 'text']).to_csv(
+            sample_bible_root / "data" / "raw" / "bible_개역개정.csv", index=False, encoding='utf-8'
+        )
+        store = translation_store.get_translation_store(['KJV', '개역개정'])
+
+        assert len(store) == 13
+        assert store.get_verse('John', 1, 1)['개역개정'] == '태초에 말씀이 계시니라'
+        assert store.get_verse('출애굽기', 3, 14)['KJV'] is not None
+        assert store.get_passage('요한복음', 1, 1, 1, 1)['book'].tolist() == ['John']
+
+    def test_translation_without_shared_books(self, two_translations, sample_bible_root):
+        """다른 번역본과 맞는 책이 하나도 없으면 따로 떨어진 저장소 대신 ValueError"""
+        pd.DataFrame([('Jean', 1, 1, 'Au commencement était la Parole')],
+                     columns=['book', 'chapter', 'verse', 'text']).to_csv(
+            sample_bible_root / "data" / "raw" / "bible_LSG.csv", index=False, encoding='utf-8'
+        )
+        with pytest.raises(ValueError, match='LSG'):
+            translation_store.build_translation_store(['KJV', 'LSG'])
+
+    def test_unknown_translation(self, two_translations):
+        """저장되지 않은 번역본 요청은 KeyError"""
+        store = translation_store.get_translation_store(two_translations)
+        with pytest.raises(KeyError):
+            store.get_verse('John', 1, 1, translations=['ESV'])
+
+class TestBibleIndex:
+    """(book, chapter, verse) 인덱스 테스트"""
+
+    def test_get_passage_range(self, sample_bible_root):
+        """출 3:1-22 구간 조회"""
+        passage = bible_utils.get_passage("Exodus", 3, 1, 3, 22)
+
+        assert passage['verse'].tolist() == [1, 2, 14]
+        assert (passage['chapter'] == 3).all()
+
+    def test_get_passage_defaults(self, sample_bible_root):
+        """절을 생략하면 장 전체, 여러 장에 걸친 구간도 지원"""
+        assert bible_utils.get_passage("john", 1)['verse'].tolist() == [1, 4, 5, 14, 17]
+        assert len(bible_utils.get_passage(" EXODUS ", 1, 7, 3, 2)) == 3
+        assert bible_utils.get_passage("Exodus", 4).empty
+
+    def test_chapter_offsets(self, sample_bible_root):
+        """책/장별 행 오프셋이 실제 행과 일치"""
+        df = bible_utils.load_bible()
+        index = bible_utils.get_bible_index()
+
+        start, stop = index.chapter_range("Exodus", 3)
+        assert (df['chapter'].iloc[start:stop] == 3).all()
+        assert stop - start == 3
+
+        start, stop = index.book_range("Genesis")
+        assert (start, stop) == (0, 2)
+
+    def test_unknown_book(self, sample_bible_root):
+        """없는 책은 KeyError"""
+        with pytest.raises(KeyError):
+            bible_utils.get_passage("Maccabees", 1)
+
+class TestWordIndex:
+    """단어 역색인 및 빈도 계산 테스트"""
+
+    def test_tokenize(self):
+        """소문자 단어 토큰 분리"""
+        assert word_index.tokenize("Let there be light: and the LORD's light.") == \
+            ['let', 'there', 'be', 'light', 'and', 'the', "lord's", 'light']
+
+    def test_postings(self, sample_bible_root):
+        """단어 → 구절 포스팅은 int32 배열"""
+        index = word_index.get_word_index()
+        rows, counts = index.postings_for('Light')
+
+        assert rows.dtype == np.int32 and counts.dtype == np.int32
+        texts = bible_utils.load_bible()['text'].iloc[rows].str.lower()
+        assert all('light' in text for text in texts)
+        assert counts.sum() == 5
+        assert len(index.postings_for('없는단어')[0]) == 0
+
+    def test_term_frequency(self, sample_bible_root):
+        """장별 빈도를 한 번에 계산"""
+        freq = word_index.term_frequency(['Light', 'Darkness', 'Word'], 'John')
+
+        assert freq.index.tolist() == [1]
+        assert freq.loc[1].to_dict() == {'Light': 2, 'Darkness': 2, 'Word': 4}
+
+    def test_term_frequency_chapters_and_forms(self, sample_bible_root):
+        """요청한 장은 빈도 0이어도 포함, 개념별 여러 형태 합산"""
+        freq = word_index.term_frequency({'Israel': ['israel'], 'Moses': ['moses']},
+                                         'Exodus', chapters=[1, 2, 3])
+
+        assert freq.index.tolist() == [1, 2, 3]
+        assert freq['Israel'].tolist() == [2, 0, 0]
+        assert freq['Moses'].tolist() == [0, 0, 2]
+
+    def test_chapter_analyses(self, sample_bible_root):
+        """장별 빛/어둠, 은혜/진리 분석"""
+        light = word_index.analyze_light_darkness_by_chapter('John')
+        grace = word_index.get_grace_truth_balance_by_chapter('John')
+
+        assert light.loc[1, 'ratio'] == 1.0
+        assert bool(grace.loc[1, 'is_balanced'])
+
 class TestBiblicalAnalysis:
     """성경적 분석 기능 테스트"""
     
-    def test_calculate_leah_spiritual_journey(self, biblical_assertions):
+    def test_calculate_leah_spiritual_journey(self, biblical_assertions, tribes_df):
         """레아 신앙 여정 분석 테스트"""
-        tribes_df = load_twelve_tribes()
         result = calculate_leah_spiritual_journey(tribes_df)
         
         # 결과 구조 확인
@@ -109,9 +448,8 @@ class TestBiblicalAnalysis:
         expected = ['관계', '소통', '연합', '예배']
         assert result['expected_pattern'] == expected, "예상 패턴이 올바르지 않습니다."
         
-    def test_analyze_light_darkness_ratio(self, biblical_assertions):
+    def test_analyze_light_darkness_ratio(self, biblical_assertions, john_df):
         """빛과 어둠 분석 테스트"""
-        john_df = load_john_concepts()
         result = analyze_light_darkness_ratio(john_df)
         
         # 결과 구조 확인
@@ -130,9 +468,8 @@ class TestBiblicalAnalysis:
         expected_ratio = result['light_frequency'] / result['darkness_frequency']
         assert abs(result['ratio'] - expected_ratio) < 0.01, "비율 계산이 잘못되었습니다."
         
-    def test_get_grace_truth_balance(self, biblical_assertions):
+    def test_get_grace_truth_balance(self, biblical_assertions, john_df):
         """은혜와 진리 균형 테스트"""
-        john_df = load_john_concepts()
         result = get_grace_truth_balance(john_df)
         
         # 결과 구조 확인
@@ -176,6 +513,24 @@ class TestLookupFunctions:
         info = get_greek_concept_info('존재하지않는헬라어')
         assert info is None, "존재하지 않는 헬라어에 대해 None을 반환해야 합니다."
 
+    def test_bulk_lookups(self, tribes_df):
+        """Series 단위 일괄 조회"""
+        meanings = bible_utils.get_hebrew_meanings(tribes_df['hebrew'])
+        assert meanings.tolist() == tribes_df['korean_meaning'].tolist()
+
+        words = pd.Series(['λόγος', '존재하지않는헬라어'], index=['a', 'b'])
+        info = bible_utils.get_greek_concepts_info(words)
+        assert info.loc['a', 'korean_name'] == '말씀'
+        assert info.loc['b'].isna().all()
+        assert info.loc['a', 'frequency'] == get_greek_concept_info('λόγος')['frequency']
+
+    def test_lookup_reads_csv_once(self, monkeypatch):
+        """조회 테이블은 캐시되어 CSV를 반복해서 읽지 않음"""
+        get_hebrew_meaning('יְהוּדָה')
+        monkeypatch.setattr(bible_utils, 'load_twelve_tribes',
+                            lambda: pytest.fail("조회마다 CSV를 다시 읽었습니다."))
+        assert get_hebrew_meaning('יְהוּדָה') == '찬송'
+
 class TestSpiritualMetrics:
     """영적 지표 클래스 테스트"""
     
@@ -219,6 +574,57 @@ class TestSpiritualMetrics:
         expected_matches = [True, False, True, True]
         assert result['matches'] == expected_matches, "부분 매칭 결과가 올바르지 않습니다."
 
+    def test_score_journeys_matches_single_user(self):
+        """일괄 채점 결과가 사용자별 단건 계산과 일치"""
+        journeys = {
+            'u1': ['관계', '소통', '연합', '예배'],
+            'u2': ['관계', '다른단계', '연합', '예배', '추가단계'],
+            'u3': ['소통'],
+        }
+        rows = [
+            {'user_id': user, 'stage_position': pos, 'stage': stage, 'growth': pos + 2}
+            for user, stages in journeys.items()
+            for pos, stage in reversed(list(enumerate(stages)))  # 순서가 섞여 있어도 처리
+        ]
+        scores = SpiritualMetrics.score_journeys(pd.DataFrame(rows))
+
+        for user, stages in journeys.items():
+            single = SpiritualMetrics.analyze_spiritual_pattern(stages)
+            growth = SpiritualMetrics.calculate_spiritual_growth_index(
+                [{'growth': pos + 2} for pos in range(len(stages))]
+            )
+            row = scores.loc[user]
+
+            assert row['match_rate'] == single['match_rate']
+            assert row['recommendation'] == single['recommendation']
+            assert [row[f'match_{i}'] for i in range(1, len(single['matches']) + 1)] == single['matches']
+            assert abs(row['growth_index'] - growth) < 1e-9
+
+    @pytest.mark.parametrize('leah_stages', [('관계', '소통', '연합'), ('관계', '소통', '연합', '예배', '찬양')])
+    def test_pattern_batch_parity_with_other_stage_counts(self, monkeypatch, leah_stages):
+        """레아 패턴이 4단계가 아니어도 단건과 일괄 분석이 같은 단계 수를 비교"""
+        monkeypatch.setattr(bible_utils, 'get_analysis_patterns',
+                            lambda: bible_utils.AnalysisPatterns(leah_stages=leah_stages, john_contrasts=()))
+        journeys = {
+            'u1': ['관계', '소통', '연합', '예배', '찬양', '추가단계'],
+            'u2': ['관계', '다른단계', '연합', '예배', '찬양'],
+            'u3': ['관계', '소통'],
+            'u4': ['다른단계'],
+        }
+        rows = [{'user_id': user, 'stage_position': pos, 'stage': stage}
+                for user, stages in journeys.items() for pos, stage in enumerate(stages)]
+        batch = SpiritualMetrics.analyze_spiritual_pattern_batch(pd.DataFrame(rows))
+
+        assert list(batch.columns) == [f'match_{i}' for i in range(1, len(leah_stages) + 1)] + \
+            ['match_rate', 'recommendation']
+        for user, stages in journeys.items():
+            single = SpiritualMetrics.analyze_spiritual_pattern(stages)
+            row = batch.loc[user]
+
+            assert row['match_rate'] == pytest.approx(single['match_rate'])
+            assert row['recommendation'] == single['recommendation']
+            assert [row[f'match_{i}'] for i in range(1, len(single['matches']) + 1)] == single['matches']
+
 class TestErrorHandling:
     """에러 처리 테스트"""
     
@@ -245,6 +651,441 @@ class TestErrorHandling:
         with pytest.raises((pd.errors.EmptyDataError, ValueError)):
             pd.read_csv(fake_csv)
 
+class TestFontCache:
+    """한글 폰트 탐색 캐시 테스트 (font_checker)"""
+
+    @pytest.fixture
+    def fake_fonts(self, tmp_path, monkeypatch):
+        """임시 폰트 디렉토리와 스캔 횟수를 세는 가짜 check_korean_fonts"""
+        import font_checker
+
+        font_dir = tmp_path / "fonts"
+        font_dir.mkdir()
+        font_file = font_dir / "NanumGothic.ttf"
+        font_file.write_bytes(b"")
+        scans = []
+
+        def fake_check():
+            scans.append(1)
+            return [('DejaVu Gothic', str(font_file)), ('NanumGothic', str(font_file))]
+
+        monkeypatch.setattr(font_checker, 'FONT_CACHE_PATH', tmp_path / "cache" / "korean_font.json")
+        monkeypatch.setattr(font_checker, '_font_directories', lambda: [str(font_dir)])
+        monkeypatch.setattr(font_checker, 'check_korean_fonts', fake_check)
+        return font_checker, font_dir, scans
+
+    def test_second_call_uses_cache(self, fake_fonts):
+        """두 번째 조회는 시스템 폰트를 다시 스캔하지 않음"""
+        font_checker, font_dir, scans = fake_fonts
+
+        first = font_checker.resolve_korean_font()
+        second = font_checker.resolve_korean_font()
+
+        assert first == second
+        assert first[0] == 'NanumGothic'  # 우선순위 폰트 선택
+        assert len(scans) == 1
+        assert font_checker.FONT_CACHE_PATH.exists()
+
+    def test_directory_change_invalidates_cache(self, fake_fonts):
+        """폰트 디렉토리가 바뀌면 다시 스캔"""
+        font_checker, font_dir, scans = fake_fonts
+
+        font_checker.resolve_korean_font()
+        (font_dir / "new-family").mkdir()
+        font_checker.resolve_korean_font()
+
+        assert len(scans) == 2
+
+    def test_rescan_ignores_cache(self, fake_fonts):
+        """rescan=True는 캐시를 무시"""
+        font_checker, font_dir, scans = fake_fonts
+
+        font_checker.resolve_korean_font()
+        font_checker.resolve_korean_font(rescan=True)
+
+        assert len(scans) == 2
+
+    def test_rescan_reuses_given_scan(self, fake_fonts):
+        """이미 스캔한 목록을 넘기면 다시 스캔하지 않고 캐시만 갱신"""
+        font_checker, font_dir, scans = fake_fonts
+
+        korean_fonts = font_checker.check_korean_fonts()
+        font = font_checker.resolve_korean_font(rescan=True, korean_fonts=korean_fonts)
+
+        assert font[0] == 'NanumGothic'
+        assert len(scans) == 1
+        assert font_checker.resolve_korean_font() == font
+        assert len(scans) == 1
+
+    def test_setup_rescans_unreadable_font(self, fake_fonts, monkeypatch):
+        """캐시된 폰트 파일을 등록할 수 없으면 다시 스캔하고, 다시 호출해도 sys.path는 늘지 않음"""
+        pytest.importorskip("matplotlib")
+        from utils import font_fixer
+        font_checker, font_dir, scans = fake_fonts
+        font_checker.resolve_korean_font()
+
+        failures = [OSError("깨진 폰트 파일")]
+
+        def flaky_addfont(path):
+            if failures:
+                raise failures.pop()
+
+        monkeypatch.setattr(font_fixer.fm.fontManager, 'addfont', flaky_addfont)
+        monkeypatch.setattr(font_fixer, 'save_matplotlib_config', lambda name: None)
+        monkeypatch.setattr(sys, 'path', list(sys.path))
+        monkeypatch.setattr(font_fixer.plt, 'rcParams', dict(font_fixer.plt.rcParams))
+
+        assert font_fixer.setup_korean_font() == 'NanumGothic'
+        assert len(scans) == 2
+        path_length = len(sys.path)
+        assert font_fixer.setup_korean_font() == 'NanumGothic'
+        assert len(sys.path) == path_length
+
+class TestReporting:
+    """조용한 모드와 구조화된 이벤트 테스트"""
+
+    def test_quiet_output_limits_rendering(self):
+        """조용한 모드에서는 표시 옵션으로 몇 행/열만 렌더링하고 출력도 버림 (pandas 클래스는 그대로)"""
+        import io
+        import contextlib
+
+        df = pd.DataFrame({f'c{i}': range(1000) for i in range(10)})
+        original_repr = pd.DataFrame.__repr__
+        original_max_rows = pd.get_option('display.max_rows')
+        captured = io.StringIO()
+        with contextlib.redirect_stdout(captured):
+            with reporting.quiet_output(events=io.StringIO()):
+                assert pd.DataFrame.__repr__ is original_repr
+                assert pd.get_option('display.max_rows') < len(df)
+                rendered = str(df)
+                assert len(rendered.splitlines()) < 10 and '...' in rendered
+                print("🙏 배너")
+
+        assert captured.getvalue() == ""
+        assert pd.get_option('display.max_rows') == original_max_rows  # 블록을 나오면 원래 옵션 복원
+        assert len(str(df).splitlines()) > len(rendered.splitlines())
+        assert not reporting.is_quiet()
+
+    def test_print_frame_skips_formatting_when_quiet(self, monkeypatch, capsys):
+        """조용한 모드의 print_frame/frame_preview는 to_string을 호출하지 않음"""
+        import io
+
+        df = pd.DataFrame({'x': range(1000)})
+        calls = []
+        original = pd.DataFrame.to_string
+        monkeypatch.setattr(pd.DataFrame, 'to_string',
+                            lambda self, *a, **k: calls.append(k) or original(self, *a, **k))
+
+        with reporting.quiet_output(events=io.StringIO()):
+            reporting.print_frame(df, index=False)
+            reporting.print_frame(df, full=True)
+            assert synthetic.frame_preview(df) == "<1,000행 x 1열>"
+        assert calls == []
+
+        reporting.print_frame(df.head(3), index=False)
+        assert calls == [{'index': False}]
+        assert capsys.readouterr().out.splitlines()[0].strip() == 'x'
+
+    def test_instrumented_methods_emit_json_events(self):
+        """감싼 메서드는 조용한 모드에서 step/rows/duration 이벤트를 남김"""
+        import io
+        import json
+
+        @reporting.instrument_class
+        class Analyzer:
+            def analyze_rows(self, n):
+                df = pd.DataFrame({'x': range(n)})
+                print(df)
+                return df
+
+            def _helper(self):
+                return 1
+
+        assert not hasattr(Analyzer._helper, '__reported_step__')
+
+        events = io.StringIO()
+        with reporting.quiet_output(events=events):
+            Analyzer().analyze_rows(5)
+
+        event = json.loads(events.getvalue().splitlines()[0])
+        assert event['step'] == 'Analyzer.analyze_rows'
+        assert event['rows'] == 5
+        assert event['duration'] >= 0
+
+    def test_no_events_in_normal_mode(self, capsys):
+        """일반 모드에서는 이벤트 없이 원래대로 출력"""
+        reporting.emit_event('step', rows=1)
+        assert capsys.readouterr().err == ""
+
+
+class TestInstrumentation:
+    """분석 단계 계측 테스트"""
+
+    def test_records_time_memory_and_rows(self):
+        """분석기 믹스인은 analyze_* 호출마다 시간/할당량/입출력 행 수를 기록"""
+        class Analyzer(instrumentation.InstrumentedAnalyzerMixin):
+            def __init__(self):
+                self.df = pd.DataFrame({'x': range(10)})
+
+            def analyze_big(self):
+                return pd.DataFrame({'y': np.arange(100_000)})
+
+            def analyze_filter(self, df):
+                return df[df['x'] > 4]
+
+            def run_all_analyses(self):
+                self.analyze_big()
+                return self.analyze_filter(self.df)
+
+            def helper(self):
+                return None
+
+        assert getattr(Analyzer.analyze_big, '__instrumented__', False)
+        assert not hasattr(Analyzer.helper, '__instrumented__')
+
+        with instrumentation.instrumented_run() as registry:
+            Analyzer().run_all_analyses()
+
+        records = {record.step: record for record in registry.records}
+        assert list(records) == ['Analyzer.analyze_big', 'Analyzer.analyze_filter', 'Analyzer.run_all_analyses']
+
+        big = records['Analyzer.analyze_big']
+        assert big.alloc_bytes >= 100_000 * 8
+        assert (big.rows_in, big.rows_out) == (10, 100_000)
+        assert (records['Analyzer.analyze_filter'].rows_in, records['Analyzer.analyze_filter'].rows_out) == (10, 5)
+        # 바깥 호출의 할당량은 안쪽 호출의 최대치를 포함
+        assert records['Analyzer.run_all_analyses'].alloc_bytes >= big.alloc_bytes
+        assert not instrumentation.is_enabled()
+
+    def test_trace_peak_memory(self):
+        """블록 동안의 최대 할당량을 재고, 바깥 블록은 안쪽 블록의 최대치를 포함"""
+        import tracemalloc
+
+        with instrumentation.trace_peak_memory() as outer:
+            with instrumentation.trace_peak_memory() as inner:
+                block = np.ones(200_000)
+                del block
+            assert inner.bytes >= 200_000 * 8
+        assert outer.bytes >= inner.bytes
+        assert not tracemalloc.is_tracing()
+
+    def test_disabled_is_passthrough(self):
+        """계측이 꺼져 있으면 기록하지 않음"""
+        @instrumentation.instrumented
+        def analyze():
+            return [1, 2]
+
+        instrumentation.registry.clear()
+        assert analyze() == [1, 2]
+        assert len(instrumentation.registry) == 0
+
+    def test_dump_csv_and_json(self, tmp_path):
+        """기록을 CSV/JSON으로 내보내고 단계별로 요약"""
+        @instrumentation.instrumented(name='step')
+        def analyze(n):
+            return pd.Series(range(n))
+
+        with instrumentation.instrumented_run(trace_memory=False) as registry:
+            analyze(3)
+            analyze(7)
+
+        registry.to_csv(tmp_path / 'steps.csv')
+        registry.to_json(tmp_path / 'steps.json')
+
+        frame = pd.read_csv(tmp_path / 'steps.csv')
+        assert list(frame.columns) == ['step', 'wall_time', 'cpu_time', 'alloc_bytes', 'rows_in', 'rows_out']
+        assert frame['rows_out'].tolist() == [3, 7]
+        assert frame['alloc_bytes'].isna().all()  # 메모리 추적 없이 실행
+
+        import json
+        assert len(json.loads((tmp_path / 'steps.json').read_text(encoding='utf-8'))) == 2
+
+        summary = registry.summary()
+        assert summary.loc['step', 'calls'] == 2
+        assert summary.loc['step', 'max_rows_out'] == 7
+
+class TestSynthetic:
+    """합성 데이터 도우미 테스트"""
+
+    def test_tile_frame_steps(self):
+        """반복 회차마다 id와 날짜가 이어짐"""
+        base = pd.DataFrame({'event_id': [1, 2],
+                             'when': pd.to_datetime(['2024-01-01', '2024-01-02'])})
+        df = synthetic.tile_frame(base, 5, steps={'event_id': 2, 'when': pd.Timedelta(days=2)})
+
+        assert df['event_id'].tolist() == [1, 2, 3, 4, 5]
+        assert df['when'].is_monotonic_increasing
+        assert df['when'].iloc[-1] == pd.Timestamp('2024-01-05')
+        assert synthetic.tile_frame(base).equals(base)
+
+        with pytest.raises(ValueError):
+            synthetic.tile_frame(base, -1)
+
+    def test_dates_beyond_nanosecond_range(self):
+        """나노초 범위를 넘는 날짜는 초 단위로 생성"""
+        dates = synthetic.date_range('1446-01-01', periods=3, freq='D')
+        assert dates[-1] == pd.Timestamp('1446-01-03')
+
+        base = pd.DataFrame({'when': pd.to_datetime(['2200-01-01'])})
+        df = synthetic.tile_frame(base, 3, steps={'when': pd.Timedelta(days=365 * 50)})
+        assert df['when'].iloc[-1].year == 2299
+
+    def test_frame_preview_truncates(self):
+        """큰 표는 앞부분만 출력"""
+        df = pd.DataFrame({'n': range(100)})
+        preview = synthetic.frame_preview(df, max_rows=5)
+
+        assert '100행 x 1열 중 앞 5행' in preview
+        assert len(preview.splitlines()) == 7  # 머리글 + 5행 + 요약
+        assert synthetic.numbered_labels('user_', 1, 3).tolist() == ['user_1', 'user_2']
+
+    def test_chunk_bounds_and_seeds(self, tmp_path):
+        """청크 경계와 청크별 시드는 워커 수와 무관, 이전 part 파일은 지움"""
+        assert synthetic.chunk_bounds(5, 2) == [(0, 2), (2, 4), (4, 5)]
+        assert synthetic.chunk_bounds(0, 2) == []
+        with pytest.raises(ValueError):
+            synthetic.chunk_bounds(5, 0)
+
+        def build(rng, start, stop):
+            return pd.DataFrame({'row': np.arange(start, stop), 'value': rng.random(stop - start)})
+
+        df = synthetic.generate_chunked(build, 5, chunk_size=2, seed=7, workers=1)
+        assert df['row'].tolist() == [0, 1, 2, 3, 4]
+        assert df['value'].iloc[2] == np.random.default_rng(np.random.SeedSequence(7).spawn(3)[1]).random()
+
+        (tmp_path / 'part-00009.parquet').write_bytes(b'stale')
+        synthetic.generate_chunked(build, 5, chunk_size=2, seed=7, workers=1, output_dir=tmp_path)
+        assert len(list(tmp_path.glob('part-*.parquet'))) == 3
+        pd.testing.assert_frame_equal(pd.read_parquet(tmp_path), df)
+
+class TestDataIO:
+    """형식 등록, 자동 판별, 형식 비교 테스트"""
+
+    @pytest.fixture
+    def frame(self):
+        return pd.DataFrame({'tribe': ['Judah', 'Levi', 'Dan'] * 4, 'count': range(12),
+                             'weight': np.linspace(0.5, 6.0, 12)})
+
+    @pytest.mark.parametrize('name', ['offerings.csv', 'offerings.parquet', 'offerings.feather',
+                                      'offerings.jsonl', 'offerings.pkl', 'offerings.csv.gz',
+                                      'offerings.jsonl.bz2', 'offerings.pkl.xz'])
+    def test_round_trip(self, tmp_path, frame, name):
+        """확장자로 형식과 압축을 판별해 저장하고 그대로 불러옴"""
+        path = data_io.save(frame, tmp_path / name)
+        pd.testing.assert_frame_equal(data_io.load(path), frame)
+
+    def test_excel_round_trip(self, tmp_path, frame):
+        pytest.importorskip('openpyxl')
+        path = data_io.save(frame, tmp_path / 'offerings.xlsx')
+        pd.testing.assert_frame_equal(data_io.load(path), frame)
+
+    def test_detect_format(self, tmp_path, frame):
+        assert data_io.detect_format('offerings.CSV') == 'csv'
+        assert data_io.detect_format('offerings.jsonl.gz') == 'jsonl'
+        assert data_io.detect_compression('offerings.csv.zst') == 'zstd'
+
+        for name in ('parquet', 'feather', 'pickle'):
+            path = data_io.save(frame, tmp_path / 'checkpoint', format=name)
+            assert data_io.detect_format(path) == name, "확장자가 없으면 매직 바이트로 판별"
+        with pytest.raises(ValueError):
+            data_io.detect_format('offerings.xml')
+
+    def test_compression_options(self, tmp_path, frame):
+        """형식별 압축 옵션을 그대로 전달하고 지원하지 않는 조합은 거절"""
+        path = data_io.save(frame, tmp_path / 'offerings.parquet', compression='gzip')
+        import pyarrow.parquet as pq
+        assert pq.ParquetFile(path).metadata.row_group(0).column(0).compression == 'GZIP'
+
+        with pytest.raises(ValueError):
+            data_io.save(frame, tmp_path / 'offerings.xlsx', compression='gzip')
+        with pytest.raises(ValueError):
+            data_io.save(frame, tmp_path / 'offerings.csv', format='xml')
+
+    def test_register_format(self, tmp_path, frame, monkeypatch):
+        monkeypatch.setitem(data_io.FORMATS, 'tsv', data_io.FileFormat(
+            'tsv', ('.tsv',),
+            lambda df, path, compression, index, **kwargs: df.to_csv(path, sep='\t', index=index),
+            lambda path, **kwargs: pd.read_csv(path, sep='\t', **kwargs)))
+        path = data_io.save(frame, tmp_path / 'offerings.tsv')
+        assert path.read_text().startswith('tribe\tcount')
+        pd.testing.assert_frame_equal(data_io.load(path), frame)
+
+    def test_select_excel_engine(self, monkeypatch):
+        assert data_io.select_excel_engine('offerings.csv') is None
+
+        installed = {'openpyxl', 'pyxlsb'}
+        monkeypatch.setattr(data_io.importlib.util, 'find_spec',
+                            lambda name: object() if name in installed else None)
+        assert data_io.select_excel_engine('offerings.xlsx') == 'openpyxl'
+        assert data_io.select_excel_engine('offerings.XLSB') == 'pyxlsb'
+        installed.add('python_calamine')
+        assert data_io.select_excel_engine('offerings.xlsx') == 'calamine'
+        installed.clear()
+        with pytest.raises(ImportError):
+            data_io.select_excel_engine('offerings.xlsx')
+
+    def test_benchmark_formats(self, frame):
+        report = data_io.benchmark_formats(frame, formats=['csv', 'parquet', 'pickle'],
+                                           compressions={'csv': [None, 'gzip']}, repeat=1)
+
+        assert sorted(zip(report['format'], report['compression'].fillna('none'))) == [
+            ('csv', 'gzip'), ('csv', 'none'), ('parquet', 'snappy'), ('pickle', 'none')]
+        assert report['error'].isna().all()
+        assert (report['file_size'] > 0).all() and (report['peak_memory'] > 0).all()
+        assert report['read_time'].is_monotonic_increasing
+
+    def test_benchmark_records_unwritable_format(self):
+        """이 표를 쓸 수 없는 형식은 실패 대신 error로 기록"""
+        mixed = pd.DataFrame({'value': [1, 'six']})
+        report = data_io.benchmark_formats(mixed, formats=['parquet', 'csv'], repeat=1).set_index('format')
+        assert report.loc['csv', 'error'] is None
+        assert 'ArrowInvalid' in report.loc['parquet', 'error'] or 'ArrowTypeError' in report.loc['parquet', 'error']
+
+
+class TestImportTime:
+    """utils 임포트 시간 벤치마크 (무거운 의존성은 지연 로드)"""
+
+    HEAVY_MODULES = ('pandas', 'numpy', 'yaml', 'matplotlib')
+
+    def _run_import(self, project_root, statement):
+        import json
+        import subprocess
+        import sys
+
+        code = (
+            "import json, sys, time\n"
+            "start = time.perf_counter()\n"
+            f"{statement}\n"
+            "elapsed = time.perf_counter() - start\n"
+            f"print(json.dumps({{'elapsed': elapsed, 'loaded': [m for m in {self.HEAVY_MODULES!r} if m in sys.modules]}}))\n"
+        )
+        output = subprocess.run([sys.executable, "-c", code], cwd=project_root,
+                                capture_output=True, text=True, check=True).stdout
+        return json.loads(output.strip().splitlines()[-1])
+
+    def test_utils_import_is_light(self, project_root):
+        """utils 하위 모듈 임포트는 pandas/numpy/yaml/matplotlib을 불러오지 않음"""
+        result = self._run_import(
+            project_root,
+            "import utils, utils.bible_utils, utils.word_index, utils.font_config"
+        )
+
+        assert result['loaded'] == [], f"임포트 시점에 로드된 무거운 모듈: {result['loaded']}"
+        assert result['elapsed'] < 0.5, f"utils 임포트가 {result['elapsed']:.3f}초 걸렸습니다."
+
+    @pytest.mark.parametrize('module', ['run_chapters', 'build', 'benchmark', 'font_checker'])
+    def test_cli_import_is_light(self, project_root, module):
+        """명령줄 도구도 임포트만으로는 무거운 의존성을 불러오지 않음 (--help, --list가 빠르게 응답)"""
+        result = self._run_import(project_root, f"import {module}")
+
+        assert result['loaded'] == [], f"{module} 임포트 시점에 로드된 무거운 모듈: {result['loaded']}"
+        assert result['elapsed'] < 0.5, f"{module} 임포트가 {result['elapsed']:.3f}초 걸렸습니다."
+
+    def test_dependencies_load_on_first_use(self, project_root):
+        """처음 사용할 때 필요한 의존성만 로드"""
+        result = self._run_import(project_root, "import utils; utils.load_config()")
+        assert result['loaded'] == ['yaml']
+
 @pytest.mark.slow
 class TestPerformance:
     """성능 테스트 (시간이 오래 걸릴 수 있음)"""
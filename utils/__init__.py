@@ -0,0 +1,47 @@
+"""
+JesusBornd 유틸리티 패키지
+출애굽기 × 요한복음 블렌딩을 위한 헬퍼 모듈 모음
+
+`import utils`는 가볍게 유지하고, 하위 모듈과 자주 쓰는 함수는
+처음 접근할 때 불러옵니다 (예: `utils.load_bible()`, `utils.word_index`).
+"""
+
+import importlib
+
+# 지연 로드되는 하위 모듈
+_SUBMODULES = {'bible_utils', 'word_index', 'translation_store', 'reporting', 'instrumentation', 'synthetic', 'data_io',
+               'font_config', 'font_fixer'}
+
+# 패키지 수준에서 바로 쓸 수 있는 이름 → 정의된 하위 모듈
+_EXPORTS = {
+    'load_config': 'bible_utils',
+    'reload_config': 'bible_utils',
+    'get_analysis_patterns': 'bible_utils',
+    'load_bible': 'bible_utils',
+    'load_corpus': 'bible_utils',
+    'load_exodus': 'bible_utils',
+    'get_passage': 'bible_utils',
+    'iter_verses': 'bible_utils',
+    'load_twelve_tribes': 'bible_utils',
+    'load_john_concepts': 'bible_utils',
+    'SpiritualMetrics': 'bible_utils',
+    'term_frequency': 'word_index',
+    'get_translation_store': 'translation_store',
+    'ensure_korean_font': 'font_config',
+}
+
+__all__ = sorted(_SUBMODULES | set(_EXPORTS))
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
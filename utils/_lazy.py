@@ -0,0 +1,50 @@
+"""
+지연 임포트 도우미
+pandas, numpy, yaml, matplotlib 같은 무거운 의존성을 처음 사용할 때 불러옵니다.
+
+"때가 이르매" (갈 4:4) - 필요할 때 필요한 것을
+"""
+
+import importlib
+from types import ModuleType
+
+
+class LazyModule(ModuleType):
+    """첫 속성 접근 시 실제 모듈을 임포트하는 대리 모듈
+
+    `pd = LazyModule('pandas')`처럼 모듈 전역에 두면 `pd.read_csv` 등을
+    처음 쓰는 순간 pandas를 불러오고, 이후에는 실제 모듈로 위임합니다.
+    속성 설정/삭제(monkeypatch 포함)도 실제 모듈에 그대로 적용됩니다.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__['_lazy_target'] = None
+
+    def _load(self) -> ModuleType:
+        target = self.__dict__['_lazy_target']
+        if target is None:
+            target = importlib.import_module(self.__name__)
+            self.__dict__['_lazy_target'] = target
+        return target
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr: str, value):
+        setattr(self._load(), attr, value)
+
+    def __delattr__(self, attr: str):
+        delattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__['_lazy_target'] is not None else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """지연 모듈 생성 (이미 임포트된 모듈이어도 대리 객체를 반환)"""
+    return LazyModule(name)
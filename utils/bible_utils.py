@@ -5,28 +5,460 @@ JesusBornd 성경 분석 유틸리티
 "태초에 말씀이 계시니라" - 모든 분석의 시작점
 """
 
-import pandas as pd
-import numpy as np
+from __future__ import annotations
+
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-import yaml
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Optional, Union
+from dataclasses import dataclass
+import hashlib
+import json
+
+from utils._lazy import lazy_import
+
+# 무거운 의존성은 처음 사용할 때 로드 (utils 임포트를 가볍게 유지)
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+yaml = lazy_import('yaml')
 
 # 프로젝트 루트 경로
 PROJECT_ROOT = Path(__file__).parent.parent
 
+# 프로세스 전역 말뭉치 캐시: 원본 CSV 경로 → (mtime_ns, size, DataFrame, BibleIndex)
+_CORPUS_CACHE: Dict[Path, Tuple[int, int, pd.DataFrame, 'BibleIndex']] = {}
+
+# 설정 캐시: config.yml 경로 → (mtime_ns, FrozenConfig)
+_CONFIG_CACHE: Dict[Path, Tuple[int, 'FrozenConfig']] = {}
+
+# 예시 CSV 조회 테이블 캐시: (테이블 이름, CSV 경로) → (mtime_ns, 테이블)
+_LOOKUP_CACHE: Dict[Tuple[str, Path], Tuple[int, Any]] = {}
+
+# (book, chapter, verse)를 하나의 정렬 키로 합칠 때 쓰는 비트 폭 (장/절 < 1024)
+_VERSE_BITS = 10
+_CHAPTER_BITS = 10
+
+# 절 번호의 최댓값 (구간 끝을 "장 끝까지"로 지정할 때)
+MAX_VERSE = (1 << _VERSE_BITS) - 1
+
+# Parquet 사이드카 형식 버전 (컬럼 타입, 정렬 순서 등 저장 형식이 바뀌면 올림 - 다르면 다시 파싱)
+# 1: 파싱 결과 그대로, 2: (book, chapter, verse) lexsort 정렬
+_CORPUS_FORMAT_VERSION = 2
+
+# 스트리밍 읽기용 원본 CSV 컬럼 타입
+_VERSE_DTYPES = {'book': 'string', 'chapter': 'int16', 'verse': 'int16', 'text': 'string'}
+
+
+class FrozenConfig(dict):
+    """수정할 수 없는 설정 딕셔너리 (캐시를 여러 호출자가 공유하므로 변경 금지)"""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("설정은 읽기 전용입니다. 수정하려면 copy.deepcopy() 후 사용하세요.")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (FrozenConfig, (dict(self),))
+
+    def __deepcopy__(self, memo):
+        import copy
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+
+class FrozenList(list):
+    """수정할 수 없는 설정 리스트 (list이므로 `cfg['visualization']['figure_size'] == [10, 6]`이 그대로 성립)"""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("설정은 읽기 전용입니다. 수정하려면 copy.deepcopy() 후 사용하세요.")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = remove = pop = clear = sort = reverse = _readonly
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+    def __deepcopy__(self, memo):
+        import copy
+        return [copy.deepcopy(item, memo) for item in self]
+
+
+def _freeze(value: Any) -> Any:
+    """YAML 값을 재귀적으로 읽기 전용으로 변환 (dict → FrozenConfig, list → FrozenList)"""
+    if isinstance(value, dict):
+        return FrozenConfig({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return FrozenList(_freeze(item) for item in value)
+    return value
+
+
+@dataclass(frozen=True)
+class AnalysisPatterns:
+    """config.yml의 `analysis.patterns` 항목"""
+    leah_stages: Tuple[str, ...]
+    john_contrasts: Tuple[str, ...]
+
 
 def load_config() -> Dict:
-    """설정 파일 로드"""
+    """설정 파일 로드
+
+    파싱 결과는 캐시되며 config.yml의 수정 시각이 바뀔 때만 다시 읽습니다.
+
+    Returns:
+        Dict: 읽기 전용 설정 (FrozenConfig)
+    """
+    config_path = PROJECT_ROOT / "config.yml"
+    mtime_ns = config_path.stat().st_mtime_ns
+
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    return reload_config()
+
+
+def reload_config() -> Dict:
+    """캐시를 무시하고 config.yml을 다시 읽기
+
+    Returns:
+        Dict: 읽기 전용 설정 (FrozenConfig)
+    """
     config_path = PROJECT_ROOT / "config.yml"
+    mtime_ns = config_path.stat().st_mtime_ns
 
     with open(config_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+        config = _freeze(yaml.safe_load(f))
+
+    _CONFIG_CACHE[config_path] = (mtime_ns, config)
+    return config
+
+
+def get_analysis_patterns() -> AnalysisPatterns:
+    """`analysis.patterns` 설정 조회
+
+    Returns:
+        AnalysisPatterns: 레아 4단계, 요한복음 대조 개념
+    """
+    patterns = load_config()['analysis']['patterns']
+    return AnalysisPatterns(
+        leah_stages=tuple(patterns.get('leah_stages', ())),
+        john_contrasts=tuple(patterns.get('john_contrasts', ())),
+    )
+
+def bible_csv_path(translation: str = 'KJV') -> Path:
+    """원본 성경 CSV 경로 (data/raw/bible_<번역본>.csv, 기본값 KJV)"""
+    return PROJECT_ROOT / 'data' / 'raw' / f'bible_{translation}.csv'
+
+
+def _corpus_sidecar_path(csv_path: Path) -> Path:
+    """원본 CSV에 대응하는 Parquet 사이드카 경로 (data/processed)"""
+    return PROJECT_ROOT / 'data' / 'processed' / f"{csv_path.stem}.parquet"
+
+
+def _file_digest(path: Path, chunk_size: int = 1 << 20) -> str:
+    """파일 내용의 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def normalize_book(name: str) -> str:
+    """책 이름 비교용 키 ('  Exodus ' → 'exodus')"""
+    return str(name).strip().lower()
+
+
+# 정경 66권의 (영문 KJV 이름, 개역개정 이름) - 언어가 다른 번역본의 책을 같은 책으로 맞출 때 사용
+CANONICAL_BOOKS = (
+    ('Genesis', '창세기'), ('Exodus', '출애굽기'), ('Leviticus', '레위기'), ('Numbers', '민수기'),
+    ('Deuteronomy', '신명기'), ('Joshua', '여호수아'), ('Judges', '사사기'), ('Ruth', '룻기'),
+    ('1 Samuel', '사무엘상'), ('2 Samuel', '사무엘하'), ('1 Kings', '열왕기상'), ('2 Kings', '열왕기하'),
+    ('1 Chronicles', '역대상'), ('2 Chronicles', '역대하'), ('Ezra', '에스라'), ('Nehemiah', '느헤미야'),
+    ('Esther', '에스더'), ('Job', '욥기'), ('Psalms', '시편'), ('Proverbs', '잠언'),
+    ('Ecclesiastes', '전도서'), ('Song of Solomon', '아가'), ('Isaiah', '이사야'), ('Jeremiah', '예레미야'),
+    ('Lamentations', '예레미야애가'), ('Ezekiel', '에스겔'), ('Daniel', '다니엘'), ('Hosea', '호세아'),
+    ('Joel', '요엘'), ('Amos', '아모스'), ('Obadiah', '오바댜'), ('Jonah', '요나'), ('Micah', '미가'),
+    ('Nahum', '나훔'), ('Habakkuk', '하박국'), ('Zephaniah', '스바냐'), ('Haggai', '학개'),
+    ('Zechariah', '스가랴'), ('Malachi', '말라기'),
+    ('Matthew', '마태복음'), ('Mark', '마가복음'), ('Luke', '누가복음'), ('John', '요한복음'),
+    ('Acts', '사도행전'), ('Romans', '로마서'), ('1 Corinthians', '고린도전서'), ('2 Corinthians', '고린도후서'),
+    ('Galatians', '갈라디아서'), ('Ephesians', '에베소서'), ('Philippians', '빌립보서'), ('Colossians', '골로새서'),
+    ('1 Thessalonians', '데살로니가전서'), ('2 Thessalonians', '데살로니가후서'), ('1 Timothy', '디모데전서'),
+    ('2 Timothy', '디모데후서'), ('Titus', '디도서'), ('Philemon', '빌레몬서'), ('Hebrews', '히브리서'),
+    ('James', '야고보서'), ('1 Peter', '베드로전서'), ('2 Peter', '베드로후서'), ('1 John', '요한일서'),
+    ('2 John', '요한이서'), ('3 John', '요한삼서'), ('Jude', '유다서'), ('Revelation', '요한계시록'),
+)
+
+# 정규화한 책 이름 → 정규화한 영문 이름
+_CANONICAL_BOOK_IDS = {normalize_book(name): normalize_book(english)
+                       for english, korean in CANONICAL_BOOKS for name in (english, korean)}
+
+
+def canonical_book(name: str) -> str:
+    """번역본과 언어에 상관없는 책 키 ('창세기', ' Genesis' → 'genesis', 목록에 없으면 normalize_book())"""
+    key = normalize_book(name)
+    return _CANONICAL_BOOK_IDS.get(key, key)
+
+
+def verse_key(book_code, chapter, verse):
+    """(book 코드, 장, 절)을 하나의 int64 정렬 키로 합침 (정수 또는 int64 배열)
+
+    키 순서가 (book, chapter, verse) 순서와 같아 정렬된 키 배열에서 구간을 이진 탐색할 수 있습니다.
+    """
+    return (book_code << (_CHAPTER_BITS + _VERSE_BITS)) | (chapter << _VERSE_BITS) | verse
+
+
+def split_verse_key(keys):
+    """verse_key()의 역변환: 키(정수 또는 배열) → (book 코드, 장, 절)"""
+    return (keys >> (_CHAPTER_BITS + _VERSE_BITS),
+            (keys >> _VERSE_BITS) & ((1 << _CHAPTER_BITS) - 1),
+            keys & MAX_VERSE)
+
+
+def parse_bible_csv(csv_path: Path) -> pd.DataFrame:
+    """원본 CSV를 한 번 파싱해서 타입이 지정된 DataFrame으로 변환
+
+    book은 공백/대소문자를 정규화한 categorical(첫 등장 순서 = 정경 순서), chapter/verse는
+    최소 정수 타입으로 저장하고, 전체를 (book, chapter, verse) 순으로 정렬합니다.
+    """
+    df = pd.read_csv(csv_path, encoding='utf-8')
+
+    books = df['book'].astype(str).str.strip()
+    keys = books.str.lower()
+    display_names = books.groupby(keys, sort=False).first()  # 키별 첫 등장 표기
+    df['book'] = pd.Categorical(keys.map(display_names),
+                                categories=pd.unique(keys.map(display_names)))
+    for col in ('chapter', 'verse'):
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+
+    order = np.lexsort((df['verse'].to_numpy(), df['chapter'].to_numpy(),
+                        df['book'].cat.codes.to_numpy()))
+    return df.iloc[order].reset_index(drop=True)
+
+
+def _read_corpus_sidecar(csv_path: Path, mtime_ns: int, size: int) -> Optional[pd.DataFrame]:
+    """사이드카가 원본과 일치하면 읽어서 반환, 아니면 None
+
+    형식 버전이 다르면 버리고, mtime/size가 같으면 바로 사용하고, 다르면 해시를 비교해
+    내용이 같을 때만 재사용합니다.
+    """
+    sidecar = _corpus_sidecar_path(csv_path)
+    stamp_path = sidecar.with_suffix('.json')
+    if not sidecar.exists() or not stamp_path.exists():
+        return None
+
+    try:
+        with open(stamp_path, 'r', encoding='utf-8') as f:
+            stamp = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if stamp.get('format_version') != _CORPUS_FORMAT_VERSION:
+        return None
+    if stamp.get('mtime_ns') != mtime_ns or stamp.get('size') != size:
+        if stamp.get('sha256') != _file_digest(csv_path):
+            return None
+        _write_corpus_stamp(stamp_path, mtime_ns, size, stamp['sha256'])
+
+    try:
+        return pd.read_parquet(sidecar)
+    except (ImportError, OSError, ValueError):
+        return None
+
+
+def _write_corpus_stamp(stamp_path: Path, mtime_ns: int, size: int, sha256: str):
+    """사이드카 유효성 확인용 스탬프 저장"""
+    with open(stamp_path, 'w', encoding='utf-8') as f:
+        json.dump({'format_version': _CORPUS_FORMAT_VERSION,
+                   'mtime_ns': mtime_ns, 'size': size, 'sha256': sha256}, f)
+
+
+def _write_corpus_sidecar(csv_path: Path, df: pd.DataFrame, mtime_ns: int, size: int):
+    """파싱된 말뭉치를 Parquet 사이드카로 저장 (pyarrow가 없으면 건너뜀)"""
+    sidecar = _corpus_sidecar_path(csv_path)
+    try:
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(sidecar, index=False)
+    except (ImportError, OSError):
+        return
+    _write_corpus_stamp(sidecar.with_suffix('.json'), mtime_ns, size, _file_digest(csv_path))
+
+
+class BibleIndex:
+    """정렬된 (book, chapter, verse) 말뭉치의 행 오프셋 인덱스
+
+    book은 categorical 코드로, 세 값은 하나의 int64 정렬 키로 합쳐져 있어
+    책/장/구절 범위를 전체 스캔 없이 이진 탐색(O(log n))으로 찾습니다.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        codes = df['book'].cat.codes.to_numpy().astype(np.int64)
+        chapters = df['chapter'].to_numpy().astype(np.int64)
+        verses = df['verse'].to_numpy().astype(np.int64)
+
+        self.keys = verse_key(codes, chapters, verses)
+        self.book_codes = {normalize_book(name): code
+                           for code, name in enumerate(df['book'].cat.categories)}
+
+        # 책별 시작 오프셋 (book_offsets[code]:book_offsets[code + 1])
+        book_starts = verse_key(np.arange(len(self.book_codes) + 1, dtype=np.int64), 0, 0)
+        self.book_offsets = np.searchsorted(self.keys, book_starts)
+
+        # (book 코드, 장)별 [start, stop) 오프셋
+        chapter_keys = self.keys >> _VERSE_BITS
+        unique_keys, starts = np.unique(chapter_keys, return_index=True)
+        stops = np.append(starts[1:], len(chapter_keys))
+        self.chapter_offsets = {
+            (int(key >> _CHAPTER_BITS), int(key & ((1 << _CHAPTER_BITS) - 1))): (int(lo), int(hi))
+            for key, lo, hi in zip(unique_keys, starts, stops)
+        }
+
+    def _book_code(self, book: str) -> int:
+        code = self.book_codes.get(normalize_book(book))
+        if code is None:
+            raise KeyError(f"'{book}' 책을 말뭉치에서 찾을 수 없습니다.")
+        return code
+
+    def _key(self, code: int, chapter: int, verse: int) -> int:
+        return verse_key(code, chapter, verse)
+
+    def book_range(self, book: str) -> Tuple[int, int]:
+        """책 전체의 [start, stop) 행 범위"""
+        code = self._book_code(book)
+        return int(self.book_offsets[code]), int(self.book_offsets[code + 1])
+
+    def chapter_range(self, book: str, chapter: int) -> Tuple[int, int]:
+        """한 장의 [start, stop) 행 범위 (없는 장이면 빈 범위)"""
+        code = self._book_code(book)
+        if (code, chapter) in self.chapter_offsets:
+            return self.chapter_offsets[(code, chapter)]
+        lo = int(np.searchsorted(self.keys, self._key(code, chapter, 0)))
+        return lo, lo
+
+    def passage_range(self, book: str, start_chapter: int, start_verse: int,
+                      end_chapter: int, end_verse: int) -> Tuple[int, int]:
+        """start_chapter:start_verse ~ end_chapter:end_verse(포함) 구간의 행 범위"""
+        code = self._book_code(book)
+        lo = np.searchsorted(self.keys, self._key(code, start_chapter, start_verse), side='left')
+        hi = np.searchsorted(self.keys, self._key(code, end_chapter, end_verse), side='right')
+        return int(lo), int(max(lo, hi))
+
+
+def load_corpus() -> Tuple[pd.DataFrame, BibleIndex]:
+    """캐시된 KJV 말뭉치와 그 (book, chapter, verse) 인덱스를 함께 반환
+
+    필요할 때만 사이드카/CSV에서 로드하며, 같은 원본이면 load_bible()/get_bible_index()와
+    같은 객체를 공유합니다 (말뭉치 위에 색인을 만드는 모듈용).
+
+    Returns:
+        tuple: (DataFrame, BibleIndex) - 공유 캐시이므로 DataFrame을 수정하려면 `.copy()` 후 사용
+    """
+    csv_path = bible_csv_path()
+    stat = csv_path.stat()
+
+    cached = _CORPUS_CACHE.get(csv_path)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2], cached[3]
+
+    df = _read_corpus_sidecar(csv_path, stat.st_mtime_ns, stat.st_size)
+    if df is None:
+        df = parse_bible_csv(csv_path)
+        _write_corpus_sidecar(csv_path, df, stat.st_mtime_ns, stat.st_size)
+
+    index = BibleIndex(df)
+    _CORPUS_CACHE[csv_path] = (stat.st_mtime_ns, stat.st_size, df, index)
+    return df, index
+
+
+def clear_corpus_cache():
+    """프로세스 내 말뭉치 캐시 비우기 (디스크 사이드카는 유지)"""
+    _CORPUS_CACHE.clear()
+
 
 def load_bible() -> pd.DataFrame:
-    df = pd.read_csv(PROJECT_ROOT / 'data' / 'raw' / 'bible_KJV.csv')
+    """KJV 성경 전체 로드
 
+    CSV는 프로세스당 한 번만 파싱되고, 이후 호출은 메모리 캐시를 공유합니다.
+    콜드 스타트에서도 `data/processed`의 Parquet 사이드카(원본 mtime/해시로 검증)를 사용합니다.
+
+    Returns:
+        DataFrame: 성경 전체 구절 (공유 캐시이므로 수정하려면 `.copy()` 후 사용)
+    """
+    df, _ = load_corpus()
     return df
 
+
+def get_bible_index() -> BibleIndex:
+    """캐시된 말뭉치의 (book, chapter, verse) 인덱스"""
+    _, index = load_corpus()
+    return index
+
+
+def get_passage(book: str, start_chapter: int, start_verse: Optional[int] = None,
+                end_chapter: Optional[int] = None, end_verse: Optional[int] = None) -> pd.DataFrame:
+    """성경 본문 구간 조회 (예: get_passage("Exodus", 3, 1, 3, 22) → 출 3:1-22)
+
+    Args:
+        book: 책 이름 (공백/대소문자 무시)
+        start_chapter: 시작 장
+        start_verse: 시작 절 (생략 시 장의 처음부터)
+        end_chapter: 끝 장 (생략 시 시작 장)
+        end_verse: 끝 절, 포함 (생략 시 끝 장의 마지막 절까지)
+
+    Returns:
+        DataFrame: 해당 구간 구절 (공유 캐시의 슬라이스이므로 수정하려면 `.copy()` 후 사용)
+    """
+    df, index = load_corpus()
+    if end_chapter is None:
+        end_chapter = start_chapter
+    lo, hi = index.passage_range(
+        book, start_chapter, start_verse or 0,
+        end_chapter, end_verse if end_verse is not None else MAX_VERSE
+    )
+    return df.iloc[lo:hi]
+
+def iter_verses(books: Optional[Iterable[str]] = None, columns: Optional[Iterable[str]] = None,
+                chunksize: int = 10_000, as_tuples: bool = False,
+                translation: str = 'KJV') -> Iterator[Union[pd.DataFrame, Tuple]]:
+    """원본 CSV를 청크 단위로 스트리밍하며 구절 읽기
+
+    `load_bible()`과 달리 말뭉치 전체를 메모리에 올리지 않으므로, 책 하나나 컬럼 몇 개만
+    필요한 배치 작업에서 메모리 사용량이 chunksize에 비례하도록 유지됩니다.
+    필요한 컬럼만 타입을 지정해 읽고(usecols/dtype), 각 청크에서 책 필터를 먼저 적용합니다.
+    순서는 원본 파일 순서를 따릅니다.
+
+    Args:
+        books: 읽을 책 이름들 (공백/대소문자 무시, 생략 시 전체)
+        columns: 반환할 컬럼들 (생략 시 book, chapter, verse, text)
+        chunksize: 한 번에 읽을 행 수
+        as_tuples: True이면 청크 대신 구절 namedtuple(Verse)을 하나씩 반환
+        translation: 번역본 이름 (data/raw/bible_<번역본>.csv)
+
+    Yields:
+        DataFrame 청크 (비어 있는 청크는 건너뜀) 또는 Verse 튜플
+    """
+    columns = list(columns) if columns is not None else list(_VERSE_DTYPES)
+    unknown = [col for col in columns if col not in _VERSE_DTYPES]
+    if unknown:
+        raise ValueError(f"알 수 없는 컬럼입니다: {unknown} (가능: {list(_VERSE_DTYPES)})")
+
+    book_keys = None if books is None else {normalize_book(book) for book in books}
+    usecols = columns if book_keys is None or 'book' in columns else ['book'] + columns
+
+    reader = pd.read_csv(bible_csv_path(translation), encoding='utf-8', usecols=usecols,
+                         dtype={col: _VERSE_DTYPES[col] for col in usecols}, chunksize=chunksize)
+    with reader:
+        for chunk in reader:
+            if 'book' in chunk:
+                chunk['book'] = chunk['book'].str.strip()
+            if book_keys is not None:
+                chunk = chunk[chunk['book'].str.lower().isin(book_keys)]
+                if chunk.empty:
+                    continue
+            chunk = chunk[columns]
+
+            if as_tuples:
+                yield from chunk.itertuples(index=False, name='Verse')
+            else:
+                yield chunk
+
 def load_twelve_tribes() -> pd.DataFrame:
     """12지파 기본 정보 로드
 
@@ -37,9 +469,19 @@ def load_twelve_tribes() -> pd.DataFrame:
     return pd.read_csv(data_path, encoding='utf-8')
 
 def load_exodus() -> pd.DataFrame:
-    df = pd.read_csv(PROJECT_ROOT / 'data' / 'raw' / 'bible_KJV.csv')
-    exodus = df[df["book"].str.strip().str.lower() == "exodus"].copy()
-    return exodus
+    """출애굽기 구절 로드
+
+    캐시된 말뭉치에서 미리 계산한 책 오프셋으로 잘라내므로 복사나 문자열 스캔이 없습니다.
+
+    Returns:
+        DataFrame: 출애굽기 구절 (공유 캐시의 슬라이스이므로 수정하려면 `.copy()` 후 사용)
+    """
+    df, index = load_corpus()
+    if 'exodus' not in index.book_codes:
+        return df.iloc[0:0]
+
+    start, stop = index.book_range('exodus')
+    return df.iloc[start:stop]
 
 def load_john_concepts() -> pd.DataFrame:
     """요한복음 1장 신학적 개념 로드
@@ -60,8 +502,7 @@ def calculate_leah_spiritual_journey(tribes_df: pd.DataFrame) -> Dict:
     Returns:
         Dict: 신앙 여정 분석 결과
     """
-    config = load_config()
-    expected_pattern = config['analysis']['patterns']['leah_stages']
+    expected_pattern = list(get_analysis_patterns().leah_stages)
 
     leah_sons = tribes_df[tribes_df['mother'] == 'Leah'].sort_values('birth_order')
     first_four = leah_sons.head(4)
@@ -132,6 +573,47 @@ def get_grace_truth_balance(john_df: pd.DataFrame) -> Dict:
     }
 
 
+# 헬라어 개념 조회 결과의 키 → ch01_john_concepts.csv 컬럼
+_GREEK_INFO_COLUMNS = {
+    'korean_name': 'korean_name',
+    'transliteration': 'greek_transliteration',
+    'frequency': 'frequency_ch1',
+    'importance': 'theological_importance',
+    'contrast': 'contrast_pair',
+}
+
+
+def _cached_lookup(name: str, data_path: Path, build):
+    """예시 CSV 기반 조회 테이블을 파일 수정 시각 기준으로 캐시"""
+    mtime_ns = data_path.stat().st_mtime_ns
+    cached = _LOOKUP_CACHE.get((name, data_path))
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    table = build()
+    _LOOKUP_CACHE[(name, data_path)] = (mtime_ns, table)
+    return table
+
+
+def _hebrew_meaning_table() -> pd.Series:
+    """히브리어 이름 → 한국어 의미 (index=hebrew, 중복 시 첫 행)"""
+    def build():
+        tribes_df = load_twelve_tribes()
+        return tribes_df.drop_duplicates('hebrew').set_index('hebrew')['korean_meaning']
+    return _cached_lookup('hebrew', PROJECT_ROOT / "data/examples/ch01_tribes.csv", build)
+
+
+def _greek_concept_table() -> pd.DataFrame:
+    """헬라어 단어 → 개념 정보 (index=greek_word, 중복 시 첫 행)"""
+    def build():
+        john_df = load_john_concepts()
+        table = john_df.drop_duplicates('greek_word').set_index('greek_word')
+        return table[list(_GREEK_INFO_COLUMNS.values())].rename(
+            columns={column: key for key, column in _GREEK_INFO_COLUMNS.items()}
+        )
+    return _cached_lookup('greek', PROJECT_ROOT / "data/examples/ch01_john_concepts.csv", build)
+
+
 def get_hebrew_meaning(hebrew_name: str) -> Optional[str]:
     """히브리어 이름의 의미 조회
 
@@ -141,14 +623,24 @@ def get_hebrew_meaning(hebrew_name: str) -> Optional[str]:
     Returns:
         str: 한국어 의미 또는 None
     """
-    tribes_df = load_twelve_tribes()
-    result = tribes_df[tribes_df['hebrew'] == hebrew_name]
-
-    if not result.empty:
-        return result.iloc[0]['korean_meaning']
+    table = _hebrew_meaning_table()
+    if hebrew_name in table.index:
+        return table.at[hebrew_name]
     return None
 
 
+def get_hebrew_meanings(hebrew_names: pd.Series) -> pd.Series:
+    """여러 히브리어 이름의 의미를 한 번에 조회 (없는 이름은 NaN)
+
+    Args:
+        hebrew_names: 히브리어 이름 Series
+
+    Returns:
+        Series: 한국어 의미 (같은 index)
+    """
+    return hebrew_names.map(_hebrew_meaning_table()).rename('korean_meaning')
+
+
 def get_greek_concept_info(greek_word: str) -> Optional[Dict]:
     """헬라어 신학 개념 정보 조회
 
@@ -158,21 +650,26 @@ def get_greek_concept_info(greek_word: str) -> Optional[Dict]:
     Returns:
         Dict: 개념 정보 또는 None
     """
-    john_df = load_john_concepts()
-    result = john_df[john_df['greek_word'] == greek_word]
-
-    if not result.empty:
-        row = result.iloc[0]
-        return {
-            'korean_name': row['korean_name'],
-            'transliteration': row['greek_transliteration'],
-            'frequency': row['frequency_ch1'],
-            'importance': row['theological_importance'],
-            'contrast': row['contrast_pair']
-        }
+    table = _greek_concept_table()
+    if greek_word in table.index:
+        return table.loc[greek_word].to_dict()
     return None
 
 
+def get_greek_concepts_info(greek_words: pd.Series) -> pd.DataFrame:
+    """여러 헬라어 단어의 개념 정보를 한 번에 조회 (없는 단어의 행은 NaN)
+
+    Args:
+        greek_words: 헬라어 단어 Series
+
+    Returns:
+        DataFrame: korean_name, transliteration, frequency, importance, contrast (같은 index)
+    """
+    info = _greek_concept_table().reindex(greek_words.to_numpy())
+    info.index = greek_words.index
+    return info
+
+
 class SpiritualMetrics:
     """영적 지표 계산 클래스"""
 
@@ -202,27 +699,89 @@ class SpiritualMetrics:
         Returns:
             Dict: 패턴 분석 결과
         """
-        config = load_config()
-        leah_pattern = config['analysis']['patterns']['leah_stages']
-
-        # 패턴 매칭
-        matches = []
-        for i, stage in enumerate(journey_stages[:4]):  # 첫 4단계만 비교
-            if i < len(leah_pattern) and stage == leah_pattern[i]:
-                matches.append(True)
-            else:
-                matches.append(False)
+        leah_pattern = list(get_analysis_patterns().leah_stages)
+        n_stages = len(leah_pattern)
+
+        # 패턴 매칭 (레아 패턴의 단계 수만큼 앞에서부터 비교, 일괄 버전과 같은 기준)
+        matches = [stage == leah_pattern[i] for i, stage in enumerate(journey_stages[:n_stages])]
 
-        match_rate = sum(matches) / len(leah_pattern) * 100 if leah_pattern else 0
+        match_rate = sum(matches) / n_stages * 100 if n_stages else 0
 
         return {
-            'user_pattern': journey_stages[:4],
+            'user_pattern': journey_stages[:n_stages],
             'biblical_pattern': leah_pattern,
             'matches': matches,
             'match_rate': match_rate,
             'recommendation': get_spiritual_recommendation(match_rate)
         }
 
+    @staticmethod
+    def calculate_spiritual_growth_index_batch(journeys: pd.DataFrame) -> pd.Series:
+        """여러 사용자의 영적 성장 지수를 한 번에 계산
+
+        Args:
+            journeys: long 형식 여정 데이터 (user_id, growth 컬럼 필수)
+
+        Returns:
+            Series: 사용자별 성장 지수 (index=user_id)
+        """
+        growth = journeys['growth'].fillna(0).astype(float)
+        return growth.groupby(journeys['user_id'], sort=True).mean().rename('growth_index')
+
+    @staticmethod
+    def analyze_spiritual_pattern_batch(journeys: pd.DataFrame) -> pd.DataFrame:
+        """여러 사용자의 영적 패턴을 한 번에 분석 (`analyze_spiritual_pattern`의 벡터화 버전)
+
+        각 사용자의 stage_position 순서로 앞의 레아 패턴 단계 수(기본 4단계)만큼을 비교합니다.
+
+        Args:
+            journeys: long 형식 여정 데이터 (user_id, stage_position, stage 컬럼 필수)
+
+        Returns:
+            DataFrame: index=user_id, columns=[match_1..match_<단계 수>, match_rate, recommendation]
+        """
+        leah_pattern = np.asarray(get_analysis_patterns().leah_stages, dtype=object)
+        n_stages = len(leah_pattern)
+
+        ordered = journeys.sort_values(['user_id', 'stage_position'], kind='stable')
+        user_codes, users = pd.factorize(ordered['user_id'], sort=True)
+        ranks = ordered.groupby('user_id', sort=False).cumcount().to_numpy()
+
+        in_pattern = ranks < n_stages
+        stage_matches = ordered['stage'].to_numpy(dtype=object)[in_pattern] == leah_pattern[ranks[in_pattern]]
+
+        matches = np.zeros((len(users), n_stages), dtype=bool)
+        matches[user_codes[in_pattern], ranks[in_pattern]] = stage_matches
+
+        result = pd.DataFrame(matches, index=pd.Index(users, name='user_id'),
+                              columns=[f"match_{i + 1}" for i in range(n_stages)])
+        result['match_rate'] = matches.sum(axis=1) / n_stages * 100 if n_stages else 0.0
+        result['recommendation'] = get_spiritual_recommendations(result['match_rate'])
+        return result
+
+    @staticmethod
+    def score_journeys(journeys: pd.DataFrame) -> pd.DataFrame:
+        """여러 사용자의 성장 지수와 패턴 분석을 합친 일괄 채점
+
+        Args:
+            journeys: long 형식 여정 데이터 (user_id, stage_position, stage, growth)
+
+        Returns:
+            DataFrame: index=user_id, columns=[growth_index, match_1..match_4, match_rate, recommendation]
+        """
+        growth_index = SpiritualMetrics.calculate_spiritual_growth_index_batch(journeys)
+        patterns = SpiritualMetrics.analyze_spiritual_pattern_batch(journeys)
+        return patterns.join(growth_index).loc[:, ['growth_index', *patterns.columns]]
+
+
+# 일치율 구간별 추천사항 (높은 기준부터 확인)
+RECOMMENDATION_BUCKETS = [
+    (90, "✨ 레아와 같은 아름다운 신앙 여정을 걷고 계시네요!"),
+    (70, "🌱 좋은 신앙 패턴을 보이고 있어요. 조금 더 체계적으로 성장해보세요."),
+    (50, "📚 성경적 신앙 성장을 위해 말씀 읽기와 기도를 늘려보세요."),
+]
+DEFAULT_RECOMMENDATION = "🙏 하나님과의 관계부터 차근차근 시작해보세요. 레아의 여정을 참고하세요."
+
 
 def get_spiritual_recommendation(match_rate: float) -> str:
     """영적 성장 추천사항
@@ -233,14 +792,29 @@ def get_spiritual_recommendation(match_rate: float) -> str:
     Returns:
         str: 추천사항
     """
-    if match_rate >= 90:
-        return "✨ 레아와 같은 아름다운 신앙 여정을 걷고 계시네요!"
-    elif match_rate >= 70:
-        return "🌱 좋은 신앙 패턴을 보이고 있어요. 조금 더 체계적으로 성장해보세요."
-    elif match_rate >= 50:
-        return "📚 성경적 신앙 성장을 위해 말씀 읽기와 기도를 늘려보세요."
-    else:
-        return "🙏 하나님과의 관계부터 차근차근 시작해보세요. 레아의 여정을 참고하세요."
+    for threshold, recommendation in RECOMMENDATION_BUCKETS:
+        if match_rate >= threshold:
+            return recommendation
+    return DEFAULT_RECOMMENDATION
+
+
+def get_spiritual_recommendations(match_rates: pd.Series) -> pd.Series:
+    """여러 일치율에 대한 추천사항을 한 번에 계산 (`get_spiritual_recommendation`의 벡터화 버전)
+
+    Args:
+        match_rates: 성경적 패턴 일치율 Series
+
+    Returns:
+        Series: 추천사항 (categorical, 같은 index)
+    """
+    values = match_rates.to_numpy(dtype=float)
+    conditions = [values >= threshold for threshold, _ in RECOMMENDATION_BUCKETS]
+    labels = [recommendation for _, recommendation in RECOMMENDATION_BUCKETS]
+    categories = labels + [DEFAULT_RECOMMENDATION]
+
+    recommendations = np.select(conditions, labels, default=DEFAULT_RECOMMENDATION)
+    return pd.Series(pd.Categorical(recommendations, categories=categories),
+                     index=match_rates.index, name='recommendation')
 
 
 if __name__ == "__main__":
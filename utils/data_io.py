@@ -0,0 +1,335 @@
+"""
+JesusBornd 데이터 입출력 창구
+CSV, Parquet, Feather(Arrow IPC), Excel, JSON Lines, pickle을 하나의 save/load로 다룹니다.
+형식은 확장자(없으면 파일 앞부분의 매직 바이트)로 알아내고, 형식별 압축 옵션을 그대로 노출합니다.
+benchmark_formats(df)는 주어진 표를 형식마다 써 보고 읽어 보아 쓰기/읽기 시간, 파일 크기, 최대 메모리를 비교합니다.
+
+"각 사람은 그 마음에 정한 대로 할 것이요 인색함으로나 억지로 하지 말지니" (고후 9:7)
+
+사용 예:
+    from utils import data_io
+
+    data_io.save(df, 'offerings.parquet', compression='zstd')
+    df = data_io.load('offerings.parquet')
+    data_io.benchmark_formats(df)
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from utils._lazy import lazy_import
+
+pd = lazy_import('pandas')
+
+# 파일 이름 끝의 압축 확장자 → pandas compression 이름
+COMPRESSION_SUFFIXES = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz', '.zst': 'zstd'}
+
+# 텍스트 형식(CSV, JSON Lines)과 pickle이 지원하는 압축 (파일 전체를 압축)
+STREAM_COMPRESSIONS = (None, 'gzip', 'bz2', 'xz', 'zstd')
+
+# Excel 확장자별 읽기 엔진 우선순위 (빠른 순서) - 설치된 첫 엔진을 사용
+EXCEL_ENGINE_PREFERENCES = {
+    '.xlsx': ('calamine', 'openpyxl'),
+    '.xlsm': ('calamine', 'openpyxl'),
+    '.xls': ('calamine', 'xlrd'),
+    '.xlsb': ('calamine', 'pyxlsb'),
+    '.ods': ('calamine', 'odf'),
+}
+
+# Excel 엔진 이름 → 설치 여부를 확인할 모듈
+EXCEL_ENGINE_MODULES = {
+    'calamine': 'python_calamine',
+    'openpyxl': 'openpyxl',
+    'xlrd': 'xlrd',
+    'pyxlsb': 'pyxlsb',
+    'odf': 'odf',
+}
+
+# 매직 바이트 판별에 읽는 파일 앞부분 길이
+MAGIC_BYTES = 8
+
+PathLike = Union[str, Path]
+
+
+@dataclass(frozen=True)
+class FileFormat:
+    """등록된 파일 형식
+
+    write(df, path, compression, index, **kwargs)와 read(path, **kwargs)는 pandas 함수를 감싼 것이고,
+    compressions[0]이 기본 압축입니다. requires의 모듈이 하나라도 없으면 사용할 수 없는 형식입니다.
+    whole_file_compression이면 압축이 파일 전체에 걸려 .gz 같은 확장자로 표시하고 읽을 때 확장자로 판별합니다
+    (Parquet/Feather는 파일 안의 열 단위 압축). native_dtype_backend가 아니면 dtype_backend는
+    읽은 뒤 convert_dtypes()로 적용합니다.
+    """
+    name: str
+    extensions: Tuple[str, ...]
+    write: Callable
+    read: Callable
+    compressions: Tuple[Optional[str], ...] = (None,)
+    magic: Tuple[bytes, ...] = ()
+    requires: Tuple[str, ...] = ()
+    whole_file_compression: bool = False
+    native_dtype_backend: bool = True
+
+    @property
+    def default_compression(self) -> Optional[str]:
+        return self.compressions[0]
+
+    def is_available(self) -> bool:
+        return all(importlib.util.find_spec(module) is not None for module in self.requires)
+
+    def file_name(self, stem: str, compression: Optional[str] = None) -> str:
+        """이 형식과 압축에 맞는 파일 이름 (예: 'offerings.csv.gz')"""
+        name = f"{stem}{self.extensions[0]}"
+        if self.whole_file_compression and compression is not None:
+            name += next(suffix for suffix, value in COMPRESSION_SUFFIXES.items() if value == compression)
+        return name
+
+
+# 형식 이름 → FileFormat (register_format으로 추가)
+FORMATS: Dict[str, FileFormat] = {}
+
+
+def register_format(file_format: FileFormat) -> FileFormat:
+    """형식 등록 (같은 이름이면 교체)"""
+    FORMATS[file_format.name] = file_format
+    return file_format
+
+
+def select_excel_engine(path: PathLike) -> Optional[str]:
+    """Excel 확장자에 맞는 엔진 중 설치된 가장 빠른 엔진 (알 수 없는 확장자면 None = pandas 기본값)
+
+    Raises:
+        ImportError: 해당 확장자를 읽을 엔진이 하나도 설치되어 있지 않을 때
+    """
+    candidates = EXCEL_ENGINE_PREFERENCES.get(Path(path).suffix.lower())
+    if candidates is None:
+        return None
+    for engine in candidates:
+        if importlib.util.find_spec(EXCEL_ENGINE_MODULES[engine]) is not None:
+            return engine
+    raise ImportError(f"'{Path(path).name}'을 읽을 엔진이 없습니다. 다음 중 하나를 설치하세요: "
+                      f"{', '.join(EXCEL_ENGINE_MODULES[engine] for engine in candidates)}")
+
+
+def _write_csv(df, path, compression, index, **kwargs):
+    df.to_csv(path, index=index, compression=compression, **kwargs)
+
+
+def _read_csv(path, **kwargs):
+    return pd.read_csv(path, **kwargs)
+
+
+def _write_parquet(df, path, compression, index, **kwargs):
+    df.to_parquet(path, index=index, compression=compression, **kwargs)
+
+
+def _read_parquet(path, **kwargs):
+    return pd.read_parquet(path, **kwargs)
+
+
+def _write_feather(df, path, compression, index, **kwargs):
+    # Feather는 기본 RangeIndex만 저장하므로 index=True이면 인덱스를 열로 옮겨 저장
+    df.reset_index(drop=not index).to_feather(path, compression=compression or 'uncompressed', **kwargs)
+
+
+def _read_feather(path, **kwargs):
+    return pd.read_feather(path, **kwargs)
+
+
+def _write_excel(df, path, compression, index, **kwargs):
+    df.to_excel(path, index=index, **kwargs)
+
+
+def _read_excel(path, **kwargs):
+    if kwargs.get('engine') is None:
+        kwargs['engine'] = select_excel_engine(path)
+    return pd.read_excel(path, **kwargs)
+
+
+def _write_jsonl(df, path, compression, index, **kwargs):
+    kwargs.setdefault('date_format', 'iso')
+    df.to_json(path, orient='records', lines=True, compression=compression, **kwargs)
+
+
+def _read_jsonl(path, **kwargs):
+    return pd.read_json(path, lines=True, **kwargs)
+
+
+def _write_pickle(df, path, compression, index, **kwargs):
+    df.to_pickle(path, compression=compression, **kwargs)
+
+
+def _read_pickle(path, **kwargs):
+    return pd.read_pickle(path, **kwargs)
+
+
+register_format(FileFormat('csv', ('.csv',), _write_csv, _read_csv, compressions=STREAM_COMPRESSIONS,
+                           whole_file_compression=True))
+register_format(FileFormat('parquet', ('.parquet', '.pq'), _write_parquet, _read_parquet,
+                           compressions=('snappy', None, 'gzip', 'zstd', 'lz4', 'brotli'),
+                           magic=(b'PAR1',), requires=('pyarrow',)))
+register_format(FileFormat('feather', ('.feather', '.arrow', '.ipc'), _write_feather, _read_feather,
+                           compressions=('lz4', None, 'zstd'), magic=(b'ARROW1',), requires=('pyarrow',)))
+register_format(FileFormat('excel', ('.xlsx', '.xlsm', '.xls', '.xlsb', '.ods'), _write_excel, _read_excel,
+                           magic=(b'PK\x03\x04', b'\xd0\xcf\x11\xe0'), requires=('openpyxl',)))
+register_format(FileFormat('jsonl', ('.jsonl', '.ndjson'), _write_jsonl, _read_jsonl,
+                           compressions=STREAM_COMPRESSIONS, whole_file_compression=True))
+# pickle은 불러올 때 임의 코드를 실행할 수 있으므로 직접 만든 파일에만 사용
+register_format(FileFormat('pickle', ('.pkl', '.pickle'), _write_pickle, _read_pickle,
+                           compressions=STREAM_COMPRESSIONS, magic=(b'\x80',), whole_file_compression=True,
+                           native_dtype_backend=False))
+
+
+def detect_compression(path: PathLike) -> Optional[str]:
+    """파일 이름 끝의 압축 확장자 (.gz, .bz2, .xz, .zst)로 압축 형식 판별"""
+    return COMPRESSION_SUFFIXES.get(Path(path).suffix.lower())
+
+
+def detect_format(path: PathLike) -> str:
+    """파일 형식 판별: 압축 확장자를 뗀 확장자로, 모르는 확장자면 파일 앞부분의 매직 바이트로
+
+    Raises:
+        ValueError: 형식을 알 수 없을 때
+    """
+    path = Path(path)
+    suffixes = [suffix.lower() for suffix in path.suffixes]
+    if suffixes and suffixes[-1] in COMPRESSION_SUFFIXES:
+        suffixes.pop()
+    if suffixes:
+        for file_format in FORMATS.values():
+            if suffixes[-1] in file_format.extensions:
+                return file_format.name
+
+    if path.is_file():
+        with open(path, 'rb') as f:
+            head = f.read(MAGIC_BYTES)
+        for file_format in FORMATS.values():
+            if any(head.startswith(magic) for magic in file_format.magic):
+                return file_format.name
+    raise ValueError(f"파일 형식을 알 수 없습니다: {path.name} (지원 형식: {', '.join(FORMATS)})")
+
+
+def get_format(name: str) -> FileFormat:
+    """이름으로 형식 찾기 (없으면 ValueError)"""
+    if name not in FORMATS:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {name} (지원 형식: {', '.join(FORMATS)})")
+    return FORMATS[name]
+
+
+def available_formats() -> List[str]:
+    """필요한 패키지가 설치되어 지금 쓸 수 있는 형식 이름"""
+    return [name for name, file_format in FORMATS.items() if file_format.is_available()]
+
+
+def save(df: pd.DataFrame, path: PathLike, format: Optional[str] = None, compression: Optional[str] = 'infer',
+         index: bool = False, **kwargs) -> Path:
+    """DataFrame 저장
+
+    Args:
+        df: 저장할 표
+        path: 파일 경로
+        format: 형식 이름 (생략하면 확장자로 판별)
+        compression: 형식별 압축 ('infer'이면 .gz 같은 압축 확장자, 없으면 형식의 기본 압축).
+            파일 전체 압축(CSV, JSON Lines, pickle)은 확장자도 맞춰야 load()가 압축을 판별함
+        index: 인덱스를 저장할지 여부 (JSON Lines, pickle은 무시/항상 저장)
+        **kwargs: pandas 쓰기 함수에 전달할 추가 인자
+
+    Returns:
+        저장된 파일 경로
+    """
+    path = Path(path)
+    file_format = get_format(format or detect_format(path))
+    if compression == 'infer':
+        compression = detect_compression(path) or file_format.default_compression
+    if compression not in file_format.compressions:
+        raise ValueError(f"{file_format.name} 형식은 '{compression}' 압축을 지원하지 않습니다 "
+                         f"(가능: {list(file_format.compressions)})")
+    file_format.write(df, path, compression, index, **kwargs)
+    return path
+
+
+def load(path: PathLike, format: Optional[str] = None, dtype_backend: Optional[str] = None,
+         **kwargs) -> pd.DataFrame:
+    """DataFrame 불러오기 (형식을 생략하면 확장자나 매직 바이트로 판별, 압축은 pandas가 자동 판별)
+
+    Args:
+        path: 파일 경로
+        format: 형식 이름
+        dtype_backend: 'pyarrow'이면 pyarrow 기반 dtype(문자열은 Arrow string)으로,
+            'numpy_nullable'이면 결측 가능 dtype으로 불러옴 (생략하면 기본 numpy dtype)
+        **kwargs: pandas 읽기 함수에 전달할 추가 인자
+    """
+    file_format = get_format(format or detect_format(path))
+    if dtype_backend is None:
+        return file_format.read(Path(path), **kwargs)
+    if file_format.native_dtype_backend:
+        return file_format.read(Path(path), dtype_backend=dtype_backend, **kwargs)
+    return file_format.read(Path(path), **kwargs).convert_dtypes(dtype_backend=dtype_backend)
+
+
+def _best_time(func: Callable, repeat: int) -> float:
+    """func를 repeat번 실행한 최소 시간 (초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_formats(df: pd.DataFrame, formats: Optional[Iterable[str]] = None,
+                      compressions: Optional[Dict[str, Sequence[Optional[str]]]] = None,
+                      repeat: int = 3, directory: Optional[PathLike] = None) -> pd.DataFrame:
+    """형식(과 압축)마다 df를 써 보고 다시 읽어 비교
+
+    최대 메모리는 쓰기와 읽기를 한 번씩 하는 동안 tracemalloc이 잰 최대 할당량입니다
+    (pandas/numpy 버퍼는 포함, Arrow 메모리 풀 내부 할당은 제외).
+    이 표를 쓸 수 없는 형식(예: 섞인 타입 열의 Parquet)은 error 열에 이유를 남깁니다.
+
+    Args:
+        df: 비교할 표
+        formats: 형식 이름 (생략하면 설치된 모든 형식)
+        compressions: {형식: [압축, ...]} (생략한 형식은 기본 압축만)
+        repeat: 시간 측정 반복 횟수 (최소값 사용)
+        directory: 임시 파일을 쓸 디렉토리 (생략하면 임시 디렉토리)
+
+    Returns:
+        DataFrame: format, compression, write_time, read_time, file_size, peak_memory, error
+            (읽기 시간이 짧은 순서)
+    """
+    from utils import instrumentation
+
+    names = list(formats) if formats is not None else available_formats()
+    rows = []
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        for name in names:
+            file_format = get_format(name)
+            for compression in (compressions or {}).get(name, [file_format.default_compression]):
+                path = Path(tmp) / file_format.file_name('bench', compression)
+                row = {'format': name, 'compression': compression, 'write_time': None, 'read_time': None,
+                       'file_size': None, 'peak_memory': None, 'error': None}
+                try:
+                    row['write_time'] = _best_time(lambda: save(df, path, name, compression), repeat)
+                    row['read_time'] = _best_time(lambda: load(path, name), repeat)
+                    row['file_size'] = path.stat().st_size
+
+                    with instrumentation.trace_peak_memory() as peak:
+                        save(df, path, name, compression)
+                        load(path, name)
+                    row['peak_memory'] = peak.bytes
+                except (ImportError, ValueError, TypeError, OSError) as e:
+                    row['error'] = f"{type(e).__name__}: {e}"
+                finally:
+                    path.unlink(missing_ok=True)
+                rows.append(row)
+
+    return (pd.DataFrame(rows)
+            .astype({'write_time': 'float64', 'read_time': 'float64', 'file_size': 'Int64', 'peak_memory': 'Int64'})
+            .sort_values('read_time', ignore_index=True))
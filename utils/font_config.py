@@ -1,51 +1,58 @@
+"""
+JesusBornd 한글 폰트 설정
+matplotlib은 실제로 그래프를 그릴 때(`ensure_korean_font()` 호출 시) 처음 불러옵니다.
+"""
 
-import matplotlib
-matplotlib.use('Agg') # Set backend before importing pyplot
-
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
-import os
-
-# 프로젝트 루트 추가 (필요시)
 import sys
 from pathlib import Path
+
+# 프로젝트 루트 추가 (필요시)
 PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.append(str(PROJECT_ROOT))
-
-from font_checker import check_korean_fonts
-
-def set_korean_font():
-    font_found = False
-
-    # 1. Malgun Gothic 시도 (Windows 기본 한글 폰트)
-    if sys.platform == 'win32':
-        if 'Malgun Gothic' in [f.name for f in fm.fontManager.ttflist]:
-            plt.rcParams['font.family'] = ['Malgun Gothic']
-            print("✅ JesusBornd 한글 폰트 설정 로드 완료: Malgun Gothic")
-            font_found = True
-
-    # 2. NanumGothic 시도 (리눅스/맥 등에서 흔히 사용되는 오픈소스 한글 폰트)
-    if not font_found:
-        if 'NanumGothic' in [f.name for f in fm.fontManager.ttflist]:
-            plt.rcParams['font.family'] = ['NanumGothic']
-            print("✅ JesusBornd 한글 폰트 설정 로드 완료: NanumGothic")
-            font_found = True
-
-    # 3. 시스템에서 사용 가능한 다른 한글 폰트 찾기
-    if not font_found:
-        korean_fonts = check_korean_fonts()
-        if korean_fonts:
-            best_font_name = korean_fonts[0][0] # 첫 번째 찾은 폰트 사용
-            plt.rcParams['font.family'] = [best_font_name]
-            print(f"✅ JesusBornd 한글 폰트 설정 로드 완료: {best_font_name}")
-            font_found = True
-
-    # 4. 모든 시도 실패 시 기본 폰트 사용
-    if not font_found:
+
+# 이 프로세스에서 폰트 설정을 마쳤는지 여부
+_font_configured = False
+
+
+def set_korean_font(rescan: bool = False):
+    """한글 폰트 설정
+
+    폰트 탐색 결과는 font_checker의 디스크 캐시를 사용하므로 두 번째 실행부터는
+    시스템 폰트를 다시 스캔하지 않습니다.
+
+    Args:
+        rescan: 캐시를 무시하고 시스템 폰트를 다시 스캔할지 여부
+    """
+    import matplotlib
+    matplotlib.use('Agg') # Set backend before importing pyplot
+
+    import matplotlib.pyplot as plt
+    import matplotlib.font_manager as fm
+
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.append(str(PROJECT_ROOT))
+    from font_checker import resolve_korean_font
+
+    font = resolve_korean_font(rescan=rescan)
+
+    if font:
+        font_name, font_path = font
+        try:
+            fm.fontManager.addfont(font_path) # 캐시에서 찾은 폰트를 matplotlib에 등록
+        except (OSError, RuntimeError):
+            pass
+        plt.rcParams['font.family'] = [font_name]
+        print(f"✅ JesusBornd 한글 폰트 설정 로드 완료: {font_name}")
+    else:
         print("❌ 시스템에서 한글 폰트를 찾을 수 없습니다. 기본 폰트로 설정됩니다.")
         plt.rcParams['font.family'] = ['sans-serif']
-    
+
     plt.rcParams['axes.unicode_minus'] = False # 마이너스 부호 깨짐 방지
 
-# 함수 호출
-set_korean_font()
+
+def ensure_korean_font():
+    """한글 폰트 설정을 프로세스당 한 번만 실행 (그래프를 그리기 직전에 호출)"""
+    global _font_configured
+
+    if not _font_configured:
+        set_korean_font()
+        _font_configured = True
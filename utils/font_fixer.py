@@ -5,60 +5,67 @@ matplotlib 한글 깨짐 현상을 완벽하게 해결합니다.
 
 import matplotlib.pyplot as plt
 import matplotlib.font_manager as fm
+import argparse
 import platform
 import os
+import sys
 from pathlib import Path
 
+# font_checker.py가 있는 프로젝트 루트
+PROJECT_ROOT = Path(__file__).parent.parent
 
-def setup_korean_font():
-    """시스템에 맞는 한글 폰트를 자동으로 설정"""
 
-    # matplotlib 캐시 초기화
+def _register_font(font_path: str) -> bool:
+    """폰트 파일을 matplotlib에 등록 (깨졌거나 읽을 수 없는 파일이면 False)"""
     try:
-        cache_dir = Path.home() / '.matplotlib'
-        if cache_dir.exists():
-            for cache_file in cache_dir.glob('*.cache'):
-                cache_file.unlink()
-            print("✅ matplotlib 캐시 초기화 완료")
-    except:
-        pass
-
-    # 폰트 매니저 재구성
-    fm._load_fontmanager(try_read_cache=False)
-
-    # 사용 가능한 한글 폰트 찾기
-    korean_fonts = []
-    for font in fm.fontManager.ttflist:
-        if 'malgun' in font.name.lower() or 'gothic' in font.name.lower():
-            korean_fonts.append(font.name)
-
-    # 중복 제거
-    korean_fonts = list(set(korean_fonts))
-
-    print("\n🔍 발견된 한글 폰트:")
-    for i, font in enumerate(korean_fonts, 1):
-        print(f"  {i}. {font}")
-
-    # 우선순위대로 폰트 설정 시도
-    font_priority = ['Malgun Gothic', 'NanumGothic', 'NanumBarunGothic',
-                     'D2Coding', 'Gulim', 'Dotum', 'Batang']
-
-    selected_font = None
-    for priority_font in font_priority:
-        if priority_font in korean_fonts:
-            selected_font = priority_font
-            break
-
-    # 못 찾으면 첫 번째 한글 폰트 사용
-    if not selected_font and korean_fonts:
-        selected_font = korean_fonts[0]
+        fm.fontManager.addfont(font_path)
+    except (OSError, RuntimeError) as e:
+        print(f"⚠️ 폰트를 등록할 수 없습니다 ({font_path}): {e}")
+        return False
+    return True
+
+
+def setup_korean_font(rescan: bool = False):
+    """시스템에 맞는 한글 폰트를 자동으로 설정
+
+    Args:
+        rescan: True이면 matplotlib 폰트 캐시를 초기화하고 시스템 폰트를 전부 다시 스캔합니다.
+                False이면 font_checker의 탐색 캐시(폰트 디렉토리 mtime 기준)를 사용합니다.
+    """
+
+    if rescan:
+        # matplotlib 캐시 초기화
+        try:
+            cache_dir = Path.home() / '.matplotlib'
+            if cache_dir.exists():
+                for cache_file in cache_dir.glob('*.cache'):
+                    cache_file.unlink()
+                print("✅ matplotlib 캐시 초기화 완료")
+        except:
+            pass
+
+        # 폰트 매니저 재구성
+        fm._load_fontmanager(try_read_cache=False)
+
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.append(str(PROJECT_ROOT))
+    from font_checker import resolve_korean_font
+
+    font = resolve_korean_font(rescan=rescan)
+    if font and not _register_font(font[1]):
+        # 캐시된 폰트 파일이 깨졌거나 바뀜 → 탐색 캐시를 버리고 다시 스캔
+        print("🔍 한글 폰트를 다시 스캔합니다...")
+        font = resolve_korean_font(rescan=True)
+        if font and not _register_font(font[1]):
+            font = None
+    selected_font = font[0] if font else None
 
     if selected_font:
         # matplotlib 설정 변경
         plt.rcParams['font.family'] = selected_font
         plt.rcParams['axes.unicode_minus'] = False  # 마이너스 기호 깨짐 방지
 
-        print(f"\n✅ '{selected_font}' 폰트로 설정 완료!")
+        print(f"\n✅ '{selected_font}' 폰트로 설정 완료! ({font[1]})")
 
         # 설정 파일 생성
         save_matplotlib_config(selected_font)
@@ -71,30 +78,13 @@ def setup_korean_font():
 
 
 def save_matplotlib_config(font_name):
-    """matplotlib 설정을 파일로 저장"""
+    """matplotlib 설정을 파일로 저장
 
-    config_content = f"""
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
-
-# JesusBornd 한글 폰트 설정
-plt.rcParams['font.family'] = '{font_name}'
-plt.rcParams['axes.unicode_minus'] = False
-
-print("✅ JesusBornd 한글 폰트 설정 로드 완료: {font_name}")
-"""
+    선택된 폰트는 font_checker 캐시에 이미 저장되어 있어 utils/font_config.py는
+    다시 생성하지 않습니다 (`ensure_korean_font()`가 캐시를 읽어 설정).
+    """
 
-    # utils 폴더에 설정 파일 저장
-    utils_dir = Path('utils')
-    utils_dir.mkdir(exist_ok=True)
-
-    config_file = utils_dir / 'font_config.py'
-    with open(config_file, 'w', encoding='utf-8') as f:
-        f.write(config_content)
-
-    print(f"📁 설정 파일 생성: {config_file}")
-
-    # .matplotlibrc 파일도 생성
+    # .matplotlibrc 파일 생성
     rc_content = f"""
 font.family : {font_name}
 axes.unicode_minus : False
@@ -148,20 +138,26 @@ def test_korean_font():
 
 
 def main():
+    parser = argparse.ArgumentParser(description="JesusBornd 한글 폰트 자동 설정 도구")
+    parser.add_argument("--rescan", action="store_true",
+                        help="matplotlib 폰트 캐시와 한글 폰트 탐색 캐시를 무시하고 다시 스캔")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("    JesusBornd 한글 폰트 자동 설정 도구")
     print("    '태초에 말씀이 계시니라' - 한글도 아름답게!")
     print("=" * 60)
 
     # 한글 폰트 설정
-    selected_font = setup_korean_font()
+    selected_font = setup_korean_font(rescan=args.rescan)
 
     if selected_font:
         # 테스트 실행
         test_korean_font()
 
-        print("\n📌 이제 모든 파이썬 파일 상단에 다음 줄을 추가하세요:")
-        print("    from utils.font_config import *")
+        print("\n📌 이제 그래프를 그리기 전에 다음 함수를 호출하세요:")
+        print("    from utils.font_config import ensure_korean_font")
+        print("    ensure_korean_font()")
         print("\n또는 각 파일에서 직접 설정:")
         print(f"    import matplotlib.pyplot as plt")
         print(f"    plt.rcParams['font.family'] = '{selected_font}'")
@@ -171,7 +167,7 @@ def main():
     print("다음 행동:")
     print("1. python font_fixer.py 실행하여 한글 폰트 설정")
     print("2. 생성된 korean_font_test.png 확인")
-    print("3. 모든 분석 파일에 from utils.font_config import * 추가")
+    print("3. 시각화 코드에서 ensure_korean_font() 호출 (폰트가 바뀌었으면 --rescan)")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,238 @@
+"""
+JesusBornd 분석 단계 계측
+analyze_* 호출마다 실행 시간, CPU 시간, 할당 메모리(tracemalloc), 입력/출력 행 수를 기록해
+생성기 규모를 키웠을 때 어느 챕터의 어느 단계가 무거운지 찾습니다.
+
+"너희 중의 누가 망대를 세우고자 할진대 자기의 가진 것이 준공하기까지에 족할는지
+먼저 앉아 그 비용을 계산하지 아니하겠느냐" (눅 14:28)
+
+사용 예:
+    from utils import instrumentation
+
+    with instrumentation.instrumented_run() as registry:
+        PlaguesAggregationAnalyzer().run_all_analyses()
+    registry.to_csv('steps.csv')
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import json
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from utils._lazy import lazy_import
+from utils.reporting import _rows
+
+pd = lazy_import('pandas')
+
+# 계측 켜짐 여부와 메모리 추적 여부 (꺼져 있으면 감싼 메서드가 원래 함수를 그대로 호출)
+_enabled = False
+_trace_memory = False
+
+# 중첩 호출별 (시작 시 할당량, 지금까지의 최대 할당량)
+_memory_frames: List[List[int]] = []
+_started_tracemalloc = False
+
+
+@dataclass
+class StepRecord:
+    """analyze_* 호출 한 번의 계측 결과"""
+    step: str
+    wall_time: float
+    cpu_time: float
+    alloc_bytes: Optional[int]
+    rows_in: Optional[int]
+    rows_out: Optional[int]
+
+
+def records_frame(records: Iterable[Dict], extra_columns: Iterable[str] = ()) -> pd.DataFrame:
+    """StepRecord 딕셔너리들을 DataFrame으로 (행 수/할당량은 결측 가능 정수 Int64)"""
+    columns = list(extra_columns) + list(StepRecord.__dataclass_fields__)
+    return pd.DataFrame(list(records), columns=columns).astype(
+        {'alloc_bytes': 'Int64', 'rows_in': 'Int64', 'rows_out': 'Int64'})
+
+
+class StepRegistry:
+    """계측 결과 저장소 (CSV/JSON으로 내보내기)"""
+
+    def __init__(self):
+        self.records: List[StepRecord] = []
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def add(self, record: StepRecord):
+        self.records.append(record)
+
+    def clear(self):
+        self.records.clear()
+
+    def to_frame(self) -> pd.DataFrame:
+        """호출별 기록 DataFrame"""
+        return records_frame(asdict(record) for record in self.records)
+
+    def summary(self) -> pd.DataFrame:
+        """단계별 합계 (호출 수, 총 시간, 최대 할당량), 총 실행 시간이 긴 순서"""
+        return (self.to_frame()
+                .groupby('step')
+                .agg(calls=('wall_time', 'size'), wall_time=('wall_time', 'sum'),
+                     cpu_time=('cpu_time', 'sum'), max_alloc_bytes=('alloc_bytes', 'max'),
+                     max_rows_in=('rows_in', 'max'), max_rows_out=('rows_out', 'max'))
+                .sort_values('wall_time', ascending=False))
+
+    def to_csv(self, path: Union[str, Path]):
+        self.to_frame().to_csv(path, index=False, encoding='utf-8')
+
+    def to_json(self, path: Union[str, Path]):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump([asdict(record) for record in self.records], f, ensure_ascii=False, indent=2)
+
+
+# 기본 저장소
+registry = StepRegistry()
+
+
+def enable(trace_memory: bool = True):
+    """계측 켜기 (trace_memory=True이면 tracemalloc으로 할당량도 측정, 실행은 느려짐)"""
+    global _enabled, _trace_memory
+    _enabled, _trace_memory = True, trace_memory
+
+
+def disable():
+    """계측 끄기 (기록은 유지)"""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+@contextlib.contextmanager
+def instrumented_run(trace_memory: bool = True) -> Iterator[StepRegistry]:
+    """블록 안에서만 계측을 켜고 기본 저장소를 비운 뒤 반환"""
+    previous = (_enabled, _trace_memory)
+    registry.clear()
+    enable(trace_memory)
+    try:
+        yield registry
+    finally:
+        if previous[0]:
+            enable(previous[1])
+        else:
+            disable()
+
+
+def _memory_enter():
+    """호출 시작: 바깥 호출의 최대치를 보존한 뒤 tracemalloc 최대치 초기화"""
+    global _started_tracemalloc
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracemalloc = True
+
+    current, peak = tracemalloc.get_traced_memory()
+    if _memory_frames:
+        _memory_frames[-1][1] = max(_memory_frames[-1][1], peak)
+    tracemalloc.reset_peak()
+    _memory_frames.append([current, current])
+
+
+def _memory_exit() -> int:
+    """호출 종료: 이 호출 동안 늘어난 최대 할당량 (바이트)"""
+    global _started_tracemalloc
+    _, peak = tracemalloc.get_traced_memory()
+    baseline, frame_peak = _memory_frames.pop()
+    frame_peak = max(frame_peak, peak)
+
+    if _memory_frames:
+        _memory_frames[-1][1] = max(_memory_frames[-1][1], frame_peak)
+    elif _started_tracemalloc:
+        tracemalloc.stop()
+        _started_tracemalloc = False
+    return frame_peak - baseline
+
+
+@dataclass
+class PeakMemory:
+    """trace_peak_memory() 블록의 측정 결과 (블록이 끝나면 bytes가 채워짐)"""
+    bytes: Optional[int] = None
+
+
+@contextlib.contextmanager
+def trace_peak_memory() -> Iterator[PeakMemory]:
+    """블록 동안 늘어난 최대 할당량(바이트)을 tracemalloc으로 측정
+
+    중첩할 수 있으며 바깥 블록의 최대치는 안쪽 블록의 최대치를 포함합니다.
+    tracemalloc이 꺼져 있으면 가장 바깥 블록 동안만 켭니다.
+
+        with instrumentation.trace_peak_memory() as peak:
+            df.to_parquet(path)
+        print(peak.bytes)
+    """
+    peak = PeakMemory()
+    _memory_enter()
+    try:
+        yield peak
+    finally:
+        peak.bytes = _memory_exit()
+
+
+def _input_rows(args, kwargs) -> Optional[int]:
+    """입력 행 수: DataFrame 인자가 있으면 그 행 수 합, 없으면 분석기(self)가 가진 DataFrame 중 최대"""
+    frame_rows = [rows for rows in map(_rows, list(args[1:]) + list(kwargs.values())) if rows is not None]
+    if frame_rows:
+        return sum(frame_rows)
+
+    if args and hasattr(args[0], '__dict__'):
+        held = [rows for rows in map(_rows, vars(args[0]).values()) if rows is not None]
+        if held:
+            return max(held)
+    return None
+
+
+def instrumented(func: Callable = None, *, name: Optional[str] = None) -> Callable:
+    """호출마다 StepRecord를 기본 저장소에 기록하는 데코레이터 (계측이 꺼져 있으면 그대로 호출)"""
+    if func is None:
+        return functools.partial(instrumented, name=name)
+
+    step = name or func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return func(*args, **kwargs)
+
+        rows_in = _input_rows(args, kwargs)
+        with (trace_peak_memory() if _trace_memory else contextlib.nullcontext(PeakMemory())) as peak:
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            result = func(*args, **kwargs)
+            wall_time = time.perf_counter() - wall_start
+            cpu_time = time.process_time() - cpu_start
+
+        registry.add(StepRecord(step, wall_time, cpu_time, peak.bytes, rows_in, _rows(result)))
+        return result
+
+    wrapper.__instrumented__ = True
+    return wrapper
+
+
+class InstrumentedAnalyzerMixin:
+    """analyze_* 메서드와 run_all_analyses를 자동으로 계측하는 분석기 믹스인
+
+    class PlaguesAggregationAnalyzer(InstrumentedAnalyzerMixin): ... 처럼 상속만 하면
+    하위 클래스에 정의된 해당 메서드들이 `instrumented`로 감싸집니다.
+    """
+
+    INSTRUMENTED_PREFIXES = ('analyze_', 'run_all_analyses')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for attr, value in list(vars(cls).items()):
+            if (callable(value) and attr.startswith(cls.INSTRUMENTED_PREFIXES)
+                    and not getattr(value, '__instrumented__', False)):
+                setattr(cls, attr, instrumented(value, name=f"{cls.__name__}.{attr}"))
@@ -0,0 +1,166 @@
+"""
+JesusBornd 출력 모드
+배치 실행에서는 배너/DataFrame 출력을 건너뛰고 단계별 구조화된 JSON 이벤트(step, rows, duration)만 남깁니다.
+
+"말이 많으면 허물을 면하기 어려우나 그 입술을 제어하는 자는 지혜가 있느니라" (잠 10:19)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import inspect
+import io
+import json
+import sys
+import time
+from typing import Any, Callable, Iterator, Optional, TextIO
+
+# 현재 조용한 모드 여부 (quiet_output() 블록 안에서 켜짐)
+_quiet = False
+
+# 구조화된 이벤트를 쓸 스트림 (None이면 sys.stderr)
+_event_stream: Optional[TextIO] = None
+
+# 조용한 모드의 pandas 표시 옵션: 출력은 어차피 버리므로 몇 행/열만 포맷팅
+_QUIET_DISPLAY_OPTIONS = {'display.max_rows': 4, 'display.min_rows': 4, 'display.max_columns': 4}
+
+
+def set_quiet(quiet: bool):
+    """이벤트 기록 켜기/끄기 (출력 억제까지 하려면 quiet_output() 사용)"""
+    global _quiet
+    _quiet = quiet
+
+
+def is_quiet() -> bool:
+    """현재 조용한 모드인지 여부"""
+    return _quiet
+
+
+def set_event_stream(stream: Optional[TextIO]):
+    """구조화된 이벤트를 쓸 스트림 지정 (None이면 sys.stderr)"""
+    global _event_stream
+    _event_stream = stream
+
+
+def _rows(value: Any) -> Optional[int]:
+    """DataFrame/Series/배열 결과의 행 수 (그 밖의 값은 None)"""
+    if hasattr(value, 'shape') and getattr(value, 'ndim', 0) >= 1:
+        return int(value.shape[0])
+    return None
+
+
+def emit_event(step: str, rows: Optional[int] = None, duration: Optional[float] = None, **fields):
+    """조용한 모드에서 JSON 한 줄 이벤트 기록 (일반 모드에서는 아무것도 하지 않음)
+
+    Args:
+        step: 단계 이름 (예: 'PlaguesAggregationAnalyzer.analyze_summary_statistics')
+        rows: 결과 행 수
+        duration: 소요 시간 (초)
+        **fields: 추가 필드 (JSON으로 직렬화 가능한 값)
+    """
+    if not is_quiet():
+        return
+
+    event = {'step': step, 'rows': rows,
+             'duration': round(duration, 6) if duration is not None else None, **fields}
+    stream = _event_stream or sys.stderr
+    stream.write(json.dumps(event, ensure_ascii=False, default=str) + '\n')
+
+
+def print_frame(frame: Any, full: bool = False, **to_string_kwargs):
+    """분석 결과 표(DataFrame/Series) 출력 - 챕터의 표 출력은 모두 이 함수를 거침
+
+    조용한 모드에서는 문자열로 포맷팅하지 않고 바로 돌아가므로 큰 표도 렌더링 비용이 없습니다.
+    일반 모드에서는 full=True이거나 to_string 인자(index=False 등)를 주면 print(frame.to_string(...))과,
+    아니면 print(frame)과 같게 출력합니다.
+
+    Args:
+        frame: 출력할 DataFrame/Series
+        full: True이면 표시 옵션과 무관하게 전체 행을 to_string()으로 출력
+        **to_string_kwargs: to_string()에 넘길 인자
+    """
+    if is_quiet():
+        return
+    print(frame.to_string(**to_string_kwargs) if full or to_string_kwargs else frame)
+
+
+def reported_step(func: Callable = None, *, name: Optional[str] = None) -> Callable:
+    """함수/메서드를 하나의 단계로 기록하는 데코레이터
+
+    조용한 모드에서만 시간을 재고 이벤트를 남기며, 일반 모드에서는 원래 함수를 그대로 호출합니다.
+    """
+    if func is None:
+        return functools.partial(reported_step, name=name)
+
+    step = name or func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not is_quiet():
+            return func(*args, **kwargs)
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        emit_event(step, rows=_rows(result), duration=time.perf_counter() - start)
+        return result
+
+    wrapper.__reported_step__ = True
+    return wrapper
+
+
+def instrument_class(cls: type) -> type:
+    """클래스의 공개 메서드(analyze_*, generate_*, run_* 등)를 모두 단계로 기록하도록 감싸기"""
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith('_') or not inspect.isfunction(value) or getattr(value, '__reported_step__', False):
+            continue
+        setattr(cls, attr, reported_step(value, name=f"{cls.__name__}.{attr}"))
+    return cls
+
+
+def instrument_package(package: str):
+    """이미 임포트된 패키지 하위 모듈에 정의된 클래스들을 모두 instrument_class로 감싸기
+
+    예: instrument_package('chapters.ch09') → PlaguesAggregationAnalyzer, PlaguesDataGenerator 등
+    """
+    for module_name, module in list(sys.modules.items()):
+        if module is None or not (module_name == package or module_name.startswith(package + '.')):
+            continue
+        for value in list(vars(module).values()):
+            if inspect.isclass(value) and value.__module__ == module_name:
+                instrument_class(value)
+
+
+class _NullWriter(io.TextIOBase):
+    """쓰기를 모두 버리는 텍스트 스트림"""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+@contextlib.contextmanager
+def quiet_output(events: Optional[TextIO] = None) -> Iterator[None]:
+    """블록 안에서 조용한 모드 적용
+
+    print 출력은 버리고, 챕터의 표 출력(print_frame, synthetic.frame_preview)은 포맷팅 자체를 건너뜁니다.
+    그 밖에 남은 렌더링(f-string 안의 표 등)도 몇 행/열만 포맷팅하도록 pandas 표시 옵션을
+    블록 안에서만 줄입니다. 단계 이벤트는 events(기본 stderr)에 기록됩니다.
+
+    Args:
+        events: 구조화된 이벤트를 쓸 스트림
+    """
+    import pandas as pd
+
+    previous_quiet, previous_stream = _quiet, _event_stream
+    display_options = [item for option in _QUIET_DISPLAY_OPTIONS.items() for item in option]
+
+    set_quiet(True)
+    set_event_stream(events)
+    try:
+        with pd.option_context(*display_options), contextlib.redirect_stdout(_NullWriter()):
+            yield
+    finally:
+        set_quiet(previous_quiet)
+        set_event_stream(previous_stream)
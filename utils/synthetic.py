@@ -0,0 +1,166 @@
+"""
+JesusBornd 합성 데이터 도우미
+챕터 데이터 생성기가 기본 사건표(몇 행)를 원하는 행 수로 늘리고, 큰 결과는 앞부분만 출력하도록 돕습니다.
+모든 연산은 행 단위 파이썬 루프 없이 numpy/pandas 벡터 연산으로 처리합니다.
+아주 큰 표는 generate_chunked로 행 범위를 청크로 나눠 여러 프로세스에서 만들고 Parquet 파일로 바로 씁니다.
+
+"생육하고 번성하여 땅에 충만하라" (창 1:28)
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from utils import reporting
+from utils._lazy import lazy_import
+
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+
+# 생성 결과를 전부 출력하는 최대 행 수 (넘으면 앞부분만)
+PREVIEW_ROWS = 20
+
+# 청크 생성의 기본 청크 크기 (행 수) - 청크 경계가 난수 스트림을 정하므로 바꾸면 결과도 바뀜
+CHUNK_SIZE = 1_000_000
+
+# 청크 Parquet 파일 이름 (번호 순으로 정렬되도록 0 채움)
+CHUNK_FILE_PATTERN = 'part-{index:05d}.parquet'
+
+
+def tile_frame(base: pd.DataFrame, num_records: Optional[int] = None,
+               steps: Optional[Dict[str, object]] = None) -> pd.DataFrame:
+    """기본 표의 행을 차례로 반복해 num_records행으로 늘리기
+
+    Args:
+        base: 기본 표 (예: 재앙 3개, 사건 7개)
+        num_records: 결과 행 수 (None이면 기본 표의 복사본)
+        steps: {열: 반복 회차당 증가량} - k번째 반복에서 값에 k * 증가량을 더해
+            id나 날짜가 반복마다 이어지게 함 (예: {'event_id': 7, 'event_datetime': pd.Timedelta(days=4)})
+
+    Returns:
+        DataFrame: 0..num_records-1 인덱스의 새 표
+    """
+    if num_records is None:
+        return base.copy()
+    if num_records < 0:
+        raise ValueError(f"num_records는 0 이상이어야 합니다: {num_records}")
+
+    cycle, position = np.divmod(np.arange(num_records), len(base))
+    df = base.take(position).reset_index(drop=True)
+    for column, step in (steps or {}).items():
+        if isinstance(step, pd.Timedelta):
+            df[column] = _shift_datetimes(df[column], cycle, step)
+        else:
+            df[column] = df[column] + cycle * step
+    return df
+
+
+def _shift_datetimes(values: pd.Series, cycle: np.ndarray, step: pd.Timedelta) -> pd.Series:
+    """날짜 열을 회차 * step만큼 이동 (나노초 범위를 넘으면 초 단위로 계산)"""
+    last = int(cycle[-1]) if len(cycle) else 0
+    fits = values.max().value + last * step.value <= pd.Timestamp.max.value if len(values) else True
+    unit, scale = ('ns', 1) if fits else ('s', 10 ** 9)
+    return values.dt.as_unit(unit) + (cycle * (step.value // scale)).astype(f'timedelta64[{unit}]')
+
+
+def date_range(start, periods: int, freq: str) -> pd.DatetimeIndex:
+    """pd.date_range와 같되 나노초 범위(1677~2262년)를 벗어나면 초 단위로 생성
+
+    하루 간격 10⁶행은 2700년을 넘고, 출애굽 시대(1446년)는 시작부터 범위를 벗어나므로
+    큰 생성기는 이 함수로 날짜 열을 만듭니다.
+    """
+    try:
+        return pd.date_range(start=start, periods=periods, freq=freq)
+    except (OverflowError, pd.errors.OutOfBoundsDatetime):
+        return pd.date_range(start=start, periods=periods, freq=freq, unit='s')
+
+
+def numbered_labels(prefix: str, start: int, stop: int, suffix: str = '') -> np.ndarray:
+    """'user_1', 'user_2', ... 같은 번호 라벨 배열 (f-string 리스트 대신 벡터 연산)"""
+    labels = np.char.add(prefix, np.arange(start, stop).astype(str))
+    return np.char.add(labels, suffix) if suffix else labels
+
+
+def frame_preview(df: pd.DataFrame, columns: Optional[Sequence[str]] = None,
+                  max_rows: int = PREVIEW_ROWS) -> str:
+    """생성 결과 출력용 문자열: 작은 표는 전체, 큰 표는 앞부분과 전체 크기만
+
+    큰 표 전체를 to_string()으로 렌더링하면 행 수에 비례해 느려지므로 앞 max_rows행만 렌더링합니다.
+    조용한 모드(utils.reporting)에서는 출력이 버려지므로 표를 포맷팅하지 않고 크기만 반환합니다.
+    """
+    shown = df if columns is None else df[list(columns)]
+    if reporting.is_quiet():
+        return f"<{len(shown):,}행 x {shown.shape[1]}열>"
+    if len(shown) <= max_rows:
+        return shown.to_string(index=False)
+    return (f"{shown.head(max_rows).to_string(index=False)}\n"
+            f"... ({len(shown):,}행 x {shown.shape[1]}열 중 앞 {max_rows}행)")
+
+
+def chunk_bounds(num_records: int, chunk_size: int = CHUNK_SIZE) -> List[Tuple[int, int]]:
+    """[0, num_records) 행 범위를 chunk_size씩 나눈 (start, stop) 목록"""
+    if num_records < 0:
+        raise ValueError(f"num_records는 0 이상이어야 합니다: {num_records}")
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size는 1 이상이어야 합니다: {chunk_size}")
+    return [(start, min(start + chunk_size, num_records)) for start in range(0, num_records, chunk_size)]
+
+
+def _build_chunk(build_chunk: Callable, seed: np.random.SeedSequence, index: int, start: int, stop: int,
+                 output_dir: Optional[Path]) -> Union[pd.DataFrame, Path]:
+    """청크 하나 생성 (워커 프로세스에서 실행): 출력 디렉토리가 있으면 Parquet으로 쓰고 경로 반환"""
+    df = build_chunk(np.random.default_rng(seed), start, stop)
+    if output_dir is None:
+        return df
+    path = output_dir / CHUNK_FILE_PATTERN.format(index=index)
+    df.to_parquet(path, index=False)
+    return path
+
+
+def generate_chunked(build_chunk: Callable[[np.random.Generator, int, int], pd.DataFrame],
+                     num_records: int, chunk_size: int = CHUNK_SIZE, seed: int = 0,
+                     workers: Optional[int] = None,
+                     output_dir: Optional[Union[str, Path]] = None) -> Union[pd.DataFrame, Path]:
+    """행 범위를 청크로 나눠 병렬 생성
+
+    k번째 청크는 SeedSequence(seed).spawn()의 k번째 자식으로 만든 독립 np.random.Generator를 받으므로,
+    결과는 청크 크기와 seed로만 정해지고 워커 수나 완료 순서와 무관하게 비트 단위로 같습니다.
+    전역 np.random 상태는 건드리지 않습니다.
+
+    Args:
+        build_chunk: (rng, start, stop) → 행 start..stop-1의 DataFrame.
+            워커 프로세스로 보내지므로 모듈 수준 함수나 임포트 가능한 클래스의 메서드여야 함
+        num_records: 전체 행 수
+        chunk_size: 청크당 행 수
+        seed: 루트 시드
+        workers: 워커 프로세스 수 (생략 시 CPU 수, 1이면 현재 프로세스에서 순서대로 생성)
+        output_dir: 주면 청크마다 part-00000.parquet, part-00001.parquet, ...로 쓰고 디렉토리를 반환
+            (이전 실행의 part-*.parquet은 먼저 지움). 생략하면 청크를 이어 붙인 DataFrame 반환
+
+    Returns:
+        DataFrame 또는 Parquet 디렉토리 경로 (pd.read_parquet(경로)로 읽기)
+    """
+    bounds = chunk_bounds(num_records, chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(bounds))
+
+    if output_dir is not None:
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for stale in output_dir.glob('part-*.parquet'):
+            stale.unlink()
+
+    tasks = [(build_chunk, seeds[index], index, start, stop, output_dir)
+             for index, (start, stop) in enumerate(bounds)]
+    if workers == 1 or len(tasks) <= 1:
+        chunks = [_build_chunk(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(_build_chunk, *zip(*tasks)))
+
+    if output_dir is not None:
+        return output_dir
+    if not chunks:
+        return build_chunk(np.random.default_rng(seed), 0, 0)
+    return pd.concat(chunks, ignore_index=True)
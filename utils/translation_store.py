@@ -0,0 +1,265 @@
+"""
+JesusBornd 다중 번역본 정렬 저장소
+여러 번역본(개역개정, KJV, ESV ...)을 하나의 (book, chapter, verse) 키 배열에 맞춰 저장하고,
+구절 텍스트는 번역본별 UTF-8 바이트 덩어리 + 오프셋 배열로 디스크에서 메모리 매핑해 읽습니다.
+
+"각 사람이 자기의 난 곳 방언으로 듣게 되는 것이 어찌 됨이냐" (행 2:8) - 같은 말씀, 여러 언어
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from utils._lazy import lazy_import
+from utils import bible_utils
+from utils.bible_utils import (MAX_VERSE, bible_csv_path, canonical_book, parse_bible_csv, split_verse_key,
+                               verse_key)
+
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+
+# 프로세스 내 저장소 캐시: 저장소 디렉토리 -> TranslationStore
+_STORE_CACHE: Dict[Path, 'TranslationStore'] = {}
+
+
+def _store_dir() -> Path:
+    """정렬 저장소 디렉토리 (data/processed/translations)"""
+    return bible_utils.PROJECT_ROOT / 'data' / 'processed' / 'translations'
+
+
+def _source_stamp(translation: str) -> Dict[str, int]:
+    """원본 CSV의 mtime/size (저장소 유효성 확인용)"""
+    stat = bible_csv_path(translation).stat()
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+
+def _write_replacing(path: Path, write):
+    """임시 파일에 쓴 뒤 교체 (이미 메모리 매핑된 이전 파일은 그대로 유지됨)"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+def _default_translations() -> List[str]:
+    """config.yml의 default_translation 중 원본 CSV가 있는 번역본들 (없으면 KJV)"""
+    try:
+        defaults = bible_utils.load_config()['bible']['default_translation']
+    except (OSError, KeyError, TypeError):
+        defaults = {}
+
+    available = [name for name in defaults.values() if bible_csv_path(name).exists()]
+    return available or ['KJV']
+
+
+class TranslationStore:
+    """메모리 매핑된 다중 번역본 구절 저장소
+
+    keys[i]는 i번째 구절의 int64 정렬 키(book 코드 | chapter | verse, `BibleIndex`와 같은 인코딩)이고,
+    번역본 t의 i번째 구절은 `blob_t[offsets_t[i]:offsets_t[i + 1]]`의 UTF-8 바이트입니다.
+    해당 번역본에 없는 구절은 길이 0 구간이며 None으로 반환됩니다.
+    """
+
+    def __init__(self, store_dir: Path):
+        self.store_dir = Path(store_dir)
+        with open(self.store_dir / 'manifest.json', 'r', encoding='utf-8') as f:
+            self.manifest = json.load(f)
+
+        self.books: List[str] = self.manifest['books']
+        self.book_codes = {canonical_book(name): code for code, name in enumerate(self.books)}
+        self.keys = np.load(self.store_dir / 'keys.npy', mmap_mode='r')
+
+        self._offsets = {}
+        self._blobs = {}
+        for name in self.translations:
+            self._offsets[name] = np.load(self.store_dir / f'{name}.offsets.npy', mmap_mode='r')
+            blob_path = self.store_dir / f'{name}.txt'
+            if blob_path.stat().st_size:
+                self._blobs[name] = np.memmap(blob_path, dtype=np.uint8, mode='r')
+            else:
+                self._blobs[name] = np.empty(0, dtype=np.uint8)  # 빈 파일은 매핑할 수 없음
+
+    @property
+    def translations(self) -> List[str]:
+        """저장된 번역본 이름들 (저장 순서)"""
+        return list(self.manifest['translations'])
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _book_code(self, book: str) -> int:
+        code = self.book_codes.get(canonical_book(book))
+        if code is None:
+            raise KeyError(f"'{book}' 책을 번역본 저장소에서 찾을 수 없습니다.")
+        return code
+
+    def _check_translations(self, translations: Optional[Iterable[str]]) -> List[str]:
+        if translations is None:
+            return self.translations
+        translations = list(translations)
+        missing = [name for name in translations if name not in self._offsets]
+        if missing:
+            raise KeyError(f"저장소에 없는 번역본입니다: {missing} (저장됨: {self.translations})")
+        return translations
+
+    def passage_range(self, book: str, start_chapter: int, start_verse: int,
+                      end_chapter: int, end_verse: int) -> Tuple[int, int]:
+        """start_chapter:start_verse ~ end_chapter:end_verse(포함) 구간의 [start, stop) 위치"""
+        code = self._book_code(book)
+        lo = np.searchsorted(self.keys, verse_key(code, start_chapter, start_verse), side='left')
+        hi = np.searchsorted(self.keys, verse_key(code, end_chapter, end_verse), side='right')
+        return int(lo), int(max(lo, hi))
+
+    def texts(self, translation: str, start: int, stop: int) -> List[Optional[str]]:
+        """번역본의 [start, stop) 위치 구절 텍스트 (필요한 바이트만 디코딩)"""
+        offsets = np.asarray(self._offsets[translation][start:stop + 1])
+        blob = self._blobs[translation]
+        return [bytes(blob[lo:hi]).decode('utf-8') if hi > lo else None
+                for lo, hi in zip(offsets[:-1], offsets[1:])]
+
+    def get_verse(self, book: str, chapter: int, verse: int,
+                  translations: Optional[Iterable[str]] = None) -> Dict[str, Optional[str]]:
+        """한 구절을 번역본별로 조회 (예: {'개역개정': '태초에 말씀이 계시니라...', 'KJV': 'In the beginning...'})"""
+        translations = self._check_translations(translations)
+        lo, hi = self.passage_range(book, chapter, verse, chapter, verse)
+        return {name: (self.texts(name, lo, hi)[0] if hi > lo else None) for name in translations}
+
+    def get_passage(self, book: str, start_chapter: int, start_verse: Optional[int] = None,
+                    end_chapter: Optional[int] = None, end_verse: Optional[int] = None,
+                    translations: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """본문 구간을 번역본별 열로 나란히 조회 (`bible_utils.get_passage`의 대역본 버전)
+
+        Returns:
+            DataFrame: columns=[book, chapter, verse, <번역본>...], 없는 구절은 None
+        """
+        translations = self._check_translations(translations)
+        if end_chapter is None:
+            end_chapter = start_chapter
+        lo, hi = self.passage_range(
+            book, start_chapter, start_verse or 0,
+            end_chapter, end_verse if end_verse is not None else MAX_VERSE
+        )
+
+        _, chapters, verses = split_verse_key(np.asarray(self.keys[lo:hi]))
+        passage = pd.DataFrame({
+            'book': self.books[self._book_code(book)],
+            'chapter': chapters,
+            'verse': verses,
+        })
+        for name in translations:
+            passage[name] = self.texts(name, lo, hi)
+        return passage
+
+
+def build_translation_store(translations: Iterable[str], store_dir: Optional[Path] = None) -> TranslationStore:
+    """번역본 CSV들을 정렬 저장소로 변환
+
+    번역본을 하나씩 파싱해 텍스트는 바로 디스크에 쓰고, 키와 바이트 길이만 메모리에 남긴 뒤
+    모든 번역본의 키 합집합에 맞춰 오프셋을 만듭니다. 책은 `canonical_book()`으로 맞추므로
+    ('요한복음'과 'John'은 같은 책) 언어가 달라도 정렬되며, 순서는 먼저 나온 번역본의 정경 순서를 따릅니다.
+
+    Args:
+        translations: 번역본 이름들 (data/raw/bible_<번역본>.csv)
+        store_dir: 저장 디렉토리 (기본값: data/processed/translations)
+
+    Returns:
+        TranslationStore: 새로 만든 저장소
+
+    Raises:
+        ValueError: 어떤 번역본의 책이 앞선 번역본들과 하나도 맞지 않을 때 (책 이름 표기 확인)
+    """
+    translations = list(translations)
+    store_dir = Path(store_dir) if store_dir is not None else _store_dir()
+    store_dir.mkdir(parents=True, exist_ok=True)
+
+    # 데이터 파일을 바꾸기 전에 이전 매니페스트부터 지워, 중간에 실패해도 섞인 저장소가 유효해 보이지 않게 함
+    (store_dir / 'manifest.json').unlink(missing_ok=True)
+
+    books: List[str] = []
+    book_codes: Dict[str, int] = {}
+    per_translation = {}
+
+    for name in translations:
+        stamp = _source_stamp(name)
+        df = parse_bible_csv(bible_csv_path(name))
+
+        book_ids = [canonical_book(book) for book in df['book'].cat.categories]
+        if book_codes and not book_codes.keys() & set(book_ids):
+            raise ValueError(f"번역본 '{name}'의 책 이름이 다른 번역본과 하나도 맞지 않습니다 "
+                             f"(예: {list(df['book'].cat.categories[:3])}, 저장됨: {books[:3]}).")
+        for book, book_id in zip(df['book'].cat.categories, book_ids):
+            if book_id not in book_codes:
+                book_codes[book_id] = len(books)
+                books.append(book)
+
+        category_codes = np.array([book_codes[book_id] for book_id in book_ids], dtype=np.int64)
+        codes = category_codes[df['book'].cat.codes.to_numpy()]
+        keys = verse_key(codes, df['chapter'].to_numpy().astype(np.int64), df['verse'].to_numpy().astype(np.int64))
+
+        # 번역본 안의 키 순서로 정렬하고 중복 구절은 첫 번째만 사용
+        order = np.argsort(keys, kind='stable')
+        keys, first = np.unique(keys[order], return_index=True)
+        encoded = [str(text).encode('utf-8') for text in df['text'].to_numpy()[order[first]]]
+
+        _write_replacing(store_dir / f'{name}.txt', lambda f: f.write(b''.join(encoded)))
+        per_translation[name] = (keys, np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), stamp)
+        del df, encoded
+
+    all_keys = np.unique(np.concatenate([keys for keys, _, _ in per_translation.values()])
+                         if per_translation else np.empty(0, dtype=np.int64))
+    _write_replacing(store_dir / 'keys.npy', lambda f: np.save(f, all_keys))
+
+    for name, (keys, lengths, _) in per_translation.items():
+        aligned = np.zeros(len(all_keys), dtype=np.int64)
+        aligned[np.searchsorted(all_keys, keys)] = lengths
+        offsets = np.concatenate(([0], np.cumsum(aligned)))
+        _write_replacing(store_dir / f'{name}.offsets.npy', lambda f: np.save(f, offsets))
+
+    # 매니페스트는 모든 데이터 파일을 쓴 뒤 마지막에 저장
+    manifest = {
+        'books': books,
+        'translations': {name: stamp for name, (_, _, stamp) in per_translation.items()},
+    }
+    _write_replacing(store_dir / 'manifest.json',
+                     lambda f: f.write(json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8')))
+
+    return TranslationStore(store_dir)
+
+
+def _store_is_current(store_dir: Path, translations: List[str]) -> bool:
+    """저장소 매니페스트가 요청한 번역본들과 원본 CSV 상태에 맞는지 확인"""
+    try:
+        with open(store_dir / 'manifest.json', 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return False
+
+    stored = manifest.get('translations', {})
+    return list(stored) == translations and all(stored[name] == _source_stamp(name) for name in translations)
+
+
+def get_translation_store(translations: Optional[Iterable[str]] = None) -> TranslationStore:
+    """다중 번역본 정렬 저장소 (원본이 바뀌었거나 번역본 구성이 다를 때만 다시 생성)
+
+    Args:
+        translations: 번역본 이름들 (생략 시 config.yml의 default_translation 중 CSV가 있는 것)
+
+    Returns:
+        TranslationStore: 메모리 매핑된 저장소 (프로세스 내에서 공유)
+    """
+    translations = list(translations) if translations is not None else _default_translations()
+    store_dir = _store_dir()
+
+    cached = _STORE_CACHE.get(store_dir)
+    if cached is not None and cached.translations == translations and _store_is_current(store_dir, translations):
+        return cached
+
+    if _store_is_current(store_dir, translations):
+        store = TranslationStore(store_dir)
+    else:
+        store = build_translation_store(translations, store_dir)
+    _STORE_CACHE[store_dir] = store
+    return store
@@ -0,0 +1,179 @@
+"""
+JesusBornd 성경 단어 역색인
+KJV 말뭉치의 단어 → 구절 포스팅과 벡터화된 단어 빈도 계산
+
+"빛이 어둠에 비치되 어둠이 깨닫지 못하더라" (요 1:5) - 단어 하나하나를 세어보기
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from utils._lazy import lazy_import
+from utils.bible_utils import load_corpus
+
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+
+# 영어 단어 토큰 (소문자, 아포스트로피 포함: "lord's", "thou")
+TOKEN_PATTERN = r"[a-z]+(?:'[a-z]+)*"
+
+# 마지막으로 만든 역색인: (말뭉치 DataFrame, WordIndex)
+_WORD_INDEX_CACHE: Optional[Tuple[pd.DataFrame, 'WordIndex']] = None
+
+
+def tokenize(text: str) -> List[str]:
+    """구절 텍스트를 소문자 단어 토큰으로 분리
+
+    Args:
+        text: 구절 텍스트
+
+    Returns:
+        List[str]: 토큰 리스트 ("Let there be light:" → ['let', 'there', 'be', 'light'])
+    """
+    return re.findall(TOKEN_PATTERN, str(text).lower())
+
+
+class WordIndex:
+    """단어 → 구절 역색인
+
+    단어마다 등장한 구절의 행 번호(int32)와 그 구절 안에서의 등장 횟수(int32)를
+    하나의 연속 배열에 저장하고, `offsets[t]:offsets[t + 1]`로 단어 t의 포스팅을 찾습니다.
+    행 번호는 말뭉치 순서((book, chapter, verse) 정렬)를 따릅니다.
+    """
+
+    def __init__(self, texts: pd.Series):
+        tokens = texts.fillna('').astype(str).str.lower().str.findall(TOKEN_PATTERN)
+        lengths = tokens.str.len().to_numpy()
+        rows = np.repeat(np.arange(len(tokens), dtype=np.int64), lengths)
+
+        flat = tokens.explode().dropna().to_numpy()
+        codes, vocabulary = pd.factorize(flat, sort=True)
+        self.vocabulary = pd.Index(vocabulary)
+
+        # (단어, 구절) 쌍별 등장 횟수 → 단어 순, 구절 순으로 정렬된 포스팅
+        n_rows = max(len(tokens), 1)
+        pair_keys = codes.astype(np.int64) * n_rows + rows
+        unique_pairs, counts = np.unique(pair_keys, return_counts=True)
+        term_codes = unique_pairs // n_rows
+
+        self.postings = (unique_pairs % n_rows).astype(np.int32)
+        self.counts = counts.astype(np.int32)
+        self.offsets = np.searchsorted(term_codes, np.arange(len(self.vocabulary) + 1))
+
+    def __contains__(self, term: str) -> bool:
+        return term.lower() in self.vocabulary
+
+    def postings_for(self, term: str) -> Tuple[np.ndarray, np.ndarray]:
+        """단어의 (구절 행 번호, 구절 내 등장 횟수) 포스팅 (없는 단어면 빈 배열)"""
+        code = self.vocabulary.get_indexer([term.lower()])[0]
+        if code < 0:
+            empty = np.empty(0, dtype=np.int32)
+            return empty, empty
+        start, stop = self.offsets[code], self.offsets[code + 1]
+        return self.postings[start:stop], self.counts[start:stop]
+
+
+def get_word_index() -> WordIndex:
+    """캐시된 말뭉치의 역색인 (말뭉치가 바뀌었을 때만 다시 생성)"""
+    global _WORD_INDEX_CACHE
+
+    df, _ = load_corpus()
+    if _WORD_INDEX_CACHE is None or _WORD_INDEX_CACHE[0] is not df:
+        _WORD_INDEX_CACHE = (df, WordIndex(df['text']))
+    return _WORD_INDEX_CACHE[1]
+
+
+def _normalize_terms(terms: Union[Iterable[str], Dict[str, Iterable[str]]]) -> Dict[str, List[str]]:
+    """terms를 {열 이름: [단어 형태들]}로 정규화 ('Light' → {'Light': ['light']})"""
+    if isinstance(terms, dict):
+        return {label: [form.lower() for form in ([forms] if isinstance(forms, str) else forms)]
+                for label, forms in terms.items()}
+    return {term: [term.lower()] for term in terms}
+
+
+def term_frequency(terms: Union[Iterable[str], Dict[str, Iterable[str]]], book: str,
+                   chapters: Optional[Iterable[int]] = None) -> pd.DataFrame:
+    """책의 장별 단어 빈도를 한 번에 계산
+
+    요청한 단어들의 포스팅만 모아 장 번호로 집계하므로 단어 수만큼 말뭉치를 다시 훑지 않습니다.
+
+    Args:
+        terms: 단어 리스트 ['Light', 'Darkness'] 또는 개념별 형태 {'Light': ['light', 'lights']}
+        book: 책 이름 (공백/대소문자 무시)
+        chapters: 집계할 장 번호들 (생략 시 책의 모든 장)
+
+    Returns:
+        DataFrame: index=chapter, columns=terms, 값=등장 횟수
+    """
+    df, bible_index = load_corpus()
+    word_index = get_word_index()
+    concept_forms = _normalize_terms(terms)
+
+    start, stop = bible_index.book_range(book)
+    book_chapters = df['chapter'].to_numpy()[start:stop]
+    if chapters is None:
+        chapter_labels = np.unique(book_chapters)
+    else:
+        chapter_labels = np.asarray(sorted(set(chapters)), dtype=np.int64)
+
+    # 개념별 포스팅을 하나의 배열로 합친 뒤 책 범위만 남김
+    rows, counts, columns = [], [], []
+    for column, forms in enumerate(concept_forms.values()):
+        for form in forms:
+            form_rows, form_counts = word_index.postings_for(form)
+            rows.append(form_rows)
+            counts.append(form_counts)
+            columns.append(np.full(len(form_rows), column, dtype=np.int64))
+
+    rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.int32)
+    counts = np.concatenate(counts) if counts else np.empty(0, dtype=np.int32)
+    columns = np.concatenate(columns) if columns else np.empty(0, dtype=np.int64)
+
+    in_book = (rows >= start) & (rows < stop)
+    hit_chapters = book_chapters[rows[in_book] - start]
+    positions = np.searchsorted(chapter_labels, hit_chapters)
+    valid = (positions < len(chapter_labels))
+    valid[valid] = chapter_labels[positions[valid]] == hit_chapters[valid]
+
+    matrix = np.zeros((len(chapter_labels), len(concept_forms)), dtype=np.int64)
+    np.add.at(matrix, (positions[valid], columns[in_book][valid]), counts[in_book][valid])
+
+    return pd.DataFrame(matrix, index=pd.Index(chapter_labels, name='chapter'),
+                        columns=list(concept_forms.keys()))
+
+
+def analyze_light_darkness_by_chapter(book: str = 'John',
+                                      chapters: Optional[Iterable[int]] = None) -> pd.DataFrame:
+    """장별 빛 vs 어둠 빈도와 비율 (`analyze_light_darkness_ratio`의 말뭉치 버전)
+
+    Args:
+        book: 책 이름 (기본값: 요한복음)
+        chapters: 분석할 장 번호들 (생략 시 모든 장)
+
+    Returns:
+        DataFrame: index=chapter, columns=[light_frequency, darkness_frequency, ratio]
+    """
+    freq = term_frequency({'light_frequency': ['light'], 'darkness_frequency': ['darkness']},
+                          book, chapters)
+    freq['ratio'] = freq['light_frequency'] / freq['darkness_frequency'].where(freq['darkness_frequency'] > 0)
+    freq['ratio'] = freq['ratio'].fillna(float('inf')).where(freq['light_frequency'] > 0, 0.0)
+    return freq
+
+
+def get_grace_truth_balance_by_chapter(book: str = 'John',
+                                       chapters: Optional[Iterable[int]] = None) -> pd.DataFrame:
+    """장별 은혜와 진리 빈도 균형 (`get_grace_truth_balance`의 말뭉치 버전)
+
+    Args:
+        book: 책 이름 (기본값: 요한복음)
+        chapters: 분석할 장 번호들 (생략 시 모든 장)
+
+    Returns:
+        DataFrame: index=chapter, columns=[grace_frequency, truth_frequency, is_balanced]
+    """
+    freq = term_frequency({'grace_frequency': ['grace'], 'truth_frequency': ['truth']},
+                          book, chapters)
+    freq['is_balanced'] = freq['grace_frequency'] == freq['truth_frequency']
+    return freq